@@ -1,9 +1,11 @@
 """Standalone Python client for the Pretalx REST API."""
 
+from pretalx_client.async_client import AsyncPretalxClient
 from pretalx_client.client import PretalxClient
 from pretalx_client.models import PretalxSlot, PretalxSpeaker, PretalxTalk, SubmissionState
 
 __all__ = [
+    "AsyncPretalxClient",
     "PretalxClient",
     "PretalxSlot",
     "PretalxSpeaker",
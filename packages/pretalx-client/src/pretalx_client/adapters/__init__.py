@@ -7,10 +7,11 @@ the talks endpoint fallback pattern.
 
 from pretalx_client.adapters.normalization import localized, resolve_id_or_localized
 from pretalx_client.adapters.schedule import normalize_slot, parse_datetime
-from pretalx_client.adapters.talks import fetch_talks_with_fallback
+from pretalx_client.adapters.talks import fetch_talks_with_fallback, fetch_talks_with_fallback_async
 
 __all__ = [
     "fetch_talks_with_fallback",
+    "fetch_talks_with_fallback_async",
     "localized",
     "normalize_slot",
     "parse_datetime",
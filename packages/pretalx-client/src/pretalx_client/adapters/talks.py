@@ -6,10 +6,12 @@ falls back to ``/submissions/`` with both ``confirmed`` and ``accepted``
 states to capture all scheduled content.
 """
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pretalx_client.async_client import AsyncPretalxClient
     from pretalx_client.client import PretalxClient
 
 logger = logging.getLogger(__name__)
@@ -49,3 +51,35 @@ def fetch_talks_with_fallback(
             len(raw),
         )
     return raw
+
+
+async def fetch_talks_with_fallback_async(
+    client: AsyncPretalxClient,
+) -> list[dict[str, Any]]:
+    """Async variant of :func:`fetch_talks_with_fallback`.
+
+    On fallback the ``confirmed`` and ``accepted`` submissions are fetched
+    concurrently.
+
+    Args:
+        client: A :class:`~pretalx_client.async_client.AsyncPretalxClient` instance.
+
+    Returns:
+        A list of raw API dicts representing talks or submissions.
+    """
+    url = f"{client.api_url}talks/"
+    raw = await client._get_paginated_or_none(url)  # noqa: SLF001
+    if raw is None:
+        logger.info("talks/ endpoint returned 404, falling back to submissions/ with confirmed+accepted states")
+        confirmed, accepted = await asyncio.gather(
+            client._get_paginated(f"{client.api_url}submissions/?state=confirmed"),  # noqa: SLF001
+            client._get_paginated(f"{client.api_url}submissions/?state=accepted"),  # noqa: SLF001
+        )
+        raw = confirmed + accepted
+        logger.info(
+            "Fetched %d confirmed + %d accepted = %d submissions",
+            len(confirmed),
+            len(accepted),
+            len(raw),
+        )
+    return raw
@@ -0,0 +1,256 @@
+"""Async HTTP client for the Pretalx REST API.
+
+Provides :class:`AsyncPretalxClient`, the ``asyncio`` counterpart of
+:class:`~pretalx_client.client.PretalxClient`.  It exposes the same fetch
+methods as coroutines so independent requests (the ID-to-name mappings,
+talks and slots) can be awaited together with :func:`asyncio.gather`
+instead of one after another.
+"""
+
+import asyncio
+import logging
+from typing import Any, Self
+
+from pretalx_client.adapters.normalization import localized
+from pretalx_client.adapters.talks import fetch_talks_with_fallback_async
+from pretalx_client.generated.async_http_client import GeneratedAsyncPretalxClient
+from pretalx_client.models import (
+    PretalxSlot,
+    PretalxSpeaker,
+    PretalxTalk,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncPretalxClient:
+    """Async HTTP client for the Pretalx REST API.
+
+    Mirrors :class:`~pretalx_client.client.PretalxClient` method for method,
+    returning the same typed dataclasses.  Delegates low-level HTTP operations
+    to the auto-generated
+    :class:`~pretalx_client.generated.async_http_client.GeneratedAsyncPretalxClient`.
+
+    Args:
+        event_slug: The Pretalx event slug (e.g. ``"pycon-us-2026"``).
+        base_url: Root URL of the Pretalx instance. Defaults to
+            ``"https://pretalx.com"``.
+        api_token: Optional API token for authenticated access. When empty,
+            only publicly available data will be returned.
+
+    Requests share one pooled connection bound to the running event loop;
+    use the client as an async context manager (or await :meth:`aclose`)
+    to release it.
+
+    Example::
+
+        async with AsyncPretalxClient("pycon-us-2026", api_token="abc123") as client:
+            mappings = await client.fetch_mappings()
+            talks, slots = await asyncio.gather(
+                client.fetch_talks(**mappings),
+                client.fetch_schedule(rooms=mappings["rooms"]),
+            )
+    """
+
+    def __init__(
+        self,
+        event_slug: str,
+        *,
+        base_url: str = "https://pretalx.com",
+        api_token: str = "",
+    ) -> None:
+        """Initialize the client for a specific Pretalx event.
+
+        Args:
+            event_slug: The Pretalx event slug (e.g. ``"pycon-us-2026"``).
+            base_url: Root URL of the Pretalx instance.
+            api_token: Optional API token for authenticated access.
+        """
+        self.event_slug = event_slug
+        self.base_url = base_url.rstrip("/").removesuffix("/api")
+        self.api_token = api_token
+        self.api_url = f"{self.base_url}/api/events/{self.event_slug}/"
+
+        self._http = GeneratedAsyncPretalxClient(
+            base_url=self.base_url,
+            api_token=self.api_token,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections shared by this client's requests."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _path(self, url: str) -> str:
+        return url.removeprefix(self.base_url)
+
+    async def _get_paginated(self, url: str) -> list[dict[str, Any]]:
+        """Fetch all pages from a paginated Pretalx API endpoint.
+
+        Args:
+            url: The initial URL to fetch.
+
+        Returns:
+            A flat list of result dicts collected across all pages.
+
+        Raises:
+            RuntimeError: If the API returns an HTTP error status.
+        """
+        return await self._http._paginate(self._path(url))  # noqa: SLF001
+
+    async def _get_paginated_or_none(self, url: str) -> list[dict[str, Any]] | None:
+        """Fetch a paginated endpoint, returning ``None`` on HTTP 404.
+
+        Args:
+            url: The initial URL to fetch.
+
+        Returns:
+            A flat list of result dicts, or ``None`` if the endpoint returned
+            404.
+
+        Raises:
+            RuntimeError: If the API returns a non-404 HTTP error status.
+        """
+        return await self._http._paginate_or_none(self._path(url))  # noqa: SLF001
+
+    async def _fetch_id_name_mapping(self, endpoint: str) -> dict[int, str]:
+        """Fetch a lookup table from a Pretalx endpoint that returns ID+name objects.
+
+        Args:
+            endpoint: The endpoint path relative to the event API URL
+                (e.g. ``"rooms/"``).
+
+        Returns:
+            A dict mapping integer IDs to resolved display name strings.
+        """
+        items = await self._get_paginated(f"{self.api_url}{endpoint}")
+        mapping: dict[int, str] = {}
+        for item in items:
+            item_id = item.get("id")
+            if item_id is not None:
+                mapping[int(item_id)] = localized(item.get("name"))
+        return mapping
+
+    async def fetch_rooms(self) -> dict[int, str]:
+        """Fetch room ID-to-name mappings for the event.
+
+        Returns:
+            A dict mapping room IDs to display names.
+        """
+        return await self._fetch_id_name_mapping("rooms/")
+
+    async def fetch_rooms_full(self) -> list[dict[str, Any]]:
+        """Fetch full room data for the event.
+
+        Returns:
+            A list of raw room dicts from the Pretalx API.
+        """
+        return await self._http.rooms_list(event=self.event_slug)
+
+    async def fetch_submission_types(self) -> dict[int, str]:
+        """Fetch submission type ID-to-name mappings for the event.
+
+        Returns:
+            A dict mapping submission type IDs to display names.
+        """
+        return await self._fetch_id_name_mapping("submission-types/")
+
+    async def fetch_tracks(self) -> dict[int, str]:
+        """Fetch track ID-to-name mappings for the event.
+
+        Returns:
+            A dict mapping track IDs to display names.
+        """
+        return await self._fetch_id_name_mapping("tracks/")
+
+    async def fetch_tags(self) -> dict[int, str]:
+        """Fetch tag ID-to-name mappings for the event.
+
+        Returns:
+            A dict mapping tag IDs to display names.
+        """
+        return await self._fetch_id_name_mapping("tags/")
+
+    async def fetch_mappings(self) -> dict[str, dict[int, str]]:
+        """Fetch the room, submission type, track and tag mappings concurrently.
+
+        Returns:
+            A dict with ``rooms``, ``submission_types``, ``tracks`` and
+            ``tags`` keys, ready to pass to :meth:`fetch_talks` as keyword
+            arguments.
+
+        Raises:
+            RuntimeError: If any of the endpoints returns an HTTP error status.
+        """
+        rooms, submission_types, tracks, tags = await asyncio.gather(
+            self.fetch_rooms(),
+            self.fetch_submission_types(),
+            self.fetch_tracks(),
+            self.fetch_tags(),
+        )
+        return {"rooms": rooms, "submission_types": submission_types, "tracks": tracks, "tags": tags}
+
+    async def fetch_speakers(self) -> list[PretalxSpeaker]:
+        """Fetch all speakers for the event.
+
+        Returns:
+            A list of :class:`PretalxSpeaker` instances.
+        """
+        raw = await self._http.speakers_list(event=self.event_slug)
+        return [PretalxSpeaker.from_api(item) for item in raw]
+
+    async def fetch_talks(
+        self,
+        *,
+        submission_types: dict[int, str] | None = None,
+        tracks: dict[int, str] | None = None,
+        tags: dict[int, str] | None = None,
+        rooms: dict[int, str] | None = None,
+    ) -> list[PretalxTalk]:
+        """Fetch all confirmed/accepted talks for the event.
+
+        Uses the same ``/talks/`` to ``/submissions/`` fallback as
+        :meth:`PretalxClient.fetch_talks <pretalx_client.client.PretalxClient.fetch_talks>`.
+
+        Args:
+            submission_types: Optional ID-to-name mapping for submission types.
+            tracks: Optional ID-to-name mapping for tracks.
+            tags: Optional ID-to-name mapping for tags.
+            rooms: Optional ID-to-name mapping for rooms.
+
+        Returns:
+            A list of :class:`PretalxTalk` instances.
+        """
+        raw = await fetch_talks_with_fallback_async(self)
+        return [
+            PretalxTalk.from_api(
+                item,
+                submission_types=submission_types,
+                tracks=tracks,
+                tags=tags,
+                rooms=rooms,
+            )
+            for item in raw
+        ]
+
+    async def fetch_schedule(
+        self,
+        *,
+        rooms: dict[int, str] | None = None,
+    ) -> list[PretalxSlot]:
+        """Fetch schedule slots for the event from the paginated ``/slots/`` endpoint.
+
+        Args:
+            rooms: Optional ID-to-name mapping for resolving integer room IDs.
+
+        Returns:
+            A list of :class:`PretalxSlot` instances.
+        """
+        raw_slots = await self._http.slots_list(event=self.event_slug)
+        logger.debug("Fetched %d schedule slots", len(raw_slots))
+        return [PretalxSlot.from_api(slot, rooms=rooms) for slot in raw_slots]
@@ -10,10 +10,11 @@ the pytanis pattern with stdlib dataclasses instead of pydantic.
 """
 
 import logging
-from typing import Any
+from typing import Any, Self
 
 from pretalx_client.adapters.normalization import localized
 from pretalx_client.adapters.talks import fetch_talks_with_fallback
+from pretalx_client.conditional import PageValidators, pages_not_modified, record_validators
 from pretalx_client.generated.http_client import GeneratedPretalxClient
 from pretalx_client.models import (
     PretalxSlot,
@@ -42,12 +43,15 @@ class PretalxClient:
         api_token: Optional API token for authenticated access. When empty,
             only publicly available data will be returned.
 
+    Requests share one pooled connection; use the client as a context
+    manager (or call :meth:`close`) to release it.
+
     Example::
 
-        client = PretalxClient("pycon-us-2026", api_token="abc123")
-        speakers = client.fetch_speakers()
-        talks = client.fetch_talks()
-        schedule = client.fetch_schedule()
+        with PretalxClient("pycon-us-2026", api_token="abc123") as client:
+            speakers = client.fetch_speakers()
+            talks = client.fetch_talks()
+            schedule = client.fetch_schedule()
     """
 
     def __init__(
@@ -80,6 +84,16 @@ class PretalxClient:
             api_token=self.api_token,
         )
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections shared by this client's requests."""
+        self._http.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _get_paginated(self, url: str) -> list[dict[str, Any]]:
         """Fetch all pages from a paginated Pretalx API endpoint.
 
@@ -252,6 +266,57 @@ class PretalxClient:
             for item in raw
         ]
 
+    def fetch_speakers_if_modified(
+        self,
+        validators: PageValidators | None = None,
+    ) -> tuple[list[PretalxSpeaker] | None, PageValidators]:
+        """Fetch speakers unless every page is unchanged since the last fetch.
+
+        Args:
+            validators: The validators returned by the previous call, if any.
+
+        Returns:
+            A ``(speakers, validators)`` tuple.  ``speakers`` is ``None`` when
+            the server answered ``304 Not Modified`` for every page, in which
+            case ``validators`` is returned as given.
+        """
+        if pages_not_modified(self._http.client, validators):
+            return None, validators or {}
+        with record_validators(self._http.client) as recorded:
+            speakers = self.fetch_speakers()
+        return speakers, recorded
+
+    def fetch_talks_if_modified(
+        self,
+        validators: PageValidators | None = None,
+        *,
+        submission_types: dict[int, str] | None = None,
+        tracks: dict[int, str] | None = None,
+        tags: dict[int, str] | None = None,
+        rooms: dict[int, str] | None = None,
+    ) -> tuple[list[PretalxTalk] | None, PageValidators]:
+        """Fetch talks unless every page is unchanged since the last fetch.
+
+        Covers whichever endpoints :meth:`fetch_talks` read last time, so the
+        ``/submissions/`` fallback is revalidated too.
+
+        Args:
+            validators: The validators returned by the previous call, if any.
+            submission_types: Optional ID-to-name mapping for submission types.
+            tracks: Optional ID-to-name mapping for tracks.
+            tags: Optional ID-to-name mapping for tags.
+            rooms: Optional ID-to-name mapping for rooms.
+
+        Returns:
+            A ``(talks, validators)`` tuple.  ``talks`` is ``None`` when the
+            server answered ``304 Not Modified`` for every page.
+        """
+        if pages_not_modified(self._http.client, validators):
+            return None, validators or {}
+        with record_validators(self._http.client) as recorded:
+            talks = self.fetch_talks(submission_types=submission_types, tracks=tracks, tags=tags, rooms=rooms)
+        return talks, recorded
+
     def fetch_submissions(
         self,
         *,
@@ -307,8 +372,8 @@ class PretalxClient:
         Returns:
             A list of raw event dicts from the Pretalx API.
         """
-        http = GeneratedPretalxClient(base_url=base_url, api_token=api_token)
-        return http._paginate("/api/events/")  # noqa: SLF001
+        with GeneratedPretalxClient(base_url=base_url, api_token=api_token) as http:
+            return http._paginate("/api/events/")  # noqa: SLF001
 
     def fetch_schedule(
         self,
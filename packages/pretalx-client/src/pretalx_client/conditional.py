@@ -0,0 +1,103 @@
+"""Conditional-request helpers for incremental Pretalx fetches.
+
+A paginated endpoint spans several URLs, and an HTTP validator (``ETag`` or
+``Last-Modified``) only describes the page it came with.  A collection is
+therefore treated as unchanged only when *every* page it was last read from
+answers ``304 Not Modified``; the last of those pages had no ``next`` link,
+so an unchanged set of pages also means no page was added.
+
+:data:`PageValidators` maps each page URL to the validators it was served
+with.  It is plain JSON so callers can persist it between runs.
+"""
+
+import http
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+type PageValidators = dict[str, dict[str, str]]
+
+
+def _conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def pages_not_modified(client: httpx.Client, validators: PageValidators | None) -> bool:
+    """Revalidate previously fetched pages with conditional ``GET`` requests.
+
+    Args:
+        client: The HTTP client to send the requests with.
+        validators: Validators recorded by :func:`record_validators` on the
+            previous fetch.
+
+    Returns:
+        ``True`` when validators were given and every page answered
+        ``304 Not Modified``; ``False`` as soon as one page did not.
+
+    Raises:
+        RuntimeError: On a connection failure.
+    """
+    if not validators:
+        return False
+    for url, page_validators in validators.items():
+        try:
+            response = client.get(url, headers=_conditional_headers(page_validators))
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        if response.status_code != http.HTTPStatus.NOT_MODIFIED:
+            return False
+    return True
+
+
+@contextmanager
+def record_validators(client: httpx.Client) -> Iterator[PageValidators]:
+    """Collect the validators of every successful ``GET`` sent through ``client``.
+
+    Hooks into the client's ``response`` event for the duration of the block.
+    The yielded mapping is emptied on exit if any page came without an
+    ``ETag`` or ``Last-Modified`` header, since such an endpoint cannot be
+    revalidated as a whole.
+
+    Args:
+        client: The pooled HTTP client the fetch will use.
+
+    Yields:
+        The mapping of page URL to validators, filled in as pages arrive.
+    """
+    recorded: PageValidators = {}
+    unsupported: list[str] = []
+
+    def hook(response: httpx.Response) -> None:
+        if response.request.method != "GET" or response.status_code != http.HTTPStatus.OK:
+            return
+        page_validators = {
+            key: value
+            for key, value in (
+                ("etag", response.headers.get("ETag", "")),
+                ("last_modified", response.headers.get("Last-Modified", "")),
+            )
+            if value
+        }
+        if page_validators:
+            recorded[str(response.request.url)] = page_validators
+        else:
+            unsupported.append(str(response.request.url))
+
+    hooks = client.event_hooks["response"]
+    hooks.append(hook)
+    try:
+        yield recorded
+    finally:
+        hooks.remove(hook)
+        if unsupported:
+            recorded.clear()
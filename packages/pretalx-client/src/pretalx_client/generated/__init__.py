@@ -1,10 +1,12 @@
 """Generated Pretalx API models and HTTP client from OpenAPI schema.
 
 Re-exports the key generated types used by the handwritten adapter layer
-in :mod:`pretalx_client.models`, plus the generated HTTP client class.
+in :mod:`pretalx_client.models`, plus the generated sync and async HTTP
+client classes.
 Import from here rather than reaching into sub-modules directly.
 """
 
+from pretalx_client.generated.async_http_client import GeneratedAsyncPretalxClient
 from pretalx_client.generated.http_client import GeneratedPretalxClient
 from pretalx_client.generated.models import (
     Room as GeneratedRoom,
@@ -26,6 +28,7 @@ from pretalx_client.generated.models import (
 )
 
 __all__ = [
+    "GeneratedAsyncPretalxClient",
     "GeneratedPretalxClient",
     "GeneratedRoom",
     "GeneratedSpeaker",
@@ -0,0 +1,1401 @@
+"""Auto-generated async HTTP client for the Pretalx REST API.
+
+Generated by ``scripts/pretalx/generate_http_client.py`` from the OpenAPI
+schema at ``schemas/pretalx/schema.yml``.  Do not edit by hand.
+"""
+
+import asyncio
+import http
+import logging
+from typing import Any, Self
+
+import httpx
+
+from pretalx_client.generated.http_client import DEFAULT_LIMITS, HTTP2_AVAILABLE, remaining_page_params
+
+logger = logging.getLogger(__name__)
+
+
+class GeneratedAsyncPretalxClient:
+    """Async twin of :class:`~pretalx_client.generated.http_client.GeneratedPretalxClient`.
+
+    Same endpoint methods and arguments, built on one pooled
+    ``httpx.AsyncClient`` that is created on first use.  Close it with
+    :meth:`aclose` or ``async with``.  The client must be used from a single
+    event loop.
+
+    Args:
+        base_url: Root URL of the Pretalx instance (e.g. ``"https://pretalx.com"``).
+        api_token: Optional API token for authenticated access.
+        timeout: HTTP request timeout in seconds.
+        limits: Connection-pool limits (defaults to ``DEFAULT_LIMITS``).
+        http2: Negotiate HTTP/2.  Defaults to ``True`` when ``h2`` is installed.
+        max_concurrent_pages: How many pages of a paginated endpoint to fetch
+            at once when the first page reports ``count``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://pretalx.com",
+        api_token: str = "",
+        timeout: int = 30,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        max_concurrent_pages: int = 4,
+    ) -> None:
+        normalized = base_url.rstrip("/").removesuffix("/api")
+        self.base_url = normalized
+        self.api_token = api_token
+        self.timeout = timeout
+        self.headers: dict[str, str] = {"Accept": "application/json"}
+        if api_token:
+            self.headers["Authorization"] = f"Token {api_token}"
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared, pooled ``httpx.AsyncClient``, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.headers,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections.  The client reconnects on next use."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Execute a single HTTP request and return the JSON response.
+
+        Raises:
+            RuntimeError: On HTTP error or connection failure.
+        """
+        url = f"{self.base_url}{path}"
+        try:
+            response = await self.client.request(method, url, params=params, json=json_body)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        if response.status_code == http.HTTPStatus.NO_CONTENT:
+            return {}
+        return response.json()
+
+    async def _request_or_none(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Execute a request, returning ``None`` on HTTP 404."""
+        url = f"{self.base_url}{path}"
+        try:
+            response = await self.client.request(method, url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        return response.json()
+
+    async def _get_page(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> Any:
+        """Fetch one page, returning ``None`` on HTTP 404 when ``missing_ok``."""
+        logger.debug("Fetching %s", url)
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if missing_ok and exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                logger.debug("Got 404 for %s, endpoint unavailable", url)
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        return response.json()
+
+    async def _collect_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch every page of a paginated endpoint, concurrently when possible."""
+        url = f"{self.base_url}{path}"
+        data = await self._get_page(url, params, missing_ok=missing_ok)
+        if data is None:
+            return None
+        if isinstance(data, list):
+            return data
+
+        results: list[dict[str, Any]] = list(data.get("results", []))
+        page_params = remaining_page_params(data, params) if self.max_concurrent_pages > 1 else []
+        if page_params:
+            semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+            async def fetch(page_param: dict[str, Any]) -> Any:
+                async with semaphore:
+                    return await self._get_page(url, page_param, missing_ok=missing_ok)
+
+            pages = await asyncio.gather(*(fetch(page_param) for page_param in page_params))
+            if any(page is None for page in pages):
+                return None
+            for page in pages:
+                results.extend(page.get("results", []))
+            data = pages[-1]
+
+        # Subsequent pages use the full ``next`` URL, which already includes params.
+        next_url: str | None = data.get("next")
+        while next_url is not None:
+            data = await self._get_page(next_url, None, missing_ok=missing_ok)
+            if data is None:
+                return None
+            if isinstance(data, list):
+                results.extend(data)
+                break
+            results.extend(data.get("results", []))
+            next_url = data.get("next")
+
+        logger.debug("Collected %d results from paginated endpoint", len(results))
+        return results
+
+    async def _paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages from a paginated endpoint."""
+        return await self._collect_pages(path, params, missing_ok=False) or []
+
+    async def _paginate_or_none(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch all pages, returning ``None`` on HTTP 404."""
+        return await self._collect_pages(path, params, missing_ok=True)
+    # ===================================================================
+    # access-codes
+    # ===================================================================
+
+    async def access_codes_list(self, event: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/access-codes/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def access_codes_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/access-codes/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def access_codes_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/access-codes/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def access_codes_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/access-codes/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def access_codes_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/access-codes/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def access_codes_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/access-codes/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    # ===================================================================
+    # answers
+    # ===================================================================
+
+    async def answers_list(self, event: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, person: str | None = None, q: str | None = None, question: str | None = None, review: str | None = None, submission: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if person is not None:
+            params["person"] = person
+        if q is not None:
+            params["q"] = q
+        if question is not None:
+            params["question"] = question
+        if review is not None:
+            params["review"] = review
+        if submission is not None:
+            params["submission"] = submission
+        path = f"/api/events/{event}/answers/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def answers_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/answers/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def answers_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/answers/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def answers_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/answers/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def answers_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/answers/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def answers_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/answers/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def answers_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, person: str | None = None, q: str | None = None, question: str | None = None, review: str | None = None, submission: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if person is not None:
+            params["person"] = person
+        if q is not None:
+            params["q"] = q
+        if question is not None:
+            params["question"] = question
+        if review is not None:
+            params["review"] = review
+        if submission is not None:
+            params["submission"] = submission
+        path = f"/api/events/{event}/answers/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # events
+    # ===================================================================
+
+    async def api_events_list(self, *, is_public: bool | None = None, o: str | None = None, q: str | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if is_public is not None:
+            params["is_public"] = is_public
+        if o is not None:
+            params["o"] = o
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/"
+        return await self._request("GET", path, params=params or None)
+
+    async def root_retrieve(self, event: str) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/"
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # feedback
+    # ===================================================================
+
+    async def feedback_list(self, event: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, submission: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if submission is not None:
+            params["submission"] = submission
+        path = f"/api/events/{event}/feedback/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def feedback_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/feedback/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def feedback_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/feedback/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def feedback_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/feedback/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    # ===================================================================
+    # file-uploads
+    # ===================================================================
+
+    async def file_upload(self) -> dict[str, Any]:
+        params = None
+        path = f"/api/upload/"
+        return await self._request("POST", path, params=params or None)
+
+    # ===================================================================
+    # mail-templates
+    # ===================================================================
+
+    async def mail_templates_list(self, event: str, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/mail-templates/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def mail_templates_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/mail-templates/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def mail_templates_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/mail-templates/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def mail_templates_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/mail-templates/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def mail_templates_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/mail-templates/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def mail_templates_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/mail-templates/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def mail_templates_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/mail-templates/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # question-options
+    # ===================================================================
+
+    async def question_options_list(self, event: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, question: int | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if question is not None:
+            params["question"] = question
+        path = f"/api/events/{event}/question-options/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def question_options_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/question-options/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def question_options_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/question-options/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def question_options_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/question-options/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def question_options_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/question-options/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def question_options_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/question-options/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def question_options_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, question: int | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if question is not None:
+            params["question"] = question
+        path = f"/api/events/{event}/question-options/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # questions
+    # ===================================================================
+
+    async def questions_list(self, event: str, *, expand: list[str] | None = None, is_public: bool | None = None, is_visible_to_reviewers: bool | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, target: str | None = None, variant: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if is_public is not None:
+            params["is_public"] = is_public
+        if is_visible_to_reviewers is not None:
+            params["is_visible_to_reviewers"] = is_visible_to_reviewers
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if target is not None:
+            params["target"] = target
+        if variant is not None:
+            params["variant"] = variant
+        path = f"/api/events/{event}/questions/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def questions_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/questions/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def questions_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/questions/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def questions_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/questions/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def questions_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/questions/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def questions_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/questions/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def questions_icon_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/questions/{id}/icon/"
+        return await self._request("GET", path, params=params or None)
+
+    async def questions_log_list(self, event: str, id: int, *, is_public: bool | None = None, is_visible_to_reviewers: bool | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, target: str | None = None, variant: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if is_public is not None:
+            params["is_public"] = is_public
+        if is_visible_to_reviewers is not None:
+            params["is_visible_to_reviewers"] = is_visible_to_reviewers
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if target is not None:
+            params["target"] = target
+        if variant is not None:
+            params["variant"] = variant
+        path = f"/api/events/{event}/questions/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # reviews
+    # ===================================================================
+
+    async def reviews_list(self, event: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, speaker: str | None = None, submission: str | None = None, submission__content_locale: str | None = None, submission__pending_state: list[str] | None = None, submission__state: list[str] | None = None, submission__submission_type: int | None = None, submission__track: int | None = None, user: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if speaker is not None:
+            params["speaker"] = speaker
+        if submission is not None:
+            params["submission"] = submission
+        if submission__content_locale is not None:
+            params["submission__content_locale"] = submission__content_locale
+        if submission__pending_state is not None:
+            params["submission__pending_state"] = submission__pending_state
+        if submission__state is not None:
+            params["submission__state"] = submission__state
+        if submission__submission_type is not None:
+            params["submission__submission_type"] = submission__submission_type
+        if submission__track is not None:
+            params["submission__track"] = submission__track
+        if user is not None:
+            params["user"] = user
+        path = f"/api/events/{event}/reviews/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def reviews_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/reviews/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def reviews_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/reviews/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def reviews_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/reviews/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def reviews_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/reviews/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def reviews_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/reviews/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def reviews_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, speaker: str | None = None, submission: str | None = None, submission__content_locale: str | None = None, submission__pending_state: list[str] | None = None, submission__state: list[str] | None = None, submission__submission_type: int | None = None, submission__track: int | None = None, user: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if speaker is not None:
+            params["speaker"] = speaker
+        if submission is not None:
+            params["submission"] = submission
+        if submission__content_locale is not None:
+            params["submission__content_locale"] = submission__content_locale
+        if submission__pending_state is not None:
+            params["submission__pending_state"] = submission__pending_state
+        if submission__state is not None:
+            params["submission__state"] = submission__state
+        if submission__submission_type is not None:
+            params["submission__submission_type"] = submission__submission_type
+        if submission__track is not None:
+            params["submission__track"] = submission__track
+        if user is not None:
+            params["user"] = user
+        path = f"/api/events/{event}/reviews/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # rooms
+    # ===================================================================
+
+    async def rooms_list(self, event: str, *, limit: int | None = None, o: str | None = None, offset: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if o is not None:
+            params["o"] = o
+        if offset is not None:
+            params["offset"] = offset
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/rooms/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def rooms_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/rooms/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def rooms_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/rooms/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def rooms_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/rooms/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def rooms_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/rooms/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def rooms_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/rooms/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def rooms_log_list(self, event: str, id: int, *, limit: int | None = None, o: str | None = None, offset: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if o is not None:
+            params["o"] = o
+        if offset is not None:
+            params["offset"] = offset
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/rooms/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # root
+    # ===================================================================
+
+    async def api_retrieve(self) -> dict[str, Any]:
+        params = None
+        path = f"/api/"
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # schedules
+    # ===================================================================
+
+    async def schedules_list(self, event: str, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/schedules/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def schedules_by_version_retrieve(self, event: str, *, latest: bool | None = None, version: str | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if latest is not None:
+            params["latest"] = latest
+        if version is not None:
+            params["version"] = version
+        path = f"/api/events/{event}/schedules/by-version/"
+        return await self._request("GET", path, params=params or None)
+
+    async def schedules_release_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/schedules/release/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def schedules_retrieve(self, event: str, id: str, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/schedules/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def schedules_exporters_retrieve(self, event: str, id: str, name: str, *, lang: str | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if lang is not None:
+            params["lang"] = lang
+        path = f"/api/events/{event}/schedules/{id}/exporters/{name}/"
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # slots
+    # ===================================================================
+
+    async def slots_list(self, event: str, *, expand: list[str] | None = None, is_visible: bool | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, room: int | None = None, schedule: int | None = None, schedule_version: str | None = None, speaker: str | None = None, submission: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if is_visible is not None:
+            params["is_visible"] = is_visible
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        if room is not None:
+            params["room"] = room
+        if schedule is not None:
+            params["schedule"] = schedule
+        if schedule_version is not None:
+            params["schedule_version"] = schedule_version
+        if speaker is not None:
+            params["speaker"] = speaker
+        if submission is not None:
+            params["submission"] = submission
+        path = f"/api/events/{event}/slots/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def slots_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/slots/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def slots_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/slots/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def slots_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/slots/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def slots_ical_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/slots/{id}/ical/"
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # speaker-information
+    # ===================================================================
+
+    async def speaker_information_list(self, event: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/speaker-information/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def speaker_information_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/speaker-information/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def speaker_information_retrieve(self, event: str, id: int, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/speaker-information/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def speaker_information_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/speaker-information/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def speaker_information_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/speaker-information/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def speaker_information_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/speaker-information/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def speaker_information_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/speaker-information/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # speakers
+    # ===================================================================
+
+    async def speakers_list(self, event: str, *, expand: list[str] | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/speakers/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def speakers_retrieve(self, event: str, user__code__iexact: str, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/speakers/{user__code__iexact}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def speakers_update(self, event: str, user__code__iexact: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/speakers/{user__code__iexact}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def speakers_partial_update(self, event: str, user__code__iexact: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/speakers/{user__code__iexact}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    # ===================================================================
+    # submission-types
+    # ===================================================================
+
+    async def submission_types_list(self, event: str, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/submission-types/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def submission_types_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submission-types/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submission_types_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submission-types/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def submission_types_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submission-types/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def submission_types_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submission-types/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def submission_types_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/submission-types/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def submission_types_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/submission-types/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # submissions
+    # ===================================================================
+
+    async def submissions_list(self, event: str, *, content_locale: str | None = None, expand: list[str] | None = None, is_featured: bool | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, pending_state: list[str] | None = None, q: str | None = None, state: list[str] | None = None, submission_type: int | None = None, track: int | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if content_locale is not None:
+            params["content_locale"] = content_locale
+        if expand is not None:
+            params["expand"] = expand
+        if is_featured is not None:
+            params["is_featured"] = is_featured
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if pending_state is not None:
+            params["pending_state"] = pending_state
+        if q is not None:
+            params["q"] = q
+        if state is not None:
+            params["state"] = state
+        if submission_type is not None:
+            params["submission_type"] = submission_type
+        if track is not None:
+            params["track"] = track
+        path = f"/api/events/{event}/submissions/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def submissions_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_favourites_retrieve(self, event: str) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/favourites/"
+        return await self._request("GET", path, params=params or None)
+
+    async def submissions_retrieve(self, code__iexact: str, event: str, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/events/{event}/submissions/{code__iexact}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def submissions_update(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def submissions_partial_update(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def submissions_destroy(self, code__iexact: str, event: str) -> None:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def submissions_accept_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/accept/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_add_speaker_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/add-speaker/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_cancel_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/cancel/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_confirm_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/confirm/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_invitations_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/invitations/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_invitations_destroy(self, code__iexact: str, event: str, invitation_id: str) -> None:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/invitations/{invitation_id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def submissions_log_list(self, code__iexact: str, event: str, *, content_locale: str | None = None, is_featured: bool | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, pending_state: list[str] | None = None, q: str | None = None, state: list[str] | None = None, submission_type: int | None = None, track: int | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if content_locale is not None:
+            params["content_locale"] = content_locale
+        if is_featured is not None:
+            params["is_featured"] = is_featured
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if pending_state is not None:
+            params["pending_state"] = pending_state
+        if q is not None:
+            params["q"] = q
+        if state is not None:
+            params["state"] = state
+        if submission_type is not None:
+            params["submission_type"] = submission_type
+        if track is not None:
+            params["track"] = track
+        path = f"/api/events/{event}/submissions/{code__iexact}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def submissions_make_submitted_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/make-submitted/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_reject_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/reject/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_remove_speaker_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/remove-speaker/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_resources_create(self, code__iexact: str, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/resources/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def submissions_resources_destroy(self, code__iexact: str, event: str, resource_id: str) -> None:
+        params = None
+        path = f"/api/events/{event}/submissions/{code__iexact}/resources/{resource_id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def submissions_favourite_create(self, code: str, event: str) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/submissions/{code}/favourite/"
+        return await self._request("POST", path, params=params or None)
+
+    async def submissions_favourite_destroy(self, code: str, event: str) -> None:
+        params = None
+        path = f"/api/events/{event}/submissions/{code}/favourite/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    # ===================================================================
+    # tags
+    # ===================================================================
+
+    async def tags_list(self, event: str, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/tags/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def tags_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tags/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def tags_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tags/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def tags_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tags/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def tags_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tags/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def tags_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/tags/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def tags_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/tags/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    # ===================================================================
+    # teams
+    # ===================================================================
+
+    async def api_organisers_teams_list(self, organiser: str, *, expand: list[str] | None = None, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/organisers/{organiser}/teams/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def api_organisers_teams_create(self, organiser: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def api_organisers_teams_retrieve(self, id: int, organiser: str, *, expand: list[str] | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if expand is not None:
+            params["expand"] = expand
+        path = f"/api/organisers/{organiser}/teams/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def api_organisers_teams_update(self, id: int, organiser: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def api_organisers_teams_partial_update(self, id: int, organiser: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def api_organisers_teams_destroy(self, id: int, organiser: str) -> None:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def api_organisers_teams_invite_create(self, id: int, organiser: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/{id}/invite/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def api_organisers_teams_invites_destroy(self, id: int, invite_id: int, organiser: str) -> None:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/{id}/invites/{invite_id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def api_organisers_teams_remove_member_create(self, id: int, organiser: str, *, body: dict[str, Any] | None = None) -> None:
+        params = None
+        path = f"/api/organisers/{organiser}/teams/{id}/remove_member/"
+        await self._request("POST", path, params=params)
+        return None
+
+    # ===================================================================
+    # tracks
+    # ===================================================================
+
+    async def tracks_list(self, event: str, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/tracks/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
+    async def tracks_create(self, event: str, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tracks/"
+        return await self._request("POST", path, params=params or None, json_body=body)
+
+    async def tracks_retrieve(self, event: str, id: int) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tracks/{id}/"
+        return await self._request("GET", path, params=params or None)
+
+    async def tracks_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tracks/{id}/"
+        return await self._request("PUT", path, params=params or None, json_body=body)
+
+    async def tracks_partial_update(self, event: str, id: int, *, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = None
+        path = f"/api/events/{event}/tracks/{id}/"
+        return await self._request("PATCH", path, params=params or None, json_body=body)
+
+    async def tracks_destroy(self, event: str, id: int) -> None:
+        params = None
+        path = f"/api/events/{event}/tracks/{id}/"
+        await self._request("DELETE", path, params=params)
+        return None
+
+    async def tracks_log_list(self, event: str, id: int, *, o: str | None = None, page: int | None = None, page_size: int | None = None, q: str | None = None, auto_paginate: bool = True) -> list[dict[str, Any]]:
+        params: dict[str, Any] = {}
+        if o is not None:
+            params["o"] = o
+        if page is not None:
+            params["page"] = page
+        if page_size is not None:
+            params["page_size"] = page_size
+        if q is not None:
+            params["q"] = q
+        path = f"/api/events/{event}/tracks/{id}/log/"
+        if auto_paginate:
+            return await self._paginate(path, params=params or None)
+        return await self._request("GET", path, params=params or None)
+
@@ -6,12 +6,40 @@ schema at ``schemas/pretalx/schema.yml``.  Do not edit by hand.
 
 import http
 import logging
-from typing import Any
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from importlib.util import find_spec
+from typing import Any, Self
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+HTTP2_AVAILABLE = find_spec("h2") is not None
+DEFAULT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+
+def remaining_page_params(first_page: dict[str, Any], params: dict[str, Any] | None) -> list[dict[str, Any]]:
+    """Return query params for every page after ``first_page``, if they can be computed.
+
+    Only applies to page-number pagination (``next`` carries ``page=``) when
+    the first page reports the total ``count``; otherwise returns ``[]`` and
+    the caller follows ``next`` links instead.
+    """
+    count = first_page.get("count")
+    results = first_page.get("results") or []
+    next_url = first_page.get("next")
+    if not isinstance(count, int) or not results or not next_url:
+        return []
+    if "page" not in httpx.URL(next_url).params:
+        return []
+    page_size = len(results)
+    first = int((params or {}).get("page", 1))
+    last = first + math.ceil(count / page_size) - 1
+    return [{**(params or {}), "page": page, "page_size": page_size} for page in range(first + 1, last + 1)]
+
 
 class GeneratedPretalxClient:
     """Low-level HTTP client with one method per Pretalx API endpoint.
@@ -20,10 +48,21 @@ class GeneratedPretalxClient:
     The higher-level :class:`~pretalx_client.client.PretalxClient` wraps
     these into typed models.
 
+    Requests share one pooled ``httpx.Client`` that is created on first use
+    and kept open, so connections (and TLS sessions) are reused across
+    endpoints.  Call :meth:`close` or use the client as a context manager to
+    release them.
+
     Args:
         base_url: Root URL of the Pretalx instance (e.g. ``"https://pretalx.com"``).
         api_token: Optional API token for authenticated access.
         timeout: HTTP request timeout in seconds.
+        limits: Connection-pool limits (defaults to :data:`DEFAULT_LIMITS`).
+        http2: Negotiate HTTP/2.  Defaults to ``True`` when the ``h2``
+            package is installed (``pip install pretalx-client[http2]``).
+        max_concurrent_pages: How many pages of a paginated endpoint to fetch
+            in parallel once the first page reports ``count``.  ``1`` follows
+            ``next`` links one page at a time.
     """
 
     def __init__(
@@ -31,6 +70,10 @@ class GeneratedPretalxClient:
         base_url: str = "https://pretalx.com",
         api_token: str = "",
         timeout: int = 30,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        max_concurrent_pages: int = 4,
     ) -> None:
         normalized = base_url.rstrip("/").removesuffix("/api")
         self.base_url = normalized
@@ -39,6 +82,40 @@ class GeneratedPretalxClient:
         self.headers: dict[str, str] = {"Accept": "application/json"}
         if api_token:
             self.headers["Authorization"] = f"Token {api_token}"
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._exit_stack = ExitStack()
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared, pooled ``httpx.Client``, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._exit_stack.enter_context(
+                        httpx.Client(
+                            timeout=self.timeout,
+                            headers=self.headers,
+                            limits=self.limits,
+                            http2=self.http2,
+                        )
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled connections.  The client reconnects on next use."""
+        with self._client_lock:
+            self._client = None
+            self._exit_stack.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _request(
         self,
@@ -54,16 +131,15 @@ class GeneratedPretalxClient:
             RuntimeError: On HTTP error or connection failure.
         """
         url = f"{self.base_url}{path}"
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            try:
-                response = client.request(method, url, params=params, json=json_body)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                raise RuntimeError(msg) from exc
-            except httpx.RequestError as exc:
-                msg = f"Pretalx API connection error for URL {url}: {exc}"
-                raise RuntimeError(msg) from exc
+        try:
+            response = self.client.request(method, url, params=params, json=json_body)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
         if response.status_code == http.HTTPStatus.NO_CONTENT:
             return {}
         return response.json()
@@ -77,95 +153,105 @@ class GeneratedPretalxClient:
     ) -> dict[str, Any] | None:
         """Execute a request, returning ``None`` on HTTP 404."""
         url = f"{self.base_url}{path}"
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            try:
-                response = client.request(method, url, params=params)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
-                    return None
-                msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                raise RuntimeError(msg) from exc
-            except httpx.RequestError as exc:
-                msg = f"Pretalx API connection error for URL {url}: {exc}"
-                raise RuntimeError(msg) from exc
+        try:
+            response = self.client.request(method, url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
         return response.json()
 
-    def _paginate(
+    def _get_page(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> Any:
+        """Fetch one page, returning ``None`` on HTTP 404 when ``missing_ok``."""
+        logger.debug("Fetching %s", url)
+        try:
+            response = self.client.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if missing_ok and exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                logger.debug("Got 404 for %s, endpoint unavailable", url)
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        return response.json()
+
+    def _collect_pages(
         self,
         path: str,
-        params: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
-        """Fetch all pages from a paginated endpoint.
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch every page of a paginated endpoint.
 
-        Follows ``next`` links until exhausted.
+        When the first page reports ``count``, the remaining pages are
+        requested concurrently by page number; any page added after the count
+        was taken is then picked up by following ``next``.  Otherwise ``next``
+        links are followed one page at a time.
         """
-        url: str | None = f"{self.base_url}{path}"
-        results: list[dict[str, Any]] = []
-
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            while url is not None:
-                logger.debug("Fetching %s", url)
-                try:
-                    response = client.get(url, params=params)
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                    raise RuntimeError(msg) from exc
-                except httpx.RequestError as exc:
-                    msg = f"Pretalx API connection error for URL {url}: {exc}"
-                    raise RuntimeError(msg) from exc
-
-                data = response.json()
-                if isinstance(data, list):
-                    results.extend(data)
-                    url = None
-                else:
-                    results.extend(data.get("results", []))
-                    url = data.get("next")
-                # Only pass params on the first request; subsequent pages
-                # use the full ``next`` URL which already includes params.
-                params = None
+        url = f"{self.base_url}{path}"
+        data = self._get_page(url, params, missing_ok=missing_ok)
+        if data is None:
+            return None
+        if isinstance(data, list):
+            return data
+
+        results: list[dict[str, Any]] = list(data.get("results", []))
+        page_params = remaining_page_params(data, params) if self.max_concurrent_pages > 1 else []
+        if page_params:
+            workers = min(self.max_concurrent_pages, len(page_params))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pretalx-page") as pool:
+                pages = list(pool.map(lambda p: self._get_page(url, p, missing_ok=missing_ok), page_params))
+            if any(page is None for page in pages):
+                return None
+            for page in pages:
+                results.extend(page.get("results", []))
+            data = pages[-1]
+
+        # Subsequent pages use the full ``next`` URL, which already includes params.
+        next_url: str | None = data.get("next")
+        while next_url is not None:
+            data = self._get_page(next_url, None, missing_ok=missing_ok)
+            if data is None:
+                return None
+            if isinstance(data, list):
+                results.extend(data)
+                break
+            results.extend(data.get("results", []))
+            next_url = data.get("next")
 
         logger.debug("Collected %d results from paginated endpoint", len(results))
         return results
 
+    def _paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages from a paginated endpoint."""
+        return self._collect_pages(path, params, missing_ok=False) or []
+
     def _paginate_or_none(
         self,
         path: str,
         params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]] | None:
         """Fetch all pages, returning ``None`` on HTTP 404."""
-        url: str | None = f"{self.base_url}{path}"
-        results: list[dict[str, Any]] = []
-
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            while url is not None:
-                logger.debug("Fetching %s", url)
-                try:
-                    response = client.get(url, params=params)
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
-                        logger.debug("Got 404 for %s, endpoint unavailable", url)
-                        return None
-                    msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                    raise RuntimeError(msg) from exc
-                except httpx.RequestError as exc:
-                    msg = f"Pretalx API connection error for URL {url}: {exc}"
-                    raise RuntimeError(msg) from exc
-
-                data = response.json()
-                if isinstance(data, list):
-                    results.extend(data)
-                    url = None
-                else:
-                    results.extend(data.get("results", []))
-                    url = data.get("next")
-                params = None
-
-        logger.debug("Collected %d results from paginated endpoint", len(results))
-        return results
+        return self._collect_pages(path, params, missing_ok=True)
     # ===================================================================
     # access-codes
     # ===================================================================
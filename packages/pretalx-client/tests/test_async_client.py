@@ -0,0 +1,125 @@
+"""Tests for pretalx_client.async_client -- AsyncPretalxClient."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from pretalx_client.async_client import AsyncPretalxClient
+from pretalx_client.models import PretalxSlot, PretalxSpeaker, PretalxTalk
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+def _routes(monkeypatch, routes):
+    """Serve ``routes`` (path -> JSON list or status code) through an ``httpx.MockTransport``."""
+    requested = []
+
+    def handler(request):
+        key = request.url.path
+        if request.url.query:
+            key = f"{key}?{request.url.query.decode()}"
+        requested.append(key)
+        body = routes.get(key, 404)
+        if isinstance(body, int):
+            return httpx.Response(body, json={})
+        return httpx.Response(200, json={"count": len(body), "next": None, "results": body})
+
+    monkeypatch.setattr(
+        "pretalx_client.generated.async_http_client.httpx.AsyncClient",
+        lambda **kwargs: _RealAsyncClient(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return requested
+
+
+def _run(coro_fn):
+    async def run():
+        async with AsyncPretalxClient("evt", base_url="https://pretalx.example.com/api/") as client:
+            return await coro_fn(client)
+
+    return asyncio.run(run())
+
+
+class TestAsyncPretalxClient:
+    """Tests for the async facade's fetch methods."""
+
+    @pytest.mark.unit
+    def test_init_normalizes_base_url(self):
+        client = AsyncPretalxClient("evt", base_url="https://pretalx.example.com/api/")
+
+        assert client.base_url == "https://pretalx.example.com"
+        assert client.api_url == "https://pretalx.example.com/api/events/evt/"
+
+    @pytest.mark.unit
+    def test_fetch_mappings_gathers_all_lookups(self, monkeypatch):
+        requested = _routes(
+            monkeypatch,
+            {
+                "/api/events/evt/rooms/": [{"id": 1, "name": {"en": "Hall A"}}],
+                "/api/events/evt/submission-types/": [{"id": 2, "name": "Talk"}],
+                "/api/events/evt/tracks/": [{"id": 3, "name": "Web"}],
+                "/api/events/evt/tags/": [{"id": 4, "name": "AI"}],
+            },
+        )
+
+        mappings = _run(lambda client: client.fetch_mappings())
+
+        assert mappings == {
+            "rooms": {1: "Hall A"},
+            "submission_types": {2: "Talk"},
+            "tracks": {3: "Web"},
+            "tags": {4: "AI"},
+        }
+        assert len(requested) == 4
+
+    @pytest.mark.unit
+    def test_fetch_speakers_and_schedule(self, monkeypatch):
+        _routes(
+            monkeypatch,
+            {
+                "/api/events/evt/speakers/": [{"code": "SPK1", "name": "Alice", "submissions": ["T1"]}],
+                "/api/events/evt/slots/": [
+                    {"submission": "T1", "room": 1, "start": "2027-05-01T10:00:00Z", "end": "2027-05-01T10:30:00Z"}
+                ],
+            },
+        )
+
+        async def fetch(client):
+            return await asyncio.gather(client.fetch_speakers(), client.fetch_schedule(rooms={1: "Hall A"}))
+
+        speakers, slots = _run(fetch)
+
+        assert speakers == [PretalxSpeaker.from_api({"code": "SPK1", "name": "Alice", "submissions": ["T1"]})]
+        assert isinstance(slots[0], PretalxSlot)
+        assert slots[0].room == "Hall A"
+
+    @pytest.mark.unit
+    def test_fetch_talks_falls_back_to_submissions(self, monkeypatch):
+        requested = _routes(
+            monkeypatch,
+            {
+                "/api/events/evt/submissions/?state=confirmed": [{"code": "C1", "title": "Confirmed"}],
+                "/api/events/evt/submissions/?state=accepted": [{"code": "A1", "title": "Accepted"}],
+            },
+        )
+
+        talks = _run(lambda client: client.fetch_talks(tracks={}))
+
+        assert [talk.code for talk in talks] == ["C1", "A1"]
+        assert all(isinstance(talk, PretalxTalk) for talk in talks)
+        assert requested[0] == "/api/events/evt/talks/"
+
+    @pytest.mark.unit
+    def test_fetch_talks_uses_talks_endpoint(self):
+        client = AsyncPretalxClient("evt")
+        talks = [{"code": "T1", "title": "Talk One"}]
+
+        with (
+            patch.object(client, "_get_paginated_or_none", AsyncMock(return_value=talks)),
+            patch.object(client, "_get_paginated", AsyncMock()) as mock_paginated,
+        ):
+            result = asyncio.run(client.fetch_talks())
+
+        mock_paginated.assert_not_awaited()
+        assert [talk.code for talk in result] == ["T1"]
@@ -209,7 +209,9 @@ class TestGetPaginated:
         client = PretalxClient("evt", api_token="tok123")
         client._get_paginated("https://pretalx.com/api/events/evt/speakers/")
 
-        mock_client_cls.assert_called_once_with(timeout=30, headers=client._http.headers)
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.call_args.kwargs["timeout"] == 30
+        assert mock_client_cls.call_args.kwargs["headers"] == client._http.headers
 
 
 # ---------------------------------------------------------------------------
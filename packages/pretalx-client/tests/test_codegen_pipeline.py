@@ -666,6 +666,11 @@ paths:
         assert "class GeneratedPretalxClient" in content
         assert "def api_events_list" in content
 
+        async_content = (output_dir / "async_http_client.py").read_text()
+        assert "class GeneratedAsyncPretalxClient" in async_content
+        assert "async def api_events_list" in async_content
+        assert "return await self._request(" in async_content
+
     @pytest.mark.unit
     def test_main_missing_schema_exits(self, tmp_path):
         """SystemExit(1) when the schema file does not exist."""
@@ -0,0 +1,118 @@
+"""Tests for pretalx_client.conditional and the client's ``*_if_modified`` methods."""
+
+import httpx
+import pytest
+
+from pretalx_client.client import PretalxClient
+from pretalx_client.conditional import pages_not_modified, record_validators
+
+_RealClient = httpx.Client
+_SPEAKERS = "https://pretalx.example.com/api/events/evt/speakers/"
+# Remaining pages are requested by number, with the first page's size.
+_PAGE_2 = f"{_SPEAKERS}?page=2&page_size=1"
+
+
+def _speaker_pages(etags, *, seen=None):
+    """Serve two speaker pages with the given ETags, answering 304 to matching If-None-Match."""
+
+    def handler(request):
+        page = int(request.url.params.get("page", "1"))
+        etag = etags[page - 1]
+        if seen is not None:
+            seen.append((page, request.headers.get("If-None-Match")))
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        next_url = f"{_SPEAKERS}?page=2" if page == 1 else None
+        headers = {"ETag": etag} if etag else {}
+        body = {"count": 2, "next": next_url, "results": [{"code": f"SPK{page}", "name": f"Speaker {page}"}]}
+        return httpx.Response(200, json=body, headers=headers)
+
+    return handler
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    def install(handler):
+        monkeypatch.setattr(
+            "pretalx_client.generated.http_client.httpx.Client",
+            lambda **kwargs: _RealClient(transport=httpx.MockTransport(handler), **kwargs),
+        )
+        return PretalxClient("evt", base_url="https://pretalx.example.com")
+
+    return install
+
+
+class TestRecordValidators:
+    @pytest.mark.unit
+    def test_records_every_page(self, serve):
+        client = serve(_speaker_pages(['"a"', '"b"']))
+
+        speakers, validators = client.fetch_speakers_if_modified()
+
+        assert [speaker.code for speaker in speakers] == ["SPK1", "SPK2"]
+        assert validators == {_SPEAKERS: {"etag": '"a"'}, _PAGE_2: {"etag": '"b"'}}
+
+    @pytest.mark.unit
+    def test_page_without_validators_discards_all(self, serve):
+        client = serve(_speaker_pages(['"a"', ""]))
+
+        _speakers, validators = client.fetch_speakers_if_modified()
+
+        assert validators == {}
+
+    @pytest.mark.unit
+    def test_hook_is_removed_after_block(self):
+        http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+
+        with record_validators(http):
+            assert len(http.event_hooks["response"]) == 1
+
+        assert http.event_hooks["response"] == []
+
+
+class TestNotModified:
+    @pytest.mark.unit
+    def test_all_pages_not_modified(self, serve):
+        seen = []
+        client = serve(_speaker_pages(['"a"', '"b"'], seen=seen))
+        _speakers, validators = client.fetch_speakers_if_modified()
+        seen.clear()
+
+        speakers, returned = client.fetch_speakers_if_modified(validators)
+
+        assert speakers is None
+        assert returned == validators
+        assert sorted(seen) == [(1, '"a"'), (2, '"b"')]
+
+    @pytest.mark.unit
+    def test_one_changed_page_refetches_everything(self, serve):
+        etags = ['"a"', '"b"']
+        client = serve(_speaker_pages(etags))
+        _speakers, validators = client.fetch_speakers_if_modified()
+        etags[1] = '"b2"'
+
+        speakers, returned = client.fetch_speakers_if_modified(validators)
+
+        assert [speaker.code for speaker in speakers] == ["SPK1", "SPK2"]
+        assert returned[_PAGE_2] == {"etag": '"b2"'}
+
+    @pytest.mark.unit
+    def test_sends_if_modified_since(self):
+        received = []
+
+        def handler(request):
+            received.append(request.headers.get("If-Modified-Since"))
+            return httpx.Response(304)
+
+        http = httpx.Client(transport=httpx.MockTransport(handler))
+        stamp = "Wed, 01 Sep 2027 10:00:00 GMT"
+
+        assert pages_not_modified(http, {_SPEAKERS: {"last_modified": stamp}})
+        assert received == [stamp]
+
+    @pytest.mark.unit
+    def test_no_validators_is_never_unchanged(self):
+        http = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(304)))
+
+        assert not pages_not_modified(http, None)
+        assert not pages_not_modified(http, {})
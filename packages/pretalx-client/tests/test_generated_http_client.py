@@ -1,15 +1,18 @@
-"""Tests for the auto-generated HTTP client (GeneratedPretalxClient).
+"""Tests for the auto-generated HTTP clients (GeneratedPretalxClient and its async twin).
 
 Verifies initialization, core HTTP methods (_request, _paginate,
 _request_or_none, _paginate_or_none), and spot-checks a few generated
 endpoint methods.
 """
 
+import asyncio
+import inspect
 from unittest.mock import MagicMock, Mock
 
 import httpx
 import pytest
 
+from pretalx_client.generated.async_http_client import GeneratedAsyncPretalxClient
 from pretalx_client.generated.http_client import GeneratedPretalxClient
 
 # ---------------------------------------------------------------------------
@@ -280,6 +283,113 @@ class TestPaginateOrNone:
         assert client._paginate_or_none("/api/test/") == [{"id": 1}]
 
 
+# ---------------------------------------------------------------------------
+# Pooled client and concurrent pagination
+# ---------------------------------------------------------------------------
+
+_RealClient = httpx.Client
+
+
+def _mock_transport_client(monkeypatch, handler):
+    """Route the generated client through an ``httpx.MockTransport``; return the constructor calls."""
+    calls = []
+
+    def factory(**kwargs):
+        calls.append(kwargs)
+        return _RealClient(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr("pretalx_client.generated.http_client.httpx.Client", factory)
+    return calls
+
+
+def _paged_handler(total, page_size, seen):
+    def handler(request):
+        page = int(request.url.params.get("page", "1"))
+        size = int(request.url.params.get("page_size", page_size))
+        seen.append(page)
+        start = (page - 1) * size
+        ids = list(range(start, min(start + size, total)))
+        next_url = f"https://pretalx.com/api/items/?page={page + 1}" if start + size < total else None
+        return httpx.Response(200, json={"count": total, "next": next_url, "results": [{"id": i} for i in ids]})
+
+    return handler
+
+
+class TestPooledClient:
+    """Tests for the shared httpx.Client and concurrent page fetching."""
+
+    @pytest.mark.unit
+    def test_reuses_one_client_across_requests(self, monkeypatch):
+        calls = _mock_transport_client(monkeypatch, lambda request: httpx.Response(200, json={"ok": True}))
+
+        client = GeneratedPretalxClient(limits=httpx.Limits(max_connections=3), http2=False)
+        client._request("GET", "/api/a/")
+        client._request("GET", "/api/b/")
+
+        assert len(calls) == 1
+        assert calls[0]["limits"].max_connections == 3
+        assert calls[0]["http2"] is False
+
+    @pytest.mark.unit
+    def test_close_drops_client_and_reconnects_on_next_use(self, monkeypatch):
+        calls = _mock_transport_client(monkeypatch, lambda request: httpx.Response(200, json={}))
+
+        with GeneratedPretalxClient() as client:
+            pooled = client.client
+            client._request("GET", "/api/a/")
+        assert pooled.is_closed
+
+        client._request("GET", "/api/a/")
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_fetches_remaining_pages_by_number(self, monkeypatch):
+        seen = []
+        _mock_transport_client(monkeypatch, _paged_handler(total=95, page_size=10, seen=seen))
+
+        client = GeneratedPretalxClient(max_concurrent_pages=4)
+        result = client._paginate("/api/items/")
+
+        assert [item["id"] for item in result] == list(range(95))
+        assert sorted(seen) == list(range(1, 11))
+
+    @pytest.mark.unit
+    def test_sequential_when_concurrency_disabled(self, monkeypatch):
+        seen = []
+        _mock_transport_client(monkeypatch, _paged_handler(total=25, page_size=10, seen=seen))
+
+        client = GeneratedPretalxClient(max_concurrent_pages=1)
+
+        assert len(client._paginate("/api/items/")) == 25
+        assert seen == [1, 2, 3]
+
+    @pytest.mark.unit
+    def test_follows_next_for_cursor_pagination(self, monkeypatch):
+        def handler(request):
+            if "cursor" in request.url.params:
+                return httpx.Response(200, json={"count": 2, "next": None, "results": [{"id": 2}]})
+            next_url = "https://pretalx.com/api/items/?cursor=abc"
+            return httpx.Response(200, json={"count": 2, "next": next_url, "results": [{"id": 1}]})
+
+        _mock_transport_client(monkeypatch, handler)
+
+        assert GeneratedPretalxClient()._paginate("/api/items/") == [{"id": 1}, {"id": 2}]
+
+    @pytest.mark.unit
+    def test_concurrent_page_404_returns_none(self, monkeypatch):
+        seen = []
+        paged = _paged_handler(total=30, page_size=10, seen=seen)
+
+        def handler(request):
+            if request.url.params.get("page") == "3":
+                return httpx.Response(404, json={})
+            return paged(request)
+
+        _mock_transport_client(monkeypatch, handler)
+
+        assert GeneratedPretalxClient()._paginate_or_none("/api/items/") is None
+
+
 # ---------------------------------------------------------------------------
 # Spot-check generated methods
 # ---------------------------------------------------------------------------
@@ -366,10 +476,109 @@ class TestGeneratedMethods:
 
     @pytest.mark.unit
     def test_method_count(self):
-        """Verify the generated client has the expected number of public methods."""
+        """Verify the generated client has one public method per endpoint, plus ``close()``."""
         public_methods = [
             name
             for name in dir(GeneratedPretalxClient)
             if not name.startswith("_") and callable(getattr(GeneratedPretalxClient, name))
         ]
-        assert len(public_methods) == 129
+        assert len(public_methods) == 130
+
+
+# ---------------------------------------------------------------------------
+# Async twin
+# ---------------------------------------------------------------------------
+
+_RealAsyncClient = httpx.AsyncClient
+
+
+def _mock_async_transport_client(monkeypatch, handler):
+    """Route the async generated client through an ``httpx.MockTransport``; return the constructor calls."""
+    calls = []
+
+    def factory(**kwargs):
+        calls.append(kwargs)
+        return _RealAsyncClient(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr("pretalx_client.generated.async_http_client.httpx.AsyncClient", factory)
+    return calls
+
+
+class TestGeneratedAsyncClient:
+    """Tests for GeneratedAsyncPretalxClient."""
+
+    @pytest.mark.unit
+    def test_method_count_matches_sync_client(self):
+        """Every endpoint method has an async twin; ``aclose()`` replaces ``close()``."""
+        sync_methods = {
+            name
+            for name in dir(GeneratedPretalxClient)
+            if not name.startswith("_") and callable(getattr(GeneratedPretalxClient, name))
+        }
+        async_methods = {
+            name
+            for name in dir(GeneratedAsyncPretalxClient)
+            if not name.startswith("_") and callable(getattr(GeneratedAsyncPretalxClient, name))
+        }
+        assert async_methods == (sync_methods - {"close"}) | {"aclose"}
+        assert inspect.iscoroutinefunction(GeneratedAsyncPretalxClient.speakers_list)
+
+    @pytest.mark.unit
+    def test_reuses_one_client_and_closes(self, monkeypatch):
+        calls = _mock_async_transport_client(monkeypatch, lambda request: httpx.Response(200, json={"ok": True}))
+
+        async def run():
+            async with GeneratedAsyncPretalxClient(api_token="tok", http2=False) as client:
+                first = await client._request("GET", "/api/a/")
+                await client._request("GET", "/api/b/")
+                pooled = client.client
+            return first, pooled
+
+        first, pooled = asyncio.run(run())
+
+        assert first == {"ok": True}
+        assert len(calls) == 1
+        assert calls[0]["headers"]["Authorization"] == "Token tok"
+        assert pooled.is_closed
+
+    @pytest.mark.unit
+    def test_paginates_concurrently_by_page_number(self, monkeypatch):
+        seen = []
+        _mock_async_transport_client(monkeypatch, _paged_handler(total=95, page_size=10, seen=seen))
+
+        async def run():
+            async with GeneratedAsyncPretalxClient(max_concurrent_pages=3) as client:
+                return await client._paginate("/api/items/")
+
+        result = asyncio.run(run())
+
+        assert [item["id"] for item in result] == list(range(95))
+        assert sorted(seen) == list(range(1, 11))
+
+    @pytest.mark.unit
+    def test_generated_method_awaits_paginate(self, monkeypatch):
+        def handler(request):
+            assert request.url.path == "/api/events/evt/speakers/"
+            assert request.url.params["q"] == "alice"
+            return httpx.Response(200, json={"count": 1, "next": None, "results": [{"code": "SPK1"}]})
+
+        _mock_async_transport_client(monkeypatch, handler)
+
+        async def run():
+            async with GeneratedAsyncPretalxClient() as client:
+                return await client.speakers_list(event="evt", q="alice")
+
+        assert asyncio.run(run()) == [{"code": "SPK1"}]
+
+    @pytest.mark.unit
+    def test_404_handling(self, monkeypatch):
+        _mock_async_transport_client(monkeypatch, lambda request: httpx.Response(404, json={}))
+
+        async def run():
+            async with GeneratedAsyncPretalxClient() as client:
+                missing = await client._paginate_or_none("/api/items/")
+                with pytest.raises(RuntimeError, match="404"):
+                    await client._request("GET", "/api/items/")
+                return missing
+
+        assert asyncio.run(run()) is None
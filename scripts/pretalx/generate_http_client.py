@@ -2,7 +2,9 @@
 
 Reads ``schemas/pretalx/schema.yml`` and produces
 ``packages/pretalx-client/src/pretalx_client/generated/http_client.py``
-containing :class:`GeneratedPretalxClient` with one method per ``operationId``.
+containing :class:`GeneratedPretalxClient` with one method per ``operationId``,
+plus its ``httpx.AsyncClient`` twin :class:`GeneratedAsyncPretalxClient` in
+``generated/async_http_client.py``.
 
 The generated class handles pagination, authentication, and error handling so
 the handwritten :class:`~pretalx_client.client.PretalxClient` can delegate to
@@ -21,6 +23,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 SCHEMA_FILE = PROJECT_ROOT / "schemas" / "pretalx" / "schema.yml"
 OUTPUT_DIR = PROJECT_ROOT / "packages" / "pretalx-client" / "src" / "pretalx_client" / "generated"
 OUTPUT_FILE = OUTPUT_DIR / "http_client.py"
+ASYNC_OUTPUT_NAME = "async_http_client.py"
 
 
 # ---------------------------------------------------------------------------
@@ -217,12 +220,40 @@ schema at ``schemas/pretalx/schema.yml``.  Do not edit by hand.
 
 import http
 import logging
-from typing import Any
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from importlib.util import find_spec
+from typing import Any, Self
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+HTTP2_AVAILABLE = find_spec("h2") is not None
+DEFAULT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+
+def remaining_page_params(first_page: dict[str, Any], params: dict[str, Any] | None) -> list[dict[str, Any]]:
+    """Return query params for every page after ``first_page``, if they can be computed.
+
+    Only applies to page-number pagination (``next`` carries ``page=``) when
+    the first page reports the total ``count``; otherwise returns ``[]`` and
+    the caller follows ``next`` links instead.
+    """
+    count = first_page.get("count")
+    results = first_page.get("results") or []
+    next_url = first_page.get("next")
+    if not isinstance(count, int) or not results or not next_url:
+        return []
+    if "page" not in httpx.URL(next_url).params:
+        return []
+    page_size = len(results)
+    first = int((params or {}).get("page", 1))
+    last = first + math.ceil(count / page_size) - 1
+    return [{**(params or {}), "page": page, "page_size": page_size} for page in range(first + 1, last + 1)]
+
 
 class GeneratedPretalxClient:
     """Low-level HTTP client with one method per Pretalx API endpoint.
@@ -231,10 +262,21 @@ class GeneratedPretalxClient:
     The higher-level :class:`~pretalx_client.client.PretalxClient` wraps
     these into typed models.
 
+    Requests share one pooled ``httpx.Client`` that is created on first use
+    and kept open, so connections (and TLS sessions) are reused across
+    endpoints.  Call :meth:`close` or use the client as a context manager to
+    release them.
+
     Args:
         base_url: Root URL of the Pretalx instance (e.g. ``"https://pretalx.com"``).
         api_token: Optional API token for authenticated access.
         timeout: HTTP request timeout in seconds.
+        limits: Connection-pool limits (defaults to :data:`DEFAULT_LIMITS`).
+        http2: Negotiate HTTP/2.  Defaults to ``True`` when the ``h2``
+            package is installed (``pip install pretalx-client[http2]``).
+        max_concurrent_pages: How many pages of a paginated endpoint to fetch
+            in parallel once the first page reports ``count``.  ``1`` follows
+            ``next`` links one page at a time.
     """
 
     def __init__(
@@ -242,6 +284,10 @@ class GeneratedPretalxClient:
         base_url: str = "https://pretalx.com",
         api_token: str = "",
         timeout: int = 30,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        max_concurrent_pages: int = 4,
     ) -> None:
         normalized = base_url.rstrip("/").removesuffix("/api")
         self.base_url = normalized
@@ -250,6 +296,40 @@ class GeneratedPretalxClient:
         self.headers: dict[str, str] = {"Accept": "application/json"}
         if api_token:
             self.headers["Authorization"] = f"Token {api_token}"
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._exit_stack = ExitStack()
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared, pooled ``httpx.Client``, created on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._exit_stack.enter_context(
+                        httpx.Client(
+                            timeout=self.timeout,
+                            headers=self.headers,
+                            limits=self.limits,
+                            http2=self.http2,
+                        )
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled connections.  The client reconnects on next use."""
+        with self._client_lock:
+            self._client = None
+            self._exit_stack.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _request(
         self,
@@ -265,16 +345,15 @@ class GeneratedPretalxClient:
             RuntimeError: On HTTP error or connection failure.
         """
         url = f"{self.base_url}{path}"
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            try:
-                response = client.request(method, url, params=params, json=json_body)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                raise RuntimeError(msg) from exc
-            except httpx.RequestError as exc:
-                msg = f"Pretalx API connection error for URL {url}: {exc}"
-                raise RuntimeError(msg) from exc
+        try:
+            response = self.client.request(method, url, params=params, json=json_body)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
         if response.status_code == http.HTTPStatus.NO_CONTENT:
             return {}
         return response.json()
@@ -288,96 +367,326 @@ class GeneratedPretalxClient:
     ) -> dict[str, Any] | None:
         """Execute a request, returning ``None`` on HTTP 404."""
         url = f"{self.base_url}{path}"
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            try:
-                response = client.request(method, url, params=params)
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
-                    return None
-                msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                raise RuntimeError(msg) from exc
-            except httpx.RequestError as exc:
-                msg = f"Pretalx API connection error for URL {url}: {exc}"
-                raise RuntimeError(msg) from exc
+        try:
+            response = self.client.request(method, url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
         return response.json()
 
-    def _paginate(
+    def _get_page(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> Any:
+        """Fetch one page, returning ``None`` on HTTP 404 when ``missing_ok``."""
+        logger.debug("Fetching %s", url)
+        try:
+            response = self.client.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if missing_ok and exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                logger.debug("Got 404 for %s, endpoint unavailable", url)
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        return response.json()
+
+    def _collect_pages(
         self,
         path: str,
-        params: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
-        """Fetch all pages from a paginated endpoint.
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch every page of a paginated endpoint.
 
-        Follows ``next`` links until exhausted.
+        When the first page reports ``count``, the remaining pages are
+        requested concurrently by page number; any page added after the count
+        was taken is then picked up by following ``next``.  Otherwise ``next``
+        links are followed one page at a time.
         """
-        url: str | None = f"{self.base_url}{path}"
-        results: list[dict[str, Any]] = []
-
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            while url is not None:
-                logger.debug("Fetching %s", url)
-                try:
-                    response = client.get(url, params=params)
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                    raise RuntimeError(msg) from exc
-                except httpx.RequestError as exc:
-                    msg = f"Pretalx API connection error for URL {url}: {exc}"
-                    raise RuntimeError(msg) from exc
-
-                data = response.json()
-                if isinstance(data, list):
-                    results.extend(data)
-                    url = None
-                else:
-                    results.extend(data.get("results", []))
-                    url = data.get("next")
-                # Only pass params on the first request; subsequent pages
-                # use the full ``next`` URL which already includes params.
-                params = None
+        url = f"{self.base_url}{path}"
+        data = self._get_page(url, params, missing_ok=missing_ok)
+        if data is None:
+            return None
+        if isinstance(data, list):
+            return data
+
+        results: list[dict[str, Any]] = list(data.get("results", []))
+        page_params = remaining_page_params(data, params) if self.max_concurrent_pages > 1 else []
+        if page_params:
+            workers = min(self.max_concurrent_pages, len(page_params))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pretalx-page") as pool:
+                pages = list(pool.map(lambda p: self._get_page(url, p, missing_ok=missing_ok), page_params))
+            if any(page is None for page in pages):
+                return None
+            for page in pages:
+                results.extend(page.get("results", []))
+            data = pages[-1]
+
+        # Subsequent pages use the full ``next`` URL, which already includes params.
+        next_url: str | None = data.get("next")
+        while next_url is not None:
+            data = self._get_page(next_url, None, missing_ok=missing_ok)
+            if data is None:
+                return None
+            if isinstance(data, list):
+                results.extend(data)
+                break
+            results.extend(data.get("results", []))
+            next_url = data.get("next")
 
         logger.debug("Collected %d results from paginated endpoint", len(results))
         return results
 
+    def _paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages from a paginated endpoint."""
+        return self._collect_pages(path, params, missing_ok=False) or []
+
     def _paginate_or_none(
         self,
         path: str,
         params: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]] | None:
         """Fetch all pages, returning ``None`` on HTTP 404."""
-        url: str | None = f"{self.base_url}{path}"
-        results: list[dict[str, Any]] = []
-
-        with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-            while url is not None:
-                logger.debug("Fetching %s", url)
-                try:
-                    response = client.get(url, params=params)
-                    response.raise_for_status()
-                except httpx.HTTPStatusError as exc:
-                    if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
-                        logger.debug("Got 404 for %s, endpoint unavailable", url)
-                        return None
-                    msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
-                    raise RuntimeError(msg) from exc
-                except httpx.RequestError as exc:
-                    msg = f"Pretalx API connection error for URL {url}: {exc}"
-                    raise RuntimeError(msg) from exc
-
-                data = response.json()
-                if isinstance(data, list):
-                    results.extend(data)
-                    url = None
-                else:
-                    results.extend(data.get("results", []))
-                    url = data.get("next")
-                params = None
+        return self._collect_pages(path, params, missing_ok=True)
+
+'''
+
+
+_ASYNC_FILE_HEADER = '''\
+"""Auto-generated async HTTP client for the Pretalx REST API.
+
+Generated by ``scripts/pretalx/generate_http_client.py`` from the OpenAPI
+schema at ``schemas/pretalx/schema.yml``.  Do not edit by hand.
+"""
+
+import asyncio
+import http
+import logging
+from typing import Any, Self
+
+import httpx
+
+from pretalx_client.generated.http_client import DEFAULT_LIMITS, HTTP2_AVAILABLE, remaining_page_params
+
+logger = logging.getLogger(__name__)
+
+
+class GeneratedAsyncPretalxClient:
+    """Async twin of :class:`~pretalx_client.generated.http_client.GeneratedPretalxClient`.
+
+    Same endpoint methods and arguments, built on one pooled
+    ``httpx.AsyncClient`` that is created on first use.  Close it with
+    :meth:`aclose` or ``async with``.  The client must be used from a single
+    event loop.
+
+    Args:
+        base_url: Root URL of the Pretalx instance (e.g. ``"https://pretalx.com"``).
+        api_token: Optional API token for authenticated access.
+        timeout: HTTP request timeout in seconds.
+        limits: Connection-pool limits (defaults to ``DEFAULT_LIMITS``).
+        http2: Negotiate HTTP/2.  Defaults to ``True`` when ``h2`` is installed.
+        max_concurrent_pages: How many pages of a paginated endpoint to fetch
+            at once when the first page reports ``count``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://pretalx.com",
+        api_token: str = "",
+        timeout: int = 30,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+        max_concurrent_pages: int = 4,
+    ) -> None:
+        normalized = base_url.rstrip("/").removesuffix("/api")
+        self.base_url = normalized
+        self.api_token = api_token
+        self.timeout = timeout
+        self.headers: dict[str, str] = {"Accept": "application/json"}
+        if api_token:
+            self.headers["Authorization"] = f"Token {api_token}"
+        self.limits = limits or DEFAULT_LIMITS
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self.max_concurrent_pages = max(1, max_concurrent_pages)
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared, pooled ``httpx.AsyncClient``, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.headers,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections.  The client reconnects on next use."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Execute a single HTTP request and return the JSON response.
+
+        Raises:
+            RuntimeError: On HTTP error or connection failure.
+        """
+        url = f"{self.base_url}{path}"
+        try:
+            response = await self.client.request(method, url, params=params, json=json_body)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        if response.status_code == http.HTTPStatus.NO_CONTENT:
+            return {}
+        return response.json()
+
+    async def _request_or_none(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Execute a request, returning ``None`` on HTTP 404."""
+        url = f"{self.base_url}{path}"
+        try:
+            response = await self.client.request(method, url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        return response.json()
+
+    async def _get_page(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> Any:
+        """Fetch one page, returning ``None`` on HTTP 404 when ``missing_ok``."""
+        logger.debug("Fetching %s", url)
+        try:
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            if missing_ok and exc.response.status_code == http.HTTPStatus.NOT_FOUND:
+                logger.debug("Got 404 for %s, endpoint unavailable", url)
+                return None
+            msg = f"Pretalx API request failed: {exc.response.status_code} for URL {exc.request.url}"
+            raise RuntimeError(msg) from exc
+        except httpx.RequestError as exc:
+            msg = f"Pretalx API connection error for URL {url}: {exc}"
+            raise RuntimeError(msg) from exc
+        return response.json()
+
+    async def _collect_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None,
+        *,
+        missing_ok: bool,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch every page of a paginated endpoint, concurrently when possible."""
+        url = f"{self.base_url}{path}"
+        data = await self._get_page(url, params, missing_ok=missing_ok)
+        if data is None:
+            return None
+        if isinstance(data, list):
+            return data
+
+        results: list[dict[str, Any]] = list(data.get("results", []))
+        page_params = remaining_page_params(data, params) if self.max_concurrent_pages > 1 else []
+        if page_params:
+            semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+            async def fetch(page_param: dict[str, Any]) -> Any:
+                async with semaphore:
+                    return await self._get_page(url, page_param, missing_ok=missing_ok)
+
+            pages = await asyncio.gather(*(fetch(page_param) for page_param in page_params))
+            if any(page is None for page in pages):
+                return None
+            for page in pages:
+                results.extend(page.get("results", []))
+            data = pages[-1]
+
+        # Subsequent pages use the full ``next`` URL, which already includes params.
+        next_url: str | None = data.get("next")
+        while next_url is not None:
+            data = await self._get_page(next_url, None, missing_ok=missing_ok)
+            if data is None:
+                return None
+            if isinstance(data, list):
+                results.extend(data)
+                break
+            results.extend(data.get("results", []))
+            next_url = data.get("next")
 
         logger.debug("Collected %d results from paginated endpoint", len(results))
         return results
 
+    async def _paginate(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages from a paginated endpoint."""
+        return await self._collect_pages(path, params, missing_ok=False) or []
+
+    async def _paginate_or_none(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Fetch all pages, returning ``None`` on HTTP 404."""
+        return await self._collect_pages(path, params, missing_ok=True)
+
 '''
 
 
@@ -399,8 +708,12 @@ def _build_path_expr(path: str, path_params: list[dict]) -> str:
     return expr
 
 
-def generate_method(op: dict) -> str:
-    """Generate the Python source for a single endpoint method."""
+def generate_method(op: dict, *, is_async: bool = False) -> str:
+    """Generate the Python source for a single endpoint method.
+
+    With ``is_async`` the method is an ``async def`` that awaits the async
+    client's request helpers.
+    """
     op_id = op["operation_id"]
     method = op["method"]
     path = op["path"]
@@ -442,8 +755,11 @@ def generate_method(op: dict) -> str:
     sig = ", ".join(sig_parts)
     path_expr = _build_path_expr(path, path_params)
 
+    def_kw = "async def" if is_async else "def"
+    call = "await self." if is_async else "self."
+
     lines = []
-    lines.append(f"    def {op_id}({sig}) -> {ret_type}:")
+    lines.append(f"    {def_kw} {op_id}({sig}) -> {ret_type}:")
 
     # Build method body
     body_lines = []
@@ -462,28 +778,28 @@ def generate_method(op: dict) -> str:
     body_lines.append(f'path = f"{path_expr}"')
 
     if is_delete:
-        body_lines.append(f'self._request("{method.upper()}", path, params=params)')
+        body_lines.append(f'{call}_request("{method.upper()}", path, params=params)')
         body_lines.append("return None")
     elif paginated:
         body_lines.append("if auto_paginate:")
-        body_lines.append("    return self._paginate(path, params=params or None)")
-        body_lines.append(f'return self._request("{method.upper()}", path, params=params or None)')
+        body_lines.append(f"    return {call}_paginate(path, params=params or None)")
+        body_lines.append(f'return {call}_request("{method.upper()}", path, params=params or None)')
     elif has_body:
-        body_lines.append(f'return self._request("{method.upper()}", path, params=params or None, json_body=body)')
+        body_lines.append(f'return {call}_request("{method.upper()}", path, params=params or None, json_body=body)')
     else:
-        body_lines.append(f'return self._request("{method.upper()}", path, params=params or None)')
+        body_lines.append(f'return {call}_request("{method.upper()}", path, params=params or None)')
 
     lines.extend(f"        {bl}" for bl in body_lines)
 
     return "\n".join(lines)
 
 
-def generate_client(operations: list[dict]) -> str:
-    """Generate the full Python source for GeneratedPretalxClient."""
+def generate_client(operations: list[dict], *, is_async: bool = False) -> str:
+    """Generate the full Python source for GeneratedPretalxClient (or its async twin)."""
     methods_by_tag: dict[str, list[str]] = {}
     for op in operations:
         tag = op["tag"]
-        method_src = generate_method(op)
+        method_src = generate_method(op, is_async=is_async)
         methods_by_tag.setdefault(tag, []).append(method_src)
 
     method_blocks = []
@@ -499,7 +815,8 @@ def generate_client(operations: list[dict]) -> str:
     all_methods = "\n".join(method_blocks)
 
     # Insert methods into the class body (replace the trailing newline in header)
-    return _FILE_HEADER.rstrip("\n") + "\n" + all_methods + "\n"
+    header = _ASYNC_FILE_HEADER if is_async else _FILE_HEADER
+    return header.rstrip("\n") + "\n" + all_methods + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -524,11 +841,12 @@ def main() -> None:
     operations = extract_operations(schema)
     print(f"  Found {len(operations)} operations across {len({o['tag'] for o in operations})} tags")
 
-    source = generate_client(operations)
-
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    OUTPUT_FILE.write_text(source)
+    OUTPUT_FILE.write_text(generate_client(operations))
     print(f"  Wrote {OUTPUT_FILE.relative_to(PROJECT_ROOT)}")
+    async_output = OUTPUT_DIR / ASYNC_OUTPUT_NAME
+    async_output.write_text(generate_client(operations, is_async=True))
+    print(f"  Wrote {async_output.relative_to(PROJECT_ROOT)}")
     print(f"DONE: Generated {len(operations)} methods")
 
 
@@ -0,0 +1,46 @@
+"""Version tokens for invalidating cached snapshots and plans.
+
+A version token is a random string stored in the Django cache without an
+expiry.  Cached data records the token it was built at and is treated as
+out of date once the token has been replaced, so invalidating any number
+of cache entries is a single cache write.
+"""
+
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def current_version(key: str) -> str:
+    """Return the version token stored under ``key``, creating one if it is missing.
+
+    Args:
+        key: The cache key of the token.
+
+    Returns:
+        The current token.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, None)
+        version = cache.get(key) or uuid4().hex
+    return version
+
+
+def bump_version(key: str) -> None:
+    """Replace the version token stored under ``key``, now and again on commit.
+
+    Bumping again on commit means that data built from uncommitted rows
+    inside the surrounding transaction is not served after it commits (or
+    rolls back).
+
+    Args:
+        key: The cache key of the token.
+    """
+
+    def bump() -> None:
+        cache.set(key, uuid4().hex, None)
+
+    bump()
+    transaction.on_commit(bump)
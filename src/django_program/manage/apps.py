@@ -10,3 +10,111 @@ class DjangoProgramManageConfig(AppConfig):
     name = "django_program.manage"
     label = "program_manage"
     verbose_name = "Conference Management"
+
+    def ready(self) -> None:
+        """Connect the dashboard snapshot and sidebar permission invalidation handlers."""
+        from django.contrib.auth import get_user_model  # noqa: PLC0415
+        from django.contrib.auth.models import Group  # noqa: PLC0415
+        from django.db.models.signals import m2m_changed, post_delete, post_init, post_save  # noqa: PLC0415
+
+        from django_program.conference.models import Conference, Section  # noqa: PLC0415
+        from django_program.manage.signal_handlers import (  # noqa: PLC0415
+            invalidate_dashboards_on_change,
+            invalidate_dashboards_on_holds_expired,
+            invalidate_dashboards_on_order_save,
+            invalidate_dashboards_on_sync,
+            invalidate_sidebar_permissions_on_change,
+            remember_order_dashboard_values,
+        )
+        from django_program.pretalx.models import PretalxSyncState, Room, ScheduleSlot, Speaker, Talk  # noqa: PLC0415
+        from django_program.pretalx.signals import pretalx_synced  # noqa: PLC0415
+        from django_program.programs.models import Activity, TravelGrant  # noqa: PLC0415
+        from django_program.registration.letter import LetterRequest  # noqa: PLC0415
+        from django_program.registration.models import (  # noqa: PLC0415
+            AddOn,
+            Attendee,
+            Credit,
+            Order,
+            Payment,
+            TicketType,
+            Voucher,
+        )
+        from django_program.registration.services.condition_plan import CONDITION_MODELS  # noqa: PLC0415
+        from django_program.registration.signals import checkins_synced, holds_expired  # noqa: PLC0415
+        from django_program.sponsors.models import Sponsor, SponsorLevel  # noqa: PLC0415
+
+        # Every model the dashboard and sidebar snapshots summarize.
+        snapshot_models = (
+            Conference,
+            Section,
+            Order,
+            Payment,
+            Attendee,
+            Voucher,
+            Credit,
+            TicketType,
+            AddOn,
+            LetterRequest,
+            Talk,
+            Speaker,
+            Room,
+            ScheduleSlot,
+            PretalxSyncState,
+            Sponsor,
+            SponsorLevel,
+            Activity,
+            TravelGrant,
+            *CONDITION_MODELS,
+        )
+        for model in snapshot_models:
+            label = model.__name__
+            post_save.connect(
+                invalidate_dashboards_on_order_save if model is Order else invalidate_dashboards_on_change,
+                sender=model,
+                dispatch_uid=f"manage.dashboard_snapshot.save.{label}",
+            )
+            post_delete.connect(
+                invalidate_dashboards_on_change,
+                sender=model,
+                dispatch_uid=f"manage.dashboard_snapshot.delete.{label}",
+            )
+
+        post_init.connect(
+            remember_order_dashboard_values,
+            sender=Order,
+            dispatch_uid="manage.dashboard_snapshot.init.Order",
+        )
+
+        pretalx_synced.connect(
+            invalidate_dashboards_on_sync,
+            dispatch_uid="manage.dashboard_snapshot.pretalx_sync",
+        )
+        checkins_synced.connect(
+            invalidate_dashboards_on_sync,
+            dispatch_uid="manage.dashboard_snapshot.checkins_sync",
+        )
+        holds_expired.connect(
+            invalidate_dashboards_on_holds_expired,
+            sender=Order,
+            dispatch_uid="manage.dashboard_snapshot.holds_expired",
+        )
+
+        user_model = get_user_model()
+        for model in (user_model, Group):
+            label = model.__name__
+            post_save.connect(
+                invalidate_sidebar_permissions_on_change,
+                sender=model,
+                dispatch_uid=f"manage.sidebar_permissions.save.{label}",
+            )
+            post_delete.connect(
+                invalidate_sidebar_permissions_on_change,
+                sender=model,
+                dispatch_uid=f"manage.sidebar_permissions.delete.{label}",
+            )
+        for through in (user_model.user_permissions.through, user_model.groups.through, Group.permissions.through):
+            m2m_changed.connect(
+                invalidate_sidebar_permissions_on_change,
+                sender=through,
+                dispatch_uid=f"manage.sidebar_permissions.m2m.{through.__name__}",
+            )
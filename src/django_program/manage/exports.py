@@ -0,0 +1,132 @@
+"""Streaming CSV export framework for the management dashboard.
+
+Report exports declare their columns once as :class:`CSVColumn` instances
+and yield row objects from :meth:`StreamingCSVExportView.get_rows`.  The view
+streams the CSV through a ``StreamingHttpResponse``: querysets are read with a
+server-side cursor (``.iterator(chunk_size=...)``), each cursor chunk can be
+enriched with one extra query via :meth:`StreamingCSVExportView.prefetch_chunk`,
+and rows are written out in blocks so memory stays flat regardless of report
+size.  Clients that send ``Accept-Encoding: gzip`` get a gzip-encoded body.
+"""
+
+import csv
+import io
+import re
+from dataclasses import dataclass
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+
+from django.db.models import QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+from django.views import View
+
+from django_program.manage.views import ConferencePermissionMixin, _safe_csv_cell
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+
+
+@dataclass(frozen=True, slots=True)
+class CSVColumn:
+    """A single export column: its header and how to read a cell from a row.
+
+    Attributes:
+        header: The column heading written in the first CSV row.
+        value: Callable returning the cell value for a row object.
+        escape: When ``True`` the cell is passed through ``_safe_csv_cell``
+            so user-controlled text cannot be interpreted as a formula.
+    """
+
+    header: str
+    value: Callable[[Any], object]
+    escape: bool = False
+
+    def cell(self, row: object) -> object:
+        """Return the (optionally formula-escaped) cell value for ``row``."""
+        value = self.value(row)
+        return _safe_csv_cell(value) if self.escape else value
+
+
+class StreamingCSVExportView(ConferencePermissionMixin, View):
+    """Base view that streams a report as CSV.
+
+    Subclasses set :attr:`filename` and :attr:`columns` and implement
+    :meth:`get_rows`.  When ``get_rows`` returns a queryset it is consumed
+    with a server-side cursor in chunks of :attr:`chunk_size`; every chunk is
+    handed to :meth:`prefetch_chunk` before its rows are written.
+    """
+
+    required_permission = "export_reports"
+    filename: str = ""
+    columns: Sequence[CSVColumn] = ()
+    chunk_size: int = 2000
+    gzip: bool = True
+
+    def get_rows(self) -> Iterable[object]:
+        """Return the row objects to export, in output order."""
+        raise NotImplementedError
+
+    def prefetch_chunk(self, rows: Sequence[object]) -> None:
+        """Load related data for one chunk of rows before it is written.
+
+        The default does nothing.  Override to attach data that would
+        otherwise need a query per row, using one query per chunk.
+        """
+
+    def get(self, request: HttpRequest, **kwargs: str) -> StreamingHttpResponse:  # noqa: ARG002
+        """Return a streaming CSV download of the report.
+
+        Args:
+            request: The incoming HTTP request.
+            **kwargs: URL keyword arguments.
+
+        Returns:
+            A StreamingHttpResponse with CSV content, gzip-encoded when the
+            client accepts it.
+        """
+        content: Iterator[str | bytes] = self._stream(self.get_rows())
+        use_gzip = self.gzip and bool(_ACCEPTS_GZIP.search(request.headers.get("Accept-Encoding", "")))
+        if use_gzip:
+            content = compress_sequence(chunk.encode() for chunk in content)
+        response = StreamingHttpResponse(content, content_type="text/csv")
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept-Encoding",))
+        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-{self.filename}.csv"'
+        return response
+
+    def _stream(self, rows: Iterable[object]) -> Iterator[str]:
+        """Yield the CSV header and then one block of text per chunk of rows."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column.header for column in self.columns])
+        yield _drain(buffer)
+
+        if isinstance(rows, QuerySet):
+            rows = rows.iterator(chunk_size=self.chunk_size)
+        for chunk in batched(rows, self.chunk_size, strict=False):
+            self.prefetch_chunk(chunk)
+            writer.writerows([column.cell(row) for column in self.columns] for row in chunk)
+            yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> str:
+    """Return the buffered text and reset the buffer for reuse."""
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return text
+
+
+def yes_no(value: object) -> str:
+    """Render a truthy value as ``"Yes"`` or ``"No"``."""
+    return "Yes" if value else "No"
+
+
+def isoformat_or_blank(value: object) -> str:
+    """Render a date/datetime as ISO 8601, or an empty string when unset."""
+    return value.isoformat() if value else ""
@@ -10,15 +10,14 @@ a specific conference.
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
-from django.db.models import Avg, Count, Exists, F, OuterRef, Q, QuerySet, Sum, Value
+from django.db.models import Avg, Count, Exists, F, Model, OuterRef, Q, QuerySet, Subquery, Sum, Value
 from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
 
 if TYPE_CHECKING:
     import datetime
 
-    from django_program.conference.models import Conference
-
+from django_program.conference.models import Conference, Section
 from django_program.pretalx.models import Room, ScheduleSlot, Speaker, Talk
 from django_program.programs.models import Activity, ActivitySignup, TravelGrant
 from django_program.registration.letter import LetterRequest
@@ -27,18 +26,106 @@ from django_program.registration.models import (
     Attendee,
     Cart,
     Credit,
+    DailySalesRollup,
     Order,
     OrderLineItem,
     Payment,
     TicketType,
     Voucher,
 )
+from django_program.registration.services.rollups import rollups_ready
 from django_program.sponsors.models import Sponsor, SponsorBenefit, SponsorLevel
 
 _ZERO = Decimal("0.00")
 
 _PAID_STATUSES = [Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED]
 
+_CENT = Decimal("0.01")
+
+
+def _daily_rollups(
+    conference: Conference,
+    date_from: datetime.date | None,
+    date_until: datetime.date | None,
+) -> QuerySet[DailySalesRollup] | None:
+    """Return the conference's daily sales rollups in a date range.
+
+    Returns ``None`` until the rollups have been built for the conference
+    (see the ``rebuild_rollups`` management command), in which case callers
+    aggregate the live order tables instead.
+    """
+    if not rollups_ready(conference.pk):
+        return None
+    qs = DailySalesRollup.objects.filter(conference=conference)
+    if date_from is not None:
+        qs = qs.filter(date__gte=date_from)
+    if date_until is not None:
+        qs = qs.filter(date__lte=date_until)
+    return qs
+
+
+# Row counts shown on the conference dashboard: name -> (model, extra filter).
+_CONFERENCE_COUNTS: dict[str, tuple[type[Model], Q]] = {
+    "rooms": (Room, Q()),
+    "speakers": (Speaker, Q()),
+    "talks": (Talk, Q()),
+    "schedule_slots": (ScheduleSlot, Q()),
+    "sections": (Section, Q()),
+    "unscheduled_talks": (Talk, Q(slot_start__isnull=True)),
+    "sponsors": (Sponsor, Q()),
+    "sponsor_levels": (SponsorLevel, Q()),
+    "activities": (Activity, Q()),
+    "travel_grants": (TravelGrant, Q()),
+    "ticket_types": (TicketType, Q()),
+    "addons": (AddOn, Q()),
+    "vouchers": (Voucher, Q()),
+    "orders": (Order, Q()),
+    "paid_orders": (Order, Q(status=Order.Status.PAID)),
+    "visa_letters": (LetterRequest, Q()),
+    "visa_letters_pending": (
+        LetterRequest,
+        Q(status__in=[LetterRequest.Status.SUBMITTED, LetterRequest.Status.UNDER_REVIEW]),
+    ),
+}
+
+
+def _count_subquery(model: type[Model], condition: Q) -> Coalesce:
+    """Return a scalar subquery counting ``model`` rows of the outer conference."""
+    counts = (
+        model.objects.filter(condition, conference=OuterRef("pk"))
+        .order_by()
+        .values("conference")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), Value(0))
+
+
+def get_conference_counts(conference: Conference) -> dict[str, int]:
+    """Return the dashboard row counts for a conference in a single query.
+
+    Each count is a scalar subquery on the conference row, so the database
+    computes all of them in one round-trip.
+
+    Args:
+        conference: The conference to count rows for.
+
+    Returns:
+        A dict with ``rooms``, ``speakers``, ``talks``, ``schedule_slots``,
+        ``sections``, ``unscheduled_talks``, ``sponsors``, ``sponsor_levels``,
+        ``activities``, ``travel_grants``, ``ticket_types``, ``addons``,
+        ``vouchers``, ``orders``, ``paid_orders``, ``visa_letters``, and
+        ``visa_letters_pending`` keys.
+    """
+    # Prefixed aliases: names like ``rooms`` clash with Conference's reverse relations.
+    counts = {
+        f"count_{name}": _count_subquery(model, condition) for name, (model, condition) in _CONFERENCE_COUNTS.items()
+    }
+    row = Conference.objects.filter(pk=conference.pk).values(**counts).first()
+    if row is None:
+        return dict.fromkeys(_CONFERENCE_COUNTS, 0)
+    return {name: row[f"count_{name}"] for name in _CONFERENCE_COUNTS}
+
 
 def get_attendee_manifest(
     conference: Conference,
@@ -386,7 +473,8 @@ def get_sales_by_date(
     """Return daily sales aggregation with order count and total revenue.
 
     Queries paid orders for the conference, grouped by the date portion of
-    ``created_at``. Optionally filtered by a date range.
+    ``created_at``. Optionally filtered by a date range. Reads the daily
+    sales rollups once they have been built for the conference.
 
     Args:
         conference: The conference to scope the query to.
@@ -397,6 +485,15 @@ def get_sales_by_date(
         A list of dicts with ``date``, ``count``, and ``revenue`` keys,
         ordered chronologically.
     """
+    rollups = _daily_rollups(conference, date_from, date_until)
+    if rollups is not None:
+        return [
+            {"date": date, "count": count, "revenue": revenue}
+            for date, count, revenue in rollups.filter(ticket_type__isnull=True, orders__gt=0)
+            .order_by("date")
+            .values_list("date", "orders", "revenue")
+        ]
+
     qs = Order.objects.filter(
         conference=conference,
         status__in=_PAID_STATUSES,
@@ -591,7 +688,8 @@ def get_registration_flow(
 
     Registrations are counted from Attendee creation dates. Cancellations
     are counted from Order records with status CANCELLED, grouped by the
-    date portion of ``updated_at``.
+    date portion of ``updated_at``. Reads the daily sales rollups once they
+    have been built for the conference.
 
     Args:
         conference: The conference to scope the query to.
@@ -602,6 +700,16 @@ def get_registration_flow(
         A list of dicts with ``date``, ``registrations``, and
         ``cancellations`` keys, ordered chronologically.
     """
+    rollups = _daily_rollups(conference, date_from, date_until)
+    if rollups is not None:
+        return [
+            {"date": date, "registrations": registrations, "cancellations": cancellations}
+            for date, registrations, cancellations in rollups.filter(ticket_type__isnull=True)
+            .filter(Q(registrations__gt=0) | Q(cancellations__gt=0))
+            .order_by("date")
+            .values_list("date", "registrations", "cancellations")
+        ]
+
     reg_qs = Attendee.objects.filter(conference=conference)
     cancel_qs = Order.objects.filter(
         conference=conference,
@@ -656,7 +764,8 @@ def get_aov_by_date(
 ) -> list[dict[str, Any]]:
     """Return daily average order value for paid orders.
 
-    Groups paid orders by date, computes avg(total) per day.
+    Groups paid orders by date, computes avg(total) per day. Reads the
+    daily sales rollups once they have been built for the conference.
 
     Args:
         conference: The conference to scope the query to.
@@ -667,6 +776,15 @@ def get_aov_by_date(
         A list of dicts with ``date``, ``aov``, and ``count`` keys,
         ordered chronologically.
     """
+    rollups = _daily_rollups(conference, date_from, date_until)
+    if rollups is not None:
+        return [
+            {"date": date, "aov": (revenue / count).quantize(_CENT), "count": count}
+            for date, count, revenue in rollups.filter(ticket_type__isnull=True, orders__gt=0)
+            .order_by("date")
+            .values_list("date", "orders", "revenue")
+        ]
+
     qs = Order.objects.filter(
         conference=conference,
         status__in=_PAID_STATUSES,
@@ -699,6 +817,8 @@ def get_revenue_by_ticket_type(
     """Return daily revenue broken down by ticket type.
 
     Joins OrderLineItem -> Order (paid), groups by date and ticket type name.
+    Reads the daily sales rollups once they have been built for the
+    conference.
 
     Args:
         conference: The conference to scope the query to.
@@ -709,6 +829,24 @@ def get_revenue_by_ticket_type(
         A list of dicts with ``date``, ``ticket_type``, ``revenue``, and
         ``count`` keys, ordered chronologically then by ticket type.
     """
+    rollups = _daily_rollups(conference, date_from, date_until)
+    if rollups is not None:
+        rows = (
+            rollups.filter(ticket_type__isnull=False, quantity__gt=0)
+            .values("date", "ticket_type__name")
+            .annotate(revenue=Sum("revenue"), count=Sum("quantity"))
+            .order_by("date", "ticket_type__name")
+        )
+        return [
+            {
+                "date": row["date"],
+                "ticket_type": row["ticket_type__name"],
+                "revenue": row["revenue"],
+                "count": row["count"],
+            }
+            for row in rows
+        ]
+
     qs = OrderLineItem.objects.filter(
         order__conference=conference,
         order__status__in=_PAID_STATUSES,
@@ -0,0 +1,182 @@
+"""Signal handlers for the conference management app."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    from django_program.conference.models import Conference
+    from django_program.registration.models import Order
+    from django_program.registration.services.hold_expiry import HoldSweepResult
+
+# The order columns the dashboard, reports and sidebar snapshots read.  Saves
+# that leave all of them unchanged (billing details, UTM tags, the inventory
+# bucket, ``updated_at``) keep the cached snapshots.
+_ORDER_DASHBOARD_FIELDS = (
+    "conference_id",
+    "status",
+    "subtotal",
+    "discount_amount",
+    "total",
+    "voucher_code",
+    "hold_expires_at",
+    "created_at",
+)
+_ORDER_DASHBOARD_FIELD_NAMES = frozenset(
+    {*_ORDER_DASHBOARD_FIELDS, *(name.removesuffix("_id") for name in _ORDER_DASHBOARD_FIELDS)}
+)
+_UNLOADED = object()
+
+
+def _conference_id(instance: Model) -> int | None:
+    """Return the conference a changed row belongs to, following ``order`` if needed."""
+    from django_program.conference.models import Conference  # noqa: PLC0415
+    from django_program.registration.models import Order  # noqa: PLC0415
+
+    if isinstance(instance, Conference):
+        return instance.pk
+    conference_id = getattr(instance, "conference_id", None)
+    if conference_id is None and getattr(instance, "order_id", None) is not None:
+        descriptor = type(instance).order
+        if descriptor.is_cached(instance):
+            return instance.order.conference_id
+        conference_id = Order.objects.filter(pk=instance.order_id).values_list("conference_id", flat=True).first()
+    return conference_id
+
+
+def invalidate_dashboards_on_change(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Model,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Discard the cached dashboard snapshots of the changed row's conference.
+
+    Args:
+        sender: The model class of the saved or deleted row.
+        instance: The row that was saved or deleted.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.manage.snapshots import invalidate_dashboard_snapshots  # noqa: PLC0415
+
+    conference_id = _conference_id(instance)
+    if conference_id is not None:
+        invalidate_dashboard_snapshots(conference_id)
+
+
+def _order_dashboard_values(order: Order) -> tuple[object, ...]:
+    """Return the order's dashboard columns, marking deferred ones as unloaded."""
+    return tuple(order.__dict__.get(name, _UNLOADED) for name in _ORDER_DASHBOARD_FIELDS)
+
+
+def remember_order_dashboard_values(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Record the dashboard columns an order was loaded with.
+
+    Args:
+        sender: The ``Order`` class.
+        instance: The order that was initialised.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    instance._dashboard_values = _order_dashboard_values(instance)  # noqa: SLF001
+
+
+def invalidate_dashboards_on_order_save(
+    sender: type,
+    *,
+    instance: Order,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Discard the cached dashboard snapshots when a saved order changes them.
+
+    Orders are saved for many reasons the dashboards never show, so a save
+    only invalidates the snapshots when it creates the order or changes one
+    of the columns they read.
+
+    Args:
+        sender: The ``Order`` class.
+        instance: The order that was saved.
+        created: Whether the save inserted the order.
+        update_fields: The fields passed to ``save()``, if any.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    values = _order_dashboard_values(instance)
+    touched = update_fields is None or not _ORDER_DASHBOARD_FIELD_NAMES.isdisjoint(update_fields)
+    changed = created or (touched and getattr(instance, "_dashboard_values", None) != values)
+    instance._dashboard_values = values  # noqa: SLF001
+    if changed:
+        invalidate_dashboards_on_change(sender, instance=instance)
+
+
+def invalidate_dashboards_on_sync(
+    sender: type,  # noqa: ARG001
+    *,
+    conference: Conference,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Discard the cached dashboard snapshots of a conference after a bulk sync.
+
+    Connected to Pretalx syncs and offline check-in batches, both of which
+    write with bulk queries that bypass the model signals.
+
+    Args:
+        sender: The ``PretalxSyncService`` or ``CheckIn`` class.
+        conference: The conference that was synced.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.manage.snapshots import invalidate_dashboard_snapshots  # noqa: PLC0415
+
+    invalidate_dashboard_snapshots(conference.pk)
+
+
+def invalidate_dashboards_on_holds_expired(
+    sender: type,  # noqa: ARG001
+    *,
+    result: HoldSweepResult,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Discard the cached dashboard snapshots of every conference a hold sweep cancelled orders in.
+
+    The sweeper cancels orders with ``QuerySet.update()``, which bypasses the
+    ``Order`` save handler.
+
+    Args:
+        sender: The ``Order`` class.
+        result: The sweep's ``HoldSweepResult``.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.manage.snapshots import invalidate_dashboard_snapshots  # noqa: PLC0415
+
+    for conference_id in result.conference_ids:
+        invalidate_dashboard_snapshots(conference_id)
+
+
+def invalidate_sidebar_permissions_on_change(
+    sender: type,  # noqa: ARG001
+    *,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Discard the memoized sidebar permission flags after a permission change.
+
+    Connected to ``m2m_changed`` on user permissions, user groups and group
+    permissions, and to ``post_save`` / ``post_delete`` on users and groups.
+    The ``last_login`` update made on every login is ignored.
+
+    Args:
+        sender: The model (or through model) that changed.
+        update_fields: The fields passed to ``save()``, for ``post_save``.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+
+    from django_program.manage.snapshots import invalidate_sidebar_permissions  # noqa: PLC0415
+
+    invalidate_sidebar_permissions()
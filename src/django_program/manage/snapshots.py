@@ -0,0 +1,161 @@
+"""Cached per-conference snapshots of the management dashboards.
+
+The dashboard and reports landing pages aggregate across most of a
+conference's tables on every load, so several organizers watching them
+during a registration launch multiply database load.  This module computes
+each dashboard payload once and stores it in the Django cache, keyed by
+conference id, snapshot name and a per-conference *data version*.
+
+The data version is a token in the Django cache that
+:func:`invalidate_dashboard_snapshots` replaces.  The manage app wires it to
+``post_save`` / ``post_delete`` on the models the dashboards summarize and to
+the :data:`~django_program.pretalx.signals.pretalx_synced` signal, so a
+snapshot is never served for data that has since changed -- unless
+stale-while-revalidate is enabled with ``dashboard_stale_seconds``, in which
+case a recently invalidated snapshot is served while a single background
+refresh recomputes it.
+
+The management sidebar is cached the same way (as the ``"sidebar"``
+snapshot).  The sidebar permission flags are user specific, so they are
+memoized in the user's session against a site-wide *permissions version*
+that :func:`invalidate_sidebar_permissions` replaces whenever a user's
+permissions or group memberships change.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+from django.db import connection
+
+from django_program.cache_versions import bump_version, current_version
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django_program.conference.models import Conference
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PREFIX = "django_program:dashboard"
+_PERMISSIONS_VERSION_KEY = f"{_CACHE_PREFIX}:permissions"
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardSnapshot:
+    """A computed dashboard payload and the data version it was computed at."""
+
+    version: str
+    computed_at: float
+    payload: dict[str, Any]
+
+
+def _version_key(conference_id: int) -> str:
+    return f"{_CACHE_PREFIX}:version:{conference_id}"
+
+
+def _snapshot_key(conference_id: int, name: str) -> str:
+    return f"{_CACHE_PREFIX}:{conference_id}:{name}"
+
+
+def data_version(conference_id: int) -> str:
+    """Return the conference's current data version, creating one if it is missing."""
+    return current_version(_version_key(conference_id))
+
+
+def permissions_version() -> str:
+    """Return the current version of the memoized sidebar permission flags."""
+    return current_version(_PERMISSIONS_VERSION_KEY)
+
+
+def invalidate_sidebar_permissions() -> None:
+    """Make every session recompute its sidebar permission flags on the next page."""
+    bump_version(_PERMISSIONS_VERSION_KEY)
+
+
+def invalidate_dashboard_snapshots(conference_id: int) -> None:
+    """Mark every cached dashboard snapshot of a conference as out of date.
+
+    Args:
+        conference_id: Primary key of the conference whose data changed.
+    """
+    bump_version(_version_key(conference_id))
+
+
+def _store(conference_id: int, name: str, version: str, payload: dict[str, Any], timeout: int) -> None:
+    """Cache a freshly computed payload, unless the data changed while computing it."""
+    if data_version(conference_id) != version:
+        return
+    cache.set(_snapshot_key(conference_id, name), DashboardSnapshot(version, time.time(), payload), timeout)
+
+
+def _refresh(conference_id: int, name: str, compute: Callable[[], dict[str, Any]], timeout: int) -> None:
+    """Recompute and cache a snapshot, releasing the refresh lock when done."""
+    try:
+        version = data_version(conference_id)
+        _store(conference_id, name, version, compute(), timeout)
+    except Exception:
+        logger.exception("Refreshing the %r dashboard snapshot for conference %s failed", name, conference_id)
+    finally:
+        cache.delete(f"{_snapshot_key(conference_id, name)}:refreshing")
+        # The refresh runs on its own thread, which owns this connection.
+        connection.close()
+
+
+def _refresh_in_background(
+    conference_id: int,
+    name: str,
+    compute: Callable[[], dict[str, Any]],
+    timeout: int,
+) -> None:
+    """Start a background refresh of a snapshot unless one is already running."""
+    if not cache.add(f"{_snapshot_key(conference_id, name)}:refreshing", 1, max(timeout, 1)):
+        return
+    threading.Thread(
+        target=_refresh,
+        args=(conference_id, name, compute, timeout),
+        name=f"dashboard-snapshot-{conference_id}-{name}",
+        daemon=True,
+    ).start()
+
+
+def get_dashboard_snapshot(
+    conference: Conference,
+    name: str,
+    compute: Callable[[], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return a dashboard payload from the cache, computing it on a miss.
+
+    The payload must be picklable (evaluate querysets into lists).  Caching
+    is disabled when ``dashboard_cache_seconds`` is ``0``.
+
+    Args:
+        conference: The conference the dashboard belongs to.
+        name: Identifies the dashboard within the conference (e.g. ``"reports"``).
+        compute: Builds the payload from the database.
+
+    Returns:
+        The dashboard payload.
+    """
+    config = get_config()
+    timeout = config.dashboard_cache_seconds
+    if not timeout:
+        return compute()
+
+    conference_id = conference.pk
+    version = data_version(conference_id)
+    snapshot = cache.get(_snapshot_key(conference_id, name))
+    if snapshot is not None:
+        if snapshot.version == version:
+            return snapshot.payload
+        if time.time() - snapshot.computed_at <= config.dashboard_stale_seconds:
+            _refresh_in_background(conference_id, name, compute, timeout)
+            return snapshot.payload
+
+    payload = compute()
+    _store(conference_id, name, version, payload, timeout)
+    return payload
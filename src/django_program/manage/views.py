@@ -63,7 +63,9 @@ from django_program.manage.forms import (
     TravelGrantForm,
     VoucherForm,
 )
-from django_program.pretalx.models import Room, ScheduleSlot, Speaker, Talk, TalkOverride
+from django_program.manage.reports import get_conference_counts
+from django_program.manage.snapshots import get_dashboard_snapshot, permissions_version
+from django_program.pretalx.models import PretalxSyncState, Room, ScheduleSlot, Speaker, Talk, TalkOverride
 from django_program.pretalx.sync import PretalxSyncService
 from django_program.programs.models import Activity, ActivitySignup, Receipt, TravelGrant, TravelGrantMessage
 from django_program.registration.badge import Badge, BadgeTemplate
@@ -76,7 +78,6 @@ from django_program.registration.conditions import (
     SpeakerCondition,
     TimeOrStockLimitCondition,
 )
-from django_program.registration.letter import LetterRequest
 from django_program.registration.models import AddOn, Attendee, Credit, Order, Payment, TicketType, Voucher
 from django_program.registration.services.badge import BadgeGenerationService
 from django_program.registration.services.capacity import get_global_sold_count
@@ -150,6 +151,16 @@ def _safe_csv_cell(value: object) -> str:
     return text
 
 
+def _sync_done_label(count: int, entity_name: str, *, unscheduled: int = 0, unchanged: int = 0) -> str:
+    """Return the progress label for a finished Pretalx sync step."""
+    label = f"Synced {count} {entity_name}"
+    if unscheduled:
+        label += f" ({unscheduled} unscheduled)"
+    if unchanged:
+        label += f" ({unchanged} unchanged)"
+    return label
+
+
 _SIDEBAR_PERM_KEYS = [
     "conference",
     "settings",
@@ -169,6 +180,8 @@ _SIDEBAR_PERM_KEYS = [
     "overrides",
 ]
 
+_SIDEBAR_PERMS_SESSION_KEY = "django_program_sidebar_perms"
+
 
 class ConferencePermissionMixin(LoginRequiredMixin):
     """Permission mixin for conference-scoped management views.
@@ -250,12 +263,39 @@ class ConferencePermissionMixin(LoginRequiredMixin):
         """
         context: dict[str, object] = super().get_context_data(**kwargs)  # type: ignore[misc]
         context["conference"] = self.conference
-        context["submission_type_nav"] = self.get_submission_type_nav()
-        context["last_synced"] = self._get_last_synced()
+        context.update(get_dashboard_snapshot(self.conference, "sidebar", self._sidebar_payload))
         context["user_perms"] = self._get_sidebar_permissions()
         return context
 
+    def _sidebar_payload(self) -> dict[str, object]:
+        """Compute the conference-wide sidebar data cached as the ``"sidebar"`` snapshot."""
+        return {
+            "submission_type_nav": self.get_submission_type_nav(),
+            "last_synced": self._get_last_synced(),
+        }
+
     def _get_sidebar_permissions(self) -> dict[str, bool]:
+        """Return the sidebar visibility flags, memoized in the user's session.
+
+        The flags are recomputed when the permissions version changes (any
+        user's permissions or groups were edited) or another user logs in
+        on the session.
+        """
+        user = self.request.user
+        if user.is_superuser:
+            return dict.fromkeys(_SIDEBAR_PERM_KEYS, True)
+
+        session = self.request.session
+        version = permissions_version()
+        cached = session.get(_SIDEBAR_PERMS_SESSION_KEY)
+        if cached and cached.get("version") == version and cached.get("user") == user.pk:
+            return cached["perms"]
+
+        perms = self._compute_sidebar_permissions()
+        session[_SIDEBAR_PERMS_SESSION_KEY] = {"version": version, "user": user.pk, "perms": perms}
+        return perms
+
+    def _compute_sidebar_permissions(self) -> dict[str, bool]:
         """Build a dict of sidebar section visibility flags for the current user."""
         user = self.request.user
         if user.is_superuser or user.has_perm("program_conference.change_conference"):
@@ -283,8 +323,20 @@ class ConferencePermissionMixin(LoginRequiredMixin):
         }
 
     def _get_last_synced(self) -> object:
-        """Find the most recent synced_at timestamp across all synced models."""
+        """Find the most recent sync time across all synced models.
+
+        Incremental syncs leave unchanged rows alone, so the time Pretalx was
+        last checked (``PretalxSyncState.checked_at``) counts too.
+        """
         latest_values = []
+        checked = (
+            PretalxSyncState.objects.filter(conference=self.conference, checked_at__isnull=False)
+            .order_by("-checked_at")
+            .values_list("checked_at", flat=True)
+            .first()
+        )
+        if checked:
+            latest_values.append(checked)
         for model in (Room, Speaker, Talk, ScheduleSlot):
             latest = (
                 model.objects.filter(conference=self.conference, synced_at__isnull=False)
@@ -656,7 +708,7 @@ class ImportPretalxStreamView(LoginRequiredMixin, View):
             (3, "rooms", service.sync_rooms, None),
             (4, "speakers", service.sync_speakers, service.sync_speakers_iter),
             (5, "talks", service.sync_talks, service.sync_talks_iter),
-            (6, "schedule slots", service.sync_schedule, None),
+            (6, "schedule slots", service.sync_schedule, service.sync_schedule_iter),
         ]
 
         counts: dict[str, int] = {}
@@ -671,11 +723,15 @@ class ImportPretalxStreamView(LoginRequiredMixin, View):
                 }
             )
             try:
+                unchanged = 0
                 if iter_fn is not None:
                     count = 0
+                    skipped = 0
                     for progress in iter_fn():
                         if "count" in progress:
                             count = int(progress["count"])
+                            skipped = int(progress.get("unscheduled", 0))
+                            unchanged = int(progress.get("unchanged", 0))
                         elif progress.get("phase") == "fetching":
                             yield self._sse(
                                 {
@@ -702,9 +758,7 @@ class ImportPretalxStreamView(LoginRequiredMixin, View):
                         count = result
                         skipped = 0
                 counts[entity_name] = count
-                label = f"Synced {count} {entity_name}"
-                if skipped:
-                    label += f" ({skipped} unscheduled)"
+                label = _sync_done_label(count, entity_name, unscheduled=skipped, unchanged=unchanged)
                 yield self._sse(
                     {
                         "step": step_num,
@@ -789,6 +843,28 @@ def _build_dashboard_budget_context(conference: Conference) -> dict[str, object]
     return budget
 
 
+def _dashboard_payload(conference: Conference) -> dict[str, Any]:
+    """Compute the summary counts and budget data shown on the conference dashboard.
+
+    Args:
+        conference: The conference to summarize.
+
+    Returns:
+        A picklable dict merged into the dashboard context.
+    """
+    payload: dict[str, Any] = {}
+    payload["stats"] = get_conference_counts(conference)
+
+    budget = _build_dashboard_budget_context(conference)
+    if budget:
+        payload["budget"] = budget
+        payload["chart_budget_json"] = json.dumps(
+            {k: float(v) if isinstance(v, Decimal) else v for k, v in budget.items()}
+        )
+
+    return payload
+
+
 class DashboardView(ManagePermissionMixin, TemplateView):
     """Conference dashboard with summary statistics.
 
@@ -809,35 +885,7 @@ class DashboardView(ManagePermissionMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         conference = self.conference
         context["active_nav"] = "dashboard"
-        context["stats"] = {
-            "rooms": Room.objects.filter(conference=conference).count(),
-            "speakers": Speaker.objects.filter(conference=conference).count(),
-            "talks": Talk.objects.filter(conference=conference).count(),
-            "schedule_slots": ScheduleSlot.objects.filter(conference=conference).count(),
-            "sections": Section.objects.filter(conference=conference).count(),
-            "unscheduled_talks": Talk.objects.filter(conference=conference, slot_start__isnull=True).count(),
-            "sponsors": Sponsor.objects.filter(conference=conference).count(),
-            "sponsor_levels": SponsorLevel.objects.filter(conference=conference).count(),
-            "activities": Activity.objects.filter(conference=conference).count(),
-            "travel_grants": TravelGrant.objects.filter(conference=conference).count(),
-            "ticket_types": TicketType.objects.filter(conference=conference).count(),
-            "addons": AddOn.objects.filter(conference=conference).count(),
-            "vouchers": Voucher.objects.filter(conference=conference).count(),
-            "orders": Order.objects.filter(conference=conference).count(),
-            "paid_orders": Order.objects.filter(conference=conference, status=Order.Status.PAID).count(),
-            "visa_letters": LetterRequest.objects.filter(conference=conference).count(),
-            "visa_letters_pending": LetterRequest.objects.filter(
-                conference=conference,
-                status__in=[LetterRequest.Status.SUBMITTED, LetterRequest.Status.UNDER_REVIEW],
-            ).count(),
-        }
-
-        budget = _build_dashboard_budget_context(conference)
-        if budget:
-            context["budget"] = budget
-            context["chart_budget_json"] = json.dumps(
-                {k: float(v) if isinstance(v, Decimal) else v for k, v in budget.items()}
-            )
+        context.update(get_dashboard_snapshot(conference, "dashboard", lambda: _dashboard_payload(conference)))
 
         sponsor_profile = resolve_sponsor_profile(
             event_slug=conference.pretalx_event_slug or "",
@@ -1146,8 +1194,8 @@ class RoomCreateView(ManagePermissionMixin, CreateView):
 class SpeakerListView(ManagePermissionMixin, ListView):
     """List speakers for the current conference.
 
-    Supports search via the ``q`` GET parameter, filtering by name or
-    email.  This is a read-only view since speaker data comes from
+    Supports search via the ``q`` GET parameter, filtering by synced or
+    overridden name or email.  This is a read-only view since speaker data comes from
     Pretalx.
     """
 
@@ -1164,12 +1212,17 @@ class SpeakerListView(ManagePermissionMixin, ListView):
         """
         qs = (
             Speaker.objects.filter(conference=self.conference)
-            .select_related("override")
+            .with_overrides()
             .annotate(talk_count=Count("talks", distinct=True))
         )
         query = self.request.GET.get("q", "").strip()
         if query:
-            qs = qs.filter(Q(name__icontains=query) | Q(email__icontains=query))
+            qs = qs.filter(
+                Q(name__icontains=query)
+                | Q(email__icontains=query)
+                | Q(resolved_name__icontains=query)
+                | Q(resolved_email__icontains=query)
+            )
         return qs.order_by("-talk_count", "name")
 
     def get_context_data(self, **kwargs: object) -> dict[str, object]:
@@ -1195,7 +1248,7 @@ class SpeakerDetailView(ManagePermissionMixin, DetailView):
         """Scope speaker lookup to the current conference and preload talks."""
         return (
             Speaker.objects.filter(conference=self.conference)
-            .select_related("override")
+            .with_overrides()
             .prefetch_related("talks")
             .annotate(talk_count=Count("talks", distinct=True))
         )
@@ -1211,7 +1264,7 @@ class SpeakerDetailView(ManagePermissionMixin, DetailView):
 class TalkListView(ManagePermissionMixin, ListView):
     """List talks for the current conference.
 
-    Supports search via ``q`` (title search), filtering via ``state``
+    Supports search via ``q`` (synced or overridden title), filtering via ``state``
     GET parameter, and filtering by submission type via URL slug.
     """
 
@@ -1251,7 +1304,7 @@ class TalkListView(ManagePermissionMixin, ListView):
         """
         qs = (
             Talk.objects.filter(conference=self.conference)
-            .select_related("room", "override")
+            .with_overrides()
             .prefetch_related("speakers")
             .order_by("slot_start", "title")
         )
@@ -1260,7 +1313,7 @@ class TalkListView(ManagePermissionMixin, ListView):
             qs = qs.filter(submission_type=type_filter)
         query = self.request.GET.get("q", "").strip()
         if query:
-            qs = qs.filter(title__icontains=query)
+            qs = qs.filter(Q(title__icontains=query) | Q(resolved_title__icontains=query))
         state = self.request.GET.get("state", "").strip()
         if state:
             qs = qs.filter(state=state)
@@ -1302,7 +1355,7 @@ class TalkDetailView(ManagePermissionMixin, DetailView):
         """Scope talk lookup to conference and preload related speaker/room data."""
         return (
             Talk.objects.filter(conference=self.conference)
-            .select_related("room", "override")
+            .with_overrides()
             .prefetch_related(
                 "speakers",
                 Prefetch(
@@ -2368,12 +2421,15 @@ class SyncPretalxStreamView(ManagePermissionMixin, View):
             False,
         )
         try:
+            unchanged = 0
             if iter_fn is not None:
                 count = 0
                 skipped = 0
                 for progress in iter_fn():
                     if "count" in progress:
                         count = int(progress["count"])
+                        skipped = int(progress.get("unscheduled", 0))
+                        unchanged = int(progress.get("unchanged", 0))
                     elif progress.get("phase") == "fetching":
                         yield (
                             self._sse(
@@ -2409,9 +2465,7 @@ class SyncPretalxStreamView(ManagePermissionMixin, View):
                 else:
                     count = result
                     skipped = 0
-            label = f"Synced {count} {entity_name}"
-            if skipped:
-                label += f" ({skipped} unscheduled)"
+            label = _sync_done_label(count, entity_name, unscheduled=skipped, unchanged=unchanged)
             yield (
                 self._sse(
                     {
@@ -2476,7 +2530,7 @@ class SyncPretalxStreamView(ManagePermissionMixin, View):
                 (
                     "schedule slots",
                     lambda: service.sync_schedule(allow_large_deletions=allow_large_schedule_drop),
-                    None,
+                    lambda: service.sync_schedule_iter(allow_large_deletions=allow_large_schedule_drop),
                 )
             )
         return steps
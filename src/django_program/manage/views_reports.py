@@ -6,18 +6,19 @@ registration, financial reconciliation, and registration flow. All views
 are scoped to the current conference and gated by report-level permissions.
 """
 
-import csv
 import datetime
 import json
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 from django.db.models import Count, QuerySet, Sum
-from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
-from django.views import View
 from django.views.generic import ListView, TemplateView
 
+from django_program.manage.exports import CSVColumn, StreamingCSVExportView, isoformat_or_blank, yes_no
 from django_program.manage.reports import (
     get_addon_inventory,
     get_attendee_manifest,
@@ -39,14 +40,18 @@ from django_program.manage.reports import (
     get_voucher_summary,
     get_voucher_usage,
 )
+from django_program.manage.snapshots import get_dashboard_snapshot
 from django_program.manage.views import ConferencePermissionMixin, _safe_csv_cell
 from django_program.pretalx.models import Speaker
 from django_program.programs.models import TravelGrant
 from django_program.registration.letter import LetterRequest
-from django_program.registration.models import Attendee, Order, Payment, TicketType
+from django_program.registration.models import Attendee, Order, OrderLineItem, Payment, TicketType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from django_program.conference.models import Conference
+    from django_program.registration.models import AddOn, Credit, Voucher
 
 
 def _build_budget_context(conference: Conference) -> dict[str, object]:
@@ -104,6 +109,128 @@ def _build_budget_context(conference: Conference) -> dict[str, object]:
 ReportPermissionMixin = ConferencePermissionMixin
 
 
+def _reports_dashboard_payload(conference: Conference) -> dict[str, Any]:
+    """Compute the summary stats and chart data shown on the reports dashboard.
+
+    Args:
+        conference: The conference to summarize.
+
+    Returns:
+        A picklable dict merged into the reports dashboard context.
+    """
+    payload: dict[str, Any] = {}
+    payload["attendee_summary"] = get_attendee_summary(conference)
+    payload["ticket_types"] = list(get_ticket_inventory(conference))
+    payload["voucher_summary"] = get_voucher_summary(conference)
+    payload["discount_summary"] = get_discount_summary(conference)
+    payload["credit_summary"] = get_credit_summary(conference)
+    payload["speaker_count"] = Speaker.objects.filter(conference=conference).count()
+
+    thirty_days_ago = timezone.now().date() - datetime.timedelta(days=30)
+    recent_sales = get_sales_by_date(conference, date_from=thirty_days_ago)
+    payload["recent_sales_total"] = sum(row["revenue"] for row in recent_sales)
+
+    # Chart data: Ticket inventory breakdown
+    ticket_chart = [
+        {
+            "name": str(tt.name),
+            "sold": tt.sold_count,
+            "reserved": tt.reserved_count,
+            "remaining": (
+                max(0, tt.total_quantity - tt.sold_count - tt.reserved_count) if tt.total_quantity > 0 else 0
+            ),
+            "total": tt.total_quantity,
+        }
+        for tt in payload["ticket_types"]
+    ]
+    payload["chart_tickets_json"] = json.dumps(ticket_chart)
+
+    # Chart data: Order status breakdown
+    order_statuses = list(
+        Order.objects.filter(conference=conference)
+        .values("status")
+        .annotate(count=Count("id"), total=Sum("total"))
+        .order_by("status")
+    )
+    payload["chart_orders_json"] = json.dumps(
+        [{"status": row["status"], "count": row["count"], "total": float(row["total"] or 0)} for row in order_statuses]
+    )
+
+    # Chart data: Payment method breakdown
+    payment_methods = list(
+        Payment.objects.filter(
+            order__conference=conference,
+            status=Payment.Status.SUCCEEDED,
+        )
+        .values("method")
+        .annotate(count=Count("id"), total=Sum("amount"))
+        .order_by("method")
+    )
+    payload["chart_payments_json"] = json.dumps(
+        [{"method": row["method"], "count": row["count"], "total": float(row["total"] or 0)} for row in payment_methods]
+    )
+
+    # Chart data: Registration flow (last 30 days)
+    flow = get_registration_flow(conference, date_from=thirty_days_ago)
+    payload["chart_flow_json"] = json.dumps(
+        [
+            {
+                "date": row["date"].isoformat(),
+                "registrations": row["registrations"],
+                "cancellations": row["cancellations"],
+            }
+            for row in flow
+        ]
+    )
+
+    # Chart data: Voucher redemption rates
+    voucher_chart = [
+        {
+            "code": str(v.code),
+            "used": v.times_used,
+            "max": v.max_uses,
+            "impact": float(v.revenue_impact),
+        }
+        for v in get_voucher_usage(conference)
+    ]
+    payload["chart_vouchers_json"] = json.dumps(voucher_chart)
+
+    # Chart data: Check-in status
+    attendee_summary = payload["attendee_summary"]
+    payload["chart_checkin_json"] = json.dumps(
+        {
+            "checked_in": attendee_summary["checked_in"],
+            "total": attendee_summary["total"],
+        }
+    )
+
+    # Chart data: Speaker registration
+    speakers = list(get_speaker_registrations(conference))
+    registered = sum(1 for s in speakers if s.has_paid_order)
+    payload["chart_speakers_json"] = json.dumps(
+        {
+            "registered": registered,
+            "unregistered": len(speakers) - registered,
+            "total": len(speakers),
+        }
+    )
+
+    # Visa letter request summary
+    letter_summary = get_letter_request_summary(conference)
+    payload["letter_summary"] = letter_summary
+    payload["letter_pending_count"] = letter_summary["pending_count"]
+
+    # Budget vs actuals
+    budget = _build_budget_context(conference)
+    if budget:
+        payload["budget"] = budget
+        payload["chart_budget_json"] = json.dumps(
+            {k: float(v) if isinstance(v, Decimal) else v for k, v in budget.items()}
+        )
+
+    return payload
+
+
 class ReportsDashboardView(ConferencePermissionMixin, TemplateView):
     """Landing page for all admin reports with summary statistics."""
 
@@ -113,6 +240,9 @@ class ReportsDashboardView(ConferencePermissionMixin, TemplateView):
     def get_context_data(self, **kwargs: object) -> dict[str, object]:
         """Build context with summary stats for all report types.
 
+        The summaries and chart data come from a cached dashboard snapshot
+        (see :mod:`django_program.manage.snapshots`).
+
         Args:
             **kwargs: Additional context data.
 
@@ -121,122 +251,7 @@ class ReportsDashboardView(ConferencePermissionMixin, TemplateView):
         """
         context: dict[str, object] = super().get_context_data(**kwargs)
         conference = self.conference
-
-        context["attendee_summary"] = get_attendee_summary(conference)
-        context["ticket_types"] = get_ticket_inventory(conference)
-        context["voucher_summary"] = get_voucher_summary(conference)
-        context["discount_summary"] = get_discount_summary(conference)
-        context["credit_summary"] = get_credit_summary(conference)
-        context["speaker_count"] = Speaker.objects.filter(conference=conference).count()
-
-        thirty_days_ago = timezone.now().date() - datetime.timedelta(days=30)
-        recent_sales = get_sales_by_date(conference, date_from=thirty_days_ago)
-        context["recent_sales_total"] = sum(row["revenue"] for row in recent_sales)
-
-        # Chart data: Ticket inventory breakdown
-        ticket_chart = [
-            {
-                "name": str(tt.name),
-                "sold": tt.sold_count,
-                "reserved": tt.reserved_count,
-                "remaining": (
-                    max(0, tt.total_quantity - tt.sold_count - tt.reserved_count) if tt.total_quantity > 0 else 0
-                ),
-                "total": tt.total_quantity,
-            }
-            for tt in context["ticket_types"]  # type: ignore[union-attr]
-        ]
-        context["chart_tickets_json"] = json.dumps(ticket_chart)
-
-        # Chart data: Order status breakdown
-        order_statuses = list(
-            Order.objects.filter(conference=conference)
-            .values("status")
-            .annotate(count=Count("id"), total=Sum("total"))
-            .order_by("status")
-        )
-        context["chart_orders_json"] = json.dumps(
-            [
-                {"status": row["status"], "count": row["count"], "total": float(row["total"] or 0)}
-                for row in order_statuses
-            ]
-        )
-
-        # Chart data: Payment method breakdown
-        payment_methods = list(
-            Payment.objects.filter(
-                order__conference=conference,
-                status=Payment.Status.SUCCEEDED,
-            )
-            .values("method")
-            .annotate(count=Count("id"), total=Sum("amount"))
-            .order_by("method")
-        )
-        context["chart_payments_json"] = json.dumps(
-            [
-                {"method": row["method"], "count": row["count"], "total": float(row["total"] or 0)}
-                for row in payment_methods
-            ]
-        )
-
-        # Chart data: Registration flow (last 30 days)
-        flow = get_registration_flow(conference, date_from=thirty_days_ago)
-        context["chart_flow_json"] = json.dumps(
-            [
-                {
-                    "date": row["date"].isoformat(),
-                    "registrations": row["registrations"],
-                    "cancellations": row["cancellations"],
-                }
-                for row in flow
-            ]
-        )
-
-        # Chart data: Voucher redemption rates
-        voucher_chart = [
-            {
-                "code": str(v.code),
-                "used": v.times_used,
-                "max": v.max_uses,
-                "impact": float(v.revenue_impact),
-            }
-            for v in get_voucher_usage(conference)
-        ]
-        context["chart_vouchers_json"] = json.dumps(voucher_chart)
-
-        # Chart data: Check-in status
-        attendee_summary = context["attendee_summary"]
-        context["chart_checkin_json"] = json.dumps(
-            {
-                "checked_in": attendee_summary["checked_in"],  # type: ignore[index]
-                "total": attendee_summary["total"],  # type: ignore[index]
-            }
-        )
-
-        # Chart data: Speaker registration
-        speakers = list(get_speaker_registrations(conference))
-        registered = sum(1 for s in speakers if s.has_paid_order)
-        context["chart_speakers_json"] = json.dumps(
-            {
-                "registered": registered,
-                "unregistered": len(speakers) - registered,
-                "total": len(speakers),
-            }
-        )
-
-        # Visa letter request summary
-        letter_summary = get_letter_request_summary(conference)
-        context["letter_summary"] = letter_summary
-        context["letter_pending_count"] = letter_summary["pending_count"]
-
-        # Budget vs actuals
-        budget = _build_budget_context(conference)
-        if budget:
-            context["budget"] = budget
-            context["chart_budget_json"] = json.dumps(
-                {k: float(v) if isinstance(v, Decimal) else v for k, v in budget.items()}
-            )
-
+        context.update(get_dashboard_snapshot(conference, "reports", lambda: _reports_dashboard_payload(conference)))
         context["active_nav"] = "reports"
         return context
 
@@ -310,64 +325,43 @@ class AttendeeManifestView(ConferencePermissionMixin, ListView):
         return context
 
 
-class AttendeeManifestExportView(ConferencePermissionMixin, View):
-    """CSV export of the attendee manifest."""
+class AttendeeManifestExportView(StreamingCSVExportView):
+    """CSV export of the attendee manifest.
 
-    required_permission = "export_reports"
-
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of the attendee manifest.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
+    Ticket line items are loaded once per cursor chunk, keyed by the chunk's
+    order IDs, instead of prefetching every order's line items up front.
+    """
 
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        qs = get_attendee_manifest(
+    filename = "attendees"
+    columns = (
+        CSVColumn("Username", lambda a: a.user.username, escape=True),
+        CSVColumn("Email", lambda a: a.user.email, escape=True),
+        CSVColumn("Full Name", lambda a: a.user.get_full_name(), escape=True),
+        CSVColumn("Ticket Type", lambda a: a.ticket_descriptions, escape=True),
+        CSVColumn("Check-in Time", lambda a: isoformat_or_blank(a.checked_in_at)),
+        CSVColumn("Access Code", lambda a: a.access_code, escape=True),
+        CSVColumn("Completed Registration", lambda a: yes_no(a.completed_registration)),
+    )
+
+    def get_rows(self) -> QuerySet[Attendee]:
+        """Return the filtered attendee queryset without its line-item prefetch."""
+        return get_attendee_manifest(
             self.conference,
-            ticket_type_id=request.GET.get("ticket_type") or None,
-            checked_in=request.GET.get("checked_in", ""),
-            completed=request.GET.get("completed", ""),
-        )
-
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-attendees.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "Username",
-                "Email",
-                "Full Name",
-                "Ticket Type",
-                "Check-in Time",
-                "Access Code",
-                "Completed Registration",
-            ]
-        )
-
-        for attendee in qs:
-            # Join all ticket line item descriptions
-            ticket_name = ""
-            if attendee.order:
-                ticket_items = [li for li in attendee.order.line_items.all() if li.ticket_type_id is not None]
-                if ticket_items:
-                    ticket_name = ", ".join(li.description for li in ticket_items)
-
-            writer.writerow(
-                [
-                    _safe_csv_cell(attendee.user.username),
-                    _safe_csv_cell(attendee.user.email),
-                    _safe_csv_cell(attendee.user.get_full_name()),
-                    _safe_csv_cell(ticket_name),
-                    attendee.checked_in_at.isoformat() if attendee.checked_in_at else "",
-                    _safe_csv_cell(attendee.access_code),
-                    "Yes" if attendee.completed_registration else "No",
-                ]
-            )
+            ticket_type_id=self.request.GET.get("ticket_type") or None,
+            checked_in=self.request.GET.get("checked_in", ""),
+            completed=self.request.GET.get("completed", ""),
+        ).prefetch_related(None)
 
-        return response
+    def prefetch_chunk(self, rows: Sequence[Attendee]) -> None:
+        """Attach ``ticket_descriptions`` to each attendee with one query per chunk."""
+        descriptions: dict[int, list[str]] = defaultdict(list)
+        order_ids = {attendee.order_id for attendee in rows if attendee.order_id}
+        if order_ids:
+            line_items = OrderLineItem.objects.filter(order_id__in=order_ids, ticket_type__isnull=False)
+            for order_id, description in line_items.values_list("order_id", "description"):
+                descriptions[order_id].append(description)
+        for attendee in rows:
+            attendee.ticket_descriptions = ", ".join(descriptions.get(attendee.order_id, ()))  # type: ignore[attr-defined]
 
 
 class InventoryReportView(ConferencePermissionMixin, TemplateView):
@@ -409,80 +403,34 @@ class InventoryReportView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class InventoryReportExportView(ConferencePermissionMixin, View):
-    """CSV export of product inventory."""
-
-    required_permission = "export_reports"
+def _remaining_stock(item: TicketType | AddOn) -> int | str:
+    """Return the unsold, unreserved quantity, or ``"Unlimited"``."""
+    if item.total_quantity > 0:
+        return max(0, item.total_quantity - item.sold_count - item.reserved_count)  # type: ignore[attr-defined]
+    return "Unlimited"
 
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of inventory data.
 
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-inventory.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "Type",
-                "Name",
-                "Price",
-                "Total Quantity",
-                "Sold",
-                "Reserved",
-                "Remaining",
-                "Active",
-                "Available From",
-                "Available Until",
-            ]
-        )
+class InventoryReportExportView(StreamingCSVExportView):
+    """CSV export of product inventory."""
 
-        for tt in get_ticket_inventory(self.conference):
-            remaining = (
-                max(0, tt.total_quantity - tt.sold_count - tt.reserved_count) if tt.total_quantity > 0 else "Unlimited"
-            )
-            writer.writerow(
-                [
-                    "Ticket",
-                    _safe_csv_cell(str(tt.name)),
-                    str(tt.price),
-                    tt.total_quantity if tt.total_quantity > 0 else "Unlimited",
-                    tt.sold_count,
-                    tt.reserved_count,
-                    remaining,
-                    "Yes" if tt.is_active else "No",
-                    tt.available_from.isoformat() if tt.available_from else "",
-                    tt.available_until.isoformat() if tt.available_until else "",
-                ]
-            )
-
-        for addon in get_addon_inventory(self.conference):
-            remaining = (
-                max(0, addon.total_quantity - addon.sold_count - addon.reserved_count)
-                if addon.total_quantity > 0
-                else "Unlimited"
-            )
-            writer.writerow(
-                [
-                    "Add-on",
-                    _safe_csv_cell(str(addon.name)),
-                    str(addon.price),
-                    addon.total_quantity if addon.total_quantity > 0 else "Unlimited",
-                    addon.sold_count,
-                    addon.reserved_count,
-                    remaining,
-                    "Yes" if addon.is_active else "No",
-                    addon.available_from.isoformat() if addon.available_from else "",
-                    addon.available_until.isoformat() if addon.available_until else "",
-                ]
-            )
-
-        return response
+    filename = "inventory"
+    columns = (
+        CSVColumn("Type", lambda item: "Ticket" if isinstance(item, TicketType) else "Add-on"),
+        CSVColumn("Name", lambda item: str(item.name), escape=True),
+        CSVColumn("Price", lambda item: str(item.price)),
+        CSVColumn("Total Quantity", lambda item: item.total_quantity if item.total_quantity > 0 else "Unlimited"),
+        CSVColumn("Sold", lambda item: item.sold_count),
+        CSVColumn("Reserved", lambda item: item.reserved_count),
+        CSVColumn("Remaining", _remaining_stock),
+        CSVColumn("Active", lambda item: yes_no(item.is_active)),
+        CSVColumn("Available From", lambda item: isoformat_or_blank(item.available_from)),
+        CSVColumn("Available Until", lambda item: isoformat_or_blank(item.available_until)),
+    )
+
+    def get_rows(self) -> Iterator[TicketType | AddOn]:
+        """Yield ticket types followed by add-ons, each read with a cursor."""
+        yield from get_ticket_inventory(self.conference).iterator(chunk_size=self.chunk_size)
+        yield from get_addon_inventory(self.conference).iterator(chunk_size=self.chunk_size)
 
 
 class VoucherUsageReportView(ConferencePermissionMixin, TemplateView):
@@ -521,57 +469,29 @@ class VoucherUsageReportView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class VoucherUsageExportView(ConferencePermissionMixin, View):
+class VoucherUsageExportView(StreamingCSVExportView):
     """CSV export of voucher usage data."""
 
-    required_permission = "export_reports"
-
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of voucher usage data.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-vouchers.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "Code",
-                "Type",
-                "Discount Value",
-                "Max Uses",
-                "Times Used",
-                "Redemption Rate",
-                "Revenue Impact",
-                "Active",
-                "Valid From",
-                "Valid Until",
-            ]
-        )
-
-        for voucher in get_voucher_usage(self.conference):
-            redemption_rate = f"{(voucher.times_used / voucher.max_uses * 100):.1f}%" if voucher.max_uses > 0 else "N/A"
-            writer.writerow(
-                [
-                    _safe_csv_cell(str(voucher.code)),
-                    voucher.get_voucher_type_display(),
-                    str(voucher.discount_value),
-                    voucher.max_uses,
-                    voucher.times_used,
-                    redemption_rate,
-                    str(voucher.revenue_impact),
-                    "Yes" if voucher.is_active else "No",
-                    voucher.valid_from.isoformat() if voucher.valid_from else "",
-                    voucher.valid_until.isoformat() if voucher.valid_until else "",
-                ]
-            )
-
-        return response
+    filename = "vouchers"
+    columns = (
+        CSVColumn("Code", lambda v: str(v.code), escape=True),
+        CSVColumn("Type", lambda v: v.get_voucher_type_display()),
+        CSVColumn("Discount Value", lambda v: str(v.discount_value)),
+        CSVColumn("Max Uses", lambda v: v.max_uses),
+        CSVColumn("Times Used", lambda v: v.times_used),
+        CSVColumn(
+            "Redemption Rate",
+            lambda v: f"{(v.times_used / v.max_uses * 100):.1f}%" if v.max_uses > 0 else "N/A",
+        ),
+        CSVColumn("Revenue Impact", lambda v: str(v.revenue_impact)),
+        CSVColumn("Active", lambda v: yes_no(v.is_active)),
+        CSVColumn("Valid From", lambda v: isoformat_or_blank(v.valid_from)),
+        CSVColumn("Valid Until", lambda v: isoformat_or_blank(v.valid_until)),
+    )
+
+    def get_rows(self) -> QuerySet[Voucher]:
+        """Return vouchers annotated with their revenue impact."""
+        return get_voucher_usage(self.conference)
 
 
 class DiscountEffectivenessView(ConferencePermissionMixin, TemplateView):
@@ -610,56 +530,29 @@ class DiscountEffectivenessView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class DiscountEffectivenessExportView(ConferencePermissionMixin, View):
+class DiscountEffectivenessExportView(StreamingCSVExportView):
     """CSV export of discount effectiveness data."""
 
-    required_permission = "export_reports"
-
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of discount conditions data.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-discounts.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "Name",
-                "Type",
-                "Active",
-                "Priority",
-                "Discount Type",
-                "Discount Value",
-                "Times Used",
-                "Limit",
-                "Applicable Products",
-            ]
-        )
-
-        conditions_by_type = get_discount_conditions(self.conference)
-        for conditions in conditions_by_type.values():
-            for cond in conditions:
-                writer.writerow(
-                    [
-                        _safe_csv_cell(cond["name"]),
-                        cond["type"],
-                        "Yes" if cond["is_active"] else "No",
-                        cond["priority"],
-                        cond.get("discount_type", ""),
-                        str(cond.get("discount_value", "")),
-                        cond.get("times_used", ""),
-                        cond.get("limit", ""),
-                        _safe_csv_cell("; ".join(str(p) for p in cond.get("applicable_products", []))),
-                    ]
-                )
-
-        return response
+    filename = "discounts"
+    columns = (
+        CSVColumn("Name", lambda c: c["name"], escape=True),
+        CSVColumn("Type", lambda c: c["type"]),
+        CSVColumn("Active", lambda c: yes_no(c["is_active"])),
+        CSVColumn("Priority", lambda c: c["priority"]),
+        CSVColumn("Discount Type", lambda c: c.get("discount_type", "")),
+        CSVColumn("Discount Value", lambda c: str(c.get("discount_value", ""))),
+        CSVColumn("Times Used", lambda c: c.get("times_used", "")),
+        CSVColumn("Limit", lambda c: c.get("limit", "")),
+        CSVColumn(
+            "Applicable Products",
+            lambda c: "; ".join(str(p) for p in c.get("applicable_products", [])),
+            escape=True,
+        ),
+    )
+
+    def get_rows(self) -> Iterator[dict[str, Any]]:
+        """Return every discount condition, grouped by condition type."""
+        return chain.from_iterable(get_discount_conditions(self.conference).values())
 
 
 def _parse_date_param(value: str | None) -> datetime.date | None:
@@ -721,40 +614,21 @@ class SalesByDateView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class SalesByDateExportView(ConferencePermissionMixin, View):
+class SalesByDateExportView(StreamingCSVExportView):
     """CSV export of daily sales data."""
 
-    required_permission = "export_reports"
+    filename = "sales-by-date"
+    columns = (
+        CSVColumn("Date", lambda row: row["date"].isoformat()),
+        CSVColumn("Orders", lambda row: row["count"]),
+        CSVColumn("Revenue", lambda row: str(row["revenue"])),
+    )
 
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of daily sales.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        date_from = _parse_date_param(request.GET.get("date_from"))
-        date_until = _parse_date_param(request.GET.get("date_until"))
-        rows = get_sales_by_date(self.conference, date_from=date_from, date_until=date_until)
-
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-sales-by-date.csv"'
-        writer = csv.writer(response)
-        writer.writerow(["Date", "Orders", "Revenue"])
-
-        for row in rows:
-            writer.writerow(
-                [
-                    row["date"].isoformat(),
-                    row["count"],
-                    str(row["revenue"]),
-                ]
-            )
-
-        return response
+    def get_rows(self) -> list[dict[str, Any]]:
+        """Return daily sales rows for the requested date range."""
+        date_from = _parse_date_param(self.request.GET.get("date_from"))
+        date_until = _parse_date_param(self.request.GET.get("date_until"))
+        return get_sales_by_date(self.conference, date_from=date_from, date_until=date_until)
 
 
 class CreditNotesView(ConferencePermissionMixin, TemplateView):
@@ -791,54 +665,31 @@ class CreditNotesView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class CreditNotesExportView(ConferencePermissionMixin, View):
+class CreditNotesExportView(StreamingCSVExportView):
     """CSV export of credit notes."""
 
-    required_permission = "export_reports"
-
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of credit notes.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-credit-notes.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "User",
-                "Email",
-                "Amount",
-                "Remaining",
-                "Status",
-                "Source Order",
-                "Applied To Order",
-                "Note",
-                "Created",
-            ]
-        )
-
-        for credit in get_credit_notes(self.conference):
-            writer.writerow(
-                [
-                    _safe_csv_cell(credit.user.get_full_name() or credit.user.username),
-                    _safe_csv_cell(credit.user.email),
-                    str(credit.amount),
-                    str(credit.remaining_amount),
-                    credit.get_status_display(),
-                    _safe_csv_cell(credit.source_order.reference) if credit.source_order else "",
-                    _safe_csv_cell(credit.applied_to_order.reference) if credit.applied_to_order else "",
-                    _safe_csv_cell(credit.note),
-                    credit.created_at.isoformat(),
-                ]
-            )
-
-        return response
+    filename = "credit-notes"
+    columns = (
+        CSVColumn("User", lambda c: c.user.get_full_name() or c.user.username, escape=True),
+        CSVColumn("Email", lambda c: c.user.email, escape=True),
+        CSVColumn("Amount", lambda c: str(c.amount)),
+        CSVColumn("Remaining", lambda c: str(c.remaining_amount)),
+        CSVColumn("Status", lambda c: c.get_status_display()),
+        CSVColumn(
+            "Source Order",
+            lambda c: _safe_csv_cell(c.source_order.reference) if c.source_order else "",
+        ),
+        CSVColumn(
+            "Applied To Order",
+            lambda c: _safe_csv_cell(c.applied_to_order.reference) if c.applied_to_order else "",
+        ),
+        CSVColumn("Note", lambda c: c.note, escape=True),
+        CSVColumn("Created", lambda c: c.created_at.isoformat()),
+    )
+
+    def get_rows(self) -> QuerySet[Credit]:
+        """Return credit records with their user and orders joined in."""
+        return get_credit_notes(self.conference)
 
 
 class SpeakerRegistrationView(ConferencePermissionMixin, TemplateView):
@@ -877,37 +728,20 @@ class SpeakerRegistrationView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class SpeakerRegistrationExportView(ConferencePermissionMixin, View):
+class SpeakerRegistrationExportView(StreamingCSVExportView):
     """CSV export of speaker registration data."""
 
-    required_permission = "export_reports"
+    filename = "speaker-registrations"
+    columns = (
+        CSVColumn("Name", lambda s: str(s.name), escape=True),
+        CSVColumn("Email", lambda s: s.email or (s.user.email if s.user else ""), escape=True),
+        CSVColumn("Talk Count", lambda s: s.talk_count),
+        CSVColumn("Registered", lambda s: yes_no(s.has_paid_order)),
+    )
 
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of speaker registration status.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-speaker-registrations.csv"'
-        writer = csv.writer(response)
-        writer.writerow(["Name", "Email", "Talk Count", "Registered"])
-
-        for speaker in get_speaker_registrations(self.conference):
-            writer.writerow(
-                [
-                    _safe_csv_cell(str(speaker.name)),
-                    _safe_csv_cell(speaker.email or (speaker.user.email if speaker.user else "")),
-                    speaker.talk_count,
-                    "Yes" if speaker.has_paid_order else "No",
-                ]
-            )
-
-        return response
+    def get_rows(self) -> QuerySet[Speaker]:
+        """Return speakers annotated with their registration status."""
+        return get_speaker_registrations(self.conference)
 
 
 class ReconciliationView(ConferencePermissionMixin, TemplateView):
@@ -954,43 +788,38 @@ class ReconciliationView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class ReconciliationExportView(ConferencePermissionMixin, View):
+class ReconciliationExportView(StreamingCSVExportView):
     """CSV export of financial reconciliation data."""
 
-    required_permission = "export_reports"
-
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of reconciliation data.
+    filename = "reconciliation"
+    columns = (
+        CSVColumn("Section", itemgetter(0)),
+        CSVColumn("Item", itemgetter(1)),
+        CSVColumn("Count", itemgetter(2)),
+        CSVColumn("Amount", itemgetter(3)),
+    )
 
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
+    def get_rows(self) -> list[tuple[str, str, int | str, str]]:
+        """Flatten the reconciliation summary and breakdowns into rows."""
         recon = get_reconciliation(self.conference)
-
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-reconciliation.csv"'
-        writer = csv.writer(response)
-
-        writer.writerow(["Section", "Item", "Count", "Amount"])
-        writer.writerow(["Summary", "Total Sales", "", str(recon["sales_total"])])
-        writer.writerow(["Summary", "Total Payments", "", str(recon["payments_total"])])
-        writer.writerow(["Summary", "Credits Issued (Refunds)", "", str(recon["refunds_total"])])
-        writer.writerow(["Summary", "Credits Outstanding", "", str(recon["credits_outstanding"])])
-        writer.writerow(["Summary", "Discrepancy", "", str(recon["discrepancy"])])
-
-        for row in recon["by_payment_method"]:
-            label = dict(Payment.Method.choices).get(row["method"], row["method"])
-            writer.writerow(["Payment Method", label, row["count"], str(row["total"])])
-
-        for row in recon["by_order_status"]:
-            label = dict(Order.Status.choices).get(row["status"], row["status"])
-            writer.writerow(["Order Status", label, row["count"], str(row["total"])])
-
-        return response
+        rows: list[tuple[str, str, int | str, str]] = [
+            ("Summary", "Total Sales", "", str(recon["sales_total"])),
+            ("Summary", "Total Payments", "", str(recon["payments_total"])),
+            ("Summary", "Credits Issued (Refunds)", "", str(recon["refunds_total"])),
+            ("Summary", "Credits Outstanding", "", str(recon["credits_outstanding"])),
+            ("Summary", "Discrepancy", "", str(recon["discrepancy"])),
+        ]
+        method_labels = dict(Payment.Method.choices)
+        rows.extend(
+            ("Payment Method", method_labels.get(row["method"], row["method"]), row["count"], str(row["total"]))
+            for row in recon["by_payment_method"]
+        )
+        status_labels = dict(Order.Status.choices)
+        rows.extend(
+            ("Order Status", status_labels.get(row["status"], row["status"]), row["count"], str(row["total"]))
+            for row in recon["by_order_status"]
+        )
+        return rows
 
 
 class RegistrationFlowView(ConferencePermissionMixin, TemplateView):
@@ -1037,42 +866,22 @@ class RegistrationFlowView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class RegistrationFlowExportView(ConferencePermissionMixin, View):
+class RegistrationFlowExportView(StreamingCSVExportView):
     """CSV export of registration flow data."""
 
-    required_permission = "export_reports"
+    filename = "registration-flow"
+    columns = (
+        CSVColumn("Date", lambda row: row["date"].isoformat()),
+        CSVColumn("Registrations", lambda row: row["registrations"]),
+        CSVColumn("Cancellations", lambda row: row["cancellations"]),
+        CSVColumn("Net", lambda row: row["registrations"] - row["cancellations"]),
+    )
 
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of daily registration flow.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
-
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        date_from = _parse_date_param(request.GET.get("date_from"))
-        date_until = _parse_date_param(request.GET.get("date_until"))
-        rows = get_registration_flow(self.conference, date_from=date_from, date_until=date_until)
-
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-registration-flow.csv"'
-        writer = csv.writer(response)
-        writer.writerow(["Date", "Registrations", "Cancellations", "Net"])
-
-        for row in rows:
-            net = row["registrations"] - row["cancellations"]
-            writer.writerow(
-                [
-                    row["date"].isoformat(),
-                    row["registrations"],
-                    row["cancellations"],
-                    net,
-                ]
-            )
-
-        return response
+    def get_rows(self) -> list[dict[str, Any]]:
+        """Return daily registration flow rows for the requested date range."""
+        date_from = _parse_date_param(self.request.GET.get("date_from"))
+        date_until = _parse_date_param(self.request.GET.get("date_until"))
+        return get_registration_flow(self.conference, date_from=date_from, date_until=date_until)
 
 
 class VisaLetterReportView(ConferencePermissionMixin, TemplateView):
@@ -1115,61 +924,34 @@ class VisaLetterReportView(ConferencePermissionMixin, TemplateView):
         return context
 
 
-class VisaLetterExportView(ConferencePermissionMixin, View):
-    """CSV export of visa invitation letter requests."""
+def _reviewer_name(letter_request: LetterRequest) -> str:
+    """Return the reviewer's display name, or an empty string if unreviewed."""
+    reviewer = letter_request.reviewed_by
+    if reviewer is None:
+        return ""
+    return reviewer.get_full_name() or reviewer.username
 
-    required_permission = "export_reports"
 
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Return a CSV download of all letter requests.
-
-        Args:
-            request: The incoming HTTP request.
-            **kwargs: URL keyword arguments.
+class VisaLetterExportView(StreamingCSVExportView):
+    """CSV export of visa invitation letter requests."""
 
-        Returns:
-            An HttpResponse with CSV content.
-        """
-        qs = (
+    filename = "visa-letters"
+    columns = (
+        CSVColumn("Passport Name", lambda lr: str(lr.passport_name), escape=True),
+        CSVColumn("Nationality", lambda lr: str(lr.nationality), escape=True),
+        CSVColumn("Status", lambda lr: lr.get_status_display()),
+        CSVColumn("Travel From", lambda lr: lr.travel_from.isoformat()),
+        CSVColumn("Travel Until", lambda lr: lr.travel_until.isoformat()),
+        CSVColumn("Embassy", lambda lr: str(lr.embassy_name), escape=True),
+        CSVColumn("Submitted", lambda lr: lr.created_at.isoformat()),
+        CSVColumn("Reviewed By", _reviewer_name, escape=True),
+        CSVColumn("Reviewed At", lambda lr: isoformat_or_blank(lr.reviewed_at)),
+    )
+
+    def get_rows(self) -> QuerySet[LetterRequest]:
+        """Return all letter requests for the conference, newest first."""
+        return (
             LetterRequest.objects.filter(conference=self.conference)
             .select_related("user", "reviewed_by")
             .order_by("-created_at")
         )
-
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{self.conference.slug}-visa-letters.csv"'
-        writer = csv.writer(response)
-        writer.writerow(
-            [
-                "Passport Name",
-                "Nationality",
-                "Status",
-                "Travel From",
-                "Travel Until",
-                "Embassy",
-                "Submitted",
-                "Reviewed By",
-                "Reviewed At",
-            ]
-        )
-
-        for lr in qs:
-            reviewer = ""
-            if lr.reviewed_by:
-                reviewer = lr.reviewed_by.get_full_name() or lr.reviewed_by.username
-
-            writer.writerow(
-                [
-                    _safe_csv_cell(str(lr.passport_name)),
-                    _safe_csv_cell(str(lr.nationality)),
-                    lr.get_status_display(),
-                    lr.travel_from.isoformat(),
-                    lr.travel_until.isoformat(),
-                    _safe_csv_cell(str(lr.embassy_name)),
-                    lr.created_at.isoformat(),
-                    _safe_csv_cell(reviewer),
-                    lr.reviewed_at.isoformat() if lr.reviewed_at else "",
-                ]
-            )
-
-        return response
@@ -3,6 +3,7 @@
 from django.contrib import admin
 
 from django_program.pretalx.models import (
+    PretalxSyncState,
     Room,
     RoomOverride,
     ScheduleSlot,
@@ -123,3 +124,15 @@ class SessionRatingAdmin(admin.ModelAdmin):
     search_fields = ("talk__title", "user__username", "user__email", "comment")
     raw_id_fields = ("talk", "user")
     readonly_fields = ("created_at",)
+
+
+@admin.register(PretalxSyncState)
+class PretalxSyncStateAdmin(admin.ModelAdmin):
+    """Admin interface for inspecting incremental Pretalx sync state.
+
+    Deleting a row makes the next sync fetch that endpoint in full.
+    """
+
+    list_display = ("endpoint", "conference", "checked_at", "updated_at")
+    list_filter = ("conference",)
+    readonly_fields = ("validators", "context_hash", "checked_at", "updated_at")
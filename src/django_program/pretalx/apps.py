@@ -10,3 +10,40 @@ class DjangoProgramPretalxConfig(AppConfig):
     name = "django_program.pretalx"
     label = "program_pretalx"
     verbose_name = "Pretalx Integration"
+
+    def ready(self) -> None:
+        """Connect the schedule snapshot invalidation handlers."""
+        from django.db.models.signals import post_delete, post_save  # noqa: PLC0415
+
+        from django_program.conference.models import Conference  # noqa: PLC0415
+        from django_program.pretalx.models import (  # noqa: PLC0415
+            Room,
+            RoomOverride,
+            ScheduleSlot,
+            Talk,
+            TalkOverride,
+        )
+        from django_program.pretalx.signal_handlers import (  # noqa: PLC0415
+            invalidate_schedule_on_change,
+            rebuild_schedule_on_override_save,
+            rebuild_schedule_on_sync,
+        )
+        from django_program.pretalx.signals import pretalx_synced  # noqa: PLC0415
+
+        overrides = (TalkOverride, RoomOverride)
+        for model in (Conference, Room, ScheduleSlot, Talk, *overrides):
+            label = model.__name__
+            post_save.connect(
+                rebuild_schedule_on_override_save if model in overrides else invalidate_schedule_on_change,
+                sender=model,
+                dispatch_uid=f"pretalx.schedule_snapshot.save.{label}",
+            )
+            post_delete.connect(
+                invalidate_schedule_on_change,
+                sender=model,
+                dispatch_uid=f"pretalx.schedule_snapshot.delete.{label}",
+            )
+        pretalx_synced.connect(
+            rebuild_schedule_on_sync,
+            dispatch_uid="pretalx.schedule_snapshot.sync",
+        )
@@ -10,6 +10,9 @@ Usage::
 
     # Sync talks and schedule
     manage.py sync_pretalx --conference pycon-us-2026 --talks --schedule
+
+    # Rewrite every speaker and talk, even if Pretalx reports no changes
+    manage.py sync_pretalx --conference pycon-us-2026 --full-refresh
 """
 
 from typing import TYPE_CHECKING
@@ -79,6 +82,14 @@ class Command(BaseCommand):
                 "slots. Use only when a major schedule reduction is intentional."
             ),
         )
+        parser.add_argument(
+            "--full-refresh",
+            action="store_true",
+            default=False,
+            help=(
+                "Ignore stored ETag/Last-Modified validators and content hashes, and rewrite every speaker and talk."
+            ),
+        )
 
     def handle(self, **options: object) -> None:
         """Execute the sync command.
@@ -107,15 +118,16 @@ class Command(BaseCommand):
         sync_schedule: bool = bool(options["schedule"])
         sync_all: bool = bool(options["sync_all"])
         allow_large_schedule_drop: bool = bool(options["allow_large_schedule_drop"])
+        full_refresh: bool = bool(options["full_refresh"])
         no_specific_flag = not (sync_rooms or sync_speakers or sync_talks or sync_schedule)
 
         if sync_all or no_specific_flag:
-            results = service.sync_all(allow_large_deletions=allow_large_schedule_drop)
+            results = service.sync_all(allow_large_deletions=allow_large_schedule_drop, full_refresh=full_refresh)
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Synced {results['rooms']} rooms, "
-                    f"{results['speakers']} speakers, "
-                    f"{results['talks']} talks, "
+                    f"{_describe(results['speakers'], 'speakers', service.stats)}, "
+                    f"{_describe(results['talks'], 'talks', service.stats)}, "
                     f"{results['schedule_slots']} schedule slots"
                 )
             )
@@ -126,12 +138,12 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS(f"Synced {count} rooms"))
 
         if sync_speakers:
-            count = service.sync_speakers()
-            self.stdout.write(self.style.SUCCESS(f"Synced {count} speakers"))
+            count = service.sync_speakers(full_refresh=full_refresh)
+            self.stdout.write(self.style.SUCCESS(f"Synced {_describe(count, 'speakers', service.stats)}"))
 
         if sync_talks:
-            count = service.sync_talks()
-            self.stdout.write(self.style.SUCCESS(f"Synced {count} talks"))
+            count = service.sync_talks(full_refresh=full_refresh)
+            self.stdout.write(self.style.SUCCESS(f"Synced {_describe(count, 'talks', service.stats)}"))
 
         if sync_schedule:
             count, unscheduled = service.sync_schedule(allow_large_deletions=allow_large_schedule_drop)
@@ -139,3 +151,14 @@ class Command(BaseCommand):
             if unscheduled:
                 msg += f" ({unscheduled} unscheduled)"
             self.stdout.write(self.style.SUCCESS(msg))
+
+
+def _describe(count: int, entity: str, stats: dict[str, dict[str, int]]) -> str:
+    """Format a synced count with its new/updated/unchanged breakdown, when known."""
+    breakdown = stats.get(entity)
+    if not isinstance(breakdown, dict):
+        return f"{count} {entity}"
+    return (
+        f"{count} {entity} ({breakdown['created']} new, {breakdown['updated']} updated, "
+        f"{breakdown['unchanged']} unchanged)"
+    )
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.11 on 2026-10-16 20:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_conference", "0007_expensecategory_expense"),
+        ("program_pretalx", "0009_sessionrating"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="speaker",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="talk",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+        migrations.CreateModel(
+            name="PretalxSyncState",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("endpoint", models.CharField(max_length=50)),
+                ("validators", models.JSONField(blank=True, default=dict)),
+                ("context_hash", models.CharField(blank=True, default="", max_length=64)),
+                ("checked_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "conference",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pretalx_sync_states",
+                        to="program_conference.conference",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["endpoint"],
+                "unique_together": {("conference", "endpoint")},
+            },
+        ),
+    ]
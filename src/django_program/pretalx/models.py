@@ -1,4 +1,4 @@
-"""Speaker, Talk, Room, ScheduleSlot, and override models for Pretalx data."""
+"""Speaker, Talk, Room, ScheduleSlot, override, and sync-state models for Pretalx data."""
 
 from typing import TYPE_CHECKING
 
@@ -8,6 +8,92 @@ if TYPE_CHECKING:
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Coalesce, NullIf
+
+
+def override_or_field(field: str, *, blank: bool = True) -> Coalesce:
+    """Build the SQL for a field's effective value: the override when set, else the field.
+
+    Args:
+        field: Name of the field on the overridden model; its override lives
+            in ``override__override_<field>``.
+        blank: Whether an unset override is stored as ``""`` (text fields)
+            rather than ``NULL``.
+
+    Returns:
+        A ``Coalesce`` expression usable in ``annotate()``.
+    """
+    override = models.F(f"override__override_{field}")
+    if blank:
+        override = NullIf(override, models.Value(""))
+    return Coalesce(override, models.F(field))
+
+
+class RoomQuerySet(models.QuerySet):
+    """Queryset for rooms with batched override resolution."""
+
+    def with_overrides(self) -> RoomQuerySet:
+        """Join each room's override and annotate its effective values.
+
+        The ``effective_*`` properties read the joined override without
+        further queries.  ``resolved_name`` and ``resolved_capacity`` carry the
+        effective values in SQL, for filtering and ordering.
+
+        Returns:
+            The annotated queryset.
+        """
+        return self.select_related("override").annotate(
+            resolved_name=override_or_field("name"),
+            resolved_capacity=override_or_field("capacity", blank=False),
+        )
+
+
+class SpeakerQuerySet(models.QuerySet):
+    """Queryset for speakers with batched override resolution."""
+
+    def with_overrides(self) -> SpeakerQuerySet:
+        """Join each speaker's override and annotate its effective values.
+
+        The ``effective_*`` properties read the joined override without
+        further queries.  ``resolved_name``, ``resolved_email`` and
+        ``resolved_avatar_url`` carry the effective values in SQL, for
+        filtering and ordering.
+
+        Returns:
+            The annotated queryset.
+        """
+        return self.select_related("override").annotate(
+            resolved_name=override_or_field("name"),
+            resolved_email=override_or_field("email"),
+            resolved_avatar_url=override_or_field("avatar_url"),
+        )
+
+
+class TalkQuerySet(models.QuerySet):
+    """Queryset for talks with batched override resolution."""
+
+    def with_overrides(self) -> TalkQuerySet:
+        """Join each talk's override and rooms and annotate its effective values.
+
+        The ``effective_*`` properties, including ``effective_room`` and that
+        room's ``effective_name``, read the joined rows without further
+        queries.  ``resolved_title``, ``resolved_state``, ``resolved_room_id``,
+        ``resolved_slot_start`` and ``resolved_slot_end`` carry the effective
+        values in SQL, for filtering and ordering.
+
+        Returns:
+            The annotated queryset.
+        """
+        return self.select_related("room__override", "override__override_room__override").annotate(
+            resolved_title=override_or_field("title"),
+            resolved_state=models.Case(
+                models.When(override__is_cancelled=True, then=models.Value("cancelled")),
+                default=override_or_field("state"),
+            ),
+            resolved_room_id=override_or_field("room", blank=False),
+            resolved_slot_start=override_or_field("slot_start", blank=False),
+            resolved_slot_end=override_or_field("slot_end", blank=False),
+        )
 
 
 class Room(models.Model):
@@ -31,6 +117,8 @@ class Room(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = RoomQuerySet.as_manager()
+
     class Meta:
         ordering = ["position", "name"]
         constraints = [
@@ -103,10 +191,13 @@ class Speaker(models.Model):
         blank=True,
         related_name="speaker_profiles",
     )
+    content_hash = models.CharField(max_length=64, blank=True, default="")
     synced_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SpeakerQuerySet.as_manager()
+
     class Meta:
         ordering = ["name"]
         unique_together = [("conference", "pretalx_code")]
@@ -195,10 +286,13 @@ class Talk(models.Model):
     )
     slot_start = models.DateTimeField(null=True, blank=True)
     slot_end = models.DateTimeField(null=True, blank=True)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
     synced_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TalkQuerySet.as_manager()
+
     class Meta:
         ordering = ["slot_start", "title"]
         unique_together = [("conference", "pretalx_code")]
@@ -688,3 +782,32 @@ class SessionRating(models.Model):
 
     def __str__(self) -> str:
         return f"Rating {self.score}/5 for {self.talk} by {self.user}"
+
+
+class PretalxSyncState(models.Model):
+    """Per-endpoint bookkeeping for incremental Pretalx syncs.
+
+    Stores the HTTP validators (``ETag`` / ``Last-Modified``) each page of an
+    endpoint was last served with, so the next sync can revalidate instead of
+    re-downloading.  ``context_hash`` fingerprints the local lookups the
+    synced rows were resolved against (rooms, tracks, speakers, ...); when it
+    changes the validators are ignored and the endpoint is fetched in full.
+    """
+
+    conference = models.ForeignKey(
+        "program_conference.Conference",
+        on_delete=models.CASCADE,
+        related_name="pretalx_sync_states",
+    )
+    endpoint = models.CharField(max_length=50)
+    validators = models.JSONField(blank=True, default=dict)
+    context_hash = models.CharField(max_length=64, blank=True, default="")
+    checked_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["endpoint"]
+        unique_together = [("conference", "endpoint")]
+
+    def __str__(self) -> str:
+        return f"Sync state for '{self.endpoint}'"
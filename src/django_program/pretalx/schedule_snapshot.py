@@ -0,0 +1,198 @@
+"""Cached per-conference snapshots of the public schedule.
+
+Attendees and mobile apps poll the schedule page and its JSON feed all
+through a conference, and each hit used to join schedule slots with their
+talks, rooms and overrides.  This module builds the schedule once -- the
+slots grouped by day, the rendered JSON feed, and an ``ETag`` /
+``Last-Modified`` pair for conditional GETs -- and stores it in the Django
+cache per conference.
+
+Like the management dashboard snapshots, a snapshot is tied to a
+per-conference *schedule version*: a token in the cache that
+:func:`invalidate_schedule_snapshot` replaces whenever slots, talks, rooms
+or their overrides change, so an out-of-date schedule is never served.
+After a Pretalx sync or an override edit the snapshot is also rebuilt as
+soon as the transaction commits, so the next visitor does not pay for it.
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+from django_program.cache_versions import bump_version, current_version
+from django_program.pretalx.models import ScheduleSlot
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from datetime import date
+
+    from django_program.pretalx.models import Room
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PREFIX = "django_program:schedule"
+
+# The fields of each slot that make up the public JSON feed, in feed order.
+_FEED_FIELDS = ("title", "room", "start", "end", "slot_type", "talk_code")
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleSnapshot:
+    """A built schedule and the schedule version it was built at.
+
+    Attributes:
+        version: The schedule version the snapshot was built from.
+        days: ``(date, slots)`` pairs in start order; each slot is a dict
+            with ``title``, ``room``, ``start``, ``end``, ``slot_type``,
+            ``slot_type_display``, ``talk_code`` and ``submission_type``.
+        body: The rendered JSON feed.
+        etag: A strong ``ETag`` for ``body``, including the quotes.
+        last_modified: When ``body`` last changed, as a Unix timestamp.
+    """
+
+    version: str
+    days: tuple[tuple[date, tuple[dict[str, Any], ...]], ...]
+    body: bytes
+    etag: str
+    last_modified: float
+
+
+def _version_key(conference_id: int) -> str:
+    return f"{_CACHE_PREFIX}:version:{conference_id}"
+
+
+def _snapshot_key(conference_id: int) -> str:
+    return f"{_CACHE_PREFIX}:{conference_id}"
+
+
+def schedule_version(conference_id: int) -> str:
+    """Return the conference's current schedule version, creating one if it is missing."""
+    return current_version(_version_key(conference_id))
+
+
+def invalidate_schedule_snapshot(conference_id: int) -> None:
+    """Mark the cached schedule of a conference as out of date.
+
+    Args:
+        conference_id: Primary key of the conference whose schedule changed.
+    """
+    bump_version(_version_key(conference_id))
+
+
+def rebuild_schedule_snapshot_on_commit(conference_id: int) -> None:
+    """Invalidate the cached schedule and rebuild it once the transaction commits.
+
+    Args:
+        conference_id: Primary key of the conference whose schedule changed.
+    """
+    invalidate_schedule_snapshot(conference_id)
+
+    def rebuild() -> None:
+        try:
+            get_schedule_snapshot(conference_id)
+        except Exception:
+            logger.exception("Rebuilding the schedule snapshot for conference %s failed", conference_id)
+
+    transaction.on_commit(rebuild)
+
+
+def _slot_room(slot: ScheduleSlot) -> Room | None:
+    """Return the room a slot is shown in, honouring a talk's room override."""
+    override = getattr(slot.talk, "override", None) if slot.talk is not None else None
+    if override is not None and override.override_room_id:
+        return override.override_room
+    return slot.room
+
+
+def _serialize_slot(slot: ScheduleSlot) -> dict[str, Any]:
+    talk = slot.talk
+    room = _slot_room(slot)
+    return {
+        "title": talk.effective_title if talk is not None else slot.title,
+        "room": room.effective_name if room is not None else "",
+        "start": slot.start,
+        "end": slot.end,
+        "slot_type": slot.slot_type,
+        "slot_type_display": slot.get_slot_type_display(),
+        "talk_code": talk.pretalx_code if talk is not None else "",
+        "submission_type": talk.submission_type if talk is not None else "",
+    }
+
+
+def build_schedule_snapshot(
+    conference_id: int,
+    *,
+    version: str,
+    previous: ScheduleSnapshot | None = None,
+) -> ScheduleSnapshot:
+    """Build the schedule of a conference with a single query.
+
+    Talk and room overrides are joined in the same query and applied to
+    each slot's title and room.
+
+    Args:
+        conference_id: Primary key of the conference whose schedule to build.
+        version: The schedule version read before querying.
+        previous: The last snapshot, whose ``Last-Modified`` is kept when the
+            feed has not changed.
+
+    Returns:
+        The built snapshot.
+    """
+    slots = (
+        ScheduleSlot.objects.filter(conference_id=conference_id)
+        .select_related("talk__override__override_room__override", "room__override")
+        .order_by("start", "room__position", "room__name")
+    )
+    serialized = [_serialize_slot(slot) for slot in slots]
+    feed = [
+        {
+            **{name: slot[name] for name in _FEED_FIELDS},
+            "start": slot["start"].isoformat(),
+            "end": slot["end"].isoformat(),
+        }
+        for slot in serialized
+    ]
+    body = json.dumps(feed, cls=DjangoJSONEncoder).encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    last_modified = previous.last_modified if previous is not None and previous.etag == etag else time.time()
+    days = tuple(
+        (day, tuple(day_slots)) for day, day_slots in itertools.groupby(serialized, key=lambda s: s["start"].date())
+    )
+    return ScheduleSnapshot(version=version, days=days, body=body, etag=etag, last_modified=last_modified)
+
+
+def get_schedule_snapshot(conference_id: int) -> ScheduleSnapshot:
+    """Return the conference's schedule from the cache, building it on a miss.
+
+    Caching is disabled when ``schedule_cache_seconds`` is ``0``; the
+    schedule is then built on every call.
+
+    Args:
+        conference_id: Primary key of the conference whose schedule to return.
+
+    Returns:
+        The current schedule snapshot.
+    """
+    timeout = get_config().schedule_cache_seconds
+    if not timeout:
+        return build_schedule_snapshot(conference_id, version="")
+
+    version = schedule_version(conference_id)
+    cached = cache.get(_snapshot_key(conference_id))
+    if cached is not None and cached.version == version:
+        return cached
+
+    snapshot = build_schedule_snapshot(conference_id, version=version, previous=cached)
+    # Skip the store when the schedule changed while it was being built.
+    if schedule_version(conference_id) == version:
+        cache.set(_snapshot_key(conference_id), snapshot, timeout)
+    return snapshot
@@ -0,0 +1,68 @@
+"""Signal handlers for the pretalx integration app."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from django.db.models import Model
+
+    from django_program.conference.models import Conference
+
+
+def invalidate_schedule_on_change(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Model,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Discard the cached schedule of the changed row's conference.
+
+    Args:
+        sender: The model class of the saved or deleted row.
+        instance: The slot, talk, room, override or conference that was saved
+            or deleted.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.conference.models import Conference  # noqa: PLC0415
+    from django_program.pretalx.schedule_snapshot import invalidate_schedule_snapshot  # noqa: PLC0415
+
+    conference_id = instance.pk if isinstance(instance, Conference) else instance.conference_id
+    if conference_id is not None:
+        invalidate_schedule_snapshot(conference_id)
+
+
+def rebuild_schedule_on_override_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Model,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Rebuild the cached schedule after a talk or room override is edited.
+
+    Args:
+        sender: The ``TalkOverride`` or ``RoomOverride`` class.
+        instance: The override that was saved.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.pretalx.schedule_snapshot import rebuild_schedule_snapshot_on_commit  # noqa: PLC0415
+
+    rebuild_schedule_snapshot_on_commit(instance.conference_id)
+
+
+def rebuild_schedule_on_sync(
+    sender: type,  # noqa: ARG001
+    *,
+    conference: Conference,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Rebuild the cached schedule after a Pretalx sync step.
+
+    Sync steps write with bulk queries that bypass the model signals.
+
+    Args:
+        sender: The ``PretalxSyncService`` class.
+        conference: The conference that was synced.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.pretalx.schedule_snapshot import rebuild_schedule_snapshot_on_commit  # noqa: PLC0415
+
+    rebuild_schedule_snapshot_on_commit(conference.pk)
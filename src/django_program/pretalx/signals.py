@@ -0,0 +1,16 @@
+"""Custom signals for the pretalx app.
+
+Signals:
+    pretalx_synced: Sent after a sync step has written Pretalx data.  Sync
+        steps use bulk writes that bypass model signals, so listeners that
+        cache conference data should invalidate on this instead.
+        Sender: The ``PretalxSyncService`` class.
+        Kwargs:
+            conference: The ``Conference`` that was synced.
+            entity: The data that was synced (``"rooms"``, ``"speakers"``,
+                ``"talks"`` or ``"schedule"``).
+"""
+
+from django.dispatch import Signal
+
+pretalx_synced = Signal()
@@ -6,11 +6,15 @@ models.  Each sync method is idempotent and uses bulk operations for
 performance.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import zoneinfo
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import Max, Min
@@ -18,11 +22,20 @@ from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.text import slugify
 
-from django_program.pretalx.models import Room, ScheduleSlot, Speaker, SubmissionTypeDefault, Talk
+from django_program.pretalx.models import (
+    PretalxSyncState,
+    Room,
+    ScheduleSlot,
+    Speaker,
+    SubmissionTypeDefault,
+    Talk,
+)
 from django_program.pretalx.profiles import resolve_pretalx_profile
+from django_program.pretalx.signals import pretalx_synced
 from django_program.programs.models import Activity
 from django_program.settings import get_config
 from pretalx_client.adapters.normalization import localized as _localized
+from pretalx_client.async_client import AsyncPretalxClient
 from pretalx_client.client import PretalxClient
 
 if TYPE_CHECKING:
@@ -32,10 +45,13 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
     from django_program.conference.models import Conference
+    from pretalx_client.conditional import PageValidators
+    from pretalx_client.models import PretalxSlot, PretalxTalk
 
 logger = logging.getLogger(__name__)
 
 _PROGRESS_CHUNK = 10
+_DELETE_BATCH_SIZE = 500
 
 # Maps Pretalx submission_type names (case-insensitive) to ActivityType values.
 _SUBMISSION_TYPE_TO_ACTIVITY: dict[str, str] = {
@@ -84,6 +100,11 @@ class PretalxSyncService:
             base_url=base_url,
             api_token=api_token,
         )
+        self.async_client = AsyncPretalxClient(
+            conference.pretalx_event_slug,
+            base_url=base_url,
+            api_token=api_token,
+        )
         self._schedule_delete_guard_enabled = config.pretalx.schedule_delete_guard_enabled
         self._schedule_delete_guard_min_existing_slots = config.pretalx.schedule_delete_guard_min_existing_slots
         self._schedule_delete_guard_max_fraction_removed = float(
@@ -92,21 +113,24 @@ class PretalxSyncService:
 
         self._rooms: dict[int, Room] | None = None
         self._room_names: dict[int, str] | None = None
+        self._rooms_by_name: tuple[dict[int, Room], dict[str, Room]] | None = None
         self._submission_types: dict[int, str] | None = None
         self._tracks: dict[int, str] | None = None
         self._tags: dict[int, str] | None = None
+        self.stats: dict[str, dict[str, int]] = {}
         self.profile = resolve_pretalx_profile(
             event_slug=conference.pretalx_event_slug,
             conference_slug=conference.slug,
         )
 
     def _ensure_mappings(self) -> None:
-        """Pre-fetch room, submission type, and track ID-to-name mappings.
+        """Pre-fetch room, submission type, track, and tag ID-to-name mappings.
 
         Fetches each mapping once and caches it on the instance so that
         subsequent sync methods can resolve integer IDs from the real Pretalx
-        API into human-readable names.  Safe to call multiple times; only
-        fetches on the first call.
+        API into human-readable names.  Rooms come from the database; the
+        submission type, track, and tag endpoints are requested concurrently.
+        Safe to call multiple times; only fetches on the first call.
         """
         if self._rooms is None:
             logger.debug("Fetching room mappings for %s", self.conference.slug)
@@ -116,22 +140,41 @@ class PretalxSyncService:
                 if room.pretalx_id is not None
             }
             self._room_names = {pid: str(room.name) for pid, room in self._rooms.items()}
-        if self._submission_types is None:
-            logger.debug("Fetching submission type mappings for %s", self.conference.slug)
-            self._submission_types = self.client.fetch_submission_types()
-        if self._tracks is None:
-            logger.debug("Fetching track mappings for %s", self.conference.slug)
-            self._tracks = self.client.fetch_tracks()
-        if self._tags is None:
-            logger.debug("Fetching tag mappings for %s", self.conference.slug)
-            try:
-                self._tags = self.client.fetch_tags()
-            except RuntimeError:
+        pending = [name for name in ("submission_types", "tracks", "tags") if getattr(self, f"_{name}") is None]
+        if not pending:
+            return
+        logger.debug("Fetching %s mappings for %s", ", ".join(pending), self.conference.slug)
+        results = async_to_sync(self._fetch_mappings)(pending)
+        for name, result in zip(pending, results, strict=True):
+            mapping = result
+            if isinstance(result, RuntimeError) and name == "tags":
                 logger.warning(
                     "Could not fetch tag mappings for %s; continuing without tags",
                     self.conference.slug,
                 )
-                self._tags = {}
+                mapping = {}
+            elif isinstance(result, BaseException):
+                raise result
+            setattr(self, f"_{name}", mapping)
+
+    async def _fetch_mappings(self, names: list[str]) -> list[dict[int, str] | BaseException]:
+        """Fetch the named ID-to-name mappings concurrently.
+
+        Args:
+            names: Mapping names, each matching an ``AsyncPretalxClient.fetch_<name>`` method.
+
+        Returns:
+            One mapping per name, or the exception its request raised.
+        """
+        try:
+            return await asyncio.gather(
+                *(getattr(self.async_client, f"fetch_{name}")() for name in names),
+                return_exceptions=True,
+            )
+        finally:
+            # ``async_to_sync`` runs each call on a fresh event loop, so the
+            # pooled connection cannot outlive it.
+            await self.async_client.aclose()
 
     def sync_rooms(self) -> int:
         """Fetch rooms from Pretalx and upsert into the database.
@@ -172,60 +215,90 @@ class PretalxSyncService:
         self._room_names = None
         self._ensure_mappings()
 
+        pretalx_synced.send(sender=PretalxSyncService, conference=self.conference, entity="rooms")
         return count
 
-    def sync_speakers(self) -> int:
+    def sync_speakers(self, *, full_refresh: bool = False) -> int:
         """Fetch speakers from Pretalx and upsert into the database.
 
         Uses bulk operations for performance and delegates to
         :meth:`sync_speakers_iter` which yields progress dicts.
 
+        Args:
+            full_refresh: Ignore stored validators and content hashes and
+                rewrite every speaker.
+
         Returns:
             The number of speakers synced.
         """
         count = 0
-        for progress in self.sync_speakers_iter():
+        for progress in self.sync_speakers_iter(full_refresh=full_refresh):
             if "count" in progress:
                 count = progress["count"]
         return count
 
-    def sync_speakers_iter(self) -> Iterator[dict[str, int | str]]:
+    def sync_speakers_iter(self, *, full_refresh: bool = False) -> Iterator[dict[str, int | str]]:
         """Bulk sync speakers from Pretalx, yielding progress updates.
 
+        The request is conditional on the validators stored from the last
+        run; if Pretalx answers ``304 Not Modified`` only ``synced_at`` is
+        refreshed.  Otherwise speakers whose content hash is unchanged are
+        not rewritten either, apart from ``synced_at``.
+
+        Args:
+            full_refresh: Ignore stored validators and content hashes and
+                rewrite every speaker.
+
         Yields:
             A ``{"phase": "fetching"}`` dict before the API call,
             dicts with ``current``/``total`` keys during processing,
-            and a final dict with ``count`` when complete.
+            and a final dict with ``count`` (speakers seen) and
+            ``created``/``updated``/``unchanged`` breakdown when complete.
         """
         yield {"phase": "fetching"}
-        api_speakers = self.client.fetch_speakers()
+        state = self._sync_state("speakers")
+        context = ""
+        api_speakers, validators = self.client.fetch_speakers_if_modified(
+            self._stored_validators(state, context, full_refresh=full_refresh),
+        )
+        now = timezone.now()
+        if api_speakers is None:
+            linked = self._link_speaker_users()
+            unchanged = Speaker.objects.filter(conference=self.conference).update(synced_at=now) - linked
+            self._save_sync_state(state, validators, context, now)
+            yield self._sync_result("speakers", created=0, updated=linked, unchanged=unchanged)
+            return
+
         total = len(api_speakers)
         if total == 0:
-            yield {"count": 0}
+            self._save_sync_state(state, validators, context, now)
+            yield self._sync_result("speakers", created=0, updated=0, unchanged=0)
             return
 
-        now = timezone.now()
         yield {"current": 0, "total": total}
 
         existing = {s.pretalx_code: s for s in Speaker.objects.filter(conference=self.conference)}
-
-        emails = {s.email.lower() for s in api_speakers if s.email}
-        user_model: type[AbstractBaseUser] = get_user_model()  # type: ignore[assignment]
-        users_by_email: dict[str, object] = {}
-        if emails:
-            for u in user_model.objects.annotate(
-                email_lower=Lower("email"),
-            ).filter(email_lower__in=emails):
-                users_by_email[u.email_lower] = u
+        users_by_email = self._users_by_email({s.email.lower() for s in api_speakers if s.email})
 
         to_create: list[Speaker] = []
         to_update: list[Speaker] = []
+        unchanged: list[int] = []
 
         for i, api_speaker in enumerate(api_speakers):
-            target = to_update if api_speaker.code in existing else to_create
-            target.append(
-                _build_speaker(api_speaker, self.conference, existing, users_by_email, now),
+            digest = _content_hash(api_speaker.name, api_speaker.biography, api_speaker.avatar_url, api_speaker.email)
+            current = existing.get(api_speaker.code)
+            needs_user = (
+                current is not None
+                and current.user_id is None
+                and bool(api_speaker.email)
+                and api_speaker.email.lower() in users_by_email
             )
+            if current is not None and current.content_hash == digest and not needs_user and not full_refresh:
+                unchanged.append(current.pk)
+            else:
+                speaker = _build_speaker(api_speaker, self.conference, existing, users_by_email, now)
+                speaker.content_hash = digest
+                (to_update if current is not None else to_create).append(speaker)
             if (i + 1) % _PROGRESS_CHUNK == 0 or (i + 1) == total:
                 yield {"current": i + 1, "total": total}
 
@@ -234,31 +307,100 @@ class PretalxSyncService:
         if to_update:
             Speaker.objects.bulk_update(
                 to_update,
-                fields=["name", "biography", "avatar_url", "email", "synced_at", "user"],
+                fields=["name", "biography", "avatar_url", "email", "content_hash", "synced_at", "user"],
                 batch_size=500,
             )
+        if unchanged:
+            Speaker.objects.filter(pk__in=unchanged).update(synced_at=now)
+        self._save_sync_state(state, validators, context, now)
+        yield self._sync_result("speakers", created=len(to_create), updated=len(to_update), unchanged=len(unchanged))
+
+    def _users_by_email(self, emails: set[str]) -> dict[str, object]:
+        """Map lower-cased emails to existing users, in one query."""
+        users_by_email: dict[str, object] = {}
+        if emails:
+            user_model: type[AbstractBaseUser] = get_user_model()  # type: ignore[assignment]
+            for u in user_model.objects.annotate(
+                email_lower=Lower("email"),
+            ).filter(email_lower__in=emails):
+                users_by_email[u.email_lower] = u
+        return users_by_email
+
+    def _link_speaker_users(self) -> int:
+        """Link unlinked speakers to users who have since registered with their email.
+
+        Keeps the user matching of a full sync when Pretalx reports no
+        changes.
+
+        Returns:
+            The number of speakers that were linked.
+        """
+        unlinked = list(Speaker.objects.filter(conference=self.conference, user__isnull=True).exclude(email=""))
+        users_by_email = self._users_by_email({s.email.lower() for s in unlinked})
+        linked = []
+        for speaker in unlinked:
+            matched = users_by_email.get(speaker.email.lower())
+            if matched:
+                speaker.user = matched
+                linked.append(speaker)
+        if linked:
+            Speaker.objects.bulk_update(linked, fields=["user"], batch_size=500)
+        return len(linked)
 
-        count = len(to_create) + len(to_update)
+    def _sync_state(self, endpoint: str) -> PretalxSyncState:
+        state, _created = PretalxSyncState.objects.get_or_create(conference=self.conference, endpoint=endpoint)
+        return state
+
+    @staticmethod
+    def _stored_validators(state: PretalxSyncState, context: str, *, full_refresh: bool) -> PageValidators | None:
+        """Return the validators to revalidate with, or ``None`` to fetch in full.
+
+        Validators are only usable while the lookups the rows were resolved
+        against (``context``) are the same as on the run that stored them.
+        """
+        if full_refresh or state.context_hash != context:
+            return None
+        return state.validators or None
+
+    @staticmethod
+    def _save_sync_state(state: PretalxSyncState, validators: PageValidators, context: str, now: datetime) -> None:
+        state.validators = validators
+        state.context_hash = context
+        state.checked_at = now
+        state.save(update_fields=["validators", "context_hash", "checked_at", "updated_at"])
+
+    def _sync_result(self, entity: str, *, created: int, updated: int, unchanged: int) -> dict[str, int | str]:
+        """Record and log the outcome of a speaker or talk sync, returning its final progress dict."""
+        pretalx_synced.send(sender=PretalxSyncService, conference=self.conference, entity=entity)
+        counts = {"created": created, "updated": updated, "unchanged": unchanged}
+        self.stats[entity] = counts
+        count = created + updated + unchanged
         logger.info(
-            "Synced %d speakers (%d new, %d updated) for %s",
+            "Synced %d %s (%d new, %d updated, %d unchanged) for %s",
             count,
-            len(to_create),
-            len(to_update),
+            entity,
+            created,
+            updated,
+            unchanged,
             self.conference.slug,
         )
-        yield {"count": count}
+        return {"count": count, **counts}
 
-    def sync_talks(self) -> int:
+    def sync_talks(self, *, full_refresh: bool = False) -> int:
         """Fetch talks from Pretalx and upsert into the database.
 
         Uses bulk operations for performance and delegates to
         :meth:`sync_talks_iter` which yields progress dicts.
 
+        Args:
+            full_refresh: Ignore stored validators and content hashes and
+                rewrite every talk.
+
         Returns:
             The number of talks synced.
         """
         count = 0
-        for progress in self.sync_talks_iter():
+        for progress in self.sync_talks_iter(full_refresh=full_refresh):
             if "count" in progress:
                 count = progress["count"]
         return count
@@ -296,109 +438,148 @@ class PretalxSyncService:
                 batch_size=500,
             )
 
-    def sync_talks_iter(self) -> Iterator[dict[str, int | str]]:
+    def _talk_row(
+        self,
+        api_talk: PretalxTalk,
+        speaker_pk_map: dict[str, int],
+    ) -> tuple[dict[str, object], list[int], str]:
+        """Resolve an API talk into model field values, speaker PKs, and their content hash."""
+        room = self._resolve_room(api_talk.room)
+        fields = {
+            "title": api_talk.title,
+            "abstract": api_talk.abstract,
+            "description": api_talk.description,
+            "submission_type": api_talk.submission_type,
+            "track": self.profile.sync_track(api_talk),
+            "tags": self.profile.sync_tags(api_talk),
+            "duration": api_talk.duration,
+            "state": api_talk.state,
+            "room": room,
+            "slot_start": _parse_iso_datetime(api_talk.slot_start),
+            "slot_end": _parse_iso_datetime(api_talk.slot_end),
+        }
+        speaker_pks = [speaker_pk_map[code] for code in api_talk.speaker_codes if code in speaker_pk_map]
+        return fields, speaker_pks, _content_hash({**fields, "room": room.pk if room else None}, speaker_pks)
+
+    @staticmethod
+    def _write_talks(to_create: list[Talk], to_update: list[Talk]) -> None:
+        """Bulk-insert new talks and bulk-update changed ones."""
+        if to_create:
+            Talk.objects.bulk_create(to_create, batch_size=500)
+        if to_update:
+            Talk.objects.bulk_update(
+                to_update,
+                fields=[
+                    "title",
+                    "abstract",
+                    "description",
+                    "submission_type",
+                    "track",
+                    "tags",
+                    "duration",
+                    "state",
+                    "room",
+                    "slot_start",
+                    "slot_end",
+                    "content_hash",
+                    "synced_at",
+                ],
+                batch_size=500,
+            )
+
+    def sync_talks_iter(self, *, full_refresh: bool = False) -> Iterator[dict[str, int | str]]:
         """Bulk sync talks from Pretalx, yielding progress updates.
 
+        Like :meth:`sync_speakers_iter`, the request is conditional and talks
+        whose content hash (including their room and speakers) is unchanged
+        are not rewritten (only ``synced_at`` is refreshed) and keep their speakers.
+
+        Args:
+            full_refresh: Ignore stored validators and content hashes and
+                rewrite every talk.
+
         Yields:
             A ``{"phase": "fetching"}`` dict before the API call,
             dicts with ``current``/``total`` keys during processing,
-            and a final dict with ``count`` when complete.
+            and a final dict with ``count`` (talks seen) and
+            ``created``/``updated``/``unchanged`` breakdown when complete.
         """
         self._ensure_mappings()
         yield {"phase": "fetching"}
-        api_talks = self.client.fetch_talks(
+        speaker_pk_map = dict(
+            Speaker.objects.filter(conference=self.conference).values_list("pretalx_code", "pk"),
+        )
+        state = self._sync_state("talks")
+        context = _content_hash(
+            self._submission_types,
+            self._tracks,
+            self._tags,
+            {pid: [room.pk, room.name] for pid, room in (self._rooms or {}).items()},
+            speaker_pk_map,
+        )
+        api_talks, validators = self.client.fetch_talks_if_modified(
+            self._stored_validators(state, context, full_refresh=full_refresh),
             submission_types=self._submission_types,
             tracks=self._tracks,
             tags=self._tags,
             rooms=self._room_names,
         )
-        total = len(api_talks)
-        if total == 0:
-            yield {"count": 0}
+        now = timezone.now()
+        if not api_talks:
+            # ``None`` means Pretalx answered 304: every stored talk is unchanged.
+            self._save_sync_state(state, validators, context, now)
+            talks = Talk.objects.filter(conference=self.conference)
+            unchanged = talks.update(synced_at=now) if api_talks is None else 0
+            yield self._sync_result("talks", created=0, updated=0, unchanged=unchanged)
             return
 
-        now = timezone.now()
+        total = len(api_talks)
         yield {"current": 0, "total": total}
 
         existing = {t.pretalx_code: t for t in Talk.objects.filter(conference=self.conference)}
-        speaker_pk_map = {s.pretalx_code: s.pk for s in Speaker.objects.filter(conference=self.conference)}
 
         to_create: list[Talk] = []
         to_update: list[Talk] = []
         m2m_map: dict[str, list[int]] = {}
+        unchanged: list[int] = []
 
         for i, api_talk in enumerate(api_talks):
-            room = self._resolve_room(api_talk.room)
-            fields = {
-                "title": api_talk.title,
-                "abstract": api_talk.abstract,
-                "description": api_talk.description,
-                "submission_type": api_talk.submission_type,
-                "track": self.profile.sync_track(api_talk),
-                "tags": self.profile.sync_tags(api_talk),
-                "duration": api_talk.duration,
-                "state": api_talk.state,
-                "room": room,
-                "slot_start": _parse_iso_datetime(api_talk.slot_start),
-                "slot_end": _parse_iso_datetime(api_talk.slot_end),
-                "synced_at": now,
-            }
-
-            if api_talk.code in existing:
-                talk = existing[api_talk.code]
+            fields, speaker_pks, digest = self._talk_row(api_talk, speaker_pk_map)
+            current = existing.get(api_talk.code)
+            if current is not None and current.content_hash == digest and not full_refresh:
+                unchanged.append(current.pk)
+            elif current is not None:
                 for k, v in fields.items():
-                    setattr(talk, k, v)
-                to_update.append(talk)
+                    setattr(current, k, v)
+                current.content_hash = digest
+                current.synced_at = now
+                to_update.append(current)
+                m2m_map[api_talk.code] = speaker_pks
             else:
                 to_create.append(
                     Talk(
                         conference=self.conference,
                         pretalx_code=api_talk.code,
+                        content_hash=digest,
+                        synced_at=now,
                         **fields,
                     )
                 )
-
-            m2m_map[api_talk.code] = [speaker_pk_map[code] for code in api_talk.speaker_codes if code in speaker_pk_map]
+                m2m_map[api_talk.code] = speaker_pks
 
             if (i + 1) % _PROGRESS_CHUNK == 0 or (i + 1) == total:
                 yield {"current": i + 1, "total": total}
 
-        if to_create:
-            Talk.objects.bulk_create(to_create, batch_size=500)
-        if to_update:
-            Talk.objects.bulk_update(
-                to_update,
-                fields=[
-                    "title",
-                    "abstract",
-                    "description",
-                    "submission_type",
-                    "track",
-                    "tags",
-                    "duration",
-                    "state",
-                    "room",
-                    "slot_start",
-                    "slot_end",
-                    "synced_at",
-                ],
-                batch_size=500,
-            )
+        self._write_talks(to_create, to_update)
+        if unchanged:
+            Talk.objects.filter(pk__in=unchanged).update(synced_at=now)
 
-        self._bulk_set_talk_speakers(m2m_map)
+        if m2m_map:
+            self._bulk_set_talk_speakers(m2m_map)
+            self._sync_activities_from_talks(now)
 
-        count = len(to_create) + len(to_update)
-        logger.info(
-            "Synced %d talks (%d new, %d updated) for %s",
-            count,
-            len(to_create),
-            len(to_update),
-            self.conference.slug,
-        )
-
-        self._sync_activities_from_talks(now)
-
-        yield {"count": count}
+        self._save_sync_state(state, validators, context, now)
+        yield self._sync_result("talks", created=len(to_create), updated=len(to_update), unchanged=len(unchanged))
 
     def _sync_activities_from_talks(self, now: datetime) -> None:
         """Auto-create or update Activities for Pretalx submission types.
@@ -544,7 +725,7 @@ class PretalxSyncService:
         """Fetch schedule slots from Pretalx and upsert into the database.
 
         Slots that no longer appear in the Pretalx schedule are deleted
-        after the sync completes.
+        after the sync completes.  Delegates to :meth:`sync_schedule_iter`.
 
         Args:
             allow_large_deletions: When ``True``, bypasses the schedule-drop
@@ -555,80 +736,134 @@ class PretalxSyncService:
             *unscheduled_count* is the number of talks that still have
             no scheduled slot after the sync.
         """
-        with transaction.atomic():
-            self._ensure_mappings()
-            api_slots = self.client.fetch_schedule(rooms=self._room_names)
-            existing_count = ScheduleSlot.objects.filter(conference=self.conference).count()
-            now = timezone.now()
-            count = 0
-
-            for api_slot in api_slots:
-                talk = None
-                slot_type = _classify_slot(api_slot.title, api_slot.code)
-                title = api_slot.title
-
-                if api_slot.code:
-                    try:
-                        talk = Talk.objects.get(
-                            conference=self.conference,
-                            pretalx_code=api_slot.code,
-                        )
-                        title = title or talk.title
-                    except Talk.DoesNotExist:
-                        # Some schedule slots legitimately have no local Talk
-                        # record (for example external events).
-                        pass
-
-                start_dt = api_slot.start_dt or _parse_iso_datetime(api_slot.start)
-                end_dt = api_slot.end_dt or _parse_iso_datetime(api_slot.end)
-
-                if start_dt is None or end_dt is None:
-                    logger.warning("Skipping slot with unparsable times: %s", api_slot)
-                    continue
+        count = 0
+        unscheduled = 0
+        for progress in self.sync_schedule_iter(allow_large_deletions=allow_large_deletions):
+            if "count" in progress:
+                count = int(progress["count"])
+                unscheduled = int(progress["unscheduled"])
+        return count, unscheduled
 
-                room = self._resolve_room(api_slot.room)
+    def sync_schedule_iter(self, *, allow_large_deletions: bool = False) -> Iterator[dict[str, int | str]]:
+        """Bulk sync schedule slots from Pretalx, yielding progress updates.
 
-                ScheduleSlot.objects.update_or_create(
-                    conference=self.conference,
-                    start=start_dt,
-                    room=room,
-                    defaults={
-                        "talk": talk,
-                        "title": title,
-                        "end": end_dt,
-                        "slot_type": slot_type,
-                        "synced_at": now,
-                    },
-                )
+        Existing slots are keyed by ``(start, room)`` and diffed in memory
+        against the API payload, then written with ``bulk_create`` /
+        ``bulk_update`` and a batched delete of stale slots.  Only the
+        writes run inside a transaction; the API fetch does not.
 
-                logger.debug("Synced slot %s at %s in %s", title, start_dt, api_slot.room)
-                count += 1
+        Args:
+            allow_large_deletions: When ``True``, bypasses the schedule-drop
+                safety guard and permits large stale-slot deletions.
 
-            stale_qs = ScheduleSlot.objects.filter(
-                conference=self.conference,
-            ).exclude(synced_at=now)
-            stale_count = stale_qs.count()
-            self._check_schedule_deletion_safety(
-                existing_count=existing_count,
-                stale_count=stale_count,
-                allow_large_deletions=allow_large_deletions,
+        Yields:
+            A ``{"phase": "fetching"}`` dict before the API call,
+            dicts with ``current``/``total`` keys during processing,
+            and a final dict with ``count`` and ``unscheduled`` when complete.
+
+        Raises:
+            RuntimeError: If the stale-slot deletion would trip the
+                schedule-drop safety guard.  Nothing is written in that case.
+        """
+        self._ensure_mappings()
+        yield {"phase": "fetching"}
+        api_slots = self.client.fetch_schedule(rooms=self._room_names)
+        now = timezone.now()
+        total = len(api_slots)
+        yield {"current": 0, "total": total}
+
+        talks_by_code = {
+            code: (pk, title)
+            for code, pk, title in Talk.objects.filter(conference=self.conference).values_list(
+                "pretalx_code", "pk", "title"
             )
-            stale_count, _ = stale_qs.delete()
-            if stale_count:
-                logger.info("Removed %d stale schedule slots for %s", stale_count, self.conference.slug)
+        }
+        existing = {
+            (slot.start, slot.room_id): slot for slot in ScheduleSlot.objects.filter(conference=self.conference)
+        }
 
-            logger.info("Synced %d schedule slots for %s", count, self.conference.slug)
+        to_create: dict[tuple[datetime, int | None], ScheduleSlot] = {}
+        to_update: dict[tuple[datetime, int | None], ScheduleSlot] = {}
+        count = 0
 
-            self._backfill_talks_from_schedule()
+        for i, api_slot in enumerate(api_slots):
+            times = _slot_times(api_slot)
+            if times is None:
+                logger.warning("Skipping slot with unparsable times: %s", api_slot)
+            else:
+                start_dt, end_dt = times
+                # Some schedule slots legitimately have no local Talk record
+                # (for example external events).
+                talk_pk, talk_title = talks_by_code.get(api_slot.code, (None, "")) if api_slot.code else (None, "")
+                room = self._resolve_room(api_slot.room)
+                key = (start_dt, room.pk if room else None)
+                fields = {
+                    "talk_id": talk_pk,
+                    "title": api_slot.title or talk_title,
+                    "end": end_dt,
+                    "slot_type": _classify_slot(api_slot.title, api_slot.code),
+                    "synced_at": now,
+                }
+                slot = existing.get(key)
+                if slot is not None:
+                    for k, v in fields.items():
+                        setattr(slot, k, v)
+                    to_update[key] = slot
+                else:
+                    to_create[key] = ScheduleSlot(conference=self.conference, start=start_dt, room=room, **fields)
+                count += 1
 
-            unscheduled = Talk.objects.filter(
-                conference=self.conference,
-                slot_start__isnull=True,
-            ).count()
-            if unscheduled:
-                logger.info("%d talks remain unscheduled for %s", unscheduled, self.conference.slug)
+            if (i + 1) % _PROGRESS_CHUNK == 0 or (i + 1) == total:
+                yield {"current": i + 1, "total": total}
 
-            return count, unscheduled
+        stale_pks = [slot.pk for key, slot in existing.items() if key not in to_update]
+        self._check_schedule_deletion_safety(
+            existing_count=len(existing),
+            stale_count=len(stale_pks),
+            allow_large_deletions=allow_large_deletions,
+        )
+
+        self._write_schedule(stale_pks, list(to_create.values()), list(to_update.values()))
+
+        if stale_pks:
+            logger.info("Removed %d stale schedule slots for %s", len(stale_pks), self.conference.slug)
+        logger.info(
+            "Synced %d schedule slots (%d new, %d updated) for %s",
+            count,
+            len(to_create),
+            len(to_update),
+            self.conference.slug,
+        )
+
+        unscheduled = Talk.objects.filter(
+            conference=self.conference,
+            slot_start__isnull=True,
+        ).count()
+        if unscheduled:
+            logger.info("%d talks remain unscheduled for %s", unscheduled, self.conference.slug)
+
+        pretalx_synced.send(sender=PretalxSyncService, conference=self.conference, entity="schedule")
+        yield {"count": count, "unscheduled": unscheduled}
+
+    def _write_schedule(
+        self,
+        stale_pks: list[int],
+        to_create: list[ScheduleSlot],
+        to_update: list[ScheduleSlot],
+    ) -> None:
+        """Apply a schedule diff and backfill talk times in one transaction."""
+        with transaction.atomic():
+            for start in range(0, len(stale_pks), _DELETE_BATCH_SIZE):
+                ScheduleSlot.objects.filter(pk__in=stale_pks[start : start + _DELETE_BATCH_SIZE]).delete()
+            if to_create:
+                ScheduleSlot.objects.bulk_create(to_create, batch_size=500)
+            if to_update:
+                ScheduleSlot.objects.bulk_update(
+                    to_update,
+                    fields=["talk", "title", "end", "slot_type", "synced_at"],
+                    batch_size=500,
+                )
+            self._backfill_talks_from_schedule()
 
     def _backfill_talks_from_schedule(self) -> None:
         """Populate talk room/slot fields from linked schedule slots.
@@ -662,6 +897,10 @@ class PretalxSyncService:
     def _resolve_room(self, room_name: str) -> Room | None:
         """Look up a Room instance by its display name.
 
+        The name index is built once per ``_rooms`` mapping, so resolving
+        every slot of a large schedule stays a dict lookup.  When two rooms
+        share a name the first one wins.
+
         Args:
             room_name: The room display name as resolved from the Pretalx API.
 
@@ -671,10 +910,12 @@ class PretalxSyncService:
         """
         if not room_name or self._rooms is None:
             return None
-        for room in self._rooms.values():
-            if room.name == room_name:
-                return room
-        return None
+        if self._rooms_by_name is None or self._rooms_by_name[0] is not self._rooms:
+            by_name: dict[str, Room] = {}
+            for room in self._rooms.values():
+                by_name.setdefault(str(room.name), room)
+            self._rooms_by_name = (self._rooms, by_name)
+        return self._rooms_by_name[1].get(room_name)
 
     def apply_type_defaults(self) -> int:
         """Apply SubmissionTypeDefault records to unscheduled talks.
@@ -746,9 +987,14 @@ class PretalxSyncService:
             )
         return len(to_update)
 
-    def sync_all(self, *, allow_large_deletions: bool = False) -> dict[str, int]:
+    def sync_all(self, *, allow_large_deletions: bool = False, full_refresh: bool = False) -> dict[str, int]:
         """Run all sync operations in dependency order.
 
+        Args:
+            allow_large_deletions: Passed through to :meth:`sync_schedule`.
+            full_refresh: Rewrite every speaker and talk instead of only
+                the ones that changed.
+
         Returns:
             A mapping of entity type to the number synced.  The
             ``schedule_slots`` key contains only the synced count;
@@ -759,8 +1005,8 @@ class PretalxSyncService:
         schedule_count, unscheduled = self.sync_schedule(allow_large_deletions=allow_large_deletions)
         result: dict[str, int] = {
             "rooms": self.sync_rooms(),
-            "speakers": self.sync_speakers(),
-            "talks": self.sync_talks(),
+            "speakers": self.sync_speakers(full_refresh=full_refresh),
+            "talks": self.sync_talks(full_refresh=full_refresh),
             "schedule_slots": schedule_count,
         }
         if unscheduled:
@@ -807,6 +1053,12 @@ def _build_speaker(
     )
 
 
+def _content_hash(*values: object) -> str:
+    """Return a stable SHA-256 hex digest of JSON-serializable ``values``."""
+    payload = json.dumps(values, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
 def _parse_iso_datetime(value: str) -> datetime | None:
     """Parse an ISO 8601 string into a datetime, returning ``None`` on failure."""
     if not value:
@@ -817,6 +1069,19 @@ def _parse_iso_datetime(value: str) -> datetime | None:
         return None
 
 
+def _slot_times(api_slot: PretalxSlot) -> tuple[datetime, datetime] | None:
+    """Return a slot's timezone-aware start and end, or ``None`` if either is unparsable."""
+    start_dt = api_slot.start_dt or _parse_iso_datetime(api_slot.start)
+    end_dt = api_slot.end_dt or _parse_iso_datetime(api_slot.end)
+    if start_dt is None or end_dt is None:
+        return None
+    if timezone.is_naive(start_dt):
+        start_dt = timezone.make_aware(start_dt)
+    if timezone.is_naive(end_dt):
+        end_dt = timezone.make_aware(end_dt)
+    return start_dt, end_dt
+
+
 def _classify_slot(title: str, code: str) -> str:
     """Determine the slot type from a Pretalx slot's title and code."""
     if code:
@@ -2,26 +2,29 @@
 
 Provides read-only schedule, talk, and speaker views scoped to a conference
 via the ``conference_slug`` URL kwarg.  All views resolve the conference from
-the URL and return a 404 if the slug does not match.
+the URL and return a 404 if the slug does not match.  The schedule views are
+served from the cached snapshot in
+:mod:`django_program.pretalx.schedule_snapshot`.
 """
 
-import itertools
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.db.models import Prefetch
+from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django.views import View
 from django.views.generic import DetailView, ListView, TemplateView
 
 from django_program.conference.models import Conference
 from django_program.features import FeatureRequiredMixin
-from django_program.pretalx.models import ScheduleSlot, Speaker, Talk
+from django_program.pretalx.models import Speaker, Talk
+from django_program.pretalx.schedule_snapshot import get_schedule_snapshot
 
 if TYPE_CHECKING:
-    from datetime import date
-
     from django.db.models import QuerySet
 
 
@@ -78,7 +81,8 @@ class ScheduleView(ConferenceMixin, FeatureRequiredMixin, TemplateView):
     """Full schedule view grouped by day.
 
     Renders the conference schedule with slots organized by date. Each day
-    is a ``(date, list[ScheduleSlot])`` tuple ordered by start time.
+    is a ``(date, list[dict])`` tuple ordered by start time, taken from the
+    cached schedule snapshot.
     """
 
     required_feature = "public_ui"
@@ -91,19 +95,8 @@ class ScheduleView(ConferenceMixin, FeatureRequiredMixin, TemplateView):
             Context dict containing ``conference`` and ``days``.
         """
         context = super().get_context_data(**kwargs)
-        slots = (
-            ScheduleSlot.objects.filter(
-                conference=self.conference,
-            )
-            .select_related("talk", "room")
-            .order_by("start", "room__position", "room__name")
-        )
-
-        days: list[tuple[date, list[ScheduleSlot]]] = [
-            (day, list(day_slots)) for day, day_slots in itertools.groupby(slots, key=lambda s: s.start.date())
-        ]
-
-        context["days"] = days
+        snapshot = get_schedule_snapshot(self.conference.pk)
+        context["days"] = [(day, list(day_slots)) for day, day_slots in snapshot.days]
         try:
             conference_tz = ZoneInfo(self.conference.timezone)
         except (ZoneInfoNotFoundError, ValueError):  # fmt: skip
@@ -118,48 +111,39 @@ class ScheduleJSONView(ConferenceMixin, FeatureRequiredMixin, View):
     Returns a JSON array of schedule slots suitable for embedding in
     JavaScript schedule widgets. Each slot includes title, room, start/end
     times, slot type, and the linked talk code when available.
+
+    The body is the pre-rendered feed from the schedule snapshot.  Responses
+    carry ``ETag`` and ``Last-Modified`` headers, and a client whose copy is
+    current gets a ``304 Not Modified``.
     """
 
     required_feature = "public_ui"
 
-    def get(self, _request: HttpRequest, **_kwargs: str) -> JsonResponse:
+    def get(self, request: HttpRequest, **_kwargs: str) -> HttpResponse:
         """Return schedule slots as a JSON array.
 
         Args:
-            _request: The incoming HTTP request.
+            request: The incoming HTTP request.
             **_kwargs: URL keyword arguments (unused).
 
         Returns:
-            A JSON response with the schedule data.
+            A JSON response with the schedule data, or a 304 response when
+            the client's ``If-None-Match`` / ``If-Modified-Since`` matches.
         """
-        slots = (
-            ScheduleSlot.objects.filter(
-                conference=self.conference,
-            )
-            .select_related("talk", "room")
-            .order_by("start", "room__position", "room__name")
-        )
-
-        data = [
-            {
-                "title": slot.display_title,
-                "room": slot.room.name if slot.room else "",
-                "start": slot.start.isoformat(),
-                "end": slot.end.isoformat(),
-                "slot_type": slot.slot_type,
-                "talk_code": slot.talk.pretalx_code if slot.talk else "",
-            }
-            for slot in slots
-        ]
-
-        return JsonResponse(data, safe=False)
+        snapshot = get_schedule_snapshot(self.conference.pk)
+        last_modified = int(snapshot.last_modified)
+        response = HttpResponse(snapshot.body, content_type="application/json")
+        response["ETag"] = snapshot.etag
+        response["Last-Modified"] = http_date(last_modified)
+        # Given the response, a 304 keeps its ETag and Last-Modified headers.
+        return get_conditional_response(request, etag=snapshot.etag, last_modified=last_modified, response=response)
 
 
 class TalkDetailView(ConferenceMixin, FeatureRequiredMixin, DetailView):
     """Detail view for a single talk.
 
     Looks up the talk by its Pretalx code within the conference scope.
-    Prefetches the speakers relation for display.
+    Overrides are resolved for the talk, its room and its speakers.
     """
 
     required_feature = "public_ui"
@@ -176,7 +160,9 @@ class TalkDetailView(ConferenceMixin, FeatureRequiredMixin, DetailView):
             Http404: If no talk matches the conference and code.
         """
         return get_object_or_404(
-            Talk.objects.prefetch_related("speakers"),
+            Talk.objects.with_overrides().prefetch_related(
+                Prefetch("speakers", queryset=Speaker.objects.with_overrides()),
+            ),
             conference=self.conference,
             pretalx_code=self.kwargs["pretalx_code"],
         )
@@ -193,26 +179,26 @@ class TalkDetailView(ConferenceMixin, FeatureRequiredMixin, DetailView):
 
 
 class SpeakerListView(ConferenceMixin, FeatureRequiredMixin, ListView):
-    """List view of all speakers for a conference, ordered by name."""
+    """List view of all speakers for a conference, ordered by effective name."""
 
     required_feature = "public_ui"
     template_name = "django_program/pretalx/speaker_list.html"
     context_object_name = "speakers"
 
     def get_queryset(self) -> QuerySet[Speaker]:
-        """Return speakers for the current conference ordered by name.
+        """Return speakers for the current conference ordered by effective name.
 
         Returns:
-            A queryset of Speaker instances.
+            A queryset of Speaker instances with their overrides resolved.
         """
-        return Speaker.objects.filter(conference=self.conference).order_by("name")
+        return Speaker.objects.filter(conference=self.conference).with_overrides().order_by("resolved_name")
 
 
 class SpeakerDetailView(ConferenceMixin, FeatureRequiredMixin, DetailView):
     """Detail view for a single speaker.
 
     Looks up the speaker by their Pretalx code within the conference scope.
-    Prefetches talks for display.
+    Overrides are resolved for the speaker and their talks.
     """
 
     required_feature = "public_ui"
@@ -229,7 +215,9 @@ class SpeakerDetailView(ConferenceMixin, FeatureRequiredMixin, DetailView):
             Http404: If no speaker matches the conference and code.
         """
         return get_object_or_404(
-            Speaker.objects.prefetch_related("talks"),
+            Speaker.objects.with_overrides().prefetch_related(
+                Prefetch("talks", queryset=Talk.objects.with_overrides()),
+            ),
             conference=self.conference,
             pretalx_code=self.kwargs["pretalx_code"],
         )
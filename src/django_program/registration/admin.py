@@ -204,7 +204,7 @@ class StripeCustomerAdmin(admin.ModelAdmin):
 class StripeEventAdmin(admin.ModelAdmin):
     """Read-only admin for Stripe webhook events."""
 
-    list_display = ("stripe_id", "kind", "processed", "livemode", "created_at")
+    list_display = ("stripe_id", "kind", "processed", "attempts", "livemode", "created_at")
     list_filter = ("kind", "processed", "livemode")
     search_fields = ("stripe_id", "customer_id")
     readonly_fields = (
@@ -214,6 +214,8 @@ class StripeEventAdmin(admin.ModelAdmin):
         "payload",
         "customer_id",
         "processed",
+        "attempts",
+        "next_attempt_at",
         "api_version",
         "created_at",
     )
@@ -13,10 +13,129 @@ class DjangoProgramRegistrationConfig(AppConfig):
 
     def ready(self) -> None:
         """Connect signal handlers."""
-        from django_program.registration.signal_handlers import create_attendee_on_order_paid  # noqa: PLC0415
+        from django.db.models.signals import m2m_changed, post_delete, post_init, post_save, pre_delete  # noqa: PLC0415
+
+        from django_program.conference.models import Conference  # noqa: PLC0415
+        from django_program.registration.models import (  # noqa: PLC0415
+            Attendee,
+            CheckIn,
+            Order,
+            OrderLineItem,
+            ProductRedemption,
+        )
+        from django_program.registration.services.condition_plan import CONDITION_MODELS  # noqa: PLC0415
+        from django_program.registration.signal_handlers import (  # noqa: PLC0415
+            count_inventory_on_line_item_delete,
+            count_inventory_on_line_item_save,
+            count_registration_on_attendee_delete,
+            count_registration_on_attendee_save,
+            create_attendee_on_order_paid,
+            invalidate_condition_plan_on_conference_change,
+            invalidate_condition_plan_on_m2m_change,
+            invalidate_condition_plan_on_save,
+            log_checkin_change_on_activity,
+            log_checkin_change_on_attendee_change,
+            log_checkin_change_on_order_delete,
+            log_checkin_change_on_order_save,
+            remember_order_cancellation_day,
+            sync_inventory_on_order_save,
+            update_rollups_on_order_delete,
+            update_rollups_on_order_save,
+        )
         from django_program.registration.signals import order_paid  # noqa: PLC0415
 
         order_paid.connect(
             create_attendee_on_order_paid,
             dispatch_uid="registration.create_attendee_on_order_paid",
         )
+
+        for condition_cls in CONDITION_MODELS:
+            label = condition_cls.__name__
+            post_save.connect(
+                invalidate_condition_plan_on_save,
+                sender=condition_cls,
+                dispatch_uid=f"registration.condition_plan.save.{label}",
+            )
+            post_delete.connect(
+                invalidate_condition_plan_on_save,
+                sender=condition_cls,
+                dispatch_uid=f"registration.condition_plan.delete.{label}",
+            )
+            for m2m_field in condition_cls._meta.many_to_many:  # noqa: SLF001
+                m2m_changed.connect(
+                    invalidate_condition_plan_on_m2m_change,
+                    sender=m2m_field.remote_field.through,
+                    dispatch_uid=f"registration.condition_plan.m2m.{label}.{m2m_field.name}",
+                )
+
+        for signal, name in ((post_save, "save"), (post_delete, "delete")):
+            signal.connect(
+                invalidate_condition_plan_on_conference_change,
+                sender=Conference,
+                dispatch_uid=f"registration.condition_plan.conference.{name}",
+            )
+
+        post_save.connect(
+            sync_inventory_on_order_save,
+            sender=Order,
+            dispatch_uid="registration.inventory.order_save",
+        )
+        post_save.connect(
+            count_inventory_on_line_item_save,
+            sender=OrderLineItem,
+            dispatch_uid="registration.inventory.line_item_save",
+        )
+        post_delete.connect(
+            count_inventory_on_line_item_delete,
+            sender=OrderLineItem,
+            dispatch_uid="registration.inventory.line_item_delete",
+        )
+
+        post_init.connect(
+            remember_order_cancellation_day,
+            sender=Order,
+            dispatch_uid="registration.rollups.order_init",
+        )
+        post_save.connect(
+            update_rollups_on_order_save,
+            sender=Order,
+            dispatch_uid="registration.rollups.order_save",
+        )
+        post_delete.connect(
+            update_rollups_on_order_delete,
+            sender=Order,
+            dispatch_uid="registration.rollups.order_delete",
+        )
+        post_save.connect(
+            count_registration_on_attendee_save,
+            sender=Attendee,
+            dispatch_uid="registration.rollups.attendee_save",
+        )
+        post_delete.connect(
+            count_registration_on_attendee_delete,
+            sender=Attendee,
+            dispatch_uid="registration.rollups.attendee_delete",
+        )
+
+        for signal, name in ((post_save, "save"), (post_delete, "delete")):
+            signal.connect(
+                log_checkin_change_on_attendee_change,
+                sender=Attendee,
+                dispatch_uid=f"registration.checkin_sync.attendee_{name}",
+            )
+            for activity_cls in (CheckIn, ProductRedemption):
+                signal.connect(
+                    log_checkin_change_on_activity,
+                    sender=activity_cls,
+                    dispatch_uid=f"registration.checkin_sync.{activity_cls.__name__}.{name}",
+                )
+        post_save.connect(
+            log_checkin_change_on_order_save,
+            sender=Order,
+            dispatch_uid="registration.checkin_sync.order_save",
+        )
+        pre_delete.connect(
+            log_checkin_change_on_order_delete,
+            sender=Order,
+            dispatch_uid="registration.checkin_sync.order_delete",
+        )
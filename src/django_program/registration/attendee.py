@@ -94,6 +94,7 @@ class Attendee(models.Model):
     )
     access_code = models.CharField(max_length=20, unique=True, editable=False)
     checked_in_at = models.DateTimeField(null=True, blank=True)
+    checkin_count = models.PositiveIntegerField(default=0, editable=False)
     completed_registration = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -1,12 +1,14 @@
 """On-site check-in and product redemption models for conference registration.
 
 Provides models for tracking attendee check-ins at the conference venue,
-per-product door checks (tutorials, meals, events), and product redemption
-to prevent double-use of purchased items.
+per-product door checks (tutorials, meals, events), product redemption
+to prevent double-use of purchased items, and the change log that lets
+offline scanners sync incrementally.
 """
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class CheckIn(models.Model):
@@ -14,7 +16,8 @@ class CheckIn(models.Model):
 
     Multiple check-ins per attendee are allowed to support re-entry scenarios
     (e.g. leaving for lunch and returning). Each record captures who performed
-    the check-in and at which station.
+    the check-in and at which station.  Check-ins replayed by an offline
+    scanner keep the scanner's timestamp and carry its idempotency key.
     """
 
     attendee = models.ForeignKey(
@@ -27,7 +30,7 @@ class CheckIn(models.Model):
         on_delete=models.CASCADE,
         related_name="checkins",
     )
-    checked_in_at = models.DateTimeField(auto_now_add=True)
+    checked_in_at = models.DateTimeField(default=timezone.now)
     checked_in_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -43,9 +46,22 @@ class CheckIn(models.Model):
         help_text='Station identifier, e.g. "Door A", "Registration Desk 1".',
     )
     note = models.TextField(blank=True, default="")
+    client_key = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Idempotency key of a check-in replayed by an offline scanner.",
+    )
 
     class Meta:
         ordering = ["-checked_in_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conference", "client_key"],
+                condition=~models.Q(client_key=""),
+                name="registration_checkin_unique_client_key",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"CheckIn: {self.attendee} at {self.checked_in_at}"
@@ -114,7 +130,9 @@ class ProductRedemption(models.Model):
     ``quantity`` times. The business-layer limit is enforced by
     ``RedemptionService.redeem_product()`` with row-level locking; no
     unique constraint exists at the DB level so that quantity > 1 items
-    can produce multiple redemption rows.
+    can produce multiple redemption rows.  Redemptions replayed by an
+    offline scanner keep the scanner's timestamp and carry its idempotency
+    key, which is unique per conference.
     """
 
     attendee = models.ForeignKey(
@@ -132,7 +150,7 @@ class ProductRedemption(models.Model):
         on_delete=models.CASCADE,
         related_name="redemptions",
     )
-    redeemed_at = models.DateTimeField(auto_now_add=True)
+    redeemed_at = models.DateTimeField(default=timezone.now)
     redeemed_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -142,9 +160,55 @@ class ProductRedemption(models.Model):
         help_text="Staff member who performed this redemption.",
     )
     note = models.TextField(blank=True, default="")
+    client_key = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="Idempotency key of a redemption replayed by an offline scanner.",
+    )
 
     class Meta:
         ordering = ["-redeemed_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conference", "client_key"],
+                condition=~models.Q(client_key=""),
+                name="registration_productredemption_unique_client_key",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Redemption: {self.attendee} → {self.order_line_item}"
+
+
+class CheckInChange(models.Model):
+    """One entry in a conference's check-in change log.
+
+    Every save or delete that can change an attendee's offline preload
+    record (the attendee, their order, check-ins and redemptions) appends a
+    row.  The auto-incrementing primary key is the change sequence number
+    that scanners pass back as ``?since=`` to fetch only what changed;
+    ``changed_at`` bounds the window a delta re-reads for changes that
+    committed out of key order.
+    ``attendee_id`` is not a foreign key so that entries for deleted
+    attendees survive and can be reported as removals.
+    """
+
+    conference = models.ForeignKey(
+        "program_conference.Conference",
+        on_delete=models.CASCADE,
+        related_name="checkin_changes",
+    )
+    attendee_id = models.BigIntegerField()
+    access_code = models.CharField(max_length=20)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["pk"]
+        indexes = [
+            models.Index(fields=["conference", "id"], name="registration_checkinchange_seq"),
+            models.Index(fields=["conference", "changed_at"], name="registration_checkinchange_at"),
+        ]
+
+    def __str__(self) -> str:
+        return f"CheckInChange #{self.pk}: {self.access_code}"
@@ -156,21 +156,56 @@ class DiscountEffect(models.Model):
         Returns:
             The total discount amount (always non-negative).
         """
-        effective_qty = quantity
-        if self.max_quantity > 0:
-            effective_qty = min(quantity, self.max_quantity)
+        return _calculate_effect_discount(
+            self.discount_type,
+            self.discount_value,
+            self.max_quantity,
+            unit_price,
+            quantity,
+        )
+
+
+def _calculate_effect_discount(
+    discount_type: str,
+    discount_value: Decimal,
+    max_quantity: int,
+    unit_price: Decimal,
+    quantity: int,
+) -> Decimal:
+    """Shared discount math for ``DiscountEffect`` and compiled condition plans.
 
-        line_total = unit_price * effective_qty
+    Args:
+        discount_type: A ``DiscountEffect.DiscountType`` value.
+        discount_value: Percentage (0-100) or fixed amount per item.
+        max_quantity: Maximum items discounted per line (0 = unlimited).
+        unit_price: The per-unit price of the item.
+        quantity: The number of items.
 
-        if self.discount_type == self.DiscountType.PERCENTAGE:
-            clamped = min(self.discount_value, Decimal(100))
-            pct = clamped / Decimal(100)
-            return (line_total * pct).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    Returns:
+        The total discount amount (always non-negative).
+    """
+    effective_qty = quantity
+    if max_quantity > 0:
+        effective_qty = min(quantity, max_quantity)
 
-        if self.discount_type == self.DiscountType.FIXED_AMOUNT:
-            return min(self.discount_value * effective_qty, line_total)
+    line_total = unit_price * effective_qty
+
+    if discount_type == DiscountEffect.DiscountType.PERCENTAGE:
+        clamped = min(discount_value, Decimal(100))
+        pct = clamped / Decimal(100)
+        return (line_total * pct).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
-        return Decimal("0.00")
+    if discount_type == DiscountEffect.DiscountType.FIXED_AMOUNT:
+        return min(discount_value * effective_qty, line_total)
+
+    return Decimal("0.00")
+
+
+def _calculate_percentage_discount(percentage: Decimal, unit_price: Decimal, quantity: int) -> Decimal:
+    """Shared flat-percentage math for ``DiscountForCategory`` and compiled plans."""
+    line_total = unit_price * quantity
+    pct = percentage / Decimal(100)
+    return (line_total * pct).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
 def _check_time_and_stock(
@@ -261,23 +296,10 @@ class SpeakerCondition(ConditionBase, DiscountEffect):
             user: The authenticated user to check.
             conference: The conference context.
         """
-        from django_program.pretalx.models import Speaker  # noqa: PLC0415
-
-        speakers = Speaker.objects.filter(conference=self.conference, user=user)
-        if not speakers.exists():
-            return False
+        from django_program.registration.services.eligibility import UserEligibilityContext  # noqa: PLC0415
 
-        if self.is_presenter:
-            return True
-
-        if self.is_copresenter:
-            for speaker in speakers:
-                for talk in speaker.talks.filter(conference=self.conference):
-                    if talk.speakers.count() > 1:
-                        return True
-            return False
-
-        return False
+        context = UserEligibilityContext(user, self.conference_id)
+        return context.matches_speaker_roles(is_presenter=self.is_presenter, is_copresenter=self.is_copresenter)
 
 
 class GroupMemberCondition(ConditionBase, DiscountEffect):
@@ -304,11 +326,10 @@ class GroupMemberCondition(ConditionBase, DiscountEffect):
             user: The authenticated user to check.
             conference: The conference context (unused, already filtered by FK).
         """
+        from django_program.registration.services.eligibility import UserEligibilityContext  # noqa: PLC0415
+
         group_ids = set(self.groups.values_list("pk", flat=True))
-        if not group_ids:
-            return False
-        user_group_ids = set(user.groups.values_list("pk", flat=True))
-        return bool(group_ids & user_group_ids)
+        return UserEligibilityContext(user, self.conference_id).in_any_group(group_ids)
 
 
 class IncludedProductCondition(ConditionBase, DiscountEffect):
@@ -335,18 +356,10 @@ class IncludedProductCondition(ConditionBase, DiscountEffect):
             user: The authenticated user to check.
             conference: The conference context.
         """
-        enabling_ids = set(self.enabling_ticket_types.values_list("pk", flat=True))
-        if not enabling_ids:
-            return False
-
-        from django_program.registration.models import Order, OrderLineItem  # noqa: PLC0415
+        from django_program.registration.services.eligibility import UserEligibilityContext  # noqa: PLC0415
 
-        return OrderLineItem.objects.filter(
-            order__user=user,
-            order__conference=self.conference,
-            order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED],
-            ticket_type_id__in=enabling_ids,
-        ).exists()
+        enabling_ids = set(self.enabling_ticket_types.values_list("pk", flat=True))
+        return UserEligibilityContext(user, self.conference_id).has_purchased_any(enabling_ids)
 
 
 class DiscountForProduct(ConditionBase, DiscountEffect):
@@ -431,6 +444,4 @@ class DiscountForCategory(ConditionBase):
         Returns:
             The total discount amount.
         """
-        line_total = unit_price * quantity
-        pct = self.percentage / Decimal(100)
-        return (line_total * pct).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return _calculate_percentage_discount(self.percentage, unit_price, quantity)
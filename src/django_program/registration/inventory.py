@@ -0,0 +1,60 @@
+"""Denormalized inventory counters for ticket types and add-ons.
+
+Each ``InventoryCounter`` row carries running totals for one product so that
+availability checks are a single-row read instead of a ``SUM`` over every
+order line item.  The counters are maintained by
+:mod:`django_program.registration.services.inventory` as orders move between
+inventory buckets, and can be rebuilt from order history with the
+``reconcile_inventory`` management command.
+"""
+
+from django.db import models
+
+
+class InventoryCounter(models.Model):
+    """Running sold/held/released totals for a single ticket type or add-on.
+
+    ``sold`` counts units in paid or partially refunded orders, ``held``
+    counts units reserved by pending orders with an active hold, and
+    ``released`` is an informational running total of units that returned
+    to the pool through cancellation, hold expiry, or full refund.
+    """
+
+    ticket_type = models.OneToOneField(
+        "program_registration.TicketType",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="inventory",
+    )
+    addon = models.OneToOneField(
+        "program_registration.AddOn",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="inventory",
+    )
+    sold = models.IntegerField(default=0)
+    held = models.IntegerField(default=0)
+    released = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(ticket_type__isnull=False, addon__isnull=True)
+                    | models.Q(ticket_type__isnull=True, addon__isnull=False)
+                ),
+                name="registration_inventorycounter_exactly_one_product",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        product = self.ticket_type or self.addon
+        return f"{product}: {self.sold} sold, {self.held} held"
+
+    @property
+    def committed(self) -> int:
+        """Return the units unavailable for sale (sold plus actively held)."""
+        return self.sold + self.held
@@ -0,0 +1 @@
+"""Registration management commands."""
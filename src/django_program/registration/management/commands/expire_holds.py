@@ -0,0 +1,90 @@
+"""Management command to cancel pending orders whose inventory hold has lapsed.
+
+Usage::
+
+    # Sweep every conference once (e.g. from cron every minute)
+    manage.py expire_holds
+
+    # Sweep one conference in batches of 200
+    manage.py expire_holds --conference pycon-us-2026 --batch-size 200
+
+    # Keep sweeping every 30 seconds until interrupted
+    manage.py expire_holds --interval 30
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_program.conference.models import Conference
+from django_program.registration.services.hold_expiry import expire_stale_holds
+
+if TYPE_CHECKING:
+    import argparse
+
+
+class Command(BaseCommand):
+    """Expire stale pending orders and release their inventory and voucher usage."""
+
+    help = "Cancel pending orders whose inventory hold has expired"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Register command-line arguments.
+
+        Args:
+            parser: The argument parser to add arguments to.
+        """
+        parser.add_argument(
+            "--conference",
+            default="",
+            help="Conference slug to sweep (default: all conferences).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Orders per transaction (default: DJANGO_PROGRAM['hold_sweep_batch_size']).",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop each sweep after this many batches.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Repeat the sweep every N seconds until interrupted (default: sweep once).",
+        )
+
+    def handle(self, **options: object) -> None:
+        """Run one sweep, or keep sweeping when ``--interval`` is given."""
+        conference_slug = str(options["conference"])
+        interval = int(options["interval"] or 0)
+
+        conference_id = None
+        if conference_slug:
+            try:
+                conference_id = Conference.objects.values_list("pk", flat=True).get(slug=conference_slug)
+            except Conference.DoesNotExist:
+                msg = f"Conference with slug '{conference_slug}' not found"
+                raise CommandError(msg) from None
+
+        while True:
+            result = expire_stale_holds(
+                conference_id=conference_id,
+                batch_size=options["batch_size"],
+                max_batches=options["max_batches"],
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Expired {result.orders_expired} orders in {result.batches} batches "
+                    f"({result.holds_released} holds, {result.vouchers_released} voucher uses released) "
+                    f"in {result.duration_seconds:.3f}s"
+                )
+            )
+            if interval <= 0:
+                return
+            time.sleep(interval)
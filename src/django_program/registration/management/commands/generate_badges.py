@@ -0,0 +1,142 @@
+"""Management command to render a conference's badges in bulk.
+
+Usage::
+
+    # Render missing PDF badges with the default template on 8 worker processes
+    manage.py generate_badges --conference pycon-us-2026 --workers 8
+
+    # Also bundle every badge into a ZIP for the print shop
+    manage.py generate_badges --conference pycon-us-2026 --zip badges.zip
+
+    # Impose the badges N-up on Letter sheets for an office printer (not stored)
+    manage.py generate_badges --conference pycon-us-2026 --sheets badges.pdf --paper letter
+
+Badges already rendered for the template and format are kept, so an
+interrupted run can simply be started again.  ``--sheets`` on its own only
+writes the print sheets; combine it with ``--zip`` to store the badges too.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_program.conference.models import Conference
+from django_program.registration.badge import Badge, BadgeTemplate
+from django_program.registration.models import TicketType
+from django_program.registration.services.badge_bulk import PAPER_SIZES, BulkBadgeProgress, BulkBadgeRenderer
+
+if TYPE_CHECKING:
+    import argparse
+
+
+class Command(BaseCommand):
+    """Render badges for every attendee and optionally bundle them for printing."""
+
+    help = "Render attendee badges in bulk, optionally writing a ZIP or imposed print-sheet PDF"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Register command-line arguments.
+
+        Args:
+            parser: The argument parser to add arguments to.
+        """
+        parser.add_argument("--conference", required=True, help="Conference slug.")
+        parser.add_argument("--template", default="", help="Badge template slug (default: the default template).")
+        parser.add_argument(
+            "--format",
+            default=Badge.Format.PDF,
+            choices=[Badge.Format.PDF, Badge.Format.PNG],
+            help="Badge file format (default: pdf).",
+        )
+        parser.add_argument("--ticket-type", default="", help="Only attendees holding this ticket type slug.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes (default: DJANGO_PROGRAM['badge_render_workers']).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Attendees per batch (default: DJANGO_PROGRAM['badge_batch_size']).",
+        )
+        parser.add_argument("--zip", default="", help="Write every badge file into this ZIP archive.")
+        parser.add_argument("--sheets", default="", help="Write the badges imposed on print sheets to this PDF.")
+        parser.add_argument(
+            "--paper",
+            default="a4",
+            choices=sorted(PAPER_SIZES),
+            help="Sheet size for --sheets (default: a4).",
+        )
+
+    def handle(self, **options: object) -> None:
+        """Render the badges and write the requested bundles."""
+        renderer = self._renderer(options)
+
+        zip_path = str(options["zip"])
+        sheets_path = str(options["sheets"])
+        if zip_path:
+            with Path(zip_path).open("wb") as output:
+                result = renderer.write_zip(output)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Wrote {result.total} badges to {zip_path} ({result.rendered} rendered, {result.skipped} reused)"
+                )
+            )
+        elif not sheets_path:
+            count = sum(1 for _ in renderer)
+            self.stdout.write(self.style.SUCCESS(f"Badges ready for {count} attendees"))
+
+        if sheets_path:
+            try:
+                with Path(sheets_path).open("wb") as output:
+                    result = renderer.write_sheets(output, paper=str(options["paper"]))
+            except ValueError as exc:
+                raise CommandError(str(exc)) from None
+            self.stdout.write(self.style.SUCCESS(f"Imposed {result.total} badges on sheets in {sheets_path}"))
+
+    def _renderer(self, options: dict[str, object]) -> BulkBadgeRenderer:
+        """Look up the conference, template and ticket type and build the renderer."""
+        conference_slug = str(options["conference"])
+        try:
+            conference = Conference.objects.get(slug=conference_slug)
+        except Conference.DoesNotExist:
+            msg = f"Conference with slug '{conference_slug}' not found"
+            raise CommandError(msg) from None
+
+        template = None
+        if options["template"]:
+            try:
+                template = BadgeTemplate.objects.get(conference=conference, slug=options["template"])
+            except BadgeTemplate.DoesNotExist:
+                msg = f"Badge template '{options['template']}' not found"
+                raise CommandError(msg) from None
+
+        ticket_type = None
+        if options["ticket_type"]:
+            try:
+                ticket_type = TicketType.objects.get(conference=conference, slug=options["ticket_type"])
+            except TicketType.DoesNotExist:
+                msg = f"Ticket type '{options['ticket_type']}' not found"
+                raise CommandError(msg) from None
+
+        try:
+            return BulkBadgeRenderer(
+                conference,
+                template=template,
+                badge_format=str(options["format"]),
+                ticket_type=ticket_type,
+                workers=options["workers"],
+                batch_size=options["batch_size"],
+                progress=self._report,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from None
+
+    def _report(self, progress: BulkBadgeProgress) -> None:
+        """Print a progress line after each batch."""
+        self.stdout.write(
+            f"{progress.completed}/{progress.total} badges ({progress.rendered} rendered, {progress.skipped} reused)"
+        )
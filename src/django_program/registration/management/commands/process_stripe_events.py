@@ -0,0 +1,74 @@
+"""Management command to process queued Stripe webhook events.
+
+Usage::
+
+    # Drain the queue once (e.g. from cron every minute)
+    manage.py process_stripe_events
+
+    # Keep draining every 2 seconds until interrupted, 100 events per batch
+    manage.py process_stripe_events --interval 2 --batch-size 100
+
+Several workers can run side by side; each batch skips the events another
+worker has locked.
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+
+from django_program.registration.services.webhook_queue import process_stripe_events
+
+if TYPE_CHECKING:
+    import argparse
+
+
+class Command(BaseCommand):
+    """Run the registered handlers for pending Stripe webhook events."""
+
+    help = "Process Stripe webhook events recorded by the webhook view"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Register command-line arguments.
+
+        Args:
+            parser: The argument parser to add arguments to.
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=None,
+            help="Events per transaction (default: DJANGO_PROGRAM['stripe']['webhook_batch_size']).",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop each run after this many batches.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help="Repeat every N seconds until interrupted (default: run once).",
+        )
+
+    def handle(self, **options: object) -> None:
+        """Drain the queue once, or keep draining when ``--interval`` is given."""
+        interval = float(options["interval"] or 0)
+
+        while True:
+            result = process_stripe_events(
+                batch_size=options["batch_size"],
+                max_batches=options["max_batches"],
+            )
+            if result.batches or interval <= 0:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Processed {result.processed} Stripe events ({result.failed} failed) "
+                        f"in {result.batches} batches in {result.duration_seconds:.3f}s"
+                    )
+                )
+            if interval <= 0:
+                return
+            time.sleep(interval)
@@ -0,0 +1,54 @@
+"""Management command to rebuild the daily sales rollups from order history.
+
+Usage::
+
+    # Rebuild every conference
+    manage.py rebuild_rollups
+
+    # Rebuild one conference
+    manage.py rebuild_rollups --conference pycon-us-2026
+"""
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_program.conference.models import Conference
+from django_program.registration.services.rollups import rebuild_rollups
+
+if TYPE_CHECKING:
+    import argparse
+
+
+class Command(BaseCommand):
+    """Recompute the daily sales, registration and cancellation rollups."""
+
+    help = "Rebuild the daily sales rollups used by the reporting dashboards"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Register command-line arguments.
+
+        Args:
+            parser: The argument parser to add arguments to.
+        """
+        parser.add_argument(
+            "--conference",
+            default="",
+            help="Conference slug to rebuild (default: all conferences).",
+        )
+
+    def handle(self, **options: object) -> None:
+        """Rebuild the rollups and report how many rows were written."""
+        conference_slug = str(options["conference"])
+
+        conference_id = None
+        if conference_slug:
+            try:
+                conference_id = Conference.objects.values_list("pk", flat=True).get(slug=conference_slug)
+            except Conference.DoesNotExist:
+                msg = f"Conference with slug '{conference_slug}' not found"
+                raise CommandError(msg) from None
+
+        result = rebuild_rollups(conference_id=conference_id)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {result.rows} rollup rows for {result.conferences} conferences"))
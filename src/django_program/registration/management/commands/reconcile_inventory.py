@@ -0,0 +1,73 @@
+"""Management command to rebuild inventory counters from order history.
+
+Usage::
+
+    # Reconcile every conference
+    manage.py reconcile_inventory
+
+    # Reconcile one conference, reporting drift without writing
+    manage.py reconcile_inventory --conference pycon-us-2026 --dry-run
+"""
+
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_program.conference.models import Conference
+from django_program.registration.services.inventory import reconcile_inventory
+
+if TYPE_CHECKING:
+    import argparse
+
+
+class Command(BaseCommand):
+    """Recompute sold/held/released counters and correct any drift."""
+
+    help = "Rebuild ticket type and add-on inventory counters from order history"
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        """Register command-line arguments.
+
+        Args:
+            parser: The argument parser to add arguments to.
+        """
+        parser.add_argument(
+            "--conference",
+            default="",
+            help="Conference slug to reconcile (default: all conferences).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            default=False,
+            help="Report drift without correcting it.",
+        )
+
+    def handle(self, **options: object) -> None:
+        """Execute the reconciliation and report every corrected counter."""
+        conference_slug = str(options["conference"])
+        dry_run = bool(options["dry_run"])
+
+        conference_id = None
+        if conference_slug:
+            try:
+                conference_id = Conference.objects.values_list("pk", flat=True).get(slug=conference_slug)
+            except Conference.DoesNotExist:
+                msg = f"Conference with slug '{conference_slug}' not found"
+                raise CommandError(msg) from None
+
+        result = reconcile_inventory(conference_id=conference_id, dry_run=dry_run)
+
+        for drift in result.drift:
+            product = "ticket type" if drift.column == "ticket_type_id" else "add-on"
+            self.stdout.write(
+                f"{product} {drift.product_id}: sold/held/released "
+                f"{'/'.join(map(str, drift.actual))} -> {'/'.join(map(str, drift.expected))}"
+            )
+
+        verb = "Would correct" if dry_run else "Corrected"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {len(result.drift)} counters and {result.orders_rebucketed} order inventory buckets"
+            )
+        )
@@ -0,0 +1,100 @@
+# Generated by Django 5.2.11 on 2026-10-16 19:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_inventory_counters(apps, _schema_editor):
+    Order = apps.get_model("program_registration", "Order")
+    OrderLineItem = apps.get_model("program_registration", "OrderLineItem")
+    InventoryCounter = apps.get_model("program_registration", "InventoryCounter")
+
+    now = timezone.now()
+    Order.objects.filter(status__in=["paid", "partially_refunded"]).update(inventory_bucket="sold")
+    Order.objects.filter(status="pending", hold_expires_at__gt=now).update(inventory_bucket="held")
+
+    fields = {"sold": "sold", "held": "held", "": "released"}
+    counters = {}
+    rows = (
+        OrderLineItem.objects.values("ticket_type_id", "addon_id", "order__inventory_bucket")
+        .annotate(total=models.Sum("quantity"))
+        .order_by()
+    )
+    for row in rows:
+        if row["ticket_type_id"] is not None:
+            key = ("ticket_type_id", row["ticket_type_id"])
+        elif row["addon_id"] is not None:
+            key = ("addon_id", row["addon_id"])
+        else:
+            continue
+        counter = counters.setdefault(key, {"sold": 0, "held": 0, "released": 0})
+        counter[fields[row["order__inventory_bucket"]]] += row["total"]
+
+    InventoryCounter.objects.bulk_create(
+        InventoryCounter(**{column: product_id}, **totals) for (column, product_id), totals in counters.items()
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_registration", "0021_add_qbo_invoice_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="order",
+            name="inventory_bucket",
+            field=models.CharField(
+                blank=True,
+                choices=[("", "Released"), ("held", "Held"), ("sold", "Sold")],
+                default="",
+                editable=False,
+                help_text="Inventory counter this order's line items are currently counted under.",
+                max_length=10,
+            ),
+        ),
+        migrations.CreateModel(
+            name="InventoryCounter",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("sold", models.IntegerField(default=0)),
+                ("held", models.IntegerField(default=0)),
+                ("released", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "addon",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventory",
+                        to="program_registration.addon",
+                    ),
+                ),
+                (
+                    "ticket_type",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventory",
+                        to="program_registration.tickettype",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(("addon__isnull", True), ("ticket_type__isnull", False)),
+                            models.Q(("addon__isnull", False), ("ticket_type__isnull", True)),
+                            _connector="OR",
+                        ),
+                        name="registration_inventorycounter_exactly_one_product",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_inventory_counters, migrations.RunPython.noop),
+    ]
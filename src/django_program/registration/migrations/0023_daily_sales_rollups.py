@@ -0,0 +1,75 @@
+# Generated by Django 5.2.11 on 2026-10-16 21:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_conference", "0010_alter_conference_options"),
+        ("program_registration", "0022_inventory_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailySalesRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("date", models.DateField()),
+                ("orders", models.IntegerField(default=0)),
+                ("revenue", models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ("quantity", models.IntegerField(default=0)),
+                ("registrations", models.IntegerField(default=0)),
+                ("cancellations", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "conference",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sales_rollups",
+                        to="program_conference.conference",
+                    ),
+                ),
+                (
+                    "ticket_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sales_rollups",
+                        to="program_registration.tickettype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("ticket_type__isnull", True)),
+                        fields=("conference", "date"),
+                        name="registration_dailysalesrollup_unique_day",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("ticket_type__isnull", False)),
+                        fields=("conference", "date", "ticket_type"),
+                        name="registration_dailysalesrollup_unique_ticket_type_day",
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SalesRollupState",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("rebuilt_at", models.DateTimeField()),
+                (
+                    "conference",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sales_rollup_state",
+                        to="program_conference.conference",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.11 on 2026-10-16 23:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_conference", "0010_alter_conference_options"),
+        ("program_registration", "0023_daily_sales_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CheckInChange",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("attendee_id", models.BigIntegerField()),
+                ("access_code", models.CharField(max_length=20)),
+                ("changed_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "conference",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkin_changes",
+                        to="program_conference.conference",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["pk"],
+                "indexes": [models.Index(fields=["conference", "id"], name="registration_checkinchange_seq")],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.11 on 2026-10-16 23:58
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_registration", "0024_checkinchange"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="checkin",
+            name="checked_in_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="checkin",
+            name="client_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Idempotency key of a check-in replayed by an offline scanner.",
+                max_length=64,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="productredemption",
+            name="redeemed_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="productredemption",
+            name="client_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Idempotency key of a redemption replayed by an offline scanner.",
+                max_length=64,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="checkin",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("client_key", ""), _negated=True),
+                fields=("conference", "client_key"),
+                name="registration_checkin_unique_client_key",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="productredemption",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("client_key", ""), _negated=True),
+                fields=("conference", "client_key"),
+                name="registration_productredemption_unique_client_key",
+            ),
+        ),
+    ]
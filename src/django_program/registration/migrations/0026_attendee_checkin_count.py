@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-17 00:31
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_checkin_counts(apps, _schema_editor):
+    Attendee = apps.get_model("program_registration", "Attendee")
+    CheckIn = apps.get_model("program_registration", "CheckIn")
+
+    counts = (
+        CheckIn.objects.filter(attendee=models.OuterRef("pk"))
+        .order_by()
+        .values("attendee")
+        .annotate(count=models.Count("pk"))
+        .values("count")
+    )
+    Attendee.objects.filter(checkins__isnull=False).update(checkin_count=Coalesce(models.Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_registration", "0025_offline_checkin_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="attendee",
+            name="checkin_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_checkin_counts, migrations.RunPython.noop),
+    ]
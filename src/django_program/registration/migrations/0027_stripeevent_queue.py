@@ -0,0 +1,34 @@
+# Generated by Django 5.2.11 on 2026-10-17 01:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_registration", "0026_attendee_checkin_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stripeevent",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0, help_text="Failed processing attempts."),
+        ),
+        migrations.AddField(
+            model_name="stripeevent",
+            name="next_attempt_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the queue worker may process the event next; empty means right away.",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stripeevent",
+            index=models.Index(
+                condition=models.Q(("processed", False)),
+                fields=["next_attempt_at", "created_at"],
+                name="registration_stripeevent_queue",
+            ),
+        ),
+    ]
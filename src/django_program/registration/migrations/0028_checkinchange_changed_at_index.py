@@ -0,0 +1,16 @@
+# Generated by Django 5.2.11 on 2026-10-17 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("program_registration", "0027_stripeevent_queue"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="checkinchange",
+            index=models.Index(fields=["conference", "changed_at"], name="registration_checkinchange_at"),
+        ),
+    ]
@@ -59,7 +59,10 @@ class TicketType(models.Model):
         """Return the number of tickets still available for purchase.
 
         Counts tickets in paid/partially-refunded orders plus pending orders
-        with an active inventory hold (``hold_expires_at`` in the future).
+        with an inventory hold, read from the ticket type's
+        :class:`~django_program.registration.inventory.InventoryCounter` in a
+        single-row query.  Holds that have lapsed but were not yet released
+        are still counted until ``release_expired_holds`` runs.
 
         Returns:
             The remaining count, or ``None`` if this ticket type has unlimited
@@ -67,15 +70,9 @@ class TicketType(models.Model):
         """
         if self.total_quantity == 0:
             return None
-        now = timezone.now()
-        sold = (
-            self.order_line_items.filter(
-                models.Q(order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED])
-                | models.Q(order__status=Order.Status.PENDING, order__hold_expires_at__gt=now),
-            ).aggregate(total=models.Sum("quantity"))["total"]
-            or 0
-        )
-        return self.total_quantity - sold
+        from django_program.registration.services.inventory import ticket_type_committed  # noqa: PLC0415
+
+        return self.total_quantity - ticket_type_committed(self.pk)
 
     @property
     def is_available(self) -> bool:
@@ -361,6 +358,13 @@ class Order(models.Model):
         PARTIALLY_REFUNDED = "partially_refunded", "Partially Refunded"
         CANCELLED = "cancelled", "Cancelled"
 
+    class InventoryBucket(models.TextChoices):
+        """Which inventory counter an order's line items are counted under."""
+
+        NONE = "", "Released"
+        HELD = "held", "Held"
+        SOLD = "sold", "Sold"
+
     conference = models.ForeignKey(
         "program_conference.Conference",
         on_delete=models.CASCADE,
@@ -421,6 +425,14 @@ class Order(models.Model):
         blank=True,
         help_text="When set on pending orders, inventory is reserved until this timestamp.",
     )
+    inventory_bucket = models.CharField(
+        max_length=10,
+        choices=InventoryBucket.choices,
+        blank=True,
+        default=InventoryBucket.NONE,
+        editable=False,
+        help_text="Inventory counter this order's line items are currently counted under.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -430,6 +442,27 @@ class Order(models.Model):
     def __str__(self) -> str:
         return f"{self.reference} ({self.status})"
 
+    def save(self, *args: object, **kwargs: object) -> None:
+        """Assign the initial inventory bucket and protect it on later saves.
+
+        After creation ``inventory_bucket`` is owned by
+        :mod:`django_program.registration.services.inventory`, which moves it
+        under a row lock together with the counters.  A full save from an
+        instance loaded earlier must not write an outdated bucket back, so it
+        is left out of ``update_fields``.
+        """
+        if self._state.adding:
+            from django_program.registration.services.inventory import bucket_for  # noqa: PLC0415
+
+            self.inventory_bucket = bucket_for(self.status, getattr(self, "hold_expires_at", None))
+        elif kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "inventory_bucket"
+            ]
+        super().save(*args, **kwargs)
+
 
 class OrderLineItem(models.Model):
     """A snapshot of a purchased item at checkout time.
@@ -634,7 +667,8 @@ class StripeEvent(models.Model):
     """A record of a Stripe webhook event for idempotent processing.
 
     Stores the full event payload and tracks whether the event has been
-    successfully processed by the webhook handler.
+    successfully processed by the webhook handler.  Unprocessed events double
+    as the work queue drained by ``manage.py process_stripe_events``.
     """
 
     stripe_id = models.CharField(max_length=200, unique=True)
@@ -644,10 +678,23 @@ class StripeEvent(models.Model):
     customer_id = models.CharField(max_length=200, blank=True, default="")
     processed = models.BooleanField(default=False)
     api_version = models.CharField(max_length=50, blank=True, default="")
+    attempts = models.PositiveSmallIntegerField(default=0, help_text="Failed processing attempts.")
+    next_attempt_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the queue worker may process the event next; empty means right away.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at", "created_at"],
+                condition=models.Q(processed=False),
+                name="registration_stripeevent_queue",
+            ),
+        ]
 
     def __str__(self) -> str:
         status = "processed" if self.processed else "pending"
@@ -685,7 +732,7 @@ class EventProcessingException(models.Model):
 # for FK/M2M fields and lazy imports for model lookups in methods.
 # Re-export badge models for convenience.
 from django_program.registration.badge import Badge, BadgeTemplate  # noqa: E402
-from django_program.registration.checkin import CheckIn, DoorCheck, ProductRedemption  # noqa: E402
+from django_program.registration.checkin import CheckIn, CheckInChange, DoorCheck, ProductRedemption  # noqa: E402
 from django_program.registration.conditions import (  # noqa: E402
     DiscountForCategory,
     DiscountForProduct,
@@ -694,6 +741,7 @@ from django_program.registration.conditions import (  # noqa: E402
     SpeakerCondition,
     TimeOrStockLimitCondition,
 )
+from django_program.registration.inventory import InventoryCounter  # noqa: E402
 from django_program.registration.letter import LetterRequest  # noqa: E402
 from django_program.registration.purchase_order import (  # noqa: E402
     PurchaseOrder,
@@ -701,6 +749,7 @@ from django_program.registration.purchase_order import (  # noqa: E402
     PurchaseOrderLineItem,
     PurchaseOrderPayment,
 )
+from django_program.registration.rollups import DailySalesRollup, SalesRollupState  # noqa: E402
 from django_program.registration.terminal import TerminalPayment  # noqa: E402
 
 __all__ = [
@@ -712,13 +761,16 @@ __all__ = [
     "Cart",
     "CartItem",
     "CheckIn",
+    "CheckInChange",
     "Credit",
+    "DailySalesRollup",
     "DiscountForCategory",
     "DiscountForProduct",
     "DoorCheck",
     "EventProcessingException",
     "GroupMemberCondition",
     "IncludedProductCondition",
+    "InventoryCounter",
     "LetterRequest",
     "Order",
     "OrderLineItem",
@@ -728,6 +780,7 @@ __all__ = [
     "PurchaseOrderCreditNote",
     "PurchaseOrderLineItem",
     "PurchaseOrderPayment",
+    "SalesRollupState",
     "SpeakerCondition",
     "StripeCustomer",
     "StripeEvent",
@@ -0,0 +1,82 @@
+"""Materialized daily sales rollups for the reporting dashboards.
+
+``DailySalesRollup`` holds pre-aggregated sales, registration and
+cancellation figures per conference and day so the financial and reports
+dashboards read a few dozen rows instead of aggregating every order on each
+page load.  The rows are maintained by
+:mod:`django_program.registration.services.rollups` as orders move in and out
+of the paid state, and can be rebuilt from order history with the
+``rebuild_rollups`` management command.
+"""
+
+from django.db import models
+
+
+class DailySalesRollup(models.Model):
+    """Sales figures for one conference, day and (optionally) ticket type.
+
+    The row without a ticket type carries the day's totals: ``orders`` and
+    ``revenue`` for paid (or partially refunded) orders created that day,
+    ``registrations`` for attendees created that day and ``cancellations``
+    for orders cancelled that day.  Rows with a ticket type carry the
+    ``quantity`` and line item ``revenue`` of that ticket type in the day's
+    paid orders.
+    """
+
+    conference = models.ForeignKey(
+        "program_conference.Conference",
+        on_delete=models.CASCADE,
+        related_name="sales_rollups",
+    )
+    date = models.DateField()
+    ticket_type = models.ForeignKey(
+        "program_registration.TicketType",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="sales_rollups",
+    )
+    orders = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    quantity = models.IntegerField(default=0)
+    registrations = models.IntegerField(default=0)
+    cancellations = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conference", "date"],
+                condition=models.Q(ticket_type__isnull=True),
+                name="registration_dailysalesrollup_unique_day",
+            ),
+            models.UniqueConstraint(
+                fields=["conference", "date", "ticket_type"],
+                condition=models.Q(ticket_type__isnull=False),
+                name="registration_dailysalesrollup_unique_ticket_type_day",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        scope = self.ticket_type or "all tickets"
+        return f"{self.conference} {self.date} ({scope}): {self.orders} orders, {self.revenue}"
+
+
+class SalesRollupState(models.Model):
+    """Marks a conference's rollups as built from its complete order history.
+
+    Rollups are only read by the reports once a rebuild has completed for the
+    conference; until then the incremental updates cover just the orders
+    that changed since the rollups were introduced.
+    """
+
+    conference = models.OneToOneField(
+        "program_conference.Conference",
+        on_delete=models.CASCADE,
+        related_name="sales_rollup_state",
+    )
+    rebuilt_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.conference} rollups rebuilt {self.rebuilt_at:%Y-%m-%d %H:%M}"
@@ -3,10 +3,25 @@
 Generates PDF and PNG badges using reportlab and Pillow respectively,
 with embedded QR codes encoding the attendee's access code for check-in
 scanning.
+
+Everything that does not depend on the attendee is memoized in bounded,
+process-wide LRU caches: resolved font paths, registered PDF fonts, loaded
+Pillow fonts, decoded template images, QR codes, and each template's static
+layer (background, header, logo and conference name).  Template entries are
+keyed by the template's pk and ``updated_at``, so editing a template renders
+with the new settings straight away.  A PDF badge draws its static layer as
+a form XObject that is defined once per PDF document, which lets print
+sheets reuse it for every badge on them.
 """
 
+import contextlib
+import functools
+import hashlib
 import io
 import logging
+import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -18,13 +33,113 @@ from django_program.registration.badge import Badge, BadgeTemplate
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Hashable, Iterator
 
     from django_program.conference.models import Conference
     from django_program.registration.attendee import Attendee
     from django_program.registration.models import TicketType
 
-_FONT_CACHE: dict[str, str] = {}
+
+class _LRUCache[K: Hashable, V](OrderedDict[K, V]):
+    """A bounded mapping that evicts its least recently used entries.
+
+    Read entries with :meth:`get`: a ``key in cache`` check followed by
+    ``cache[key]`` can race with another thread evicting the key.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+    def get[D](self, key: K, default: D | None = None) -> V | D | None:
+        """Return the entry for ``key`` and mark it recently used, or ``default``."""
+        with self._lock:
+            value = super().get(key, _NOT_CACHED)
+            if value is _NOT_CACHED:
+                return default
+            self.move_to_end(key)
+            return value
+
+    def __getitem__(self, key: K) -> V:
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+
+# ``_NOT_CACHED`` marks a cache miss; ``_MISSING`` is cached for lookups that found nothing.
+_NOT_CACHED = object()
+_MISSING = object()
+_FONT_CACHE: _LRUCache[str, str] = _LRUCache(maxsize=128)
+_PDF_FONT_CACHE: _LRUCache[str, object] = _LRUCache(maxsize=64)
+_PNG_FONT_CACHE: _LRUCache[float, tuple] = _LRUCache(maxsize=4)
+_IMAGE_CACHE: _LRUCache[tuple, object] = _LRUCache(maxsize=32)
+_STATIC_LAYER_CACHE: _LRUCache[tuple, tuple] = _LRUCache(maxsize=8)
+_PDF_HEADER_MM = 22
+
+# Static-layer forms already defined in each reportlab canvas (PDF document).
+_CANVAS_FORMS: weakref.WeakKeyDictionary[object, set[str]] = weakref.WeakKeyDictionary()
+
+
+def _template_key(template: BadgeTemplate) -> tuple[int, str] | None:
+    """Identify a saved template version for the caches; ``None`` for unsaved templates."""
+    if template.pk is None or template.updated_at is None:
+        return None
+    return template.pk, template.updated_at.isoformat()
+
+
+def _template_image(template: BadgeTemplate, field: str, loader: Callable[[str], object]) -> object | None:
+    """Return the decoded ``logo`` or ``background_image`` of a template, memoized.
+
+    Args:
+        template: The badge template.
+        field: ``"logo"`` or ``"background_image"``.
+        loader: Decodes the image from its file path (e.g. ``ImageReader``).
+
+    Returns:
+        The decoded image, or ``None`` if the field is empty or the file
+        cannot be read.
+    """
+    image_file = getattr(template, field)
+    if not (image_file and image_file.name):
+        return None
+    version = _template_key(template)
+    key = (version, field, image_file.name, loader)
+    cached = _IMAGE_CACHE.get(key, _NOT_CACHED) if version is not None else _NOT_CACHED
+    if cached is not _NOT_CACHED:
+        return None if cached is _MISSING else cached
+    try:
+        image = loader(image_file.path)
+    except OSError:
+        image = None
+    if version is not None:
+        _IMAGE_CACHE[key] = _MISSING if image is None else image
+    return image
+
+
+@functools.lru_cache(maxsize=1024)
+def _qr_image(data: str, size: int) -> object:
+    """Build the QR code for ``data`` as a ``size``-pixel Pillow image (treat as read-only)."""
+    import qrcode  # noqa: PLC0415
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=10,
+        border=2,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    return img.resize((size, size))
 
 
 def _resolve_font_path(font_name: str) -> str | None:
@@ -47,8 +162,9 @@ def _resolve_font_path(font_name: str) -> str | None:
     if not font_name:
         return None
 
-    if font_name in _FONT_CACHE:
-        return _FONT_CACHE[font_name]
+    cached = _FONT_CACHE.get(font_name)
+    if cached is not None:
+        return cached
 
     # Direct path
     if Path(font_name).is_file():
@@ -152,20 +268,8 @@ class BadgeGenerationService:
         Returns:
             PNG image bytes.
         """
-        import qrcode  # noqa: PLC0415
-
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=2,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        img = img.resize((size, size))
         buf = io.BytesIO()
-        img.save(buf, format="PNG")
+        _qr_image(data, size).save(buf, format="PNG")
         return buf.getvalue()
 
     def _get_attendee_display_name(self, attendee: Attendee) -> str:
@@ -248,6 +352,30 @@ class BadgeGenerationService:
             return None
         return register_name
 
+    def _pdf_font(self, font_spec: str) -> str | None:
+        """Return the reportlab name of a template font, registering it once per process.
+
+        Each font file is registered under a name derived from its path, so
+        templates with different fonts never overwrite each other's
+        registration.
+
+        Args:
+            font_spec: Font filename or path from the template.
+
+        Returns:
+            The registered font name, or ``None`` to use the built-in font.
+        """
+        path = _resolve_font_path(font_spec)
+        if not path:
+            return None
+        cached = _PDF_FONT_CACHE.get(path, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
+            return None if cached is _MISSING else cached
+        digest = hashlib.sha1(path.encode(), usedforsecurity=False).hexdigest()[:12]
+        name = self._register_pdf_font(font_spec, f"BadgeFont-{digest}")
+        _PDF_FONT_CACHE[path] = _MISSING if name is None else name
+        return name
+
     def _pdf_centered(  # noqa: PLR0913
         self, layout: _PDFLayout, text: str, font: str, max_size: int, min_size: int, y: float
     ) -> float:
@@ -320,14 +448,12 @@ class BadgeGenerationService:
         c.setFillColorRGB(*_hex_to_reportlab(str(template.background_color)))  # type: ignore[attr-defined]
         c.rect(0, 0, layout.width, layout.height, fill=1, stroke=0)  # type: ignore[attr-defined]
 
-        if template.background_image and template.background_image.name:
-            try:
-                bg_img = ImageReader(template.background_image.path)
+        bg_img = _template_image(template, "background_image", ImageReader)
+        if bg_img is not None:
+            with contextlib.suppress(OSError):
                 c.drawImage(  # type: ignore[attr-defined]
                     bg_img, 0, 0, width=layout.width, height=layout.height, preserveAspectRatio=True, anchor="c"
                 )
-            except FileNotFoundError, OSError:
-                pass
 
     def _pdf_draw_header(self, layout: _PDFLayout, attendee: Attendee, template: BadgeTemplate) -> float:
         """Draw the accent header bar with logo and conference name.
@@ -344,7 +470,7 @@ class BadgeGenerationService:
 
         mm = layout.mm_unit
         c = layout.canvas
-        header_h = 22 * mm
+        header_h = _PDF_HEADER_MM * mm
 
         # Only draw header bar if no custom background image
         if not (template.background_image and template.background_image.name):
@@ -352,16 +478,16 @@ class BadgeGenerationService:
             c.rect(0, layout.height - header_h, layout.width, header_h, fill=1, stroke=0)  # type: ignore[attr-defined]
 
         # Logo — left side of header
-        if template.logo and template.logo.name:
+        logo_img = _template_image(template, "logo", ImageReader)
+        if logo_img is not None:
             try:
-                logo_img = ImageReader(template.logo.path)
                 logo_h = 14 * mm
                 iw, ih = logo_img.getSize()
                 logo_w = logo_h * (iw / ih)
                 logo_x = layout.margin
                 logo_y = layout.height - header_h + (header_h - logo_h) / 2
                 c.drawImage(logo_img, logo_x, logo_y, width=logo_w, height=logo_h)  # type: ignore[attr-defined]
-            except FileNotFoundError, OSError:
+            except OSError:
                 pass
 
         # Conference name — centered (or right of logo)
@@ -375,6 +501,39 @@ class BadgeGenerationService:
 
         return layout.height - header_h
 
+    def _pdf_draw_static_layer(self, layout: _PDFLayout, attendee: Attendee, template: BadgeTemplate) -> float:
+        """Draw the background and header, which are the same on every badge of a template.
+
+        For saved templates the layer is recorded as a form XObject the first
+        time it is drawn in a PDF document and referenced afterwards, so a
+        print sheet holds one copy of it however many badges it carries.
+
+        Args:
+            layout: PDF layout parameters.
+            attendee: The attendee (for the conference name).
+            template: The badge template.
+
+        Returns:
+            The y position below the header.
+        """
+        version = _template_key(template)
+        if version is None:
+            self._pdf_draw_background(layout, template)
+            return self._pdf_draw_header(layout, attendee, template)
+
+        c = layout.canvas
+        key = repr((version, attendee.conference_id, layout.font_name))
+        form = f"BadgeStatic{hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()[:12]}"
+        defined = _CANVAS_FORMS.setdefault(c, set())
+        if form not in defined:
+            c.beginForm(form, upperx=layout.width, uppery=layout.height)  # type: ignore[attr-defined]
+            self._pdf_draw_background(layout, template)
+            self._pdf_draw_header(layout, attendee, template)
+            c.endForm()  # type: ignore[attr-defined]
+            defined.add(form)
+        c.doForm(form)  # type: ignore[attr-defined]
+        return layout.height - _PDF_HEADER_MM * layout.mm_unit
+
     def generate_badge_pdf(self, attendee: Attendee, template: BadgeTemplate) -> bytes:
         """Generate a conference-style portrait badge as PDF.
 
@@ -392,6 +551,27 @@ class BadgeGenerationService:
         from reportlab.lib.units import mm  # noqa: PLC0415
         from reportlab.pdfgen import canvas  # noqa: PLC0415
 
+        buf = io.BytesIO()
+        c = canvas.Canvas(buf, pagesize=(template.width_mm * mm, template.height_mm * mm))
+        self.draw_badge_pdf(c, attendee, template)
+        c.showPage()
+        c.save()
+        return buf.getvalue()
+
+    def draw_badge_pdf(self, c: object, attendee: Attendee, template: BadgeTemplate) -> None:
+        """Draw a badge onto a reportlab canvas with its origin at the badge's bottom-left corner.
+
+        Used by :meth:`generate_badge_pdf` for single-badge pages and by the
+        bulk renderer to impose several badges on one print sheet (translate
+        the canvas before calling).
+
+        Args:
+            c: The reportlab canvas to draw on.
+            attendee: The attendee to draw a badge for.
+            template: The badge template defining layout and colors.
+        """
+        from reportlab.lib.units import mm  # noqa: PLC0415
+
         width = template.width_mm * mm
         height = template.height_mm * mm
         margin = 6 * mm
@@ -399,16 +579,9 @@ class BadgeGenerationService:
         accent_rgb = _hex_to_reportlab(str(template.accent_color))
         text_rgb = _hex_to_reportlab(str(template.text_color))
 
-        buf = io.BytesIO()
-        c = canvas.Canvas(buf, pagesize=(width, height))
-
         # Resolve custom fonts
-        name_font = "Helvetica-Bold"
-        body_font = "Helvetica"
-        font_name_str = str(template.font_name) if template.font_name else ""
-        font_body_str = str(template.font_body) if template.font_body else ""
-        name_font = self._register_pdf_font(font_name_str, "CustomName") or name_font
-        body_font = self._register_pdf_font(font_body_str, "CustomBody") or body_font
+        name_font = self._pdf_font(str(template.font_name or "")) or "Helvetica-Bold"
+        body_font = self._pdf_font(str(template.font_body or "")) or "Helvetica"
 
         layout = _PDFLayout(
             canvas=c,
@@ -422,8 +595,7 @@ class BadgeGenerationService:
             font_body=body_font,
         )
 
-        self._pdf_draw_background(layout, template)
-        header_bottom = self._pdf_draw_header(layout, attendee, template)
+        header_bottom = self._pdf_draw_static_layer(layout, attendee, template)
 
         ticket_label = self._get_ticket_type_label(attendee) if template.show_ticket_type else ""
         banner_pos = str(template.ticket_banner_position)
@@ -439,10 +611,6 @@ class BadgeGenerationService:
         if template.show_qr_code:
             self._pdf_draw_qr(layout, attendee)
 
-        c.showPage()
-        c.save()
-        return buf.getvalue()
-
     def _pdf_draw_ticket_banner(self, layout: _PDFLayout, ticket_label: str, header_bottom: float) -> float:
         """Draw a colored ticket-type banner below the header for special types.
 
@@ -564,7 +732,7 @@ class BadgeGenerationService:
         c = layout.canvas
         qr_size = 20 * mm
         pad = 2 * mm
-        qr_bytes = self.generate_qr_code(self._get_qr_data(attendee), size=200)
+        qr_img = _qr_image(self._get_qr_data(attendee), 200)
         qr_x = layout.width - qr_size - layout.margin
         qr_y = layout.margin + 4 * mm
 
@@ -582,7 +750,7 @@ class BadgeGenerationService:
         )
 
         c.drawImage(  # type: ignore[attr-defined]
-            ImageReader(io.BytesIO(qr_bytes)), qr_x, qr_y, width=qr_size, height=qr_size
+            ImageReader(qr_img), qr_x, qr_y, width=qr_size, height=qr_size
         )
         c.setFillColorRGB(0, 0, 0)  # type: ignore[attr-defined]
         c.setFont("Courier", 7)  # type: ignore[attr-defined]
@@ -627,11 +795,8 @@ class BadgeGenerationService:
             attendee: The attendee whose QR code to render.
             layout: Layout parameters (dimensions, colors, fonts).
         """
-        from PIL import Image  # noqa: PLC0415
-
         qr_size = int(18 * layout.px_per_mm)
-        qr_bytes = self.generate_qr_code(self._get_qr_data(attendee), size=qr_size)
-        qr_img = Image.open(io.BytesIO(qr_bytes)).resize((qr_size, qr_size))
+        qr_img = _qr_image(self._get_qr_data(attendee), qr_size)
         qr_x = layout.width - qr_size - layout.margin
         qr_y = layout.height - qr_size - layout.margin - int(3 * layout.px_per_mm)
         img.paste(qr_img, (qr_x, qr_y))  # type: ignore[union-attr]
@@ -643,6 +808,57 @@ class BadgeGenerationService:
         code_y = layout.height - layout.margin
         draw.text((code_x, code_y), code_text, fill=layout.text_color, font=layout.font_mono)  # type: ignore[union-attr]
 
+    def _png_static_layer(
+        self,
+        attendee: Attendee,
+        template: BadgeTemplate,
+        px_per_mm: float,
+        fonts: tuple[object, object, object, object],
+    ) -> tuple[object, int]:
+        """Return a fresh copy of the PNG background, accent bar and conference name.
+
+        The layer is built once per template version and conference name and
+        copied for each badge.
+
+        Args:
+            attendee: The attendee (for the conference name).
+            template: The badge template.
+            px_per_mm: Pixels per millimeter.
+            fonts: The loaded (large, medium, small, mono) fonts.
+
+        Returns:
+            Tuple of (image to draw the attendee onto, y position below the layer).
+        """
+        from PIL import Image, ImageDraw  # noqa: PLC0415
+
+        version = _template_key(template)
+        conf_name = str(attendee.conference.name) if template.show_conference_name else ""
+        key = (version, conf_name, px_per_mm)
+        cached = _STATIC_LAYER_CACHE.get(key) if version is not None else None
+        if cached is not None:
+            base, y_cursor = cached
+            return base.copy(), y_cursor
+
+        width = int(template.width_mm * px_per_mm)
+        height = int(template.height_mm * px_per_mm)
+        margin = int(4 * px_per_mm)
+        bar_height = int(6 * px_per_mm)
+        accent_color = _hex_to_rgb(str(template.accent_color))
+
+        base = Image.new("RGB", (width, height), _hex_to_rgb(str(template.background_color)))
+        draw = ImageDraw.Draw(base)
+        draw.rectangle([0, 0, width, bar_height], fill=accent_color)
+        y_cursor = bar_height + int(2 * px_per_mm)
+
+        if conf_name:
+            draw.text((margin, y_cursor), conf_name, fill=accent_color, font=fonts[1])
+            y_cursor += int(5 * px_per_mm)
+
+        if version is None:
+            return base, y_cursor
+        _STATIC_LAYER_CACHE[key] = (base, y_cursor)
+        return base.copy(), y_cursor
+
     def generate_badge_png(self, attendee: Attendee, template: BadgeTemplate) -> bytes:
         """Generate a single badge as a PNG using Pillow.
 
@@ -653,29 +869,25 @@ class BadgeGenerationService:
         Returns:
             PNG image bytes.
         """
-        from PIL import Image, ImageDraw  # noqa: PLC0415
+        from PIL import ImageDraw  # noqa: PLC0415
 
         dpi = 300
         px_per_mm = dpi / 25.4
         width = int(template.width_mm * px_per_mm)
         height = int(template.height_mm * px_per_mm)
         margin = int(4 * px_per_mm)
-        bar_height = int(6 * px_per_mm)
 
-        bg_color = _hex_to_rgb(str(template.background_color))
         text_color = _hex_to_rgb(str(template.text_color))
         accent_color = _hex_to_rgb(str(template.accent_color))
 
-        img = Image.new("RGB", (width, height), bg_color)
-        draw = ImageDraw.Draw(img)
-        draw.rectangle([0, 0, width, bar_height], fill=accent_color)
-
-        font_large, font_medium, font_small, font_mono = self._load_png_fonts(px_per_mm)
-        y_cursor = bar_height + int(2 * px_per_mm)
+        fonts = _PNG_FONT_CACHE.get(px_per_mm)
+        if fonts is None:
+            fonts = self._load_png_fonts(px_per_mm)
+            _PNG_FONT_CACHE[px_per_mm] = fonts
+        font_large, font_medium, font_small, font_mono = fonts
 
-        if template.show_conference_name:
-            draw.text((margin, y_cursor), str(attendee.conference.name), fill=accent_color, font=font_medium)
-            y_cursor += int(5 * px_per_mm)
+        img, y_cursor = self._png_static_layer(attendee, template, px_per_mm, fonts)
+        draw = ImageDraw.Draw(img)
 
         if template.show_name:
             name = self._get_attendee_display_name(attendee)
@@ -785,7 +997,10 @@ class BadgeGenerationService:
         """Generate badges for all attendees of a conference.
 
         Yields badges as they are generated, allowing progress tracking.
-        Optionally filters attendees by ticket type.
+        Optionally filters attendees by ticket type.  Rendering and storage
+        are batched by :class:`~django_program.registration.services.badge_bulk.BulkBadgeRenderer`,
+        which also offers worker processes, progress callbacks and ZIP or
+        print-sheet bundles.
 
         Args:
             conference: The conference whose attendees need badges.
@@ -801,33 +1016,9 @@ class BadgeGenerationService:
         Raises:
             ValueError: If no template is provided and no default exists.
         """
-        from django.db.models import Prefetch  # noqa: PLC0415
-
-        from django_program.registration.attendee import Attendee  # noqa: PLC0415
-        from django_program.registration.models import OrderLineItem  # noqa: PLC0415
-
-        queryset = (
-            Attendee.objects.filter(conference=conference)
-            .select_related(
-                "user",
-                "conference",
-                "order",
-            )
-            .prefetch_related(
-                Prefetch(
-                    "order__line_items",
-                    queryset=OrderLineItem.objects.filter(ticket_type__isnull=False).select_related("ticket_type"),
-                ),
-            )
-        )
-
-        if ticket_type is not None:
-            queryset = queryset.filter(
-                order__line_items__ticket_type=ticket_type,
-            ).distinct()
+        from django_program.registration.services.badge_bulk import BulkBadgeRenderer  # noqa: PLC0415
 
-        for attendee in queryset:
-            yield self.generate_or_get_badge(attendee, template=template, badge_format=badge_format)
+        yield from BulkBadgeRenderer(conference, template=template, badge_format=badge_format, ticket_type=ticket_type)
 
 
 @dataclass
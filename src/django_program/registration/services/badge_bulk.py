@@ -0,0 +1,345 @@
+"""Bulk badge rendering for printing a whole conference at once.
+
+:class:`BulkBadgeRenderer` renders the badges of many attendees in batches:
+
+* each batch looks up the attendees' existing badges in one query and skips
+  the ones that already have a file, so an interrupted run resumes where it
+  stopped,
+* the remaining attendees are rendered to PDF or PNG bytes, optionally in a
+  pool of worker processes (``badge_render_workers``),
+* the rendered files are written to storage and their ``Badge`` rows created
+  or updated with one bulk query per batch.
+
+The badges can also be bundled into a ZIP archive (:meth:`BulkBadgeRenderer.write_zip`)
+or imposed N-up onto A4 or Letter print sheets in a single PDF
+(:meth:`BulkBadgeRenderer.write_sheets`).  Sheets are drawn as vectors in the
+calling process because reportlab cannot place pages of existing PDF files.
+"""
+
+import itertools
+import logging
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from django_program.registration.attendee import Attendee
+from django_program.registration.badge import Badge, BadgeTemplate
+from django_program.registration.models import OrderLineItem
+from django_program.registration.services.badge import BadgeGenerationService
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import BinaryIO
+
+    from django.db.models import QuerySet
+
+    from django_program.conference.models import Conference
+    from django_program.registration.models import TicketType
+
+logger = logging.getLogger(__name__)
+
+# Sheet sizes in points (1/72 inch).
+PAPER_SIZES: dict[str, tuple[float, float]] = {
+    "a4": (595.2756, 841.8898),
+    "letter": (612.0, 792.0),
+}
+_SHEET_MARGIN_MM = 8
+
+
+@dataclass(frozen=True, slots=True)
+class BulkBadgeProgress:
+    """Progress of a bulk run, reported after every batch."""
+
+    completed: int
+    total: int
+    rendered: int
+    skipped: int
+
+
+@dataclass(frozen=True, slots=True)
+class BulkBadgeResult:
+    """Outcome of writing a bulk badge bundle."""
+
+    total: int
+    rendered: int
+    skipped: int
+
+
+def _init_worker() -> None:
+    """Set up Django in a worker process so pickled model instances can be loaded."""
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+
+def _render_badges(template: BadgeTemplate, badge_format: str, attendees: list[Attendee]) -> list[bytes]:
+    """Render one batch of badges; runs in a worker process when a pool is used.
+
+    The attendees arrive with their user, conference, order and ticket line
+    items already loaded, so rendering does not touch the database.
+    """
+    service = BadgeGenerationService()
+    render = service.generate_badge_png if badge_format == Badge.Format.PNG else service.generate_badge_pdf
+    return [render(attendee, template) for attendee in attendees]
+
+
+@dataclass(slots=True)
+class _Batch:
+    attendees: list[Attendee]
+    existing: dict[int, Badge]
+    todo: list[Attendee]
+
+
+class BulkBadgeRenderer:
+    """Render, store and bundle the badges of a conference's attendees.
+
+    Args:
+        conference: The conference whose attendees need badges.
+        template: The badge template to use.  If ``None``, the conference
+            default template is used.
+        badge_format: Output format -- ``"pdf"`` or ``"png"``.
+        ticket_type: When provided, only attendees whose order contains this
+            ticket type are included.
+        workers: Worker processes to render with (default:
+            ``DJANGO_PROGRAM['badge_render_workers']``); ``0`` or ``1``
+            renders in the calling process.
+        batch_size: Attendees per batch (default:
+            ``DJANGO_PROGRAM['badge_batch_size']``).
+        progress: Called with a :class:`BulkBadgeProgress` after each batch.
+
+    Raises:
+        ValueError: If the format is unsupported, or no template is provided
+            and the conference has no default.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        conference: Conference,
+        template: BadgeTemplate | None = None,
+        badge_format: str = Badge.Format.PDF,
+        ticket_type: TicketType | None = None,
+        *,
+        workers: int | None = None,
+        batch_size: int | None = None,
+        progress: Callable[[BulkBadgeProgress], None] | None = None,
+    ) -> None:
+        """Resolve the template and read the worker and batch size defaults."""
+        valid_formats = {Badge.Format.PDF, Badge.Format.PNG}
+        if badge_format not in valid_formats:
+            msg = f"Unsupported badge format '{badge_format}'. Must be one of: {', '.join(sorted(valid_formats))}"
+            raise ValueError(msg)
+        if template is None:
+            template = BadgeTemplate.objects.filter(conference=conference, is_default=True).first()
+            if template is None:
+                msg = f"No default badge template found for conference '{conference.slug}'"
+                raise ValueError(msg)
+
+        config = get_config()
+        self.conference = conference
+        self.template = template
+        self.badge_format = str(badge_format)
+        self.ticket_type = ticket_type
+        self.workers = config.badge_render_workers if workers is None else workers
+        self.batch_size = batch_size or config.badge_batch_size
+        self.progress = progress
+        self.service = BadgeGenerationService()
+
+    def attendees(self) -> QuerySet[Attendee]:
+        """Return the attendees to render, with everything a badge shows preloaded."""
+        queryset = (
+            Attendee.objects.filter(conference=self.conference)
+            .select_related("user", "conference", "order")
+            .prefetch_related(
+                Prefetch(
+                    "order__line_items",
+                    queryset=OrderLineItem.objects.filter(ticket_type__isnull=False).select_related("ticket_type"),
+                ),
+            )
+            .order_by("pk")
+        )
+        if self.ticket_type is not None:
+            queryset = queryset.filter(order__line_items__ticket_type=self.ticket_type).distinct()
+        return queryset
+
+    def __iter__(self) -> Iterator[Badge]:
+        """Render missing badges and yield every attendee's badge in attendee order."""
+        for badge, _content in self._run():
+            yield badge
+
+    def write_zip(self, output: BinaryIO) -> BulkBadgeResult:
+        """Render missing badges and write every badge file into a ZIP archive.
+
+        Args:
+            output: A writable binary file object.
+
+        Returns:
+            The attendee, rendered and skipped counts.
+        """
+        total = rendered = 0
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+            for badge, rendered_content in self._run():
+                total += 1
+                if rendered_content is None:
+                    with badge.file.open("rb") as fh:
+                        content = fh.read()
+                else:
+                    content = rendered_content
+                    rendered += 1
+                archive.writestr(f"badge-{badge.attendee.access_code}.{badge.format}", content)
+        return BulkBadgeResult(total=total, rendered=rendered, skipped=total - rendered)
+
+    def write_sheets(self, output: BinaryIO, *, paper: str = "a4") -> BulkBadgeResult:
+        """Impose every attendee's badge N-up onto print sheets in one PDF.
+
+        Badges are laid out in as many rows and columns as fit the sheet
+        inside an 8mm margin, centered.  The sheets are drawn from the
+        attendee data and are not stored as ``Badge`` rows.
+
+        Args:
+            output: A writable binary file object.
+            paper: ``"a4"`` or ``"letter"``.
+
+        Returns:
+            The attendee count (all rendered, none skipped).
+
+        Raises:
+            ValueError: If the paper size is unknown or the badge does not
+                fit on it.
+        """
+        from reportlab.lib.units import mm  # noqa: PLC0415
+        from reportlab.pdfgen import canvas  # noqa: PLC0415
+
+        if paper not in PAPER_SIZES:
+            msg = f"Unsupported paper size '{paper}'. Must be one of: {', '.join(sorted(PAPER_SIZES))}"
+            raise ValueError(msg)
+        page_w, page_h = PAPER_SIZES[paper]
+        badge_w = self.template.width_mm * mm
+        badge_h = self.template.height_mm * mm
+        margin = _SHEET_MARGIN_MM * mm
+        cols = int((page_w - 2 * margin) // badge_w)
+        rows = int((page_h - 2 * margin) // badge_h)
+        if not cols or not rows:
+            msg = (
+                f"A {self.template.width_mm}x{self.template.height_mm}mm badge does not fit on a {paper.upper()} sheet"
+            )
+            raise ValueError(msg)
+        left = (page_w - cols * badge_w) / 2
+        top = (page_h + rows * badge_h) / 2
+        per_sheet = cols * rows
+
+        count = self.attendees().count() if self.progress is not None else 0
+        c = canvas.Canvas(output, pagesize=(page_w, page_h))
+        total = 0
+        for attendee in self.attendees().iterator(chunk_size=self.batch_size):
+            slot = total % per_sheet
+            if total and not slot:
+                c.showPage()
+            row, col = divmod(slot, cols)
+            c.saveState()
+            c.translate(left + col * badge_w, top - (row + 1) * badge_h)
+            clip = c.beginPath()
+            clip.rect(0, 0, badge_w, badge_h)
+            c.clipPath(clip, stroke=0, fill=0)
+            self.service.draw_badge_pdf(c, attendee, self.template)
+            c.restoreState()
+            total += 1
+            if self.progress is not None and total % self.batch_size == 0:
+                self.progress(BulkBadgeProgress(completed=total, total=count, rendered=total, skipped=0))
+        if total:
+            c.showPage()
+        c.save()
+        return BulkBadgeResult(total=total, rendered=total, skipped=0)
+
+    def _batches(self) -> Iterator[_Batch]:
+        """Split the attendees into batches, each with its existing badges looked up in one query."""
+        attendees = self.attendees().iterator(chunk_size=self.batch_size)
+        for chunk in itertools.batched(attendees, self.batch_size, strict=False):
+            attendees = list(chunk)
+            existing: dict[int, Badge] = {}
+            # Newest first, matching ``generate_or_get_badge``.
+            for badge in Badge.objects.filter(
+                attendee__in=[attendee.pk for attendee in attendees],
+                template=self.template,
+                format=self.badge_format,
+            ).order_by("-created_at"):
+                existing.setdefault(badge.attendee_id, badge)
+            todo = [attendee for attendee in attendees if not (attendee.pk in existing and existing[attendee.pk].file)]
+            yield _Batch(attendees=attendees, existing=existing, todo=todo)
+
+    def _render(self, jobs: Iterable[list[Attendee]]) -> Iterator[list[bytes]]:
+        """Render batches in order, in a process pool when more than one worker is configured."""
+        render = partial(_render_badges, self.template, self.badge_format)
+        if self.workers <= 1:
+            yield from map(render, jobs)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+            yield from pool.map(render, jobs, buffersize=self.workers * 2)
+
+    def _store(self, batch: _Batch, contents: list[bytes]) -> dict[int, Badge]:
+        """Save a batch's rendered files and write its ``Badge`` rows in bulk.
+
+        The files have to be in storage first, because storage picks their
+        final names.  If saving a file or writing the rows fails, the files
+        already saved for the batch are deleted again before the error
+        propagates, so a failed batch leaves no orphaned files behind.
+        """
+        now = timezone.now()
+        created: list[Badge] = []
+        updated: list[Badge] = []
+        stored: dict[int, Badge] = {}
+        try:
+            for attendee, content in zip(batch.todo, contents, strict=True):
+                badge = batch.existing.get(attendee.pk)
+                if badge is None:
+                    badge = Badge(attendee=attendee, template=self.template, format=self.badge_format)
+                    created.append(badge)
+                else:
+                    updated.append(badge)
+                name = f"badge-{attendee.access_code}.{self.badge_format}"
+                badge.file.save(name, ContentFile(content), save=False)
+                badge.generated_at = now
+                stored[attendee.pk] = badge
+            with transaction.atomic():
+                Badge.objects.bulk_create(created)
+                Badge.objects.bulk_update(updated, ["file", "generated_at"])
+        except Exception:
+            for badge in stored.values():
+                badge.file.storage.delete(badge.file.name)
+            raise
+        return stored
+
+    def _run(self) -> Iterator[tuple[Badge, bytes | None]]:
+        """Yield ``(badge, content)`` per attendee; ``content`` is ``None`` for skipped badges."""
+        total = self.attendees().count()
+        completed = rendered = 0
+        pending: deque[_Batch] = deque()
+
+        def jobs() -> Iterator[list[Attendee]]:
+            for batch in self._batches():
+                pending.append(batch)
+                yield batch.todo
+
+        for contents in self._render(jobs()):
+            batch = pending.popleft()
+            stored = self._store(batch, contents) if batch.todo else {}
+            by_attendee = dict(zip((attendee.pk for attendee in batch.todo), contents, strict=True))
+            for attendee in batch.attendees:
+                badge = stored.get(attendee.pk) or batch.existing[attendee.pk]
+                badge.attendee = attendee
+                yield badge, by_attendee.get(attendee.pk)
+            completed += len(batch.attendees)
+            rendered += len(batch.todo)
+            logger.info("Rendered %d of %d badges for %s", completed, total, self.conference.slug)
+            if self.progress is not None:
+                self.progress(
+                    BulkBadgeProgress(completed=completed, total=total, rendered=rendered, skipped=completed - rendered)
+                )
@@ -23,6 +23,7 @@ from django_program.registration.models import (
     Voucher,
 )
 from django_program.registration.services.capacity import validate_global_capacity
+from django_program.registration.services.inventory import addon_counts, ticket_type_remaining
 from django_program.settings import get_config
 
 
@@ -426,7 +427,7 @@ def _validate_ticket_stock_and_limit(
     existing_in_orders: int,
 ) -> None:
     """Validate ticket stock and per-user limits for add quantity."""
-    remaining = ticket_type.remaining_quantity
+    remaining = ticket_type_remaining(ticket_type, existing_in_cart + qty)
     if remaining is not None and remaining < existing_in_cart + qty:
         raise ValidationError(f"Only {remaining} tickets of type '{ticket_type.name}' remaining.")
 
@@ -471,13 +472,8 @@ def _upsert_ticket_item(
 
 def _addon_sold_quantity(addon: AddOn) -> int:
     """Return quantity already sold for an add-on."""
-    return (
-        OrderLineItem.objects.filter(
-            addon=addon,
-            order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED],
-        ).aggregate(total=models.Sum("quantity"))["total"]
-        or 0
-    )
+    sold, _held = addon_counts(addon.pk)
+    return sold
 
 
 def _validate_addon_stock(addon: AddOn, desired_total_qty: int) -> None:
@@ -693,7 +689,7 @@ def _validate_addon_available(addon: AddOn) -> None:
 
 def _validate_ticket_quantity(cart: Cart, ticket_type: TicketType, new_qty: int) -> None:
     """Validate stock and per-user limits for a new ticket quantity."""
-    remaining = ticket_type.remaining_quantity
+    remaining = ticket_type_remaining(ticket_type, new_qty)
     if remaining is not None and remaining < new_qty:
         raise ValidationError(f"Only {remaining} tickets of type '{ticket_type.name}' remaining.")
 
@@ -719,14 +715,7 @@ def _validate_ticket_quantity(cart: Cart, ticket_type: TicketType, new_qty: int)
 def _validate_addon_quantity(addon: AddOn, new_qty: int) -> None:
     """Validate remaining stock for a new add-on quantity."""
     if addon.total_quantity > 0:
-        sold = (
-            OrderLineItem.objects.filter(
-                addon=addon,
-                order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED],
-            ).aggregate(total=models.Sum("quantity"))["total"]
-            or 0
-        )
-        remaining = addon.total_quantity - sold
+        remaining = addon.total_quantity - _addon_sold_quantity(addon)
         if remaining < new_qty:
             raise ValidationError(f"Only {remaining} of add-on '{addon.name}' remaining.")
 
@@ -3,26 +3,122 @@
 Provides ``CheckInService`` for attendee check-in operations (lookup, check-in,
 badge data, door checks) and ``RedemptionService`` for tracking product
 redemption (tutorials, meals, events) against purchased order line items.
+
+A door scan is kept to one indexed read: :meth:`CheckInService.lookup_for_scan`
+loads just the attendee and its order, and :meth:`CheckInService.get_attendee_card`
+serves the name, ticket type and products from a short-lived cache that the
+offline preload warms.  Besides the ``CheckIn`` row, :meth:`CheckInService.check_in`
+makes two writes: a conditional ``UPDATE`` of the attendee's denormalized
+``checkin_count`` and the ``CheckInChange`` row the offline change log records.
 """
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Count, Q
-from django.utils import timezone
+from django.db.models import Count, F, Prefetch, Q, Value, prefetch_related_objects
+from django.db.models.functions import Coalesce
 
 from django_program.registration.attendee import Attendee
 from django_program.registration.checkin import CheckIn, DoorCheck, ProductRedemption
 from django_program.registration.models import AddOn, Order, OrderLineItem, TicketType
+from django_program.registration.signals import checkins_synced
+from django_program.settings import get_config
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.contrib.auth.models import AbstractUser
 
     from django_program.conference.models import Conference
 
 logger = logging.getLogger(__name__)
 
+_CARD_CACHE_PREFIX = "django_program:checkin_card"
+
+
+def _card_key(conference_id: int, access_code: str) -> str:
+    return f"{_CARD_CACHE_PREFIX}:{conference_id}:{access_code}"
+
+
+def serialize_line_item(item: OrderLineItem) -> dict[str, object]:
+    """Serialize an order line item for the check-in JSON API.
+
+    Args:
+        item: The order line item to serialize.
+
+    Returns:
+        A dict with line item fields suitable for JSON encoding.
+    """
+    return {
+        "id": item.pk,
+        "description": str(item.description),
+        "quantity": item.quantity,
+        "ticket_type_slug": (str(item.ticket_type.slug) if item.ticket_type else None),
+        "addon_slug": str(item.addon.slug) if item.addon else None,
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class AttendeeCard:
+    """What a scanner displays for an attendee, cached per access code.
+
+    Only display data is cached.  The order status and check-in state that
+    decide admission are read from the database on every scan.
+    """
+
+    name: str
+    email: str
+    ticket_type: str
+    products: tuple[dict[str, object], ...]
+
+    @classmethod
+    def from_attendee(cls, attendee: Attendee) -> AttendeeCard:
+        """Build a card from an attendee whose user and order line items are loaded."""
+        line_items = list(attendee.order.line_items.all()) if attendee.order is not None else []
+        return cls(
+            name=str(getattr(attendee.user, "get_full_name", lambda: "")()),
+            email=str(getattr(attendee.user, "email", "")),
+            ticket_type=next((str(item.ticket_type.name) for item in line_items if item.ticket_type), ""),
+            products=tuple(serialize_line_item(item) for item in line_items),
+        )
+
+
+def _build_card(attendee: Attendee) -> AttendeeCard:
+    """Load the user and order line items a card needs and build it."""
+    if attendee.order is not None:
+        prefetch_related_objects(
+            [attendee.order],
+            Prefetch("line_items", queryset=OrderLineItem.objects.select_related("ticket_type", "addon")),
+        )
+    return AttendeeCard.from_attendee(attendee)
+
+
+def cache_attendee_cards(conference_id: int, cards: dict[str, AttendeeCard]) -> None:
+    """Store scanner cards keyed by access code, e.g. to warm the cache from the preload.
+
+    Args:
+        conference_id: The conference the attendees belong to.
+        cards: Cards keyed by access code.
+    """
+    timeout = get_config().checkin_card_cache_seconds
+    if timeout and cards:
+        cache.set_many({_card_key(conference_id, code): card for code, card in cards.items()}, timeout)
+
+
+def invalidate_attendee_cards(conference_id: int, access_codes: Iterable[str]) -> None:
+    """Discard cached scanner cards, immediately and again on commit.
+
+    Args:
+        conference_id: The conference the attendees belong to.
+        access_codes: The access codes whose cards are out of date.
+    """
+    keys = [_card_key(conference_id, code) for code in access_codes]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
 
 class CheckInService:
     """Service for attendee check-in operations at the conference venue."""
@@ -62,6 +158,51 @@ class CheckInService:
             .get(conference=conference, access_code=access_code)
         )
 
+    @staticmethod
+    def lookup_for_scan(*, conference: Conference, access_code: str) -> Attendee:
+        """Look up an attendee for a door scan with a single indexed query.
+
+        Only the attendee and its order are loaded -- enough to validate the
+        order status and record the check-in.  Use :meth:`get_attendee_card`
+        for the data the scanner displays.
+
+        Args:
+            conference: The conference to search within.
+            access_code: The attendee's unique access code (from badge QR/barcode).
+
+        Returns:
+            The matched Attendee instance with its order and conference set.
+
+        Raises:
+            Attendee.DoesNotExist: If no attendee matches the given code
+                within the specified conference.
+        """
+        attendee = Attendee.objects.select_related("order").get(conference=conference, access_code=access_code)
+        attendee.conference = conference
+        return attendee
+
+    @staticmethod
+    def get_attendee_card(attendee: Attendee) -> AttendeeCard:
+        """Return the attendee's scanner card, from the cache when possible.
+
+        On a miss the user and order line items are loaded and the card is
+        cached for ``checkin_card_cache_seconds``.
+
+        Args:
+            attendee: The scanned attendee.
+
+        Returns:
+            The attendee's display data.
+        """
+        timeout = get_config().checkin_card_cache_seconds
+        key = _card_key(attendee.conference_id, attendee.access_code)
+        card = cache.get(key) if timeout else None
+        if card is None:
+            card = _build_card(attendee)
+            if timeout:
+                cache.set(key, card, timeout)
+        return card
+
     @staticmethod
     def check_in(
         *,
@@ -71,9 +212,10 @@ class CheckInService:
     ) -> CheckIn:
         """Record a check-in for an attendee.
 
-        Creates a ``CheckIn`` record and updates the attendee's ``checked_in_at``
-        timestamp on first check-in only. Multiple check-ins are allowed to
-        support re-entry scenarios.
+        Creates a ``CheckIn`` record, increments the attendee's
+        ``checkin_count`` and sets ``checked_in_at`` on first check-in only,
+        in one ``UPDATE``.  Multiple check-ins are allowed to support
+        re-entry scenarios.
 
         Args:
             attendee: The attendee to check in.
@@ -90,9 +232,18 @@ class CheckInService:
                 checked_in_by=checked_in_by,
                 station=station,
             )
-            if attendee.checked_in_at is None:
-                attendee.checked_in_at = timezone.now()
-                attendee.save(update_fields=["checked_in_at", "updated_at"])
+            first = attendee.checked_in_at is None
+            updates: dict[str, object] = {"checkin_count": F("checkin_count") + 1}
+            if first:
+                updates["checked_in_at"] = Coalesce("checked_in_at", Value(checkin.checked_in_at))
+                updates["updated_at"] = checkin.checked_in_at
+            Attendee.objects.filter(pk=attendee.pk).update(**updates)
+
+        attendee.checkin_count += 1
+        if first:
+            attendee.checked_in_at = checkin.checked_in_at
+            # The UPDATE bypasses the Attendee signals the dashboards listen to.
+            checkins_synced.send(sender=CheckIn, conference=attendee.conference)
 
         logger.info(
             "Checked in attendee %s (access_code=%s) at station '%s'",
@@ -134,8 +285,6 @@ class CheckInService:
                         }
                     )
 
-        check_in_count = CheckIn.objects.filter(attendee=attendee).count()
-
         return {
             "name": full_name,
             "email": str(user.email),
@@ -143,7 +292,7 @@ class CheckInService:
             "ticket_type": ticket_type_name,
             "checked_in": attendee.checked_in_at is not None,
             "first_check_in_at": attendee.checked_in_at,
-            "check_in_count": check_in_count,
+            "check_in_count": attendee.checkin_count,
             "products": products,
         }
 
@@ -0,0 +1,399 @@
+"""Change tracking for the offline check-in preload.
+
+Scanners download every admissible attendee once and then poll for deltas.
+Each save or delete that can alter an attendee's preload record appends a
+:class:`~django_program.registration.checkin.CheckInChange` row (see the
+registration signal handlers), and the row's primary key serves as a
+per-database, monotonically increasing change sequence:
+
+* a full preload reports the latest sequence number,
+* a delta request (``?since=<seq>``) re-sends the current record of every
+  attendee changed after that number, and lists the access codes of changed
+  attendees that are no longer admissible (deleted, or whose order is no
+  longer paid) as removals.
+
+Primary keys are handed out when a row is inserted, not when its
+transaction commits.  A transaction can take a lower key and commit after a
+poll has already returned a higher sequence number, so a delta also re-reads
+every change recorded up to ``checkin_change_overlap_seconds`` before the
+change it starts from.  Records and removals are idempotent, so scanners
+apply the re-sent ones again without harm.  Changes that bypass
+model signals (``QuerySet.update()``, raw SQL) and edits to the user's name
+or email are not logged; scanners should still take a full preload at the
+start of each day.
+
+In the other direction, :func:`reconcile_offline_actions` applies the scans
+and redemptions a scanner queued while offline in one transaction: the
+attendees, line items and already-applied idempotency keys are loaded with
+one query each, the new rows are bulk-inserted with the scanner's
+timestamps, and check-in counts and first check-in times are set with a
+single ``UPDATE``.  A resent batch that collides with the original on the
+keys' unique constraint is applied again, reporting the keys the original
+committed as duplicates.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Max, Prefetch, Q
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from django_program.registration.attendee import Attendee
+from django_program.registration.checkin import CheckIn, CheckInChange, ProductRedemption
+from django_program.registration.models import Order, OrderLineItem
+from django_program.registration.services.checkin import CheckInService
+from django_program.registration.signals import checkins_synced
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import datetime
+
+    from django.contrib.auth.models import AbstractUser
+    from django.db.models import QuerySet
+
+    from django_program.conference.models import Conference
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_ORDER_STATUSES = (Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED)
+MAX_OFFLINE_ACTIONS = 500
+SCAN = "scan"
+REDEEM = "redeem"
+
+
+def record_changes(conference_id: int, attendees: Iterable[tuple[int, str]]) -> None:
+    """Append change log entries for attendees whose preload record may have changed.
+
+    Args:
+        conference_id: The attendees' conference.
+        attendees: ``(attendee_id, access_code)`` pairs.
+    """
+    CheckInChange.objects.bulk_create(
+        CheckInChange(conference_id=conference_id, attendee_id=attendee_id, access_code=access_code)
+        for attendee_id, access_code in attendees
+    )
+
+
+def latest_sequence(conference: Conference) -> int:
+    """Return the conference's latest change sequence number (``0`` before any change)."""
+    return CheckInChange.objects.filter(conference=conference).aggregate(seq=Max("pk"))["seq"] or 0
+
+
+def changes_since(conference: Conference, since: int) -> QuerySet[CheckInChange]:
+    """Return the change log entries a scanner at sequence number ``since`` may have missed.
+
+    These are the entries after ``since`` plus, because transactions can
+    commit out of primary key order, the entries recorded within
+    ``checkin_change_overlap_seconds`` before entry ``since`` was.
+    """
+    changes = CheckInChange.objects.filter(conference=conference)
+    overlap = get_config().checkin_change_overlap_seconds
+    since_at = changes.filter(pk=since).values_list("changed_at", flat=True).first()
+    if not overlap or since_at is None:
+        return changes.filter(pk__gt=since)
+    return changes.filter(Q(pk__gt=since) | Q(changed_at__gte=since_at - timedelta(seconds=overlap)))
+
+
+def preload_attendees(conference: Conference) -> QuerySet[Attendee]:
+    """Return the attendees admissible at check-in, with everything the preload shows loaded."""
+    return (
+        Attendee.objects.filter(
+            conference=conference,
+            order__isnull=False,
+            order__status__in=PRELOAD_ORDER_STATUSES,
+        )
+        .select_related("user", "order")
+        .prefetch_related(
+            Prefetch(
+                "order__line_items",
+                queryset=OrderLineItem.objects.select_related("ticket_type", "addon"),
+            ),
+            "redemptions",
+        )
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class OfflineAction:
+    """A scan or redemption queued by a scanner while it was offline.
+
+    Attributes:
+        kind: ``"scan"`` or ``"redeem"``.
+        key: The scanner's idempotency key; replaying a key is a no-op.
+        access_code: The scanned attendee's access code.
+        occurred_at: When the scanner recorded the action.
+        station: Identifier of the scanning station.
+        line_item_id: The order line item to redeem (redemptions only).
+    """
+
+    kind: str
+    key: str
+    access_code: str
+    occurred_at: datetime
+    station: str = ""
+    line_item_id: int | None = None
+
+
+@dataclass(slots=True)
+class OfflineResult:
+    """The outcome of one offline action.
+
+    Attributes:
+        key: The action's idempotency key.
+        status: ``"checked_in"``, ``"redeemed"``, ``"duplicate"`` (the key
+            was already applied) or ``"rejected"``.
+        error: Why the action was rejected.
+        record_id: The ``CheckIn`` or ``ProductRedemption`` created for the
+            action, or the one created when its key was first applied.
+    """
+
+    key: str
+    status: str
+    error: str = ""
+    record_id: int | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the result as a JSON-serializable dict."""
+        data: dict[str, object] = {"key": self.key, "status": self.status}
+        if self.error:
+            data["error"] = self.error
+        if self.record_id is not None:
+            data["id"] = self.record_id
+        return data
+
+
+def reconcile_offline_actions(
+    conference: Conference,
+    actions: Sequence[OfflineAction],
+    *,
+    performed_by: AbstractUser | None = None,
+) -> list[OfflineResult]:
+    """Apply a batch of queued offline scans and redemptions in order.
+
+    Actions are validated like their online counterparts: the attendee must
+    exist in the conference with a paid order, and a redemption must target
+    a line item of that order that is not fully redeemed (counting earlier
+    actions of the batch).  Actions whose key was already applied, in an
+    earlier batch or earlier in this one, are reported as duplicates.
+    Timestamps in the future are clamped to now.
+
+    A scanner that resends a batch while the original is still being applied
+    races it for the same keys.  The unique constraint on the keys makes the
+    later insert fail once the earlier batch commits; the batch is then
+    rolled back to a savepoint and applied again against the re-read keys, so
+    the overlapping actions are reported as duplicates.
+
+    Args:
+        conference: The conference the scanner works for.
+        actions: The queued actions, oldest first.
+        performed_by: The staff member the scanner is signed in as.
+
+    Returns:
+        One result per action, in the same order.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                batch = _OfflineBatch.apply(conference, actions, performed_by=performed_by, now=now)
+        except IntegrityError:
+            logger.info("Offline batch for %s overlapped a concurrent batch; applying it again", conference.slug)
+            batch = _OfflineBatch.apply(conference, actions, performed_by=performed_by, now=now)
+
+    if batch.touched:
+        checkins_synced.send(sender=CheckIn, conference=conference)
+    logger.info(
+        "Reconciled %d offline actions for %s: %d applied, %d duplicates",
+        len(actions),
+        conference.slug,
+        len(batch.created),
+        sum(result.status == "duplicate" for result in batch.results),
+    )
+    return batch.results
+
+
+def _applied_keys(conference: Conference, actions: Sequence[OfflineAction]) -> dict[tuple[str, str], int]:
+    """Return the record id of every key in ``actions`` that the conference already applied."""
+    applied = {
+        (SCAN, key): pk
+        for key, pk in CheckIn.objects.filter(
+            conference=conference, client_key__in=[a.key for a in actions if a.kind == SCAN]
+        ).values_list("client_key", "pk")
+    }
+    applied.update(
+        ((REDEEM, key), pk)
+        for key, pk in ProductRedemption.objects.filter(
+            conference=conference, client_key__in=[a.key for a in actions if a.kind == REDEEM]
+        ).values_list("client_key", "pk")
+    )
+    return applied
+
+
+@dataclass(slots=True)
+class _OfflineBatch:
+    """One attempt at applying a batch of offline actions.
+
+    Holds the rows the batch reads, loaded up front with one query each, and
+    what it has decided so far: a result per action, the records to insert
+    and the per-attendee check-in counts.
+    """
+
+    conference: Conference
+    performed_by: AbstractUser | None
+    now: datetime
+    attendees: dict[str, Attendee]
+    line_items: dict[int, OrderLineItem]
+    redeemed: Counter[tuple[int, int]]
+    applied: dict[tuple[str, str], int | OfflineResult]
+    results: list[OfflineResult] = field(default_factory=list)
+    created: list[tuple[OfflineResult, CheckIn | ProductRedemption]] = field(default_factory=list)
+    duplicates: list[tuple[OfflineResult, OfflineResult]] = field(default_factory=list)
+    first_check_in: dict[int, datetime] = field(default_factory=dict)
+    scans: Counter[int] = field(default_factory=Counter)
+    touched: dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def apply(
+        cls,
+        conference: Conference,
+        actions: Sequence[OfflineAction],
+        *,
+        performed_by: AbstractUser | None,
+        now: datetime,
+    ) -> _OfflineBatch:
+        """Load what the actions need, decide each one in order and write the outcome."""
+        attendees = {
+            attendee.access_code: attendee
+            for attendee in Attendee.objects.select_related("order").filter(
+                conference=conference, access_code__in={action.access_code for action in actions}
+            )
+        }
+        line_item_ids = {action.line_item_id for action in actions if action.kind == REDEEM}
+        line_items = {
+            item.pk: item
+            for item in OrderLineItem.objects.select_for_update()
+            .filter(pk__in=line_item_ids, order__conference=conference)
+            .order_by("pk")
+        }
+        redeemed: Counter[tuple[int, int]] = Counter(
+            {
+                (row["attendee_id"], row["order_line_item_id"]): row["count"]
+                for row in ProductRedemption.objects.filter(order_line_item_id__in=line_items)
+                .values("attendee_id", "order_line_item_id")
+                .annotate(count=Count("id"))
+            }
+        )
+        batch = cls(
+            conference=conference,
+            performed_by=performed_by,
+            now=now,
+            attendees=attendees,
+            line_items=line_items,
+            redeemed=redeemed,
+            applied=dict(_applied_keys(conference, actions)),
+        )
+        for action in actions:
+            batch._decide(action)
+        batch._write()
+        return batch
+
+    def _decide(self, action: OfflineAction) -> None:
+        """Validate one action and queue its record, or record why it was not applied."""
+        result = OfflineResult(key=action.key, status="rejected")
+        self.results.append(result)
+        original = self.applied.get((action.kind, action.key))
+        if original is not None:
+            result.status = "duplicate"
+            if isinstance(original, OfflineResult):
+                self.duplicates.append((result, original))
+            else:
+                result.record_id = original
+            return
+
+        attendee = self.attendees.get(action.access_code)
+        if attendee is None:
+            result.error = "Attendee not found"
+            return
+        status_error = CheckInService.validate_order_status(attendee)
+        if status_error is not None:
+            result.error = status_error
+            return
+
+        record = self._scan(action, attendee, result) if action.kind == SCAN else self._redeem(action, attendee, result)
+        if record is not None:
+            self.applied[(action.kind, action.key)] = result
+            self.created.append((result, record))
+            self.touched[attendee.pk] = attendee.access_code
+
+    def _scan(self, action: OfflineAction, attendee: Attendee, result: OfflineResult) -> CheckIn:
+        """Build the check-in for a scan and count it towards the attendee's totals."""
+        occurred_at = min(action.occurred_at, self.now)
+        result.status = "checked_in"
+        self.scans[attendee.pk] += 1
+        if attendee.checked_in_at is None:
+            self.first_check_in[attendee.pk] = min(self.first_check_in.get(attendee.pk, occurred_at), occurred_at)
+        return CheckIn(
+            attendee=attendee,
+            conference=self.conference,
+            checked_in_by=self.performed_by,
+            station=action.station,
+            checked_in_at=occurred_at,
+            client_key=action.key,
+        )
+
+    def _redeem(self, action: OfflineAction, attendee: Attendee, result: OfflineResult) -> ProductRedemption | None:
+        """Build the redemption for a redeem action, or reject it and return ``None``."""
+        item = self.line_items.get(action.line_item_id)
+        if item is None or item.order_id != attendee.order_id:
+            result.error = "Line item not found in attendee's order"
+            return None
+        if self.redeemed[(attendee.pk, item.pk)] >= item.quantity:
+            result.error = "Product already fully redeemed"
+            return None
+        self.redeemed[(attendee.pk, item.pk)] += 1
+        result.status = "redeemed"
+        return ProductRedemption(
+            attendee=attendee,
+            order_line_item=item,
+            conference=self.conference,
+            redeemed_by=self.performed_by,
+            redeemed_at=min(action.occurred_at, self.now),
+            client_key=action.key,
+        )
+
+    def _write(self) -> None:
+        """Insert the new records, update the attendees' check-in counts and log the changes."""
+        CheckIn.objects.bulk_create([record for _, record in self.created if isinstance(record, CheckIn)])
+        ProductRedemption.objects.bulk_create(
+            [record for _, record in self.created if isinstance(record, ProductRedemption)]
+        )
+        for result, record in self.created:
+            result.record_id = record.pk
+        for result, original in self.duplicates:
+            result.record_id = original.record_id
+
+        if self.scans:
+            Attendee.objects.filter(pk__in=self.scans).update(
+                checkin_count=F("checkin_count")
+                + models.Case(
+                    *(models.When(pk=pk, then=models.Value(count)) for pk, count in self.scans.items()),
+                    output_field=models.PositiveIntegerField(),
+                ),
+                checked_in_at=Coalesce(
+                    "checked_in_at",
+                    models.Case(
+                        *(models.When(pk=pk, then=models.Value(at)) for pk, at in self.first_check_in.items()),
+                        default=None,
+                        output_field=models.DateTimeField(),
+                    ),
+                ),
+                updated_at=self.now,
+            )
+        if self.touched:
+            record_changes(self.conference.pk, self.touched.items())
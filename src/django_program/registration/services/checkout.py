@@ -5,17 +5,17 @@ All methods are stateless and operate on model instances directly.
 """
 
 import json
-import secrets
-import string
+import time
 from datetime import timedelta
 from decimal import Decimal
 
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError, models, transaction
+from django.db import models, transaction
 from django.utils import timezone
 
 from django_program.registration.models import (
     Cart,
+    CartItem,
     Credit,
     Order,
     OrderLineItem,
@@ -25,7 +25,15 @@ from django_program.registration.models import (
 from django_program.registration.services.capacity import validate_global_capacity
 from django_program.registration.services.cart import get_summary_from_items
 from django_program.registration.services.conditions import commit_condition_usage
-from django_program.registration.signals import order_paid
+from django_program.registration.services.inventory import (
+    addon_counts,
+    record_line_items,
+    release_expired_holds,
+    ticket_type_remaining,
+)
+from django_program.registration.services.metrics import checkout_latency
+from django_program.registration.services.references import generate_order_reference
+from django_program.registration.signals import checkout_timed, order_paid
 from django_program.settings import get_config
 
 
@@ -33,12 +41,10 @@ def _generate_reference() -> str:
     """Generate a unique order reference using the configured prefix.
 
     The prefix is set via ``DJANGO_PROGRAM["order_reference_prefix"]``
-    (default ``"ORD"``), producing references like ``PYCON-A1B2C3D4``.
+    (default ``"ORD"``), producing time-ordered references like
+    ``PYCON-01JF3QZ8T0K2M`` that need no collision retry.
     """
-    config = get_config()
-    chars = string.ascii_uppercase + string.digits
-    suffix = "".join(secrets.choice(chars) for _ in range(8))
-    return f"{config.order_reference_prefix}-{suffix}"
+    return generate_order_reference()
 
 
 def _snapshot_voucher(voucher: Voucher) -> str:
@@ -60,6 +66,70 @@ def _finalize_discount_usage(voucher: Voucher | None, summary: object, now: obje
         commit_condition_usage(summary.condition_discounts)
 
 
+def _lap(timings: dict[str, float], phase: str, since: float) -> float:
+    """Record the time elapsed since ``since`` under ``phase`` and return now."""
+    now = time.perf_counter()
+    timings[phase] = now - since
+    return now
+
+
+def _persist_order(  # noqa: PLR0913
+    cart: Cart,
+    items: list[CartItem],
+    summary: object,
+    *,
+    voucher: Voucher | None,
+    hold_expires_at: object,
+    billing: dict[str, str],
+) -> Order:
+    """Write the order, its line items and the cart status change.
+
+    The reference comes from a collision-free generator, so the order is a
+    single ``INSERT`` with no retry loop, and every line item goes into one
+    ``bulk_create``.  ``bulk_create`` skips ``post_save``, so the new line
+    items are counted into the inventory counters explicitly.
+    """
+    order_kwargs = {
+        "conference": cart.conference,
+        "user": cart.user,
+        "status": Order.Status.PENDING,
+        "subtotal": summary.subtotal,
+        "discount_amount": summary.discount,
+        "total": summary.total,
+        "voucher_code": voucher.code if voucher else "",
+        "voucher_details": _snapshot_voucher(voucher) if voucher else "",
+        "reference": _generate_reference(),
+        **billing,
+    }
+    if _order_has_hold_expires_at():
+        order_kwargs["hold_expires_at"] = hold_expires_at
+    order = Order.objects.create(**order_kwargs)
+
+    items_by_id = {item.pk: item for item in items}
+    line_items = []
+    for line in summary.items:
+        cart_item = items_by_id.get(line.item_id)
+        if cart_item is None:
+            raise ValidationError("Cart changed during checkout. Please try again.")
+        line_items.append(
+            OrderLineItem(
+                order=order,
+                description=line.description,
+                quantity=line.quantity,
+                unit_price=line.unit_price,
+                discount_amount=line.discount,
+                line_total=line.line_total,
+                ticket_type=cart_item.ticket_type,
+                addon=cart_item.addon,
+            )
+        )
+    record_line_items(OrderLineItem.objects.bulk_create(line_items))
+
+    cart.status = Cart.Status.CHECKED_OUT
+    cart.save(update_fields=["status", "updated_at"])
+    return order
+
+
 class CheckoutService:
     """Stateless service for checkout operations.
 
@@ -82,6 +152,9 @@ class CheckoutService:
         snapshots each CartItem into OrderLineItems, records voucher details,
         and marks the cart as CHECKED_OUT.
 
+        The time spent locking, revalidating, pricing and persisting is
+        recorded in ``checkout_latency`` and sent with ``checkout_timed``.
+
         Args:
             cart: The open cart to check out.
             billing_name: Customer billing name.
@@ -95,8 +168,10 @@ class CheckoutService:
             ValidationError: If the cart is empty, expired, not open, or if
                 stock/price validation fails at checkout time.
         """
+        timings: dict[str, float] = {}
+        started = mark = time.perf_counter()
         now = timezone.now()
-        _expire_stale_pending_orders(conference_id=cart.conference_id, now=now)
+
         cart = Cart.objects.select_for_update().select_related("voucher").get(pk=cart.pk)
 
         if cart.status != Cart.Status.OPEN:
@@ -108,64 +183,35 @@ class CheckoutService:
         items = list(cart.items.select_for_update().select_related("ticket_type", "addon"))
         if not items:
             raise ValidationError("Cannot check out an empty cart.")
+        mark = _lap(timings, "lock", mark)
 
         _revalidate_stock(items, cart.conference)
-
-        summary = get_summary_from_items(cart, items)
-
         voucher = cart.voucher
         _validate_voucher_for_checkout(voucher)
-        voucher_code = voucher.code if voucher else ""
-        voucher_details = _snapshot_voucher(voucher) if voucher else ""
-        hold_expires_at = now + timedelta(minutes=get_config().pending_order_expiry_minutes)
-        max_retries = 10
-        for attempt in range(max_retries):
-            reference = _generate_reference()
-            try:
-                order_kwargs = {
-                    "conference": cart.conference,
-                    "user": cart.user,
-                    "status": Order.Status.PENDING,
-                    "subtotal": summary.subtotal,
-                    "discount_amount": summary.discount,
-                    "total": summary.total,
-                    "voucher_code": voucher_code,
-                    "voucher_details": voucher_details,
-                    "billing_name": billing_name,
-                    "billing_email": billing_email,
-                    "billing_company": billing_company,
-                    "reference": reference,
-                }
-                if _order_has_hold_expires_at():
-                    order_kwargs["hold_expires_at"] = hold_expires_at
-                order = Order.objects.create(**order_kwargs)
-                break
-            except IntegrityError:
-                if attempt >= max_retries - 1:
-                    raise
-                continue
-
-        items_by_id = {item.pk: item for item in items}
-        for line in summary.items:
-            cart_item = items_by_id.get(line.item_id)
-            if cart_item is None:
-                raise ValidationError("Cart changed during checkout. Please try again.")
-            OrderLineItem.objects.create(
-                order=order,
-                description=line.description,
-                quantity=line.quantity,
-                unit_price=line.unit_price,
-                discount_amount=line.discount,
-                line_total=line.line_total,
-                ticket_type=cart_item.ticket_type,
-                addon=cart_item.addon,
-            )
-
-        cart.status = Cart.Status.CHECKED_OUT
-        cart.save(update_fields=["status", "updated_at"])
+        mark = _lap(timings, "revalidate", mark)
 
+        summary = get_summary_from_items(cart, items)
+        mark = _lap(timings, "price", mark)
+
+        order = _persist_order(
+            cart,
+            items,
+            summary,
+            voucher=voucher,
+            hold_expires_at=now + timedelta(minutes=get_config().pending_order_expiry_minutes),
+            billing={
+                "billing_name": billing_name,
+                "billing_email": billing_email,
+                "billing_company": billing_company,
+            },
+        )
         _finalize_discount_usage(voucher, summary, now)
+        _lap(timings, "persist", mark)
 
+        timings["total"] = time.perf_counter() - started
+        for phase, seconds in timings.items():
+            checkout_latency.observe(phase, seconds)
+        checkout_timed.send(sender=Order, order=order, timings=timings)
         return order
 
     @staticmethod
@@ -392,9 +438,9 @@ def _revalidate_global_capacity(items: list[object], conference: object) -> None
 def _revalidate_ticket_stock(item: object) -> None:
     """Validate a ticket type is still available with sufficient stock."""
     tt = item.ticket_type
+    remaining = ticket_type_remaining(tt, item.quantity)
     if not tt.is_available:
         raise ValidationError(f"Ticket type '{tt.name}' is no longer available.")
-    remaining = tt.remaining_quantity
     if remaining is not None and remaining < item.quantity:
         raise ValidationError(f"Only {remaining} tickets of type '{tt.name}' remaining, but {item.quantity} requested.")
 
@@ -412,42 +458,15 @@ def _revalidate_addon_stock(item: object, now: object, ticket_type_ids: set[int]
     if addon.available_until and now > addon.available_until:
         raise ValidationError(f"Add-on '{addon.name}' is no longer available.")
     if addon.total_quantity > 0:
-        sold = (
-            OrderLineItem.objects.filter(addon=addon)
-            .filter(
-                models.Q(order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED])
-                | models.Q(order__status=Order.Status.PENDING, order__hold_expires_at__gt=now)
-            )
-            .aggregate(total=models.Sum("quantity"))["total"]
-            or 0
-        )
-        remaining = addon.total_quantity - sold
+        remaining = addon.total_quantity - sum(addon_counts(addon.pk))
+        if remaining < item.quantity and release_expired_holds(conference_id=addon.conference_id):
+            remaining = addon.total_quantity - sum(addon_counts(addon.pk))
         if remaining < item.quantity:
             raise ValidationError(
                 f"Only {remaining} of add-on '{addon.name}' remaining, but {item.quantity} requested."
             )
 
 
-def _expire_stale_pending_orders(*, conference_id: int, now: object) -> None:
-    """Mark stale pending orders as cancelled and release voucher usage."""
-    if not _order_has_hold_expires_at():
-        return
-    stale_qs = Order.objects.filter(
-        conference_id=conference_id,
-        status=Order.Status.PENDING,
-        hold_expires_at__isnull=False,
-        hold_expires_at__lte=now,
-    )
-    voucher_codes = list(stale_qs.exclude(voucher_code="").values_list("voucher_code", flat=True))
-    stale_qs.update(status=Order.Status.CANCELLED, hold_expires_at=None)
-    for code in voucher_codes:
-        Voucher.objects.filter(
-            conference_id=conference_id,
-            code=code,
-            times_used__gt=0,
-        ).update(times_used=models.F("times_used") - 1)
-
-
 def _order_has_hold_expires_at() -> bool:
     """Return True when the Order model has hold_expires_at in this runtime."""
     return hasattr(Order, "hold_expires_at")
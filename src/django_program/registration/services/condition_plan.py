@@ -0,0 +1,284 @@
+"""Compiled, cached condition plans for the discount and condition engine.
+
+Loading every active condition (six tables plus their M2M scopes) on each
+cart render is the dominant query cost of the cart and checkout pages.  This
+module compiles a conference's active conditions once into an immutable,
+priority-sorted :class:`ConditionPlan` that holds everything evaluation needs:
+scope id sets, time/stock windows, and the discount math inputs.
+
+Plans are cached at two levels:
+
+* **In process** -- a module-level dict keyed by conference id, so repeated
+  evaluations in the same worker cost no cache round-trip for the plan body.
+* **Django cache** -- shared across workers, keyed by conference id and a
+  version token.
+
+The version token lives in the Django cache and is replaced by
+:func:`invalidate_condition_plan`, which the registration app wires to
+``post_save`` / ``post_delete`` / ``m2m_changed`` on every ``ConditionBase``
+subclass.  A stale in-process plan is detected by comparing its version with
+the shared token.
+"""
+
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+
+from django_program.cache_versions import bump_version, current_version
+from django_program.registration.conditions import (
+    ConditionBase,
+    DiscountForCategory,
+    DiscountForProduct,
+    GroupMemberCondition,
+    IncludedProductCondition,
+    SpeakerCondition,
+    TimeOrStockLimitCondition,
+    _calculate_effect_discount,
+    _calculate_percentage_discount,
+    _check_time_and_stock,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from django_program.registration.models import CartItem
+
+logger = logging.getLogger(__name__)
+
+# Every concrete condition model.  Order only matters for tie-breaking when
+# two conditions share the same (priority, name).
+CONDITION_MODELS: tuple[type[ConditionBase], ...] = (
+    TimeOrStockLimitCondition,
+    SpeakerCondition,
+    GroupMemberCondition,
+    IncludedProductCondition,
+    DiscountForProduct,
+    DiscountForCategory,
+)
+
+_CACHE_PREFIX = "django_program:condition_plan"
+_PLAN_CACHE_TIMEOUT = 60 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCondition:
+    """An immutable snapshot of one active condition.
+
+    Holds the scope and discount inputs of a ``ConditionBase`` subclass so
+    that evaluation and pricing need no further database access for
+    condition metadata.
+    """
+
+    model: str
+    pk: int
+    conference_id: int
+    name: str
+    priority: int
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    limit: int = 0
+    times_used: int = 0
+    is_category: bool = False
+    discount_type: str = ""
+    discount_value: Decimal = Decimal("0.00")
+    max_quantity: int = 0
+    percentage: Decimal = Decimal("0.00")
+    apply_to_tickets: bool = False
+    apply_to_addons: bool = False
+    ticket_type_ids: frozenset[int] = frozenset()
+    addon_ids: frozenset[int] = frozenset()
+    is_presenter: bool = False
+    is_copresenter: bool = False
+    group_ids: frozenset[int] = frozenset()
+    enabling_ticket_type_ids: frozenset[int] = frozenset()
+
+    def is_open(self) -> bool:
+        """Return True if the condition is inside its time window with stock left."""
+        return _check_time_and_stock(self.start_time, self.end_time, self.limit, self.times_used)
+
+    def matches_item(self, item: CartItem) -> bool:
+        """Return True if the cart item falls within this condition's scope.
+
+        Category discounts match on ``apply_to_tickets`` / ``apply_to_addons``;
+        every other condition matches on its applicable id sets, where an
+        empty set means "all products of that kind".
+        """
+        if item.ticket_type_id is not None:
+            if self.is_category:
+                return self.apply_to_tickets
+            return not self.ticket_type_ids or item.ticket_type_id in self.ticket_type_ids
+        if item.addon_id is not None:
+            if self.is_category:
+                return self.apply_to_addons
+            return not self.addon_ids or item.addon_id in self.addon_ids
+        return False
+
+    def calculate_discount(self, unit_price: Decimal, quantity: int) -> Decimal:
+        """Calculate the discount amount exactly as the source model would."""
+        if self.is_category:
+            return _calculate_percentage_discount(self.percentage, unit_price, quantity)
+        return _calculate_effect_discount(
+            self.discount_type,
+            self.discount_value,
+            self.max_quantity,
+            unit_price,
+            quantity,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ConditionPlan:
+    """A conference's active conditions, sorted by ``(priority, name)``."""
+
+    conference_id: int
+    version: str
+    conditions: tuple[CompiledCondition, ...] = ()
+
+    def get(self, model: str, pk: int) -> CompiledCondition | None:
+        """Return the compiled condition for ``(model, pk)``, if present."""
+        for condition in self.conditions:
+            if condition.pk == pk and condition.model == model:
+                return condition
+        return None
+
+
+_local_plans: dict[int, ConditionPlan] = {}
+
+
+def _ids(manager: object) -> frozenset[int]:
+    """Collect primary keys from a prefetched related manager."""
+    return frozenset(obj.pk for obj in manager.all())
+
+
+def _compile_condition(condition: ConditionBase) -> CompiledCondition:
+    """Snapshot a condition model instance into a ``CompiledCondition``."""
+    fields: dict[str, object] = {
+        "model": type(condition).__name__,
+        "pk": condition.pk,
+        "conference_id": condition.conference_id,
+        "name": str(condition.name),
+        "priority": condition.priority,
+        "start_time": getattr(condition, "start_time", None),
+        "end_time": getattr(condition, "end_time", None),
+        "limit": getattr(condition, "limit", 0),
+        "times_used": getattr(condition, "times_used", 0),
+    }
+    if isinstance(condition, DiscountForCategory):
+        fields.update(
+            is_category=True,
+            percentage=condition.percentage,
+            apply_to_tickets=condition.apply_to_tickets,
+            apply_to_addons=condition.apply_to_addons,
+        )
+    else:
+        fields.update(
+            discount_type=condition.discount_type,
+            discount_value=condition.discount_value,
+            max_quantity=condition.max_quantity,
+            ticket_type_ids=_ids(condition.applicable_ticket_types),
+            addon_ids=_ids(condition.applicable_addons),
+        )
+    if isinstance(condition, SpeakerCondition):
+        fields.update(is_presenter=condition.is_presenter, is_copresenter=condition.is_copresenter)
+    elif isinstance(condition, GroupMemberCondition):
+        fields["group_ids"] = _ids(condition.groups)
+    elif isinstance(condition, IncludedProductCondition):
+        fields["enabling_ticket_type_ids"] = _ids(condition.enabling_ticket_types)
+    return CompiledCondition(**fields)
+
+
+def compile_condition_plan(conference_id: int, *, version: str = "") -> ConditionPlan:
+    """Build a fresh plan for a conference from the database.
+
+    Runs one query per condition table plus one per M2M relation, the same
+    cost the evaluator previously paid on every request.
+
+    Args:
+        conference_id: Primary key of the conference.
+        version: The version token the plan is compiled for.
+
+    Returns:
+        An immutable, priority-sorted ``ConditionPlan``.
+    """
+    compiled: list[CompiledCondition] = []
+    for condition_cls in CONDITION_MODELS:
+        m2m_names = [f.name for f in condition_cls._meta.many_to_many]  # noqa: SLF001
+        qs = condition_cls.objects.filter(conference_id=conference_id, is_active=True).prefetch_related(*m2m_names)
+        compiled.extend(_compile_condition(condition) for condition in qs)
+    compiled.sort(key=lambda c: (c.priority, c.name))
+    return ConditionPlan(conference_id=conference_id, version=version, conditions=tuple(compiled))
+
+
+def _version_key(conference_id: int) -> str:
+    return f"{_CACHE_PREFIX}:version:{conference_id}"
+
+
+def _plan_key(conference_id: int, version: str) -> str:
+    return f"{_CACHE_PREFIX}:{conference_id}:{version}"
+
+
+def get_condition_plan(conference: object) -> ConditionPlan:
+    """Return the current compiled plan for a conference.
+
+    Serves the in-process copy when its version matches the shared token,
+    then falls back to the Django cache, and only compiles from the
+    database when both miss.
+
+    Args:
+        conference: The conference (or any object with a ``pk``).
+
+    Returns:
+        The conference's ``ConditionPlan``.
+    """
+    conference_id = conference.pk
+    version = current_version(_version_key(conference_id))
+
+    local = _local_plans.get(conference_id)
+    if local is not None and local.version == version:
+        return local
+
+    plan_key = _plan_key(conference_id, version)
+    plan = cache.get(plan_key)
+    if plan is None:
+        plan = compile_condition_plan(conference_id, version=version)
+        cache.set(plan_key, plan, _PLAN_CACHE_TIMEOUT)
+    _local_plans[conference_id] = plan
+    return plan
+
+
+def invalidate_condition_plan(conference_id: int) -> None:
+    """Discard the compiled plan for a conference in every process.
+
+    Other processes notice the new version token; this one also drops its
+    in-process copy right away.
+
+    Args:
+        conference_id: Primary key of the conference whose conditions changed.
+    """
+    _local_plans.pop(conference_id, None)
+    bump_version(_version_key(conference_id))
+
+
+def invalidate_after_usage(conference_id: int, used: Iterable[tuple[str, int]]) -> None:
+    """Invalidate a plan after ``times_used`` was bumped via ``QuerySet.update()``.
+
+    ``update()`` bypasses model signals, so ``commit_condition_usage`` calls
+    this explicitly.  Only stock-capped conditions read ``times_used`` during
+    evaluation, so uncapped usage leaves the plan (and its cache hit rate
+    during a sales launch) untouched.
+
+    Args:
+        conference_id: Primary key of the conference the usage belongs to.
+        used: ``(model_name, pk)`` pairs whose usage counter changed.
+    """
+    plan = _local_plans.get(conference_id)
+    for model_name, pk in used:
+        compiled = plan.get(model_name, pk) if plan is not None else None
+        if compiled is None or compiled.limit > 0:
+            logger.debug("Invalidating condition plan for conference %s after usage commit", conference_id)
+            invalidate_condition_plan(conference_id)
+            return
@@ -5,6 +5,9 @@ returns applicable discounts as structured data for cart pricing integration.
 
 All condition types are merged into a single priority-sorted list before
 evaluation so that priority ordering is respected globally across types.
+That list is compiled once per conference and cached (see
+:mod:`django_program.registration.services.condition_plan`), so evaluation
+issues no queries for condition metadata.
 """
 
 from dataclasses import dataclass
@@ -18,14 +21,18 @@ if TYPE_CHECKING:
 
 from django_program.registration.conditions import (
     ConditionBase,
-    DiscountForCategory,
-    DiscountForProduct,
     GroupMemberCondition,
     IncludedProductCondition,
     SpeakerCondition,
-    TimeOrStockLimitCondition,
 )
 from django_program.registration.models import AddOn, Cart, CartItem, TicketType
+from django_program.registration.services.condition_plan import (
+    CONDITION_MODELS,
+    CompiledCondition,
+    get_condition_plan,
+    invalidate_after_usage,
+)
+from django_program.registration.services.eligibility import UserEligibilityContext
 
 
 @dataclass
@@ -39,98 +46,44 @@ class CartItemDiscount:
     original_price: Decimal
     condition_pk: int = 0
     condition_model: str = ""
+    conference_id: int = 0
 
 
-# All concrete condition types that use DiscountEffect (ConditionBase + DiscountEffect).
-_DISCOUNT_EFFECT_TYPES: list[type[ConditionBase]] = [
-    TimeOrStockLimitCondition,
-    SpeakerCondition,
-    GroupMemberCondition,
-    IncludedProductCondition,
-    DiscountForProduct,
-]
+_USER_CHECKS = {
+    SpeakerCondition.__name__: lambda c, ctx: ctx.matches_speaker_roles(
+        is_presenter=c.is_presenter,
+        is_copresenter=c.is_copresenter,
+    ),
+    GroupMemberCondition.__name__: lambda c, ctx: ctx.in_any_group(c.group_ids),
+    IncludedProductCondition.__name__: lambda c, ctx: ctx.has_purchased_any(c.enabling_ticket_type_ids),
+}
 
 
-def _item_matches_discount_scope(
-    item: CartItem,
-    applicable_ticket_ids: set[int],
-    applicable_addon_ids: set[int],
-) -> bool:
-    """Check whether a cart item falls within a condition's applicable scope.
+def _evaluate_compiled(condition: CompiledCondition, eligibility: UserEligibilityContext) -> bool:
+    """Return True if the user qualifies for a compiled condition.
 
-    Args:
-        item: The cart item to check.
-        applicable_ticket_ids: Set of ticket type PKs (empty means all tickets).
-        applicable_addon_ids: Set of add-on PKs (empty means all add-ons).
-
-    Returns:
-        True if the item is covered by the discount scope.
+    Time windows and stock caps are checked from the plan snapshot; the
+    user-dependent condition types read from the shared eligibility context,
+    which loads each fact at most once.
     """
-    if item.ticket_type_id is not None:
-        if not applicable_ticket_ids:
-            return True
-        return item.ticket_type_id in applicable_ticket_ids
-    if item.addon_id is not None:
-        if not applicable_addon_ids:
-            return True
-        return item.addon_id in applicable_addon_ids
-    return False
-
-
-def _item_matches_category_scope(item: CartItem, condition: DiscountForCategory) -> bool:
-    """Check whether a cart item falls within a category discount's scope."""
-    if item.ticket_type_id is not None:
-        return condition.apply_to_tickets
-    if item.addon_id is not None:
-        return condition.apply_to_addons
-    return False
-
-
-def _gather_all_conditions(conference: object) -> list[ConditionBase]:
-    """Fetch all active conditions across all types, sorted globally by priority.
-
-    Returns a single merged list sorted by (priority, name) so that
-    evaluation respects priority across different condition types.
-    """
-    all_conditions: list[ConditionBase] = []
-
-    for condition_cls in _DISCOUNT_EFFECT_TYPES:
-        qs = condition_cls.objects.filter(
-            conference=conference,
-            is_active=True,
-        ).prefetch_related("applicable_ticket_types", "applicable_addons")
-        all_conditions.extend(qs)
-
-    category_qs = DiscountForCategory.objects.filter(conference=conference, is_active=True)
-    all_conditions.extend(category_qs)
-
-    all_conditions.sort(key=lambda c: (c.priority, str(c.name)))
-    return all_conditions
+    if not condition.is_open():
+        return False
+    user_check = _USER_CHECKS.get(condition.model)
+    return user_check is None or user_check(condition, eligibility)
 
 
 def _apply_condition_to_items(
-    condition: ConditionBase,
+    condition: CompiledCondition,
     items: list[CartItem],
     discounted_item_ids: set[int],
     results: list[CartItemDiscount],
 ) -> None:
     """Apply a single evaluated condition to undiscounted cart items."""
-    is_category = isinstance(condition, DiscountForCategory)
-    applicable_ticket_ids: set[int] = set()
-    applicable_addon_ids: set[int] = set()
-
-    if not is_category:
-        applicable_ticket_ids = {t.pk for t in condition.applicable_ticket_types.all()}
-        applicable_addon_ids = {a.pk for a in condition.applicable_addons.all()}
-
     for item in items:
         if item.pk in discounted_item_ids:
             continue
 
-        if is_category:
-            if not _item_matches_category_scope(item, condition):
-                continue
-        elif not _item_matches_discount_scope(item, applicable_ticket_ids, applicable_addon_ids):
+        if not condition.matches_item(item):
             continue
 
         discount_amount = condition.calculate_discount(item.unit_price, item.quantity)
@@ -140,12 +93,13 @@ def _apply_condition_to_items(
         results.append(
             CartItemDiscount(
                 cart_item_id=item.pk,
-                condition_name=str(condition.name),
-                condition_type=type(condition).__name__,
+                condition_name=condition.name,
+                condition_type=condition.model,
                 discount_amount=discount_amount,
                 original_price=item.line_total,
                 condition_pk=condition.pk,
-                condition_model=type(condition).__name__,
+                condition_model=condition.model,
+                conference_id=condition.conference_id,
             )
         )
         discounted_item_ids.add(item.pk)
@@ -155,18 +109,27 @@ def evaluate_for_items(
     items: list[CartItem],
     user: object,
     conference: object,
+    *,
+    eligibility: UserEligibilityContext | None = None,
 ) -> list[CartItemDiscount]:
     """Evaluate all conditions against a list of cart items (side-effect free).
 
-    Gathers all active conditions into a single priority-sorted list,
-    evaluates each against the user, and applies the first matching
-    discount per item (no stacking). Does NOT mutate the database;
-    call ``commit_condition_usage()`` at checkout to persist usage.
+    Walks the conference's compiled condition plan (already priority-sorted
+    and cached), evaluates each condition against the user, and applies the
+    first matching discount per item (no stacking). Does NOT mutate the
+    database; call ``commit_condition_usage()`` at checkout to persist usage.
+
+    User-dependent facts (speaker roles, groups, purchases) come from a
+    single ``UserEligibilityContext`` shared by every condition, so the
+    whole evaluation costs at most three queries regardless of how many
+    conditions are active.
 
     Args:
         items: Pre-fetched cart items to evaluate against.
         user: The cart owner.
         conference: The conference context.
+        eligibility: An existing context for the same user and conference,
+            to share its loaded facts with other calls in the same request.
 
     Returns:
         A list of CartItemDiscount entries, one per discounted cart item.
@@ -174,12 +137,16 @@ def evaluate_for_items(
     if not items:
         return []
 
-    all_conditions = _gather_all_conditions(conference)
+    plan = get_condition_plan(conference)
+    if eligibility is None:
+        eligibility = UserEligibilityContext(user, conference.pk)
     discounted_item_ids: set[int] = set()
     results: list[CartItemDiscount] = []
 
-    for condition in all_conditions:
-        if condition.evaluate(user, conference):
+    for condition in plan.conditions:
+        if len(discounted_item_ids) == len(items):
+            break
+        if _evaluate_compiled(condition, eligibility):
             _apply_condition_to_items(condition, items, discounted_item_ids, results)
 
     return results
@@ -210,21 +177,24 @@ def commit_condition_usage(discounts: list[CartItemDiscount]) -> None:
     Groups discounts by condition and increments ``times_used`` by the number
     of items each condition discounted. Uses a conditional UPDATE that only
     increments when ``limit=0 OR times_used + count <= limit`` to prevent
-    overshooting the cap under concurrency.
+    overshooting the cap under concurrency. Because ``update()`` bypasses
+    model signals, compiled plans holding a stock-capped condition are
+    invalidated explicitly afterwards.
 
     Args:
         discounts: The discount results from ``evaluate_for_items``.
     """
-    model_map: dict[str, type[ConditionBase]] = {
-        cls.__name__: cls for cls in [*_DISCOUNT_EFFECT_TYPES, DiscountForCategory]
-    }
+    model_map: dict[str, type[ConditionBase]] = {cls.__name__: cls for cls in CONDITION_MODELS}
     usage_counts: dict[tuple[str, int], int] = {}
+    used_by_conference: dict[int, set[tuple[str, int]]] = {}
 
     for d in discounts:
         if not d.condition_pk or not d.condition_model:
             continue
         key = (d.condition_model, d.condition_pk)
         usage_counts[key] = usage_counts.get(key, 0) + 1
+        if d.conference_id:
+            used_by_conference.setdefault(d.conference_id, set()).add(key)
 
     for (model_name, pk), count in usage_counts.items():
         model_cls = model_map.get(model_name)
@@ -237,19 +207,33 @@ def commit_condition_usage(discounts: list[CartItemDiscount]) -> None:
                 times_used=models.F("times_used") + count,
             )
 
+    for conference_id, used in used_by_conference.items():
+        invalidate_after_usage(conference_id, used)
+
 
-def get_eligible_discounts(user: object, conference: object) -> list[ConditionBase]:
+def get_eligible_discounts(
+    user: object,
+    conference: object,
+    *,
+    eligibility: UserEligibilityContext | None = None,
+) -> list[CompiledCondition]:
     """Return all conditions the user currently qualifies for.
 
     Args:
         user: The authenticated user.
         conference: The conference to check conditions for.
+        eligibility: An existing context for the same user and conference,
+            to share its loaded facts with other calls in the same request.
 
     Returns:
-        A list of condition instances the user qualifies for.
+        A priority-sorted list of compiled conditions the user qualifies for.
+        Each exposes ``model``, ``pk``, ``name`` and ``priority`` for looking
+        up the underlying condition row when needed.
     """
-    all_conditions = _gather_all_conditions(conference)
-    return [c for c in all_conditions if c.evaluate(user, conference)]
+    plan = get_condition_plan(conference)
+    if eligibility is None:
+        eligibility = UserEligibilityContext(user, conference.pk)
+    return [c for c in plan.conditions if _evaluate_compiled(c, eligibility)]
 
 
 def get_visible_products(user: object, conference: object) -> tuple[QuerySet, QuerySet]:  # noqa: ARG001
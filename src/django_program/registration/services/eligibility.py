@@ -0,0 +1,140 @@
+"""Batched, per-request answers to the user-dependent condition questions.
+
+``SpeakerCondition``, ``GroupMemberCondition`` and ``IncludedProductCondition``
+each need a fact about the current user: are they a speaker (or
+co-presenter), which auth groups are they in, and which products have they
+already bought. Asking per condition costs a query (or a loop of queries)
+per active condition; :class:`UserEligibilityContext` answers all of them
+with at most three queries, fetched lazily and shared by every condition
+evaluated for the same user and conference.
+"""
+
+from functools import cached_property
+
+from django.db.models import Exists, OuterRef
+
+
+class UserEligibilityContext:
+    """Lazily loaded eligibility facts for one user within one conference.
+
+    Each group of facts is fetched with a single query the first time a
+    condition asks for it:
+
+    * speaker roles -- one query over ``Speaker`` with a co-presenter subquery
+    * auth group ids -- one query over the user's groups
+    * purchased ticket type and add-on ids -- one query over paid line items
+
+    Anonymous users (or ``None``) never trigger a query and qualify for none
+    of the user-dependent conditions.
+    """
+
+    def __init__(self, user: object, conference_id: int) -> None:
+        """Bind the context to a user and conference.
+
+        Args:
+            user: The user being evaluated (may be anonymous or ``None``).
+            conference_id: Primary key of the conference.
+        """
+        self.user = user
+        self.conference_id = conference_id
+
+    @property
+    def _has_user(self) -> bool:
+        return getattr(self.user, "pk", None) is not None
+
+    @cached_property
+    def _speaker_copresenter_flags(self) -> tuple[bool, ...]:
+        """One flag per linked Speaker: True if they share a talk with someone else."""
+        if not self._has_user:
+            return ()
+
+        from django_program.pretalx.models import Speaker, Talk  # noqa: PLC0415
+
+        talk_speakers = Talk.speakers.through
+        shares_a_talk = (
+            talk_speakers.objects.filter(
+                talk__conference_id=self.conference_id,
+                talk__speakers=OuterRef("pk"),
+            )
+            .exclude(speaker=OuterRef("pk"))
+            .values("pk")
+        )
+        return tuple(
+            Speaker.objects.filter(conference_id=self.conference_id, user=self.user)
+            .annotate(has_copresenter=Exists(shares_a_talk))
+            .values_list("has_copresenter", flat=True)
+        )
+
+    @property
+    def is_speaker(self) -> bool:
+        """Return True if the user is linked to a Speaker in this conference."""
+        return bool(self._speaker_copresenter_flags)
+
+    @property
+    def is_copresenter(self) -> bool:
+        """Return True if the user shares at least one talk with another speaker."""
+        return any(self._speaker_copresenter_flags)
+
+    @cached_property
+    def group_ids(self) -> frozenset[int]:
+        """Return the primary keys of the user's auth groups."""
+        if not self._has_user:
+            return frozenset()
+        return frozenset(self.user.groups.values_list("pk", flat=True))
+
+    @cached_property
+    def _purchased_product_ids(self) -> tuple[frozenset[int], frozenset[int]]:
+        if not self._has_user:
+            return frozenset(), frozenset()
+
+        from django_program.registration.models import Order, OrderLineItem  # noqa: PLC0415
+
+        rows = OrderLineItem.objects.filter(
+            order__user=self.user,
+            order__conference_id=self.conference_id,
+            order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED],
+        ).values_list("ticket_type_id", "addon_id")
+        ticket_type_ids: set[int] = set()
+        addon_ids: set[int] = set()
+        for ticket_type_id, addon_id in rows:
+            if ticket_type_id is not None:
+                ticket_type_ids.add(ticket_type_id)
+            if addon_id is not None:
+                addon_ids.add(addon_id)
+        return frozenset(ticket_type_ids), frozenset(addon_ids)
+
+    @property
+    def purchased_ticket_type_ids(self) -> frozenset[int]:
+        """Return ticket type ids from the user's paid or partially refunded orders."""
+        return self._purchased_product_ids[0]
+
+    @property
+    def purchased_addon_ids(self) -> frozenset[int]:
+        """Return add-on ids from the user's paid or partially refunded orders."""
+        return self._purchased_product_ids[1]
+
+    def matches_speaker_roles(self, *, is_presenter: bool, is_copresenter: bool) -> bool:
+        """Apply ``SpeakerCondition``'s presenter/co-presenter rules.
+
+        Pretalx has no explicit primary/co-presenter role: any linked speaker
+        qualifies when ``is_presenter`` is set, and when only
+        ``is_copresenter`` is set the speaker must share a talk with at
+        least one other speaker.
+        """
+        if not self.is_speaker:
+            return False
+        if is_presenter:
+            return True
+        return is_copresenter and self.is_copresenter
+
+    def in_any_group(self, group_ids: frozenset[int] | set[int]) -> bool:
+        """Return True if the user belongs to at least one of ``group_ids``."""
+        if not group_ids:
+            return False
+        return not self.group_ids.isdisjoint(group_ids)
+
+    def has_purchased_any(self, ticket_type_ids: frozenset[int] | set[int]) -> bool:
+        """Return True if the user has a paid order for any of ``ticket_type_ids``."""
+        if not ticket_type_ids:
+            return False
+        return not self.purchased_ticket_type_ids.isdisjoint(ticket_type_ids)
@@ -0,0 +1,244 @@
+"""Background expiry of pending orders whose inventory hold has lapsed.
+
+Expiring holds used to happen at the start of every checkout, so every buyer
+paid for a scan of the conference's pending orders and contended on the same
+rows.  The sweeper here does that work out of band, in bounded batches:
+
+* each batch locks up to ``batch_size`` stale orders with
+  ``SELECT ... FOR UPDATE SKIP LOCKED`` so concurrent sweepers (or a payment
+  touching one of the orders) never block each other,
+* the batch's held inventory is released and the orders are cancelled,
+* voucher usage for the whole batch is returned in one grouped ``UPDATE``,
+* the cancellation counts of the daily sales rollups are recounted.
+
+The batches cancel orders with ``QuerySet.update()``, which skips the model
+signals, so listeners that cache order data should invalidate on
+:data:`~django_program.registration.signals.holds_expired`.
+
+Run it from cron or a worker with ``manage.py expire_holds``, or start the
+optional in-process thread with :func:`start_hold_sweeper`.  Every sweep sends
+the :data:`~django_program.registration.signals.holds_expired` signal with a
+:class:`HoldSweepResult` for metrics.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING
+
+from django.db import close_old_connections, models, transaction
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from django_program.registration.models import Order, Voucher
+from django_program.registration.services.inventory import release_order_holds
+from django_program.registration.services.rollups import recount_cancellations
+from django_program.registration.signals import holds_expired
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class HoldSweepResult:
+    """Counts and timing for one hold-expiry sweep.
+
+    ``conference_ids`` holds the conferences that had orders expired.
+    """
+
+    orders_expired: int = 0
+    holds_released: int = 0
+    vouchers_released: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+    conference_ids: frozenset[int] = frozenset()
+
+
+def _release_voucher_usage(usage: Counter[tuple[int, str]]) -> int:
+    """Return voucher uses for expired orders in a single grouped ``UPDATE``.
+
+    Args:
+        usage: Number of expired orders per ``(conference_id, voucher_code)``.
+
+    Returns:
+        The number of voucher uses returned.
+    """
+    if not usage:
+        return 0
+    match = reduce(or_, (models.Q(conference_id=conf_id, code=code) for conf_id, code in usage))
+    released_uses = models.Case(
+        *(
+            models.When(conference_id=conf_id, code=code, then=models.Value(count))
+            for (conf_id, code), count in usage.items()
+        ),
+        default=models.Value(0),
+        output_field=models.IntegerField(),
+    )
+    Voucher.objects.filter(match, times_used__gt=0).update(
+        times_used=Greatest(models.F("times_used") - released_uses, models.Value(0)),
+    )
+    return sum(usage.values())
+
+
+def _expire_batch(stale: models.QuerySet[Order], batch_size: int) -> tuple[int, int, int, set[int]]:
+    """Lock, release and cancel one batch of stale orders.
+
+    Returns:
+        ``(orders_expired, holds_released, vouchers_released, conference_ids)``
+        for the batch.
+    """
+    with transaction.atomic():
+        rows = list(
+            stale.order_by("hold_expires_at", "pk")
+            .select_for_update(skip_locked=True)
+            .values_list("pk", "conference_id", "voucher_code", "updated_at")[:batch_size]
+        )
+        if not rows:
+            return 0, 0, 0, set()
+        order_ids = [pk for pk, _conference_id, _code, _updated_at in rows]
+        holds_released = release_order_holds(order_ids)
+        Order.objects.filter(pk__in=order_ids).update(
+            status=Order.Status.CANCELLED,
+            hold_expires_at=None,
+            inventory_bucket=Order.InventoryBucket.NONE,
+        )
+        vouchers_released = _release_voucher_usage(
+            Counter((conference_id, code) for _pk, conference_id, code, _updated_at in rows if code)
+        )
+        recount_cancellations(
+            (conference_id, timezone.localdate(updated_at)) for _pk, conference_id, _code, updated_at in rows
+        )
+    return len(rows), holds_released, vouchers_released, {conference_id for _pk, conference_id, _code, _at in rows}
+
+
+def expire_stale_holds(
+    *,
+    conference_id: int | None = None,
+    now: datetime | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> HoldSweepResult:
+    """Cancel pending orders whose hold has lapsed, in batches.
+
+    Each batch runs in its own transaction, so a long backlog is worked off
+    without holding locks for the whole sweep.
+
+    Args:
+        conference_id: Restrict the sweep to one conference.
+        now: The reference time (defaults to now).
+        batch_size: Orders per batch (defaults to ``hold_sweep_batch_size``).
+        max_batches: Stop after this many batches (default: until done).
+
+    Returns:
+        A ``HoldSweepResult`` with counts and timing for the sweep.
+    """
+    started = time.monotonic()
+    now = now or timezone.now()
+    batch_size = batch_size or get_config().hold_sweep_batch_size
+    stale = Order.objects.filter(
+        status=Order.Status.PENDING,
+        hold_expires_at__isnull=False,
+        hold_expires_at__lte=now,
+    )
+    if conference_id is not None:
+        stale = stale.filter(conference_id=conference_id)
+
+    orders_expired = holds_released = vouchers_released = batches = 0
+    conference_ids: set[int] = set()
+    while max_batches is None or batches < max_batches:
+        expired, released, vouchers, batch_conference_ids = _expire_batch(stale, batch_size)
+        if not expired:
+            break
+        conference_ids |= batch_conference_ids
+        batches += 1
+        orders_expired += expired
+        holds_released += released
+        vouchers_released += vouchers
+        if expired < batch_size:
+            break
+
+    result = HoldSweepResult(
+        orders_expired=orders_expired,
+        holds_released=holds_released,
+        vouchers_released=vouchers_released,
+        batches=batches,
+        duration_seconds=time.monotonic() - started,
+        conference_ids=frozenset(conference_ids),
+    )
+    if orders_expired:
+        logger.info(
+            "Expired %d stale pending orders in %d batches (%d holds, %d voucher uses released) in %.3fs",
+            orders_expired,
+            batches,
+            holds_released,
+            vouchers_released,
+            result.duration_seconds,
+        )
+    holds_expired.send(sender=Order, result=result, conference_id=conference_id)
+    return result
+
+
+_sweeper_lock = threading.Lock()
+_sweeper_thread: threading.Thread | None = None
+_sweeper_stop = threading.Event()
+
+
+def _run_sweeper(interval: int) -> None:
+    while not _sweeper_stop.wait(interval):
+        close_old_connections()
+        try:
+            expire_stale_holds()
+        except Exception:
+            logger.exception("Hold-expiry sweep failed")
+        finally:
+            close_old_connections()
+
+
+def start_hold_sweeper(interval_seconds: int | None = None) -> threading.Thread | None:
+    """Start the in-process hold-expiry sweeper thread, if configured.
+
+    Intended to be called once per process from the host project (for
+    example its ``AppConfig.ready()`` or a server ``post_fork`` hook).  Does
+    nothing when the interval is ``0`` or a sweeper is already running.
+
+    Args:
+        interval_seconds: Seconds between sweeps (defaults to
+            ``hold_sweep_interval_seconds``).
+
+    Returns:
+        The sweeper thread, or ``None`` when the sweeper is disabled.
+    """
+    global _sweeper_thread  # noqa: PLW0603
+
+    interval = get_config().hold_sweep_interval_seconds if interval_seconds is None else interval_seconds
+    if interval <= 0:
+        return None
+    with _sweeper_lock:
+        if _sweeper_thread is None or not _sweeper_thread.is_alive():
+            _sweeper_stop.clear()
+            _sweeper_thread = threading.Thread(
+                target=_run_sweeper,
+                args=(interval,),
+                name="django-program-hold-sweeper",
+                daemon=True,
+            )
+            _sweeper_thread.start()
+        return _sweeper_thread
+
+
+def stop_hold_sweeper(timeout: float | None = None) -> None:
+    """Signal the in-process sweeper to stop and wait for it to exit."""
+    global _sweeper_thread
+
+    with _sweeper_lock:
+        thread, _sweeper_thread = _sweeper_thread, None
+        _sweeper_stop.set()
+    if thread is not None:
+        thread.join(timeout)
@@ -0,0 +1,376 @@
+"""Maintenance of the denormalized inventory counters.
+
+Every order sits in exactly one inventory *bucket*:
+
+* ``sold`` -- paid or partially refunded
+* ``held`` -- pending with a hold that has not yet expired
+* ``""`` (released) -- cancelled, refunded, or pending without an active hold
+
+Each :class:`~django_program.registration.inventory.InventoryCounter` holds
+the line item quantities per bucket for one ticket type or add-on, so
+``sold + held`` is the number of units unavailable for sale and
+``sold + held + released`` is every unit ever ordered.
+
+The bucket an order's line items were counted under is stored on the order
+itself (``Order.inventory_bucket``).  Moving an order between buckets locks
+the order row, rewrites the bucket and shifts the order's quantities between
+counters with ``F()`` updates, all inside one transaction -- so concurrent
+status changes cannot double count and the counters stay consistent with the
+orders that produced them.
+
+Holds expire by the passage of time rather than by a write, so expired holds
+stay in ``held`` until the hold-expiry sweeper (or :func:`release_expired_holds`)
+runs.  Cart and checkout stock checks release them on demand whenever stock
+looks insufficient, so a stale hold never blocks a sale.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from django_program.registration.inventory import InventoryCounter
+from django_program.registration.models import Order, OrderLineItem, TicketType
+from django_program.registration.services.rollups import record_order_sales, record_sold_line_items
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+_PRODUCT_FIELDS = ("ticket_type_id", "addon_id")
+_BUCKET_FIELDS = {
+    Order.InventoryBucket.SOLD: "sold",
+    Order.InventoryBucket.HELD: "held",
+    Order.InventoryBucket.NONE: "released",
+}
+
+# A product is identified by the counter column that points at it and its pk,
+# e.g. ``("ticket_type_id", 7)``.
+ProductKey = tuple[str, int]
+
+
+def bucket_for(status: str, hold_expires_at: datetime | None, now: datetime | None = None) -> str:
+    """Return the inventory bucket for an order in the given state.
+
+    Args:
+        status: The order status.
+        hold_expires_at: The order's hold expiry, if any.
+        now: The reference time (defaults to the current time).
+
+    Returns:
+        An ``Order.InventoryBucket`` value.
+    """
+    if status in (Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED):
+        return Order.InventoryBucket.SOLD
+    if status == Order.Status.PENDING and hold_expires_at is not None and hold_expires_at > (now or timezone.now()):
+        return Order.InventoryBucket.HELD
+    return Order.InventoryBucket.NONE
+
+
+def bucket_expression(now: datetime, *, prefix: str = "") -> models.Case:
+    """Return a database expression computing :func:`bucket_for` per order row.
+
+    Args:
+        now: The reference time for hold expiry.
+        prefix: Lookup path to the order, e.g. ``"order__"`` from a line item.
+    """
+    return models.Case(
+        models.When(
+            **{f"{prefix}status__in": [Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED]},
+            then=models.Value(Order.InventoryBucket.SOLD),
+        ),
+        models.When(
+            **{f"{prefix}status": Order.Status.PENDING, f"{prefix}hold_expires_at__gt": now},
+            then=models.Value(Order.InventoryBucket.HELD),
+        ),
+        default=models.Value(Order.InventoryBucket.NONE),
+        output_field=models.CharField(),
+    )
+
+
+def _product_key(ticket_type_id: int | None, addon_id: int | None) -> ProductKey | None:
+    if ticket_type_id is not None:
+        return ("ticket_type_id", ticket_type_id)
+    if addon_id is not None:
+        return ("addon_id", addon_id)
+    return None
+
+
+def _order_quantities(order_ids: Iterable[int]) -> dict[ProductKey, int]:
+    """Sum line item quantities per product for the given orders."""
+    rows = (
+        OrderLineItem.objects.filter(order_id__in=list(order_ids))
+        .values(*_PRODUCT_FIELDS)
+        .annotate(total=models.Sum("quantity"))
+    )
+    totals: dict[ProductKey, int] = {}
+    for row in rows:
+        key = _product_key(row["ticket_type_id"], row["addon_id"])
+        if key is not None:
+            totals[key] = row["total"]
+    return totals
+
+
+def _apply_deltas(deltas: dict[ProductKey, dict[str, int]]) -> None:
+    """Add per-field deltas to each product's counter row, creating rows on demand."""
+    for (column, product_id), fields in deltas.items():
+        changes = {name: models.F(name) + delta for name, delta in fields.items() if delta}
+        if not changes:
+            continue
+        if not InventoryCounter.objects.filter(**{column: product_id}).update(**changes):
+            InventoryCounter.objects.get_or_create(**{column: product_id})
+            InventoryCounter.objects.filter(**{column: product_id}).update(**changes)
+
+
+def _move_quantities(order_ids: Iterable[int], source: str, target: str) -> None:
+    """Shift the quantities of ``order_ids`` from one bucket's counter to another's."""
+    deltas: dict[ProductKey, dict[str, int]] = defaultdict(dict)
+    for key, quantity in _order_quantities(order_ids).items():
+        deltas[key][_BUCKET_FIELDS[source]] = -quantity
+        deltas[key][_BUCKET_FIELDS[target]] = quantity
+    _apply_deltas(deltas)
+
+
+def sync_order_inventory(order: Order, *, now: datetime | None = None) -> str:
+    """Move an order's line item quantities to the bucket matching its state.
+
+    Called whenever an order's status or hold changes.  The order row is
+    locked while its stored bucket is compared and rewritten, so concurrent
+    transitions of the same order serialize and each quantity moves once.
+    Orders entering or leaving ``sold`` are added to or removed from the
+    daily sales rollups in the same transaction.
+
+    Args:
+        order: The order whose status or hold changed.
+        now: The reference time for hold expiry (defaults to now).
+
+    Returns:
+        The order's bucket after the sync.
+    """
+    target = bucket_for(order.status, getattr(order, "hold_expires_at", None), now)
+    with transaction.atomic():
+        current = (
+            Order.objects.select_for_update().filter(pk=order.pk).values_list("inventory_bucket", flat=True).first()
+        )
+        if current is not None and current != target:
+            Order.objects.filter(pk=order.pk).update(inventory_bucket=target)
+            _move_quantities([order.pk], current, target)
+            if Order.InventoryBucket.SOLD in (current, target):
+                record_order_sales(order, sign=1 if target == Order.InventoryBucket.SOLD else -1)
+    order.inventory_bucket = target
+    return target
+
+
+def record_line_items(items: Iterable[OrderLineItem], *, sign: int = 1) -> None:
+    """Count newly created (``sign=1``) or deleted (``sign=-1``) line items.
+
+    Quantities are added to the counter field of the bucket each item's
+    order is currently in; items on sold orders also update the daily sales
+    rollups.
+
+    Args:
+        items: The line items that were created or deleted.
+        sign: ``1`` for created items, ``-1`` for deleted items.
+    """
+    items = [item for item in items if _product_key(item.ticket_type_id, item.addon_id) is not None]
+    if not items:
+        return
+    buckets = dict(Order.objects.filter(pk__in={item.order_id for item in items}).values_list("pk", "inventory_bucket"))
+    deltas: dict[ProductKey, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for item in items:
+        bucket = buckets.get(item.order_id)
+        if bucket is None:
+            continue
+        key = _product_key(item.ticket_type_id, item.addon_id)
+        deltas[key][_BUCKET_FIELDS[bucket]] += sign * item.quantity
+    _apply_deltas(deltas)
+    record_sold_line_items(
+        [item for item in items if buckets.get(item.order_id) == Order.InventoryBucket.SOLD],
+        sign=sign,
+    )
+
+
+def release_order_holds(order_ids: Iterable[int]) -> int:
+    """Release the held quantities of the given orders.
+
+    Only orders still in the ``held`` bucket are moved; the caller is
+    expected to hold row locks on them (see :func:`release_expired_holds`
+    and the hold-expiry sweeper).
+
+    Args:
+        order_ids: Primary keys of the orders to release.
+
+    Returns:
+        The number of orders whose quantities were released.
+    """
+    held_ids = list(
+        Order.objects.filter(pk__in=list(order_ids), inventory_bucket=Order.InventoryBucket.HELD).values_list(
+            "pk", flat=True
+        )
+    )
+    if held_ids:
+        Order.objects.filter(pk__in=held_ids).update(inventory_bucket=Order.InventoryBucket.NONE)
+        _move_quantities(held_ids, Order.InventoryBucket.HELD, Order.InventoryBucket.NONE)
+    return len(held_ids)
+
+
+def release_expired_holds(*, conference_id: int | None = None, now: datetime | None = None) -> int:
+    """Release the held quantities of pending orders whose hold has lapsed.
+
+    The orders themselves stay pending (payment may still arrive, which moves
+    them straight to ``sold``); cancelling them is left to the hold-expiry
+    sweeper.  Rows another transaction has locked are skipped.
+
+    Args:
+        conference_id: Restrict the release to one conference.
+        now: The reference time (defaults to now).
+
+    Returns:
+        The number of orders released.
+    """
+    now = now or timezone.now()
+    expired = Order.objects.filter(inventory_bucket=Order.InventoryBucket.HELD, hold_expires_at__lte=now)
+    if conference_id is not None:
+        expired = expired.filter(conference_id=conference_id)
+    with transaction.atomic():
+        released = release_order_holds(expired.select_for_update(skip_locked=True).values_list("pk", flat=True))
+    if released:
+        logger.debug("Released inventory holds for %d expired orders", released)
+    return released
+
+
+def ticket_type_committed(ticket_type_id: int) -> int:
+    """Return the sold plus held units of a ticket type (one single-row read)."""
+    counts = InventoryCounter.objects.filter(ticket_type_id=ticket_type_id).values_list("sold", "held").first()
+    return sum(counts) if counts else 0
+
+
+def addon_counts(addon_id: int) -> tuple[int, int]:
+    """Return ``(sold, held)`` for an add-on (one single-row read)."""
+    return InventoryCounter.objects.filter(addon_id=addon_id).values_list("sold", "held").first() or (0, 0)
+
+
+def ticket_type_remaining(ticket_type: TicketType, wanted: int) -> int | None:
+    """Return a ticket type's remaining stock, releasing lapsed holds if it looks short.
+
+    Holds that lapsed since the last sweep still count as ``held``.  Only
+    when they would turn a request away are the conference's expired holds
+    released and the counter read again.
+
+    Args:
+        ticket_type: The ticket type being purchased.
+        wanted: The quantity the caller needs.
+
+    Returns:
+        The remaining count, or ``None`` for unlimited ticket types.
+    """
+    remaining = ticket_type.remaining_quantity
+    if remaining is not None and remaining < wanted and release_expired_holds(conference_id=ticket_type.conference_id):
+        remaining = ticket_type.remaining_quantity
+    return remaining
+
+
+@dataclass(frozen=True, slots=True)
+class CounterDrift:
+    """A counter row whose stored values differ from the order history."""
+
+    column: str
+    product_id: int
+    expected: tuple[int, int, int]
+    actual: tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class ReconcileResult:
+    """Outcome of :func:`reconcile_inventory`."""
+
+    orders_rebucketed: int
+    drift: tuple[CounterDrift, ...]
+
+
+def _rebucket_orders(orders: models.QuerySet[Order], now: datetime, *, dry_run: bool) -> int:
+    """Rewrite stored buckets that disagree with each order's status and hold."""
+    misplaced = orders.annotate(expected_bucket=bucket_expression(now)).exclude(
+        inventory_bucket=models.F("expected_bucket")
+    )
+    by_bucket: dict[str, list[int]] = defaultdict(list)
+    for pk, bucket in misplaced.select_for_update().values_list("pk", "expected_bucket"):
+        by_bucket[bucket].append(pk)
+    if not dry_run:
+        for bucket, pks in by_bucket.items():
+            Order.objects.filter(pk__in=pks).update(inventory_bucket=bucket)
+    return sum(len(pks) for pks in by_bucket.values())
+
+
+def _expected_counts(orders: models.QuerySet[Order], now: datetime) -> dict[ProductKey, tuple[int, int, int]]:
+    """Sum ``(sold, held, released)`` per product from the line items of ``orders``."""
+    expected: dict[ProductKey, dict[str, int]] = defaultdict(lambda: dict.fromkeys(_BUCKET_FIELDS.values(), 0))
+    rows = (
+        OrderLineItem.objects.filter(order__in=orders)
+        .annotate(bucket=bucket_expression(now, prefix="order__"))
+        .values(*_PRODUCT_FIELDS, "bucket")
+        .annotate(total=models.Sum("quantity"))
+    )
+    for row in rows:
+        key = _product_key(row["ticket_type_id"], row["addon_id"])
+        if key is not None:
+            expected[key][_BUCKET_FIELDS[row["bucket"]]] += row["total"]
+    return {key: (fields["sold"], fields["held"], fields["released"]) for key, fields in expected.items()}
+
+
+def reconcile_inventory(
+    *,
+    conference_id: int | None = None,
+    dry_run: bool = False,
+    now: datetime | None = None,
+) -> ReconcileResult:
+    """Recompute every order bucket and counter from the order history.
+
+    Orders whose stored bucket disagrees with their status and hold (for
+    example expired holds nobody has released yet, or rows changed with
+    ``QuerySet.update()``) are re-bucketed, then each product's counter is
+    rebuilt from the line item quantities per bucket.
+
+    Args:
+        conference_id: Restrict the reconciliation to one conference.
+        dry_run: Report drift without writing anything.
+        now: The reference time for hold expiry (defaults to now).
+
+    Returns:
+        A ``ReconcileResult`` describing what was (or would be) corrected.
+    """
+    now = now or timezone.now()
+    orders = Order.objects.all()
+    counters = InventoryCounter.objects.all()
+    if conference_id is not None:
+        orders = orders.filter(conference_id=conference_id)
+        counters = counters.filter(
+            models.Q(ticket_type__conference_id=conference_id) | models.Q(addon__conference_id=conference_id)
+        )
+
+    with transaction.atomic():
+        rebucketed = _rebucket_orders(orders, now, dry_run=dry_run)
+        expected = _expected_counts(orders, now)
+        actual = {
+            _product_key(counter.ticket_type_id, counter.addon_id): (counter.sold, counter.held, counter.released)
+            for counter in counters.select_for_update()
+        }
+
+        drift: list[CounterDrift] = []
+        for key in sorted(expected.keys() | actual.keys()):
+            want = expected.get(key, (0, 0, 0))
+            have = actual.get(key, (0, 0, 0))
+            if want == have:
+                continue
+            drift.append(CounterDrift(column=key[0], product_id=key[1], expected=want, actual=have))
+            if not dry_run:
+                InventoryCounter.objects.update_or_create(
+                    **{key[0]: key[1]},
+                    defaults={"sold": want[0], "held": want[1], "released": want[2]},
+                )
+    return ReconcileResult(orders_rebucketed=rebucketed, drift=tuple(drift))
@@ -0,0 +1,91 @@
+"""Lightweight in-process latency histograms for registration hot paths.
+
+The package does not depend on a metrics backend, so timings are recorded
+into fixed-bucket histograms kept per process.  Exporters (Prometheus,
+StatsD, a management page) can read :meth:`LatencyHistogram.snapshot`, or
+subscribe to the signal sent by the instrumented code path, e.g.
+:data:`~django_program.registration.signals.checkout_timed`.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Upper bounds in seconds; observations above the last bound land in +Inf.
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseStats:
+    """Cumulative statistics for one phase of a histogram.
+
+    ``buckets`` holds cumulative counts aligned with the histogram's bucket
+    bounds, followed by the total count for the ``+Inf`` bucket.
+    """
+
+    count: int
+    total_seconds: float
+    buckets: tuple[int, ...]
+
+
+class LatencyHistogram:
+    """A thread-safe latency histogram with one series per phase."""
+
+    def __init__(self, name: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Create an empty histogram.
+
+        Args:
+            name: A name for the histogram, used by exporters.
+            buckets: Ascending bucket upper bounds in seconds.
+        """
+        self.name = name
+        self.bounds = buckets
+        self._lock = threading.Lock()
+        self._series: dict[str, list[float]] = {}
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Record one observation for ``phase``."""
+        with self._lock:
+            series = self._series.setdefault(phase, [0.0] * (len(self.bounds) + 2))
+            for index, bound in enumerate(self.bounds):
+                if seconds <= bound:
+                    series[index] += 1
+                    break
+            else:
+                series[len(self.bounds)] += 1
+            series[-1] += seconds
+
+    @contextmanager
+    def time(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block and record it under ``phase``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started)
+
+    def snapshot(self) -> dict[str, PhaseStats]:
+        """Return cumulative statistics for every recorded phase."""
+        with self._lock:
+            stats: dict[str, PhaseStats] = {}
+            for phase, series in self._series.items():
+                cumulative: list[int] = []
+                running = 0
+                for count in series[:-1]:
+                    running += int(count)
+                    cumulative.append(running)
+                stats[phase] = PhaseStats(count=running, total_seconds=series[-1], buckets=tuple(cumulative))
+            return stats
+
+    def reset(self) -> None:
+        """Discard all observations."""
+        with self._lock:
+            self._series.clear()
+
+
+checkout_latency = LatencyHistogram("registration_checkout_seconds")
@@ -0,0 +1,251 @@
+"""Maintenance of the materialized daily sales rollups.
+
+:class:`~django_program.registration.rollups.DailySalesRollup` rows are kept
+in step with the order history incrementally:
+
+* when an order enters or leaves the ``sold`` inventory bucket (see
+  :func:`~django_program.registration.services.inventory.sync_order_inventory`)
+  its total and line items are added to or removed from the rollups of the
+  day it was created, inside the same transaction that moves the bucket,
+* line items created or deleted on an already sold order adjust their ticket
+  type's row,
+* attendee creation and deletion adjust the day's ``registrations``,
+* cancellations are recounted for the day the order was cancelled.
+
+Changes that bypass model signals (``QuerySet.update()``, raw SQL, fixture
+loads) are not seen; :func:`rebuild_rollups` recomputes every row from order
+history and marks the conference's rollups as ready to be read by the reports.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.registration.attendee import Attendee
+from django_program.registration.models import Order, OrderLineItem
+from django_program.registration.rollups import DailySalesRollup, SalesRollupState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+_ZERO = Decimal("0.00")
+_PAID_STATUSES = (Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED)
+
+# A rollup row is identified by ``(conference_id, date, ticket_type_id)``;
+# ``ticket_type_id`` is ``None`` for the day's totals row.
+RollupKey = tuple[int, date, int | None]
+
+
+def _local_date(value: datetime) -> date:
+    """Return the date of ``value`` in the current time zone, as ``TruncDate`` does."""
+    return timezone.localdate(value) if timezone.is_aware(value) else value.date()
+
+
+def _apply_deltas(deltas: dict[RollupKey, dict[str, int | Decimal]]) -> None:
+    """Add per-field deltas to each rollup row, creating rows on demand."""
+    for (conference_id, day, ticket_type_id), fields in deltas.items():
+        changes = {name: models.F(name) + delta for name, delta in fields.items() if delta}
+        if not changes:
+            continue
+        lookup = {"conference_id": conference_id, "date": day, "ticket_type_id": ticket_type_id}
+        if not DailySalesRollup.objects.filter(**lookup).update(**changes):
+            DailySalesRollup.objects.get_or_create(**lookup)
+            DailySalesRollup.objects.filter(**lookup).update(**changes)
+
+
+def _add_line_items(
+    deltas: dict[RollupKey, dict[str, int | Decimal]],
+    conference_id: int,
+    day: date,
+    rows: Iterable[tuple[int, int, Decimal]],
+    sign: int,
+) -> None:
+    """Accumulate ``(ticket_type_id, quantity, line_total)`` rows into ``deltas``."""
+    for ticket_type_id, quantity, line_total in rows:
+        fields = deltas[(conference_id, day, ticket_type_id)]
+        fields["quantity"] = fields.get("quantity", 0) + sign * quantity
+        fields["revenue"] = fields.get("revenue", _ZERO) + sign * line_total
+
+
+def record_order_sales(order: Order, *, sign: int = 1, include_line_items: bool = True) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) a sold order from the rollups.
+
+    The order counts towards the day it was created, matching the live
+    sales reports.
+
+    Args:
+        order: The order entering or leaving the ``sold`` bucket.
+        sign: ``1`` when the order became sold, ``-1`` when it stopped being sold.
+        include_line_items: Also adjust the order's ticket type rows.  New
+            orders pass ``False`` because their line items are recorded as
+            they are created.
+    """
+    day = _local_date(order.created_at)
+    deltas: dict[RollupKey, dict[str, int | Decimal]] = defaultdict(dict)
+    deltas[(order.conference_id, day, None)] = {"orders": sign, "revenue": sign * order.total}
+    if include_line_items:
+        rows = (
+            OrderLineItem.objects.filter(order_id=order.pk, ticket_type__isnull=False)
+            .values("ticket_type_id")
+            .annotate(quantity=models.Sum("quantity"), line_total=models.Sum("line_total"))
+            .values_list("ticket_type_id", "quantity", "line_total")
+        )
+        _add_line_items(deltas, order.conference_id, day, rows, sign)
+    _apply_deltas(deltas)
+
+
+def record_sold_line_items(items: Iterable[OrderLineItem], *, sign: int = 1) -> None:
+    """Count line items created on (or deleted from) orders that are already sold.
+
+    Args:
+        items: Line items whose order is in the ``sold`` bucket.
+        sign: ``1`` for created items, ``-1`` for deleted items.
+    """
+    items = [item for item in items if item.ticket_type_id is not None]
+    if not items:
+        return
+    orders = {
+        pk: (conference_id, _local_date(created_at))
+        for pk, conference_id, created_at in Order.objects.filter(pk__in={item.order_id for item in items}).values_list(
+            "pk", "conference_id", "created_at"
+        )
+    }
+    deltas: dict[RollupKey, dict[str, int | Decimal]] = defaultdict(dict)
+    for item in items:
+        if item.order_id not in orders:
+            continue
+        conference_id, day = orders[item.order_id]
+        _add_line_items(deltas, conference_id, day, [(item.ticket_type_id, item.quantity, item.line_total)], sign)
+    _apply_deltas(deltas)
+
+
+def record_registration(attendee: Attendee, *, sign: int = 1) -> None:
+    """Count a created (``sign=1``) or deleted (``sign=-1``) attendee registration.
+
+    Args:
+        attendee: The attendee that was created or deleted.
+        sign: ``1`` for created attendees, ``-1`` for deleted ones.
+    """
+    key = (attendee.conference_id, _local_date(attendee.created_at), None)
+    _apply_deltas({key: {"registrations": sign}})
+
+
+def recount_cancellations(days: Iterable[tuple[int, date]]) -> None:
+    """Recount the cancelled orders of each ``(conference_id, date)`` pair.
+
+    Cancellations are dated by the order's ``updated_at``, as in the live
+    registration flow report, so the day is recounted rather than adjusted.
+
+    Args:
+        days: The ``(conference_id, date)`` pairs whose cancellations changed.
+    """
+    for conference_id, day in set(days):
+        count = Order.objects.filter(
+            conference_id=conference_id,
+            status=Order.Status.CANCELLED,
+            updated_at__date=day,
+        ).count()
+        DailySalesRollup.objects.update_or_create(
+            conference_id=conference_id,
+            date=day,
+            ticket_type=None,
+            defaults={"cancellations": count},
+        )
+
+
+def rollups_ready(conference_id: int) -> bool:
+    """Return whether the conference's rollups have been built from its full history."""
+    return SalesRollupState.objects.filter(conference_id=conference_id).exists()
+
+
+@dataclass(frozen=True, slots=True)
+class RebuildResult:
+    """Outcome of :func:`rebuild_rollups`."""
+
+    conferences: int
+    rows: int
+
+
+def _day_totals(conference_ids: list[int]) -> dict[RollupKey, dict[str, int | Decimal]]:
+    """Aggregate every rollup field per conference, day and ticket type from history."""
+    rows: dict[RollupKey, dict[str, int | Decimal]] = defaultdict(dict)
+    paid = Order.objects.filter(conference_id__in=conference_ids, status__in=_PAID_STATUSES)
+
+    for row in (
+        paid.annotate(day=TruncDate("created_at"))
+        .values("conference_id", "day")
+        .annotate(orders=models.Count("id"), revenue=Coalesce(models.Sum("total"), models.Value(_ZERO)))
+    ):
+        rows[(row["conference_id"], row["day"], None)].update(orders=row["orders"], revenue=row["revenue"])
+
+    for row in (
+        OrderLineItem.objects.filter(order__in=paid, ticket_type__isnull=False)
+        .annotate(day=TruncDate("order__created_at"))
+        .values("order__conference_id", "day", "ticket_type_id")
+        .annotate(quantity=models.Sum("quantity"), revenue=Coalesce(models.Sum("line_total"), models.Value(_ZERO)))
+    ):
+        key = (row["order__conference_id"], row["day"], row["ticket_type_id"])
+        rows[key].update(quantity=row["quantity"], revenue=row["revenue"])
+
+    for row in (
+        Attendee.objects.filter(conference_id__in=conference_ids)
+        .annotate(day=TruncDate("created_at"))
+        .values("conference_id", "day")
+        .annotate(registrations=models.Count("id"))
+    ):
+        rows[(row["conference_id"], row["day"], None)]["registrations"] = row["registrations"]
+
+    for row in (
+        Order.objects.filter(conference_id__in=conference_ids, status=Order.Status.CANCELLED)
+        .annotate(day=TruncDate("updated_at"))
+        .values("conference_id", "day")
+        .annotate(cancellations=models.Count("id"))
+    ):
+        rows[(row["conference_id"], row["day"], None)]["cancellations"] = row["cancellations"]
+
+    return rows
+
+
+def rebuild_rollups(*, conference_id: int | None = None, now: datetime | None = None) -> RebuildResult:
+    """Recompute the daily sales rollups from order and attendee history.
+
+    The conference's rollup rows are replaced in one transaction and its
+    :class:`~django_program.registration.rollups.SalesRollupState` is stamped,
+    after which the report functions read from the rollups.
+
+    Args:
+        conference_id: Restrict the rebuild to one conference.
+        now: The timestamp recorded as ``rebuilt_at`` (defaults to now).
+
+    Returns:
+        A ``RebuildResult`` with the number of conferences and rows written.
+    """
+    now = now or timezone.now()
+    conferences = Conference.objects.all()
+    if conference_id is not None:
+        conferences = conferences.filter(pk=conference_id)
+
+    with transaction.atomic():
+        conference_ids = list(conferences.select_for_update().values_list("pk", flat=True))
+        totals = _day_totals(conference_ids)
+        DailySalesRollup.objects.filter(conference_id__in=conference_ids).delete()
+        DailySalesRollup.objects.bulk_create(
+            DailySalesRollup(conference_id=conf_id, date=day, ticket_type_id=ticket_type_id, **fields)
+            for (conf_id, day, ticket_type_id), fields in totals.items()
+        )
+        for conf_id in conference_ids:
+            SalesRollupState.objects.update_or_create(conference_id=conf_id, defaults={"rebuilt_at": now})
+
+    logger.info("Rebuilt %d daily sales rollup rows for %d conferences", len(totals), len(conference_ids))
+    return RebuildResult(conferences=len(conference_ids), rows=len(totals))
@@ -1,7 +1,10 @@
 """Voucher bulk generation service.
 
 Provides functions for generating batches of unique, cryptographically
-random voucher codes within a single database transaction.
+random voucher codes within a single database transaction.  Callers that
+need more than 500 codes, such as sponsor bulk purchases, call
+:func:`generate_voucher_codes` once per chunk so that no single transaction
+stays open for the whole run.
 """
 
 import secrets
@@ -9,7 +12,7 @@ import string
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
 from django_program.registration.models import Voucher
 
@@ -25,6 +28,13 @@ if TYPE_CHECKING:
 _CODE_ALPHABET = string.ascii_uppercase + string.digits
 _CODE_LENGTH = 8
 _MAX_COUNT = 500
+_BATCH_SIZE = 500
+_MAX_ROUNDS = 10
+
+# ``bytes.translate`` tables mapping random bytes onto the code alphabet.  The
+# top ``256 % 36`` byte values are dropped so every character is equally likely.
+_BYTE_TO_CHAR = bytes(ord(_CODE_ALPHABET[b % len(_CODE_ALPHABET)]) for b in range(256))
+_BIASED_BYTES = bytes(range(256 - 256 % len(_CODE_ALPHABET), 256))
 
 
 @dataclass
@@ -61,29 +71,83 @@ class VoucherBulkConfig:
     applicable_addons: QuerySet[AddOn] | None = None
 
 
-def _generate_unique_code(prefix: str, existing_codes: set[str]) -> str:
-    """Generate a single voucher code that does not collide with existing ones.
+def _random_codes(prefix: str, count: int) -> set[str]:
+    """Generate up to ``count`` distinct random voucher codes.
 
     Produces codes in the format ``{prefix}{8_random_chars}`` where the random
     portion uses uppercase alphanumeric characters (A-Z, 0-9) for readability.
-    Retries up to 100 times if a collision is detected.
+    All random characters for the batch come from one ``secrets.token_bytes``
+    call mapped onto the alphabet with ``bytes.translate``; bytes that would
+    bias the distribution are dropped and topped up.  Duplicate draws collapse,
+    so the result may hold fewer than ``count`` codes.
 
     Args:
         prefix: The fixed prefix prepended to each code.
-        existing_codes: Set of codes that already exist for uniqueness checks.
+        count: Number of codes to draw.
+
+    Returns:
+        A set of candidate codes, not yet checked against the database.
+    """
+    needed = count * _CODE_LENGTH
+    chars = b""
+    while len(chars) < needed:
+        chars += secrets.token_bytes(needed - len(chars) + _CODE_LENGTH).translate(_BYTE_TO_CHAR, _BIASED_BYTES)
+    text = chars[:needed].decode("ascii")
+    return {f"{prefix}{text[i : i + _CODE_LENGTH]}" for i in range(0, needed, _CODE_LENGTH)}
+
+
+def _insert_vouchers(config: VoucherBulkConfig) -> list[str]:
+    """Insert ``config.count`` vouchers with fresh random codes.
+
+    Each round draws the missing number of codes, drops the ones that already
+    exist with a single ``code__in`` query, and inserts the rest with a
+    batched ``bulk_create`` in a savepoint.  Codes lost to existing vouchers
+    or duplicate draws are made up in the next round; if a concurrent writer
+    claims a candidate between the check and the insert, the savepoint is
+    rolled back and the round is drawn again.
+
+    Must be called inside a transaction.
 
     Returns:
-        A unique voucher code string.
+        The codes of the inserted vouchers.
 
     Raises:
-        RuntimeError: If a unique code cannot be generated after 100 attempts.
+        RuntimeError: If the vouchers cannot be inserted within ``_MAX_ROUNDS`` rounds.
     """
-    for _ in range(100):
-        random_part = "".join(secrets.choice(_CODE_ALPHABET) for _ in range(_CODE_LENGTH))
-        code = f"{prefix}{random_part}"
-        if code not in existing_codes:
-            return code
-    msg = f"Failed to generate a unique voucher code with prefix '{prefix}' after 100 attempts"
+    codes: list[str] = []
+    for _ in range(_MAX_ROUNDS):
+        missing = config.count - len(codes)
+        if not missing:
+            return codes
+        candidates = _random_codes(config.prefix, missing)
+        candidates -= set(
+            Voucher.objects.filter(conference=config.conference, code__in=candidates).values_list("code", flat=True)
+        )
+        fresh = sorted(candidates)
+        try:
+            with transaction.atomic():
+                Voucher.objects.bulk_create(
+                    [
+                        Voucher(
+                            conference=config.conference,
+                            code=code,
+                            voucher_type=config.voucher_type,
+                            discount_value=config.discount_value,
+                            max_uses=config.max_uses,
+                            valid_from=config.valid_from,
+                            valid_until=config.valid_until,
+                            unlocks_hidden_tickets=config.unlocks_hidden_tickets,
+                        )
+                        for code in fresh
+                    ],
+                    batch_size=_BATCH_SIZE,
+                )
+        except IntegrityError:
+            continue
+        codes.extend(fresh)
+    if len(codes) == config.count:
+        return codes
+    msg = f"Failed to generate {config.count} unique voucher codes with prefix '{config.prefix}'"
     raise RuntimeError(msg)
 
 
@@ -92,9 +156,11 @@ def generate_voucher_codes(config: VoucherBulkConfig) -> list[Voucher]:
 
     Creates ``config.count`` vouchers with cryptographically random codes,
     all sharing the same configuration (type, discount, validity window, etc.).
-    The vouchers are inserted in a single ``bulk_create`` call wrapped in a
-    transaction for atomicity. M2M relations are set via a single
-    ``bulk_create`` on the through tables to avoid N+1 queries.
+    Candidate codes are checked against the database in one ``code__in``
+    query per round rather than by loading every existing code, and the
+    vouchers are inserted with batched ``bulk_create`` calls inside a single
+    transaction. M2M relations are set via batched ``bulk_create`` calls on
+    the through tables to avoid N+1 queries.
 
     Args:
         config: Bulk generation configuration specifying the conference, prefix,
@@ -105,58 +171,38 @@ def generate_voucher_codes(config: VoucherBulkConfig) -> list[Voucher]:
 
     Raises:
         ValueError: If ``config.count`` is less than 1 or greater than 500.
-        RuntimeError: If unique code generation fails after retries.
-        IntegrityError: If a code collision occurs at the database level despite
-            the in-memory uniqueness check (race condition safeguard).
+        RuntimeError: If unique codes cannot be generated after retries.
     """
     if config.count < 1 or config.count > _MAX_COUNT:
         msg = f"count must be between 1 and {_MAX_COUNT}, got {config.count}"
         raise ValueError(msg)
 
-    qs = Voucher.objects.filter(conference=config.conference)
-    if config.prefix:
-        qs = qs.filter(code__startswith=config.prefix)
-    existing_codes: set[str] = set(qs.values_list("code", flat=True))
-
-    vouchers_to_create: list[Voucher] = []
-    for _ in range(config.count):
-        code = _generate_unique_code(config.prefix, existing_codes)
-        existing_codes.add(code)
-        vouchers_to_create.append(
-            Voucher(
-                conference=config.conference,
-                code=code,
-                voucher_type=config.voucher_type,
-                discount_value=config.discount_value,
-                max_uses=config.max_uses,
-                valid_from=config.valid_from,
-                valid_until=config.valid_until,
-                unlocks_hidden_tickets=config.unlocks_hidden_tickets,
-            )
-        )
+    ticket_type_ids: list[int] = []
+    if config.applicable_ticket_types is not None:
+        ticket_type_ids = list(config.applicable_ticket_types.values_list("pk", flat=True))
+    addon_ids: list[int] = []
+    if config.applicable_addons is not None:
+        addon_ids = list(config.applicable_addons.values_list("pk", flat=True))
 
     with transaction.atomic():
-        created = Voucher.objects.bulk_create(vouchers_to_create)
+        codes = _insert_vouchers(config)
         # Re-fetch to guarantee PKs are populated on all database backends
-        created_codes = [v.code for v in created]
-        created = list(Voucher.objects.filter(conference=config.conference, code__in=created_codes))
+        created = list(Voucher.objects.filter(conference=config.conference, code__in=codes))
 
-        if config.applicable_ticket_types is not None and config.applicable_ticket_types.exists():
-            ticket_type_ids = list(config.applicable_ticket_types.values_list("pk", flat=True))
+        if ticket_type_ids:
             ThroughModel = Voucher.applicable_ticket_types.through  # noqa: N806
             through_objects = [
                 ThroughModel(voucher_id=voucher.pk, tickettype_id=tt_id)
                 for voucher in created
                 for tt_id in ticket_type_ids
             ]
-            ThroughModel.objects.bulk_create(through_objects)
+            ThroughModel.objects.bulk_create(through_objects, batch_size=_BATCH_SIZE)
 
-        if config.applicable_addons is not None and config.applicable_addons.exists():
-            addon_ids = list(config.applicable_addons.values_list("pk", flat=True))
+        if addon_ids:
             ThroughModel = Voucher.applicable_addons.through  # noqa: N806
             through_objects = [
                 ThroughModel(voucher_id=voucher.pk, addon_id=addon_id) for voucher in created for addon_id in addon_ids
             ]
-            ThroughModel.objects.bulk_create(through_objects)
+            ThroughModel.objects.bulk_create(through_objects, batch_size=_BATCH_SIZE)
 
     return created
@@ -0,0 +1,224 @@
+"""Waiting-room admission queue for high-demand ticket launches.
+
+When a limited ticket type opens, every buyer reaches the cart and checkout
+at once and they serialize on row locks for the cart, the stock counters and
+the vouchers.  The waiting room sits in front of those views and admits at
+most ``DJANGO_PROGRAM["waiting_room"]["concurrency"]`` buyers per ticket type
+at a time.  Everyone else is handed a queue position and an ETA, and polls
+until a slot frees up.
+
+All state lives in the Django cache (the ``cache_alias`` cache), so every
+web process shares one queue per ticket type.  A shared backend such as
+Redis or Memcached is required in production; the local-memory cache works
+for tests and single-process development.  For a ticket type the cache
+holds:
+
+* ``tail`` -- the last queue number handed out (``incr``),
+* ``head`` -- every number at or below it has been admitted or abandoned,
+* ``alive:<n>`` -- a heartbeat refreshed each time waiter ``n`` polls,
+* ``slot:<i>`` -- one key per admission slot, claimed with ``cache.add`` and
+  expiring after ``admission_seconds`` so an abandoned checkout frees its
+  slot on its own,
+* ``turn`` -- a moving average of how long an admitted buyer holds a slot,
+  used for the ETA.
+
+The head only advances past numbers whose heartbeat has gone, so a buyer
+who closes the tab stops holding up the queue after a few poll intervals.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.core import signing
+from django.core.cache import caches
+
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+
+    from django_program.registration.models import TicketType
+
+_PREFIX = "django_program:waiting_room"
+_TOKEN_SALT = "django_program.registration.waiting_room"  # noqa: S105
+_WAITER_TIMEOUT = 60 * 60
+_ADVANCE_LOCK_TIMEOUT = 5
+_ADVANCE_STEPS = 100
+_TURN_SMOOTHING = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class QueueStatus:
+    """Where a buyer stands in a ticket type's waiting room.
+
+    ``position`` is 1 for the front of the queue and ``token`` is a signed
+    snapshot of the position and ETA that a client can poll with; both are
+    empty once the buyer is admitted.
+    """
+
+    ticket_type_id: int
+    admitted: bool
+    position: int = 0
+    eta_seconds: int = 0
+    token: str = ""
+
+
+def _key(ticket_type_id: int, *parts: object) -> str:
+    return ":".join((_PREFIX, str(ticket_type_id), *map(str, parts)))
+
+
+def _cache() -> BaseCache:
+    return caches[get_config().waiting_room.cache_alias]
+
+
+def _incr(cache: BaseCache, key: str) -> int:
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        return cache.incr(key)
+
+
+def is_gated(ticket_type: TicketType) -> bool:
+    """Return whether buyers must queue for ``ticket_type``.
+
+    Only ticket types with a limited ``total_quantity`` are gated, and only
+    while the waiting room is enabled.
+    """
+    return get_config().waiting_room.enabled and ticket_type.total_quantity > 0
+
+
+def queue_holder(user: object) -> str:
+    """Return the identifier a user queues under."""
+    return f"user:{user.pk}"
+
+
+def _advance_head(cache: BaseCache, ticket_type_id: int, number: int) -> int:
+    """Move the head past abandoned or admitted numbers ahead of ``number``.
+
+    Only one caller advances at a time; the others read the current head.
+    The head never passes the caller's own number, so a waiter that has just
+    drawn a number but not yet sent its first heartbeat is never skipped.
+    """
+    head_key = _key(ticket_type_id, "head")
+    lock_key = _key(ticket_type_id, "advancing")
+    if not cache.add(lock_key, 1, _ADVANCE_LOCK_TIMEOUT):
+        return cache.get(head_key, 0)
+    try:
+        head = cache.get(head_key, 0)
+        for _ in range(_ADVANCE_STEPS):
+            if head + 1 >= number or cache.get(_key(ticket_type_id, "alive", head + 1)) is not None:
+                break
+            head = _incr(cache, head_key)
+        return head
+    finally:
+        cache.delete(lock_key)
+
+
+def _eta_seconds(cache: BaseCache, ticket_type_id: int, position: int) -> int:
+    config = get_config().waiting_room
+    turn = cache.get(_key(ticket_type_id, "turn"), config.admission_seconds)
+    return max(math.ceil(math.ceil(position / config.concurrency) * turn), config.poll_seconds)
+
+
+def admit(ticket_type_id: int, holder: str) -> QueueStatus:
+    """Join or poll the waiting room, claiming a slot when it is our turn.
+
+    The first call hands ``holder`` the next queue number; later calls keep
+    that number and refresh its heartbeat.  A holder is admitted once the
+    number of waiters ahead of it fits in the free slots, and stays admitted
+    until :func:`release` or until ``admission_seconds`` elapse.
+
+    Args:
+        ticket_type_id: The ticket type being queued for.
+        holder: The queue identity, usually from :func:`queue_holder`.
+
+    Returns:
+        A ``QueueStatus`` that is either admitted or carries the holder's
+        position, ETA and a signed status token.
+    """
+    config = get_config().waiting_room
+    cache = _cache()
+    lease_key = _key(ticket_type_id, "lease", holder)
+    if cache.get(lease_key) is not None:
+        return QueueStatus(ticket_type_id=ticket_type_id, admitted=True)
+
+    holder_key = _key(ticket_type_id, "holder", holder)
+    number = cache.get(holder_key)
+    if number is None:
+        number = _incr(cache, _key(ticket_type_id, "tail"))
+        cache.set(holder_key, number, _WAITER_TIMEOUT)
+    alive_key = _key(ticket_type_id, "alive", number)
+    cache.set(alive_key, holder, config.poll_seconds * 3)
+
+    position = max(number - _advance_head(cache, ticket_type_id, number), 1)
+    slot_keys = [_key(ticket_type_id, "slot", index) for index in range(config.concurrency)]
+    taken = cache.get_many(slot_keys)
+    free = [key for key in slot_keys if key not in taken]
+    if position <= len(free):
+        for slot_key in free:
+            if cache.add(slot_key, holder, config.admission_seconds):
+                cache.set(lease_key, (slot_key, time.time()), config.admission_seconds)
+                cache.delete_many([holder_key, alive_key])
+                return QueueStatus(ticket_type_id=ticket_type_id, admitted=True)
+
+    eta_seconds = _eta_seconds(cache, ticket_type_id, position)
+    token = signing.dumps(
+        {"ticket_type": ticket_type_id, "position": position, "eta": eta_seconds},
+        salt=_TOKEN_SALT,
+    )
+    return QueueStatus(
+        ticket_type_id=ticket_type_id,
+        admitted=False,
+        position=position,
+        eta_seconds=eta_seconds,
+        token=token,
+    )
+
+
+def release(ticket_type_id: int, holder: str) -> None:
+    """Give back ``holder``'s slot, e.g. once its checkout has completed.
+
+    Does nothing if the holder is not admitted.  The time the slot was held
+    feeds the moving average used for ETAs.
+    """
+    cache = _cache()
+    lease_key = _key(ticket_type_id, "lease", holder)
+    lease = cache.get(lease_key)
+    if lease is None:
+        return
+    slot_key, admitted_at = lease
+    if cache.get(slot_key) == holder:
+        cache.delete(slot_key)
+    cache.delete(lease_key)
+
+    held = max(time.time() - admitted_at, 0.0)
+    turn_key = _key(ticket_type_id, "turn")
+    previous = cache.get(turn_key)
+    turn = held if previous is None else (1 - _TURN_SMOOTHING) * previous + _TURN_SMOOTHING * held
+    cache.set(turn_key, turn, None)
+
+
+def read_queue_token(token: str, max_age: int | None = None) -> QueueStatus:
+    """Decode a status token handed out by :func:`admit`.
+
+    Args:
+        token: The signed token.
+        max_age: Reject tokens older than this many seconds.
+
+    Returns:
+        The waiting ``QueueStatus`` the token was issued for.
+
+    Raises:
+        django.core.signing.BadSignature: If the token is invalid or expired.
+    """
+    data = signing.loads(token, salt=_TOKEN_SALT, max_age=max_age)
+    return QueueStatus(
+        ticket_type_id=data["ticket_type"],
+        admitted=False,
+        position=data["position"],
+        eta_seconds=data["eta"],
+        token=token,
+    )
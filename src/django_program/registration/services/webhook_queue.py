@@ -0,0 +1,181 @@
+"""Background processing of queued Stripe webhook events.
+
+With ``DJANGO_PROGRAM['stripe']['webhook_queue']`` enabled, the webhook view
+only verifies and records each event, so a burst of deliveries during a sales
+launch no longer ties up web workers.  :func:`process_stripe_events` works the
+recorded events off in bounded batches:
+
+* each batch locks up to ``webhook_batch_size`` pending events with
+  ``SELECT ... FOR UPDATE SKIP LOCKED``, so several workers can drain the
+  queue side by side without blocking each other,
+* event kinds listed in ``webhook_kind_limits`` take at most that many of
+  the slots the other kinds leave free, so a flood of one kind cannot starve
+  the others,
+* each event runs its registered handler in a savepoint; a failure is
+  recorded and the event is retried with exponential backoff until
+  ``webhook_max_attempts`` is reached.
+
+Events recorded in inline mode whose handler failed are retried by the worker
+too, once their first backoff has passed.  Run it with
+``manage.py process_stripe_events``.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.db import models, transaction
+from django.utils import timezone
+
+from django_program.registration.models import StripeEvent
+from django_program.registration.webhooks import registry
+from django_program.settings import get_config
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Retries back off exponentially, but never wait longer than an hour.
+_MAX_RETRY_DELAY = timedelta(hours=1)
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookQueueResult:
+    """Counts and timing for one run of the webhook queue worker."""
+
+    processed: int = 0
+    failed: int = 0
+    batches: int = 0
+    duration_seconds: float = 0.0
+
+
+def retry_at(attempts: int, now: datetime | None = None) -> datetime:
+    """Return when an event that has failed ``attempts`` times may be retried.
+
+    Args:
+        attempts: Failed attempts so far (at least 1).
+        now: The reference time (defaults to now).
+
+    Returns:
+        ``now`` plus ``webhook_retry_seconds`` doubled for every earlier
+        failure, capped at one hour.
+    """
+    base = timedelta(seconds=get_config().stripe.webhook_retry_seconds)
+    delay = min(base * 2 ** max(attempts - 1, 0), _MAX_RETRY_DELAY)
+    return (now or timezone.now()) + delay
+
+
+def pending_events(now: datetime | None = None) -> models.QuerySet[StripeEvent]:
+    """Return the events the worker may process now, oldest first.
+
+    Args:
+        now: The reference time (defaults to now).
+    """
+    now = now or timezone.now()
+    return StripeEvent.objects.filter(
+        models.Q(next_attempt_at__isnull=True) | models.Q(next_attempt_at__lte=now),
+        processed=False,
+        kind__in=registry.keys(),
+        attempts__lt=get_config().stripe.webhook_max_attempts,
+    ).order_by("created_at", "pk")
+
+
+def _claim_batch(pending: models.QuerySet[StripeEvent], batch_size: int) -> list[StripeEvent]:
+    """Lock the next batch of at most ``batch_size`` events, honouring the per-kind limits.
+
+    Must be called inside a transaction.
+    """
+    limits = get_config().stripe.webhook_kind_limits
+    events = list(pending.exclude(kind__in=limits).select_for_update(skip_locked=True)[:batch_size])
+    for kind, limit in limits.items():
+        remaining = batch_size - len(events)
+        if remaining <= 0:
+            break
+        events.extend(pending.filter(kind=kind).select_for_update(skip_locked=True)[: min(limit, remaining)])
+    events.sort(key=lambda event: (event.created_at, event.pk))
+    return events
+
+
+def _process_batch(pending: models.QuerySet[StripeEvent], batch_size: int, now: datetime) -> tuple[int, int, int]:
+    """Lock and process one batch of events.
+
+    Returns:
+        ``(claimed, processed, failed)`` for the batch.
+    """
+    processed = failed = 0
+    with transaction.atomic():
+        events = _claim_batch(pending, batch_size)
+        for event in events:
+            handler_class = registry.get(event.kind)
+            if handler_class is None:  # pragma: no cover - filtered by ``pending_events``
+                continue
+            try:
+                handler_class(event).process()
+            except Exception:  # noqa: BLE001 - recorded by ``Webhook.log_exception``
+                event.attempts += 1
+                event.next_attempt_at = retry_at(event.attempts, now)
+                event.save(update_fields=["attempts", "next_attempt_at"])
+                failed += 1
+                logger.warning(
+                    "Stripe event %s (kind=%s) failed on attempt %d, retrying at %s",
+                    event.stripe_id,
+                    event.kind,
+                    event.attempts,
+                    event.next_attempt_at.isoformat(),
+                )
+            else:
+                processed += 1
+    return len(events), processed, failed
+
+
+def process_stripe_events(
+    *,
+    now: datetime | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> WebhookQueueResult:
+    """Process pending Stripe events in batches until the queue is drained.
+
+    Each batch runs in its own transaction, and each event in a savepoint, so
+    one failing event neither blocks nor rolls back the others.
+
+    Args:
+        now: The reference time for due retries (defaults to now).
+        batch_size: Events per batch (defaults to ``webhook_batch_size``).
+        max_batches: Stop after this many batches (default: until drained).
+
+    Returns:
+        A ``WebhookQueueResult`` with counts and timing for the run.
+    """
+    started = time.monotonic()
+    now = now or timezone.now()
+    batch_size = batch_size or get_config().stripe.webhook_batch_size
+    pending = pending_events(now)
+
+    processed = failed = batches = 0
+    while max_batches is None or batches < max_batches:
+        claimed, batch_processed, batch_failed = _process_batch(pending, batch_size, now)
+        if not claimed:
+            break
+        batches += 1
+        processed += batch_processed
+        failed += batch_failed
+
+    result = WebhookQueueResult(
+        processed=processed,
+        failed=failed,
+        batches=batches,
+        duration_seconds=time.monotonic() - started,
+    )
+    if processed or failed:
+        logger.info(
+            "Processed %d queued Stripe events (%d failed) in %d batches in %.3fs",
+            processed,
+            failed,
+            batches,
+            result.duration_seconds,
+        )
+    return result
@@ -2,10 +2,16 @@
 
 from typing import TYPE_CHECKING
 
+from django.utils import timezone
+
 if TYPE_CHECKING:
+    from datetime import date
+
     from django.contrib.auth.models import AbstractUser
 
-    from django_program.registration.models import Order
+    from django_program.registration.attendee import Attendee
+    from django_program.registration.checkin import CheckIn, ProductRedemption
+    from django_program.registration.models import Order, OrderLineItem
 
 
 def create_attendee_on_order_paid(
@@ -36,3 +42,448 @@ def create_attendee_on_order_paid(
     attendee.order = order
     attendee.completed_registration = True
     attendee.save(update_fields=["order", "completed_registration", "updated_at"])
+
+
+def invalidate_condition_plan_on_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: object,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Drop the compiled condition plan when a condition is saved or deleted.
+
+    Args:
+        sender: The condition model class.
+        instance: The condition that changed.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.registration.services.condition_plan import invalidate_condition_plan  # noqa: PLC0415
+
+    invalidate_condition_plan(instance.conference_id)
+
+
+def invalidate_condition_plan_on_m2m_change(  # noqa: PLR0913
+    sender: type,
+    *,
+    instance: object,
+    action: str,
+    reverse: bool,
+    model: type,
+    pk_set: set[int] | None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Drop the compiled condition plan when a condition's M2M scope changes.
+
+    Forward changes (``condition.groups.add(...)``) carry the condition as
+    ``instance``. Reverse changes (``ticket_type.<x>_discounts.add(...)``)
+    carry condition pks in ``pk_set``; a reverse ``clear()`` has no pk set,
+    so the affected conditions are resolved in ``pre_clear`` before the
+    through rows disappear.
+
+    Args:
+        sender: The auto-created M2M through model.
+        instance: The object whose relation changed.
+        action: The ``m2m_changed`` action name.
+        reverse: Whether the change came from the reverse side.
+        model: The class of the objects added, removed or cleared.
+        pk_set: Primary keys affected, or ``None`` for ``clear()``.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.registration.services.condition_plan import invalidate_condition_plan  # noqa: PLC0415
+
+    if not reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            invalidate_condition_plan(instance.conference_id)
+        return
+
+    if action in {"post_add", "post_remove"} and pk_set:
+        conference_ids = model.objects.filter(pk__in=pk_set).values_list("conference_id", flat=True)
+    elif action == "pre_clear":
+        source_field = next(f for f in sender._meta.fields if f.related_model is model)  # noqa: SLF001
+        target_field = next(f for f in sender._meta.fields if f.related_model is type(instance))  # noqa: SLF001
+        condition_ids = sender.objects.filter(**{target_field.name: instance}).values_list(
+            source_field.attname, flat=True
+        )
+        conference_ids = model.objects.filter(pk__in=condition_ids).values_list("conference_id", flat=True)
+    else:
+        return
+    for conference_id in set(conference_ids):
+        invalidate_condition_plan(conference_id)
+
+
+def invalidate_condition_plan_on_conference_change(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: object,
+    created: bool = True,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Start a newly created or deleted conference from a fresh plan version.
+
+    Guards against a cached plan outliving its conference when a primary key
+    is reused (e.g. after a rolled-back transaction).
+
+    Args:
+        sender: The Conference model class.
+        instance: The conference that was created or deleted.
+        created: ``False`` for ``post_save`` of an existing conference.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if not created:
+        return
+
+    from django_program.registration.services.condition_plan import invalidate_condition_plan  # noqa: PLC0415
+
+    invalidate_condition_plan(instance.pk)
+
+
+def sync_inventory_on_order_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Move an order's quantities between inventory counters after a transition.
+
+    New orders are skipped (their line items are counted as they are
+    created), as are saves that touch neither ``status`` nor
+    ``hold_expires_at``.
+
+    Args:
+        sender: The Order model class.
+        instance: The order that was saved.
+        created: Whether the order was just created.
+        update_fields: The fields passed to ``save()``, if any.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if created:
+        return
+    if update_fields is not None and not {"status", "hold_expires_at"} & set(update_fields):
+        return
+
+    from django_program.registration.services.inventory import sync_order_inventory  # noqa: PLC0415
+
+    sync_order_inventory(instance)
+
+
+def count_inventory_on_line_item_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: OrderLineItem,
+    created: bool,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Add a newly created line item to its order's inventory counter.
+
+    Args:
+        sender: The OrderLineItem model class.
+        instance: The line item that was saved.
+        created: Whether the line item was just created.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if not created:
+        return
+
+    from django_program.registration.services.inventory import record_line_items  # noqa: PLC0415
+
+    record_line_items([instance])
+
+
+def count_inventory_on_line_item_delete(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: OrderLineItem,
+    origin: object = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Remove a deleted line item from its order's inventory counter.
+
+    Args:
+        sender: The OrderLineItem model class.
+        instance: The line item that was deleted.
+        origin: The object or queryset whose deletion started the cascade.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if _deleting_conference(origin):
+        return
+
+    from django_program.registration.services.inventory import record_line_items  # noqa: PLC0415
+
+    record_line_items([instance], sign=-1)
+
+
+def _cancellation_day(order: Order) -> date | None:
+    """Return the day a cancelled order is counted on, or ``None`` if it is not cancelled (or not loaded)."""
+    from django_program.registration.models import Order  # noqa: PLC0415
+
+    updated_at = order.__dict__.get("updated_at")
+    if order.__dict__.get("status") != Order.Status.CANCELLED or updated_at is None:
+        return None
+    return timezone.localdate(updated_at)
+
+
+def remember_order_cancellation_day(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Record the cancellation day an order was loaded with.
+
+    Args:
+        sender: The ``Order`` class.
+        instance: The order that was initialised.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    instance._cancellation_day = _cancellation_day(instance)  # noqa: SLF001
+
+
+def update_rollups_on_order_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Keep the daily sales rollups in step with order creation and cancellation.
+
+    Orders created already sold are added to their day's totals (status
+    transitions of existing orders are handled by the inventory sync).
+    Cancellations are dated by ``updated_at``, so a save that cancels an
+    order, un-cancels it, or moves a cancelled order to a later day recounts
+    both the day it was loaded on and the day it is now on.
+
+    Args:
+        sender: The Order model class.
+        instance: The order that was saved.
+        created: Whether the order was just created.
+        update_fields: The fields passed to ``save()``, if any.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    from django_program.registration.models import Order  # noqa: PLC0415
+    from django_program.registration.services.rollups import (  # noqa: PLC0415
+        record_order_sales,
+        recount_cancellations,
+    )
+
+    if created and instance.inventory_bucket == Order.InventoryBucket.SOLD:
+        record_order_sales(instance, include_line_items=False)
+    if update_fields is not None and {"status", "updated_at"}.isdisjoint(update_fields):
+        return
+    previous = getattr(instance, "_cancellation_day", None)
+    current = _cancellation_day(instance)
+    instance._cancellation_day = current  # noqa: SLF001
+    if previous != current:
+        recount_cancellations([(instance.conference_id, day) for day in (previous, current) if day is not None])
+
+
+def update_rollups_on_order_delete(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    origin: object = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Remove a deleted order from the daily sales rollups.
+
+    The order's line items are removed as they are cascade-deleted.
+
+    Args:
+        sender: The Order model class.
+        instance: The order that was deleted.
+        origin: The object or queryset whose deletion started the cascade.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if _deleting_conference(origin):
+        return
+
+    from django_program.registration.models import Order  # noqa: PLC0415
+    from django_program.registration.services.rollups import (  # noqa: PLC0415
+        record_order_sales,
+        recount_cancellations,
+    )
+
+    if instance.inventory_bucket == Order.InventoryBucket.SOLD:
+        record_order_sales(instance, sign=-1, include_line_items=False)
+    elif instance.status == Order.Status.CANCELLED:
+        recount_cancellations([(instance.conference_id, timezone.localdate(instance.updated_at))])
+
+
+def count_registration_on_attendee_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Attendee,
+    created: bool,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Add a newly created attendee to its day's registration count.
+
+    Args:
+        sender: The Attendee model class.
+        instance: The attendee that was saved.
+        created: Whether the attendee was just created.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if not created:
+        return
+
+    from django_program.registration.services.rollups import record_registration  # noqa: PLC0415
+
+    record_registration(instance)
+
+
+def count_registration_on_attendee_delete(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Attendee,
+    origin: object = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Remove a deleted attendee from its day's registration count.
+
+    Args:
+        sender: The Attendee model class.
+        instance: The attendee that was deleted.
+        origin: The object or queryset whose deletion started the cascade.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if _deleting_conference(origin):
+        return
+
+    from django_program.registration.services.rollups import record_registration  # noqa: PLC0415
+
+    record_registration(instance, sign=-1)
+
+
+def log_checkin_change_on_attendee_change(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Attendee,
+    origin: object = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Log a saved or deleted attendee for the offline check-in preload.
+
+    Also discards the attendee's cached scanner card, whose order and
+    line items may have changed with it.
+
+    Args:
+        sender: The Attendee model class.
+        instance: The attendee that was saved or deleted.
+        origin: The object or queryset whose deletion started the cascade
+            (deletes only).
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if _deleting_conference(origin):
+        return
+
+    from django_program.registration.services.checkin import invalidate_attendee_cards  # noqa: PLC0415
+    from django_program.registration.services.checkin_sync import record_changes  # noqa: PLC0415
+
+    record_changes(instance.conference_id, [(instance.pk, instance.access_code)])
+    invalidate_attendee_cards(instance.conference_id, [instance.access_code])
+
+
+def log_checkin_change_on_activity(
+    sender: type,
+    *,
+    instance: CheckIn | ProductRedemption,
+    origin: object = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Log the attendee of a saved or deleted check-in or redemption.
+
+    Rows deleted along with their attendee are skipped; the attendee's own
+    deletion is logged.
+
+    Args:
+        sender: The CheckIn or ProductRedemption model class.
+        instance: The check-in or redemption that was saved or deleted.
+        origin: The object or queryset whose deletion started the cascade
+            (deletes only).
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if _deleting_conference(origin):
+        return
+
+    from django_program.registration.attendee import Attendee  # noqa: PLC0415
+    from django_program.registration.services.checkin_sync import record_changes  # noqa: PLC0415
+
+    if sender.attendee.is_cached(instance):
+        access_code = instance.attendee.access_code
+    else:
+        access_code = Attendee.objects.filter(pk=instance.attendee_id).values_list("access_code", flat=True).first()
+        if access_code is None:
+            return
+    record_changes(instance.conference_id, [(instance.attendee_id, access_code)])
+
+
+def log_checkin_change_on_order_save(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Log an order's attendees when its status may have changed.
+
+    New orders have no attendees yet, and saves that do not touch
+    ``status`` cannot change whether the attendees are admitted.
+
+    Args:
+        sender: The Order model class.
+        instance: The order that was saved.
+        created: Whether the order was just created.
+        update_fields: The fields passed to ``save()``, if any.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if created or (update_fields is not None and "status" not in update_fields):
+        return
+
+    _log_order_attendees(instance)
+
+
+def log_checkin_change_on_order_delete(
+    sender: type,  # noqa: ARG001
+    *,
+    instance: Order,
+    origin: object = None,
+    **kwargs: object,  # noqa: ARG001
+) -> None:
+    """Log an order's attendees before the deletion unlinks them from it.
+
+    Connected to ``pre_delete``: ``Attendee.order`` is ``SET_NULL``, so the
+    attendees can no longer be found through the order afterwards.
+
+    Args:
+        sender: The Order model class.
+        instance: The order about to be deleted.
+        origin: The object or queryset whose deletion started the cascade.
+        **kwargs: Additional signal keyword arguments (ignored).
+    """
+    if not _deleting_conference(origin):
+        _log_order_attendees(instance)
+
+
+def _log_order_attendees(order: Order) -> None:
+    """Append change log entries for every attendee linked to ``order``."""
+    from django_program.registration.attendee import Attendee  # noqa: PLC0415
+    from django_program.registration.services.checkin_sync import record_changes  # noqa: PLC0415
+
+    record_changes(order.conference_id, Attendee.objects.filter(order=order).values_list("pk", "access_code"))
+
+
+def _deleting_conference(origin: object) -> bool:
+    """Whether a delete cascades from a conference, whose counters, rollups and change log go with it.
+
+    Those rows are removed before the conference's orders, line items and
+    attendees, so adjusting them from the cascade would recreate rows that
+    point at the deleted conference.
+    """
+    from django_program.conference.models import Conference  # noqa: PLC0415
+
+    return isinstance(origin, Conference) or getattr(origin, "model", None) is Conference
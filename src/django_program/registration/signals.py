@@ -6,8 +6,32 @@ Signals:
         Kwargs:
             order: The ``Order`` instance that was paid.
             user: The user who owns the order.
+    checkout_timed: Sent after a successful checkout with per-phase latencies.
+        Sender: The ``Order`` class.
+        Kwargs:
+            order: The ``Order`` that was created.
+            timings: Seconds spent per phase (``lock``, ``revalidate``,
+                ``price``, ``persist``) and in ``total``.
+    holds_expired: Sent after a hold-expiry sweep, for metrics and alerting.
+        The sweep cancels orders with bulk updates that bypass the ``Order``
+        model signals; ``result.conference_ids`` names the conferences whose
+        orders changed.
+        Sender: The ``Order`` class.
+        Kwargs:
+            result: The ``HoldSweepResult`` with counts and timing.
+            conference_id: The conference swept, or ``None`` for all.
+    checkins_synced: Sent after check-ins were recorded with bulk writes that
+        bypass the ``Attendee`` model signals: an attendee's first check-in
+        and every batch of offline scans and redemptions.  Listeners that
+        cache conference data should invalidate on this.
+        Sender: The ``CheckIn`` class.
+        Kwargs:
+            conference: The ``Conference`` the scans belong to.
 """
 
 from django.dispatch import Signal
 
 order_paid = Signal()
+checkout_timed = Signal()
+holds_expired = Signal()
+checkins_synced = Signal()
@@ -27,6 +27,7 @@ from django_program.registration.views import (
 from django_program.registration.views_checkin import (
     LookupView,
     OfflinePreloadView,
+    OfflineSyncView,
     RedeemView,
     ScanView,
 )
@@ -59,6 +60,7 @@ urlpatterns = [
     path("checkin/lookup/<str:access_code>/", LookupView.as_view(), name="checkin-lookup"),
     path("checkin/redeem/", RedeemView.as_view(), name="checkin-redeem"),
     path("checkin/preload/", OfflinePreloadView.as_view(), name="checkin-preload"),
+    path("checkin/sync/", OfflineSyncView.as_view(), name="checkin-sync"),
     # Stripe Terminal API (staff-only, JSON endpoints for POS UI)
     path("terminal/connection-token/", ConnectionTokenView.as_view(), name="terminal-connection-token"),
     path("terminal/create-payment-intent/", CreatePaymentIntentView.as_view(), name="terminal-create-intent"),
@@ -5,8 +5,6 @@ scoped to a conference via the ``conference_slug`` URL kwarg.
 """
 
 import logging
-import secrets
-import string
 from datetime import timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING
@@ -36,26 +34,20 @@ from django_program.registration.models import (
     TicketType,
     Voucher,
 )
+from django_program.registration.services.inventory import record_line_items
+from django_program.registration.services.references import generate_order_reference
+from django_program.registration.services.waiting_room import admit, is_gated, queue_holder, release
+from django_program.settings import get_config
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from django.db.models import QuerySet
     from django.http import HttpRequest
 
 logger = logging.getLogger(__name__)
 
 
-def _generate_order_reference() -> str:
-    """Generate a unique order reference like ``ORD-A1B2C3``.
-
-    Returns:
-        A string in the format ``ORD-`` followed by 6 random uppercase
-        alphanumeric characters.
-    """
-    alphabet = string.ascii_uppercase + string.digits
-    chars = [secrets.choice(alphabet) for _ in range(6)]
-    return f"ORD-{''.join(chars)}"
-
-
 def _calculate_discount(subtotal: Decimal, voucher: Voucher | None) -> Decimal:
     """Calculate the discount amount for a cart based on the applied voucher.
 
@@ -99,6 +91,51 @@ def _cart_totals(cart: Cart) -> tuple[Decimal, Decimal, Decimal]:
     return subtotal, discount, total
 
 
+def _waiting_room_response(
+    request: HttpRequest, conference: object, ticket_types: Iterable[TicketType | None]
+) -> HttpResponse | None:
+    """Queue the user for each gated ticket type they are about to buy.
+
+    Args:
+        request: The incoming HTTP request.
+        conference: The conference being registered for.
+        ticket_types: The ticket types the request would add or check out.
+
+    Returns:
+        ``None`` once the user is admitted for every gated ticket type,
+        otherwise the waiting-room page (HTTP 429 with ``Retry-After``).
+    """
+    holder = queue_holder(request.user)
+    for ticket_type in {tt for tt in ticket_types if tt is not None and is_gated(tt)}:
+        status = admit(ticket_type.pk, holder)
+        if status.admitted:
+            continue
+        poll_seconds = get_config().waiting_room.poll_seconds
+        response = render(
+            request,
+            "django_program/registration/waiting_room.html",
+            {
+                "conference": conference,
+                "ticket_type": ticket_type,
+                "queue": status,
+                "eta_minutes": -(-status.eta_seconds // 60),
+                "poll_seconds": poll_seconds,
+                "resubmit": [(key, value) for key, value in request.POST.items() if key != "csrfmiddlewaretoken"],
+            },
+            status=429,
+        )
+        response["Retry-After"] = str(poll_seconds)
+        return response
+    return None
+
+
+def _leave_waiting_room(request: HttpRequest, ticket_types: Iterable[TicketType | None]) -> None:
+    """Free the user's waiting-room slots once their checkout is done."""
+    holder = queue_holder(request.user)
+    for ticket_type in {tt for tt in ticket_types if tt is not None and is_gated(tt)}:
+        release(ticket_type.pk, holder)
+
+
 class TicketSelectView(ConferenceMixin, FeatureRequiredMixin, ListView):
     """Lists available ticket types for a conference.
 
@@ -133,7 +170,8 @@ class CartView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, View):
     """Shopping cart view for adding/removing items and applying vouchers.
 
     Handles multiple POST actions distinguished by a hidden ``action``
-    field: ``add_item``, ``remove_item``, and ``apply_voucher``.
+    field: ``add_item``, ``remove_item``, and ``apply_voucher``.  Adding a
+    limited ticket type goes through the waiting room when it is enabled.
     """
 
     required_feature = ("registration", "public_ui")
@@ -167,12 +205,6 @@ class CartView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, View):
         """
         items = cart.items.select_related("ticket_type", "addon")
         now = timezone.now()
-        sold_filter = models.Q(
-            order_line_items__order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED]
-        ) | models.Q(
-            order_line_items__order__status=Order.Status.PENDING,
-            order_line_items__order__hold_expires_at__gt=now,
-        )
         available_tickets = (
             TicketType.objects.filter(
                 conference=self.conference,
@@ -186,7 +218,7 @@ class CartView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, View):
                 models.Q(available_until__isnull=True) | models.Q(available_until__gte=now),
             )
             .annotate(
-                sold_quantity=Coalesce(models.Sum("order_line_items__quantity", filter=sold_filter), 0),
+                sold_quantity=Coalesce("inventory__sold", 0) + Coalesce("inventory__held", 0),
             )
             .filter(
                 models.Q(total_quantity=0) | models.Q(total_quantity__gt=models.F("sold_quantity")),
@@ -233,6 +265,9 @@ class CartView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, View):
                 is_active=True,
             ).first()
             if ticket_type and ticket_type.is_available:
+                waiting = _waiting_room_response(request, self.conference, [ticket_type])
+                if waiting is not None:
+                    return waiting
                 item, created = CartItem.objects.get_or_create(
                     cart=cart,
                     ticket_type=ticket_type,
@@ -311,6 +346,9 @@ class CartView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, View):
                 messages.error(request, "This ticket type is no longer available.")
                 return redirect(reverse("registration:cart", args=[self.conference.slug]))
 
+            waiting = _waiting_room_response(request, self.conference, [ticket_type])
+            if waiting is not None:
+                return waiting
             item, created = CartItem.objects.get_or_create(
                 cart=cart,
                 ticket_type=ticket_type,
@@ -375,6 +413,9 @@ class CartView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, View):
             messages.error(request, "This ticket type is no longer available.")
             return redirect(reverse("registration:cart", args=[self.conference.slug]))
 
+        waiting = _waiting_room_response(request, self.conference, [ticket_type])
+        if waiting is not None:
+            return waiting
         item, created = CartItem.objects.get_or_create(
             cart=cart,
             ticket_type=ticket_type,
@@ -491,7 +532,8 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
 
     Collects billing information, creates Order and OrderLineItem records
     inside a transaction, marks the cart as checked out, and redirects
-    to the order confirmation page.
+    to the order confirmation page.  When the waiting room is enabled,
+    buyers of limited ticket types queue before reaching the form.
     """
 
     required_feature = ("registration", "public_ui")
@@ -512,16 +554,16 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
             status=Cart.Status.OPEN,
         ).first()
 
-    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
-        """Render the checkout form with the cart summary.
+    def _get_checkout_cart(self, request: HttpRequest) -> tuple[Cart, QuerySet[CartItem]] | HttpResponse:
+        """Fetch the open cart and its items, or the response to send instead.
 
         Args:
             request: The incoming HTTP request.
-            **kwargs: URL keyword arguments (unused).
 
         Returns:
-            The rendered checkout page, or a redirect to the cart if
-            no open cart exists.
+            ``(cart, items)`` when checkout can proceed, a redirect to the
+            cart page if the cart is missing or empty, or the waiting-room
+            page if the user is still queued for a ticket type in the cart.
         """
         cart = self._get_open_cart(request)
         if cart is None:
@@ -533,6 +575,27 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
             messages.error(request, "Your cart is empty.")
             return redirect(reverse("registration:cart", args=[self.conference.slug]))
 
+        waiting = _waiting_room_response(request, self.conference, [item.ticket_type for item in items])
+        if waiting is not None:
+            return waiting
+        return cart, items
+
+    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
+        """Render the checkout form with the cart summary.
+
+        Args:
+            request: The incoming HTTP request.
+            **kwargs: URL keyword arguments (unused).
+
+        Returns:
+            The rendered checkout page, or a redirect to the cart if
+            no open cart exists.
+        """
+        checkout_cart = self._get_checkout_cart(request)
+        if isinstance(checkout_cart, HttpResponse):
+            return checkout_cart
+        cart, items = checkout_cart
+
         subtotal, discount, total = _cart_totals(cart)
         form = CheckoutForm(
             initial={
@@ -556,9 +619,10 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
     def post(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
         """Validate billing info and create the order atomically.
 
-        Creates Order and OrderLineItem records from the cart, marks the
-        cart as checked out, and sets a 30-minute hold on the order for
-        inventory reservation.
+        Creates the Order with a collision-free reference and inserts its
+        OrderLineItem records with one ``bulk_create``, marks the cart as
+        checked out, and sets a 30-minute hold on the order for inventory
+        reservation.
 
         Args:
             request: The incoming HTTP request.
@@ -568,15 +632,10 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
             A redirect to the order confirmation page on success, or the
             checkout form with errors on validation failure.
         """
-        cart = self._get_open_cart(request)
-        if cart is None:
-            messages.error(request, "Your cart is empty.")
-            return redirect(reverse("registration:cart", args=[self.conference.slug]))
-
-        items = cart.items.select_related("ticket_type", "addon")
-        if not items.exists():
-            messages.error(request, "Your cart is empty.")
-            return redirect(reverse("registration:cart", args=[self.conference.slug]))
+        checkout_cart = self._get_checkout_cart(request)
+        if isinstance(checkout_cart, HttpResponse):
+            return checkout_cart
+        cart, items = checkout_cart
 
         form = CheckoutForm(request.POST)
         subtotal, discount, total = _cart_totals(cart)
@@ -598,10 +657,6 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
 
         try:
             with transaction.atomic():
-                reference = _generate_order_reference()
-                while Order.objects.filter(reference=reference).exists():
-                    reference = _generate_order_reference()
-
                 voucher_code = ""
                 voucher_details = ""
                 voucher = None
@@ -624,21 +679,24 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
                     billing_name=form.cleaned_data["billing_name"],
                     billing_email=form.cleaned_data["billing_email"],
                     billing_company=form.cleaned_data.get("billing_company", ""),
-                    reference=reference,
+                    reference=generate_order_reference(),
                     hold_expires_at=timezone.now() + timedelta(minutes=30),
                 )
 
-                for item in items:
-                    description = str(item.ticket_type.name if item.ticket_type else item.addon.name)
-                    OrderLineItem.objects.create(
+                line_items = [
+                    OrderLineItem(
                         order=order,
-                        description=description,
+                        description=str(item.ticket_type.name if item.ticket_type else item.addon.name),
                         quantity=item.quantity,
                         unit_price=item.unit_price,
                         line_total=item.line_total,
                         ticket_type=item.ticket_type,
                         addon=item.addon,
                     )
+                    for item in items
+                ]
+                # bulk_create skips post_save, so the inventory counters are updated here.
+                record_line_items(OrderLineItem.objects.bulk_create(line_items))
 
                 cart.status = Cart.Status.CHECKED_OUT
                 cart.save(update_fields=["status", "updated_at"])
@@ -662,6 +720,7 @@ class CheckoutView(LoginRequiredMixin, ConferenceMixin, FeatureRequiredMixin, Vi
                 },
             )
 
+        _leave_waiting_room(request, [item.ticket_type for item in items])
         logger.info("Order %s created for user %s", order.reference, request.user)
         return redirect(reverse("registration:order-confirmation", args=[self.conference.slug, order.reference]))
 
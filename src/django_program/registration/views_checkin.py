@@ -7,17 +7,48 @@ is responsible for including the CSRF token in POST requests.
 """
 
 import json
+import re
+from typing import TYPE_CHECKING
 
-from django.db.models import Count, Prefetch
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.text import compress_string
 from django.views import View
 
 from django_program.conference.models import Conference
 from django_program.registration.attendee import Attendee
 from django_program.registration.models import Order, OrderLineItem
-from django_program.registration.services.checkin import CheckInService, RedemptionService
+from django_program.registration.services.checkin import (
+    AttendeeCard,
+    CheckInService,
+    RedemptionService,
+    cache_attendee_cards,
+    serialize_line_item,
+)
+from django_program.registration.services.checkin_sync import (
+    MAX_OFFLINE_ACTIONS,
+    REDEEM,
+    SCAN,
+    OfflineAction,
+    OfflineResult,
+    changes_since,
+    latest_sequence,
+    preload_attendees,
+    reconcile_offline_actions,
+)
+
+if TYPE_CHECKING:
+    from django_program.registration.checkin import CheckIn
+
+_ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+# Below this size gzip saves too little to be worth it (GZipMiddleware uses the same cut-off).
+_MIN_GZIP_BYTES = 200
+_MAX_CLIENT_KEY_LENGTH = 64
 
 
 class StaffRequiredMixin:
@@ -73,24 +104,6 @@ def _serialize_attendee(attendee: Attendee) -> dict[str, object]:
     }
 
 
-def _serialize_line_item(item: OrderLineItem) -> dict[str, object]:
-    """Serialize an order line item for JSON API responses.
-
-    Args:
-        item: The order line item to serialize.
-
-    Returns:
-        A dict with line item fields suitable for JSON encoding.
-    """
-    return {
-        "id": item.pk,
-        "description": str(item.description),
-        "quantity": item.quantity,
-        "ticket_type_slug": (str(item.ticket_type.slug) if item.ticket_type else None),
-        "addon_slug": str(item.addon.slug) if item.addon else None,
-    }
-
-
 def _get_ticket_type_name(order: Order | None) -> str:
     """Extract the ticket type name from an order's prefetched line items."""
     if order is None:
@@ -115,12 +128,37 @@ def _parse_json_body(request: HttpRequest) -> dict[str, object] | None:
     return payload
 
 
+def _scan_payload(attendee: Attendee, card: AttendeeCard, checkin: CheckIn) -> dict[str, object]:
+    """Build the scan response from the checked-in attendee and their cached card."""
+    return {
+        "status": "checked_in",
+        "attendee": {
+            "id": attendee.pk,
+            "access_code": str(attendee.access_code),
+            "name": card.name,
+            "email": card.email,
+            "checked_in": True,
+            "checked_in_at": attendee.checked_in_at.isoformat(),
+            "check_in_count": attendee.checkin_count,
+        },
+        "badge": {
+            "name": card.name,
+            "ticket_type": card.ticket_type,
+        },
+        "products": list(card.products),
+        "order_status": str(attendee.order.status),
+        "checkin_id": checkin.pk,
+        "checked_in_at": checkin.checked_in_at.isoformat(),
+    }
+
+
 class ScanView(StaffRequiredMixin, View):
     """Scan an attendee's access code and perform check-in.
 
     Accepts a JSON body with ``access_code`` and records the check-in
     via ``CheckInService``. Returns the attendee data and badge info
-    on success.
+    on success.  The display data comes from the cached attendee card, so
+    a warm scan costs one indexed read plus the check-in write.
     """
 
     def post(self, request: HttpRequest, **kwargs: str) -> JsonResponse:  # noqa: ARG002
@@ -144,7 +182,7 @@ class ScanView(StaffRequiredMixin, View):
         station = str(body.get("station", ""))
 
         try:
-            attendee = CheckInService.lookup_attendee(conference=self.conference, access_code=access_code)
+            attendee = CheckInService.lookup_for_scan(conference=self.conference, access_code=access_code)
         except Attendee.DoesNotExist:
             return JsonResponse(
                 {"error": "Attendee not found", "access_code": access_code},
@@ -162,31 +200,14 @@ class ScanView(StaffRequiredMixin, View):
                 status=409,
             )
 
+        card = CheckInService.get_attendee_card(attendee)
         checkin = CheckInService.check_in(
             attendee=attendee,
             checked_in_by=request.user,
             station=station,
         )
 
-        order = attendee.order
-        products = []
-        if order is not None:
-            products = [_serialize_line_item(item) for item in order.line_items.all()]
-
-        return JsonResponse(
-            {
-                "status": "checked_in",
-                "attendee": _serialize_attendee(attendee),
-                "badge": {
-                    "name": str(getattr(attendee.user, "get_full_name", lambda: "")()),
-                    "ticket_type": _get_ticket_type_name(order),
-                },
-                "products": products,
-                "order_status": str(order.status) if order else None,
-                "checkin_id": checkin.pk,
-                "checked_in_at": checkin.checked_in_at.isoformat(),
-            }
-        )
+        return JsonResponse(_scan_payload(attendee, card, checkin))
 
 
 class LookupView(StaffRequiredMixin, View):
@@ -220,7 +241,7 @@ class LookupView(StaffRequiredMixin, View):
         redeemable: list[dict[str, object]] = []
         if order is not None:
             line_items = list(order.line_items.all())
-            products = [_serialize_line_item(item) for item in line_items]
+            products = [serialize_line_item(item) for item in line_items]
 
             redeemed_counts: dict[int, int] = {}
             for r in attendee.redemptions.values("order_line_item_id").annotate(count=Count("id")):
@@ -228,7 +249,7 @@ class LookupView(StaffRequiredMixin, View):
 
             redeemable = [
                 {
-                    **_serialize_line_item(item),
+                    **serialize_line_item(item),
                     "redeemed_count": redeemed_counts.get(item.pk, 0),
                     "remaining": item.quantity - redeemed_counts.get(item.pk, 0),
                 }
@@ -328,7 +349,7 @@ class RedeemView(StaffRequiredMixin, View):
                 "status": "redeemed",
                 "redemption_id": redemption.pk,
                 "redeemed_at": redemption.redeemed_at.isoformat(),
-                "line_item": _serialize_line_item(line_item),
+                "line_item": serialize_line_item(line_item),
                 "attendee": _serialize_attendee(attendee),
             }
         )
@@ -337,12 +358,23 @@ class RedeemView(StaffRequiredMixin, View):
 class OfflinePreloadView(StaffRequiredMixin, View):
     """Bulk export attendee data for offline scanner fallback.
 
-    Returns a JSON array of attendee records for all paid orders in the
-    conference. Optionally filtered by ticket type slug via the
-    ``ticket_type`` query parameter.
+    Returns a JSON object with the attendee records for all paid orders in
+    the conference and the change sequence number (``seq``) they reflect.
+    Optionally filtered by ticket type slug via the ``ticket_type`` query
+    parameter.
+
+    Scanners keep up to date by passing the last ``seq`` they received as
+    ``?since=<seq>``: the response then carries only the attendees changed
+    since, and lists the access codes of changed attendees that may no
+    longer be admitted under ``removed``.  A ``since`` of ``0`` or one
+    ahead of the server's sequence returns a full preload (``"full": true``)
+    that replaces the scanner's data.  The JSON is compact and gzip-encoded
+    for clients that send ``Accept-Encoding: gzip``.  Every exported
+    attendee's scanner card is cached along the way, so the scans that
+    follow a preload skip the card queries.
     """
 
-    def get(self, request: HttpRequest, **kwargs: str) -> JsonResponse:  # noqa: ARG002
+    def get(self, request: HttpRequest, **kwargs: str) -> HttpResponse:  # noqa: ARG002
         """Return preloaded attendee data for offline scanner use.
 
         Args:
@@ -350,23 +382,24 @@ class OfflinePreloadView(StaffRequiredMixin, View):
             **kwargs: URL keyword arguments (unused).
 
         Returns:
-            JSON response with an array of attendee records.
+            JSON response with the attendee records, or a 400 error for an
+            invalid ``since``.
         """
-        attendees = (
-            Attendee.objects.filter(
-                conference=self.conference,
-                order__isnull=False,
-                order__status__in=[Order.Status.PAID, Order.Status.PARTIALLY_REFUNDED],
-            )
-            .select_related("user", "order")
-            .prefetch_related(
-                Prefetch(
-                    "order__line_items",
-                    queryset=OrderLineItem.objects.select_related("ticket_type", "addon"),
-                ),
-                "redemptions",
-            )
-        )
+        try:
+            since = int(request.GET.get("since", "0") or 0)
+        except ValueError:
+            return JsonResponse({"error": "since must be an integer"}, status=400)
+
+        # Read the sequence first: changes committed while the records are
+        # being read are re-sent by the next delta.
+        seq = latest_sequence(self.conference)
+        full = since <= 0 or since > seq
+        attendees = preload_attendees(self.conference)
+        changed: dict[int, str] = {}
+        if not full:
+            changes = changes_since(self.conference, since)
+            changed = dict(changes.values_list("attendee_id", "access_code"))
+            attendees = attendees.filter(pk__in=changes.values("attendee_id"))
 
         ticket_type_slug = request.GET.get("ticket_type", "").strip()
         if ticket_type_slug:
@@ -375,14 +408,23 @@ class OfflinePreloadView(StaffRequiredMixin, View):
             ).distinct()
 
         records = [self._serialize_preload_attendee(attendee) for attendee in attendees]
+        present = {record["access_code"] for record in records}
+        cache_attendee_cards(
+            self.conference.pk,
+            {attendee.access_code: AttendeeCard.from_attendee(attendee) for attendee in attendees},
+        )
 
-        return JsonResponse(
+        return _compact_json_response(
+            request,
             {
                 "conference": str(self.conference.slug),
                 "generated_at": timezone.now().isoformat(),
+                "seq": seq,
+                "full": full,
                 "count": len(records),
                 "attendees": records,
-            }
+                "removed": sorted(set(changed.values()) - present),
+            },
         )
 
     @staticmethod
@@ -400,7 +442,7 @@ class OfflinePreloadView(StaffRequiredMixin, View):
                     redeemed_counts.get(redemption.order_line_item_id, 0) + 1
                 )
             for item in order.line_items.all():
-                product_data = _serialize_line_item(item)
+                product_data = serialize_line_item(item)
                 product_data["redeemed_count"] = redeemed_counts.get(item.pk, 0)
                 product_data["remaining"] = item.quantity - redeemed_counts.get(item.pk, 0)
                 products.append(product_data)
@@ -417,3 +459,102 @@ class OfflinePreloadView(StaffRequiredMixin, View):
             "checked_in": attendee.checked_in_at is not None,
             "checked_in_at": (attendee.checked_in_at.isoformat() if attendee.checked_in_at else None),
         }
+
+
+class OfflineSyncView(StaffRequiredMixin, View):
+    """Replay the scans and redemptions a scanner queued while offline.
+
+    Accepts a JSON body ``{"actions": [...]}`` with up to
+    ``MAX_OFFLINE_ACTIONS`` actions, oldest first.  Each action has a
+    ``type`` (``"scan"`` or ``"redeem"``), a client-generated ``key``, the
+    ``access_code``, the ISO 8601 ``occurred_at`` time and optionally a
+    ``station``; redemptions also carry a ``line_item_id``.  The batch is
+    applied in one transaction and the response lists one result per action,
+    in order.  Keys already applied are reported as ``"duplicate"``, so a
+    scanner can safely resend a batch whose response it never received.
+    """
+
+    def post(self, request: HttpRequest, **kwargs: str) -> JsonResponse:  # noqa: ARG002
+        """Apply a batch of offline actions.
+
+        Args:
+            request: The incoming HTTP request with JSON body.
+            **kwargs: URL keyword arguments (unused).
+
+        Returns:
+            JSON response with the per-action results and a summary of their
+            statuses, or a 400 error for a malformed batch.
+        """
+        body = _parse_json_body(request)
+        if body is None:
+            return JsonResponse({"error": "Invalid JSON body"}, status=400)
+        items = body.get("actions")
+        if not isinstance(items, list):
+            return JsonResponse({"error": "actions must be a list"}, status=400)
+        if len(items) > MAX_OFFLINE_ACTIONS:
+            return JsonResponse(
+                {"error": f"At most {MAX_OFFLINE_ACTIONS} actions can be sent at once"},
+                status=400,
+            )
+
+        parsed = [self._parse_action(item) for item in items]
+        actions = [action for action in parsed if isinstance(action, OfflineAction)]
+        applied = iter(reconcile_offline_actions(self.conference, actions, performed_by=request.user))
+        results = [next(applied) if isinstance(action, OfflineAction) else action for action in parsed]
+
+        summary = dict.fromkeys(("checked_in", "redeemed", "duplicate", "rejected"), 0)
+        for result in results:
+            summary[result.status] += 1
+        return JsonResponse({"results": [result.as_dict() for result in results], "summary": summary})
+
+    @staticmethod
+    def _parse_action(item: object) -> OfflineAction | OfflineResult:  # noqa: PLR0911
+        """Parse one queued action, or return its rejection if it is malformed."""
+        if not isinstance(item, dict):
+            return OfflineResult(key="", status="rejected", error="Action must be an object")
+        key = str(item.get("key", "")).strip()
+        if not key or len(key) > _MAX_CLIENT_KEY_LENGTH:
+            return OfflineResult(
+                key=key, status="rejected", error=f"key must be 1 to {_MAX_CLIENT_KEY_LENGTH} characters"
+            )
+        kind = item.get("type")
+        if kind not in {SCAN, REDEEM}:
+            return OfflineResult(key=key, status="rejected", error='type must be "scan" or "redeem"')
+        access_code = str(item.get("access_code", "")).strip()
+        if not access_code:
+            return OfflineResult(key=key, status="rejected", error="access_code is required")
+        try:
+            occurred_at = parse_datetime(str(item.get("occurred_at", "")))
+        except ValueError:  # Well-formed but impossible, e.g. February 30th.
+            occurred_at = None
+        if occurred_at is None:
+            return OfflineResult(key=key, status="rejected", error="occurred_at must be an ISO 8601 datetime")
+        if timezone.is_naive(occurred_at):
+            occurred_at = timezone.make_aware(occurred_at)
+
+        line_item_id = None
+        if kind == REDEEM:
+            try:
+                line_item_id = int(item.get("line_item_id"))  # type: ignore[arg-type]
+            except TypeError, ValueError, OverflowError:
+                return OfflineResult(key=key, status="rejected", error="line_item_id must be an integer")
+        return OfflineAction(
+            kind=kind,
+            key=key,
+            access_code=access_code,
+            occurred_at=occurred_at,
+            station=str(item.get("station", ""))[:100],
+            line_item_id=line_item_id,
+        )
+
+
+def _compact_json_response(request: HttpRequest, data: dict[str, object]) -> HttpResponse:
+    """Encode ``data`` as compact JSON, gzip-compressed when the client accepts it."""
+    content = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":")).encode()
+    response = HttpResponse(content_type="application/json")
+    if len(content) >= _MIN_GZIP_BYTES and _ACCEPTS_GZIP.search(request.headers.get("Accept-Encoding", "")):
+        content = compress_string(content)
+        response["Content-Encoding"] = "gzip"
+    response.content = content
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
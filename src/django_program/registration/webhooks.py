@@ -5,7 +5,13 @@ Each event kind (e.g. ``payment_intent.succeeded``) maps to a handler class that
 encapsulates idempotent processing, signal dispatch, and error capture.
 
 The ``stripe_webhook`` view verifies event signatures per-conference, deduplicates
-by Stripe event ID, and delegates to the appropriate handler.
+by Stripe event ID, and delegates to the appropriate handler.  Recently recorded
+event IDs are also kept in the cache for ``webhook_seen_seconds``, so a retry
+storm of redeliveries is acknowledged without signature verification or any
+database work.  With
+``DJANGO_PROGRAM['stripe']['webhook_queue']`` enabled it only records the
+event, and ``manage.py process_stripe_events`` runs the handlers (see
+:mod:`django_program.registration.services.webhook_queue`).
 
 Usage in URL configuration::
 
@@ -16,12 +22,16 @@ Usage in URL configuration::
     ]
 """
 
+import json
 import logging
+import re
 import traceback
+from functools import partial
 from typing import TYPE_CHECKING
 
 import stripe
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
@@ -124,6 +134,7 @@ class Webhook:
 
         Skips events that have already been processed. On success, marks the
         event as processed and fires any associated Django signal. On failure,
+        rolls back the handler's writes so the event can be retried cleanly,
         captures the traceback to ``EventProcessingException`` and re-raises.
         """
         if self.event.processed:
@@ -131,11 +142,13 @@ class Webhook:
             return
 
         try:
-            self.process_webhook()
-            self.send_signal()
-            self.event.processed = True
-            self.event.save(update_fields=["processed"])
+            with transaction.atomic():
+                self.process_webhook()
+                self.send_signal()
+                self.event.processed = True
+                self.event.save(update_fields=["processed"])
         except Exception:
+            self.event.processed = False
             self.log_exception()
             raise
 
@@ -432,9 +445,9 @@ class CheckoutSessionCompletedWebhook(Webhook):
 
         Skips fulfillment when ``payment_status`` is not ``"paid"`` to avoid
         issuing vouchers before funds settle (e.g. async payment methods).
+        Fulfillment itself runs once the event is committed, see
+        :func:`_fulfill_checkout_session`.
         """
-        from django_program.sponsors.services import BulkPurchaseService  # noqa: PLC0415
-
         session = _event_data_object(self.event)
         session_id = str(session.get("id", ""))
 
@@ -464,13 +477,31 @@ class CheckoutSessionCompletedWebhook(Webhook):
                 stripe_payment_intent_id="",
             ).update(stripe_payment_intent_id=payment_intent_id)
 
+        transaction.on_commit(partial(_fulfill_checkout_session, session_id))
+
+
+def _fulfill_checkout_session(session_id: str) -> None:
+    """Fulfill the bulk purchase paid through a checkout session.
+
+    Called on commit of the event's transaction (in queue mode, of the
+    worker's batch), so each chunk of ``fulfill_bulk_purchase`` commits on
+    its own instead of as a savepoint of the webhook.  A failure leaves the
+    purchase partly fulfilled; fulfilling it again from the management
+    dashboard generates the missing codes.
+    """
+    from django_program.sponsors.services import BulkPurchaseService  # noqa: PLC0415
+
+    try:
         result = BulkPurchaseService.handle_checkout_webhook(session_id)
-        if result is not None:
-            logger.info(
-                "Fulfilled BulkPurchase #%s via checkout.session.completed (session=%s)",
-                result.pk,
-                session_id,
-            )
+    except Exception:
+        logger.exception("Error fulfilling bulk purchase for checkout session %s", session_id)
+        return
+    if result is not None:
+        logger.info(
+            "Fulfilled BulkPurchase #%s via checkout.session.completed (session=%s)",
+            result.pk,
+            session_id,
+        )
 
 
 class CheckoutSessionExpiredWebhook(Webhook):
@@ -524,14 +555,109 @@ registry.register("checkout.session.expired", CheckoutSessionExpiredWebhook)
 # ---------------------------------------------------------------------------
 
 
+_SEEN_PREFIX = "django_program:stripe_event_seen"
+_EVENT_ID_RE = re.compile(r"evt_[A-Za-z0-9_]{1,200}")
+
+
+def _seen_key(stripe_id: str) -> str:
+    """Return the seen-set cache key for a Stripe event ID."""
+    return f"{_SEEN_PREFIX}:{stripe_id}"
+
+
+def _recently_seen(payload: bytes) -> bool:
+    """Return whether the event in ``payload`` was recorded recently.
+
+    The event ID is read from the unverified payload.  That is safe because a
+    hit only ever acknowledges a delivery without acting on it, and an ID only
+    enters the seen-set after its event passed signature verification.
+    """
+    try:
+        stripe_id = json.loads(payload).get("id")
+    except ValueError, AttributeError:
+        return False
+    if not isinstance(stripe_id, str) or not _EVENT_ID_RE.fullmatch(stripe_id):
+        return False
+    return cache.get(_seen_key(stripe_id)) is not None
+
+
+def _remember_event(stripe_id: str, seconds: int) -> None:
+    """Add a recorded event to the seen-set for ``seconds`` (``0`` disables it)."""
+    if seconds and _EVENT_ID_RE.fullmatch(stripe_id):
+        cache.set(_seen_key(stripe_id), 1, seconds)
+
+
+def _verified_event(payload: bytes, sig_header: str, conference_slug: str, tolerance: int) -> stripe.Event | None:
+    """Verify a delivery against the conference's webhook secret.
+
+    Returns:
+        The Stripe event, or ``None`` (after logging why) if the conference
+        is unknown, has no webhook secret, or the signature does not match.
+    """
+    try:
+        conference = Conference.objects.get(slug=conference_slug, is_active=True)
+    except Conference.DoesNotExist:
+        logger.warning("Webhook received for unknown conference slug: %s", conference_slug)
+        return None
+
+    webhook_secret = conference.stripe_webhook_secret
+    if not webhook_secret:
+        logger.error("Conference '%s' has no webhook secret configured", conference_slug)
+        return None
+
+    try:
+        return stripe.Webhook.construct_event(payload, sig_header, str(webhook_secret), tolerance=tolerance)
+    except stripe.SignatureVerificationError, ValueError:
+        logger.warning("Invalid Stripe webhook payload or signature for conference '%s'", conference_slug)
+        return None
+
+
+def _record_event(stripe_event: StripeEvent, *, queue: bool, seen_seconds: int) -> bool:
+    """Persist a verified event with a single insert and add it to the seen-set.
+
+    Args:
+        stripe_event: The unsaved event.
+        queue: Whether the queue worker runs the handler instead of this request.
+        seen_seconds: How long the seen-set remembers the event.
+
+    Returns:
+        ``True`` if this request recorded the event and should run its handler
+        now, ``False`` in queue mode or when the event was already recorded.
+    """
+    if queue:
+        # INSERT ... ON CONFLICT DO NOTHING: a redelivered event is a no-op.
+        StripeEvent.objects.bulk_create([stripe_event], ignore_conflicts=True)
+        recorded = False
+    else:
+        from django_program.registration.services.webhook_queue import retry_at  # noqa: PLC0415
+
+        # Keep the queue worker away while the handler runs here; if it fails,
+        # the worker retries the event once this first backoff has passed.
+        stripe_event.next_attempt_at = retry_at(1)
+        try:
+            # A single INSERT; the unique stripe_id turns a concurrent redelivery
+            # into an IntegrityError instead of a second processing run.
+            with transaction.atomic():
+                stripe_event.save(force_insert=True)
+        except IntegrityError:
+            logger.info("Duplicate Stripe event %s, returning 200", stripe_event.stripe_id)
+            recorded = False
+        else:
+            recorded = True
+    _remember_event(stripe_event.stripe_id, seen_seconds)
+    return recorded
+
+
 @csrf_exempt
 @require_POST
 def stripe_webhook(request: HttpRequest, conference_slug: str) -> HttpResponse:
     """Receive and process Stripe webhook events for a specific conference.
 
     Verifies the event signature against the conference's webhook secret,
-    deduplicates by Stripe event ID, persists the raw event, and dispatches
-    to the registered handler.
+    persists the raw event with a single insert that doubles as the
+    deduplication check, and dispatches to the registered handler.  Events
+    recorded in the last ``webhook_seen_seconds`` are acknowledged from the
+    cache before any of that work.  In queue mode the event is only persisted
+    and the handler runs later in ``manage.py process_stripe_events``.
 
     Always returns HTTP 200 to acknowledge receipt, even when processing
     fails. Errors are logged and captured to ``EventProcessingException``.
@@ -547,42 +673,25 @@ def stripe_webhook(request: HttpRequest, conference_slug: str) -> HttpResponse:
     payload = request.body
     sig_header = request.META.get("HTTP_STRIPE_SIGNATURE", "")
 
-    try:
-        conference = Conference.objects.get(slug=conference_slug, is_active=True)
-    except Conference.DoesNotExist:
-        logger.warning("Webhook received for unknown conference slug: %s", conference_slug)
+    config = get_config()
+    seen_seconds = config.stripe.webhook_seen_seconds
+    if seen_seconds and _recently_seen(payload):
+        logger.info("Duplicate Stripe event acknowledged from the seen-set for conference '%s'", conference_slug)
         return HttpResponse(status=200)
 
-    webhook_secret = conference.stripe_webhook_secret
-    if not webhook_secret:
-        logger.error("Conference '%s' has no webhook secret configured", conference_slug)
-        return HttpResponse(status=200)
-
-    config = get_config()
-    try:
-        event = stripe.Webhook.construct_event(
-            payload,
-            sig_header,
-            str(webhook_secret),
-            tolerance=config.stripe.webhook_tolerance,
-        )
-    except stripe.SignatureVerificationError, ValueError:
-        logger.warning("Invalid Stripe webhook payload or signature for conference '%s'", conference_slug)
+    event = _verified_event(payload, sig_header, conference_slug, config.stripe.webhook_tolerance)
+    if event is None:
         return HttpResponse(status=200)
 
     stripe_id = event["id"]
     kind = event["type"]
 
-    if StripeEvent.objects.filter(stripe_id=stripe_id).exists():
-        logger.info("Duplicate Stripe event %s, returning 200", stripe_id)
-        return HttpResponse(status=200)
-
     customer_id = ""
     data_object = event.get("data", {}).get("object", {})
     if isinstance(data_object, dict):
         customer_id = data_object.get("customer", "") or ""
 
-    stripe_event = StripeEvent.objects.create(
+    stripe_event = StripeEvent(
         stripe_id=stripe_id,
         kind=kind,
         livemode=event.get("livemode", False),
@@ -591,6 +700,9 @@ def stripe_webhook(request: HttpRequest, conference_slug: str) -> HttpResponse:
         api_version=event.get("api_version", ""),
     )
 
+    if not _record_event(stripe_event, queue=config.stripe.webhook_queue, seen_seconds=seen_seconds):
+        return HttpResponse(status=200)
+
     handler_class = registry.get(kind)
     if handler_class is None:
         logger.info("No handler registered for event kind '%s'", kind)
@@ -605,5 +717,7 @@ def stripe_webhook(request: HttpRequest, conference_slug: str) -> HttpResponse:
             stripe_id,
             kind,
         )
+        stripe_event.attempts = 1
+        stripe_event.save(update_fields=["attempts"])
 
     return HttpResponse(status=200)
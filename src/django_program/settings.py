@@ -23,13 +23,24 @@ from django.test.signals import setting_changed
 
 @dataclass(frozen=True, slots=True)
 class StripeConfig:
-    """Stripe payment gateway configuration."""
+    """Stripe payment gateway configuration.
+
+    With ``webhook_queue`` enabled the webhook view only records events, and
+    ``manage.py process_stripe_events`` runs their handlers in batches of
+    ``webhook_batch_size``, retrying failures with exponential backoff.
+    """
 
     secret_key: str | None = None
     publishable_key: str | None = None
     webhook_secret: str | None = None
     api_version: str = "2024-12-18"
     webhook_tolerance: int = 300
+    webhook_queue: bool = False
+    webhook_batch_size: int = 50
+    webhook_max_attempts: int = 8
+    webhook_retry_seconds: int = 30
+    webhook_kind_limits: dict[str, int] = field(default_factory=dict)
+    webhook_seen_seconds: int = 300
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,6 +65,22 @@ class PSFSponsorConfig:
     flight: str = "sponsors"
 
 
+@dataclass(frozen=True, slots=True)
+class WaitingRoomConfig:
+    """Admission queue in front of the cart and checkout for limited tickets.
+
+    When enabled, at most ``concurrency`` buyers per limited ticket type are
+    admitted to add it to a cart or check out at once; everyone else waits
+    in a FIFO queue kept in the ``cache_alias`` cache.
+    """
+
+    enabled: bool = False
+    concurrency: int = 25
+    admission_seconds: int = 600
+    poll_seconds: int = 5
+    cache_alias: str = "default"
+
+
 @dataclass(frozen=True, slots=True)
 class FeaturesConfig:
     """Feature toggles for enabling/disabling django-program modules and UIs.
@@ -86,8 +113,18 @@ class ProgramConfig:
     pretalx: PretalxConfig = field(default_factory=PretalxConfig)
     psf_sponsors: PSFSponsorConfig = field(default_factory=PSFSponsorConfig)
     features: FeaturesConfig = field(default_factory=FeaturesConfig)
+    waiting_room: WaitingRoomConfig = field(default_factory=WaitingRoomConfig)
     cart_expiry_minutes: int = 30
     pending_order_expiry_minutes: int = 15
+    hold_sweep_batch_size: int = 500
+    hold_sweep_interval_seconds: int = 0
+    dashboard_cache_seconds: int = 300
+    dashboard_stale_seconds: int = 0
+    checkin_card_cache_seconds: int = 60
+    checkin_change_overlap_seconds: int = 60
+    schedule_cache_seconds: int = 3600
+    badge_render_workers: int = 0
+    badge_batch_size: int = 100
     order_reference_prefix: str = "ORD"
     currency: str = "USD"
     currency_symbol: str = "$"
@@ -114,6 +151,7 @@ def get_config() -> ProgramConfig:
     pretalx_data = raw_data.pop("pretalx", {})
     psf_sponsors_data = raw_data.pop("psf_sponsors", {})
     features_data = raw_data.pop("features", {})
+    waiting_room_data = raw_data.pop("waiting_room", {})
     if not isinstance(stripe_data, Mapping):
         msg = "DJANGO_PROGRAM['stripe'] must be a mapping (dict-like object)"
         raise TypeError(msg)
@@ -126,26 +164,52 @@ def get_config() -> ProgramConfig:
     if not isinstance(features_data, Mapping):
         msg = "DJANGO_PROGRAM['features'] must be a mapping (dict-like object)"
         raise TypeError(msg)
+    if not isinstance(waiting_room_data, Mapping):
+        msg = "DJANGO_PROGRAM['waiting_room'] must be a mapping (dict-like object)"
+        raise TypeError(msg)
 
     config = ProgramConfig(
         stripe=StripeConfig(**dict(stripe_data)),
         pretalx=PretalxConfig(**dict(pretalx_data)),
         psf_sponsors=PSFSponsorConfig(**dict(psf_sponsors_data)),
         features=FeaturesConfig(**dict(features_data)),
+        waiting_room=WaitingRoomConfig(**dict(waiting_room_data)),
         **raw_data,
     )
     _validate_program_config(config)
     return config
 
 
+# Integer settings validated by name in ``_validate_program_config``.
+_POSITIVE_INT_SETTINGS = (
+    "cart_expiry_minutes",
+    "pending_order_expiry_minutes",
+    "hold_sweep_batch_size",
+    "badge_batch_size",
+)
+_NON_NEGATIVE_INT_SETTINGS = (
+    "hold_sweep_interval_seconds",
+    "dashboard_cache_seconds",
+    "dashboard_stale_seconds",
+    "checkin_card_cache_seconds",
+    "checkin_change_overlap_seconds",
+    "schedule_cache_seconds",
+    "badge_render_workers",
+)
+
+
 def _validate_program_config(config: ProgramConfig) -> None:
     """Validate high-impact configuration values with clear error messages."""
-    if not isinstance(config.cart_expiry_minutes, int) or config.cart_expiry_minutes <= 0:
-        msg = "DJANGO_PROGRAM['cart_expiry_minutes'] must be a positive integer"
-        raise ValueError(msg)
-    if not isinstance(config.pending_order_expiry_minutes, int) or config.pending_order_expiry_minutes <= 0:
-        msg = "DJANGO_PROGRAM['pending_order_expiry_minutes'] must be a positive integer"
-        raise ValueError(msg)
+    for name in _POSITIVE_INT_SETTINGS:
+        value = getattr(config, name)
+        if not isinstance(value, int) or value <= 0:
+            msg = f"DJANGO_PROGRAM['{name}'] must be a positive integer"
+            raise ValueError(msg)
+    for name in _NON_NEGATIVE_INT_SETTINGS:
+        value = getattr(config, name)
+        if not isinstance(value, int) or value < 0:
+            msg = f"DJANGO_PROGRAM['{name}'] must be a non-negative integer"
+            raise ValueError(msg)
     if not isinstance(config.currency, str) or not config.currency.strip():
         msg = "DJANGO_PROGRAM['currency'] must be a non-empty string"
         raise ValueError(msg)
@@ -165,6 +229,41 @@ def _validate_program_config(config: ProgramConfig) -> None:
     if not isinstance(threshold, (int, float)) or not 0 <= float(threshold) <= 1:
         msg = "DJANGO_PROGRAM['pretalx']['schedule_delete_guard_max_fraction_removed'] must be between 0 and 1"
         raise ValueError(msg)
+    _validate_stripe_config(config.stripe)
+    _validate_waiting_room_config(config.waiting_room)
+
+
+def _validate_stripe_config(config: StripeConfig) -> None:
+    """Validate the webhook queue and deduplication settings."""
+    if not isinstance(config.webhook_queue, bool):
+        msg = "DJANGO_PROGRAM['stripe']['webhook_queue'] must be a boolean"
+        raise TypeError(msg)
+    for name in ("webhook_batch_size", "webhook_max_attempts", "webhook_retry_seconds"):
+        value = getattr(config, name)
+        if not isinstance(value, int) or value <= 0:
+            msg = f"DJANGO_PROGRAM['stripe']['{name}'] must be a positive integer"
+            raise ValueError(msg)
+    if not isinstance(config.webhook_seen_seconds, int) or config.webhook_seen_seconds < 0:
+        msg = "DJANGO_PROGRAM['stripe']['webhook_seen_seconds'] must be a non-negative integer"
+        raise ValueError(msg)
+    limits = config.webhook_kind_limits
+    if not isinstance(limits, Mapping) or not all(
+        isinstance(kind, str) and isinstance(limit, int) and limit > 0 for kind, limit in limits.items()
+    ):
+        msg = "DJANGO_PROGRAM['stripe']['webhook_kind_limits'] must map event kinds to positive integers"
+        raise ValueError(msg)
+
+
+def _validate_waiting_room_config(config: WaitingRoomConfig) -> None:
+    """Validate the waiting-room settings."""
+    if not isinstance(config.enabled, bool):
+        msg = "DJANGO_PROGRAM['waiting_room']['enabled'] must be a boolean"
+        raise TypeError(msg)
+    for name in ("concurrency", "admission_seconds", "poll_seconds"):
+        value = getattr(config, name)
+        if not isinstance(value, int) or value <= 0:
+            msg = f"DJANGO_PROGRAM['waiting_room']['{name}'] must be a positive integer"
+            raise ValueError(msg)
 
 
 def _clear_config_cache(*, setting: str, **kwargs: object) -> None:  # noqa: ARG001
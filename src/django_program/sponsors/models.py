@@ -10,7 +10,7 @@ from django.utils.text import slugify
 if TYPE_CHECKING:
     from decimal import Decimal
 
-from django_program.pretalx.models import AbstractOverride
+from django_program.pretalx.models import AbstractOverride, override_or_field
 
 
 class SponsorLevel(models.Model):
@@ -57,6 +57,29 @@ class SponsorLevel(models.Model):
         super().save(*args, **kwargs)
 
 
+class SponsorQuerySet(models.QuerySet):
+    """Queryset for sponsors with batched override resolution."""
+
+    def with_overrides(self) -> SponsorQuerySet:
+        """Join each sponsor's override and levels and annotate its effective values.
+
+        The ``effective_*`` properties, including ``effective_level``, read
+        the joined rows without further queries.  ``resolved_name``,
+        ``resolved_contact_email``, ``resolved_is_active`` and
+        ``resolved_level_id`` carry the effective values in SQL, for
+        filtering and ordering.
+
+        Returns:
+            The annotated queryset.
+        """
+        return self.select_related("level", "override__override_level").annotate(
+            resolved_name=override_or_field("name"),
+            resolved_contact_email=override_or_field("contact_email"),
+            resolved_is_active=override_or_field("is_active", blank=False),
+            resolved_level_id=override_or_field("level", blank=False),
+        )
+
+
 class Sponsor(models.Model):
     """A sponsoring organization for a conference.
 
@@ -97,6 +120,8 @@ class Sponsor(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SponsorQuerySet.as_manager()
+
     class Meta:
         ordering = ["level__order", "name"]
         unique_together = [("conference", "slug")]
@@ -7,6 +7,7 @@ with generated voucher codes after payment, and handling the webhook callback.
 
 import datetime
 import logging
+from dataclasses import replace
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
@@ -23,12 +24,17 @@ from django_program.settings import get_config
 from django_program.sponsors.models import BulkPurchase, BulkPurchaseVoucher
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from django.contrib.auth.models import AbstractBaseUser
 
     from django_program.sponsors.models import Sponsor
 
 logger = logging.getLogger(__name__)
 
+# Voucher codes generated per transaction when fulfilling a bulk purchase.
+_FULFILL_CHUNK_SIZE = 500
+
 
 def _parse_datetime(value: object) -> datetime.datetime | None:
     """Coerce a JSON-serialized datetime value to a ``datetime`` object.
@@ -55,6 +61,77 @@ class BulkPurchaseError(Exception):
     """Raised when a bulk purchase operation fails."""
 
 
+def _fulfillment_config(bp: BulkPurchase) -> VoucherBulkConfig:
+    """Validate a locked bulk purchase and build its voucher configuration.
+
+    Args:
+        bp: The bulk purchase, locked with ``select_for_update``.
+
+    Returns:
+        The voucher configuration for the purchase's codes; ``count`` is the
+        full quantity and is narrowed per chunk by the caller.
+
+    Raises:
+        BulkPurchaseError: If the purchase cannot be fulfilled in its current
+            state or its ``voucher_config`` is incomplete.
+    """
+    if bp.payment_status not in (
+        BulkPurchase.PaymentStatus.APPROVED,
+        BulkPurchase.PaymentStatus.PROCESSING,
+        BulkPurchase.PaymentStatus.PAID,
+    ):
+        msg = f"Cannot fulfill BulkPurchase #{bp.pk} in '{bp.get_payment_status_display()}' state."
+        raise BulkPurchaseError(msg)
+
+    if bp.payment_status == BulkPurchase.PaymentStatus.APPROVED and bp.total_amount > Decimal(0):
+        msg = (
+            f"Cannot fulfill BulkPurchase #{bp.pk}: payment must be completed first. "
+            f"Only comp deals (total_amount=0) can be fulfilled from APPROVED state."
+        )
+        raise BulkPurchaseError(msg)
+
+    vc = bp.voucher_config if isinstance(bp.voucher_config, dict) else {}
+
+    if not vc.get("voucher_type") or vc.get("discount_value") is None:
+        msg = (
+            f"Cannot fulfill BulkPurchase #{bp.pk}: voucher_config is missing "
+            f"required fields (voucher_type, discount_value). "
+            f"Configure these via the manage dashboard before fulfillment."
+        )
+        raise BulkPurchaseError(msg)
+    voucher_type = str(vc.get("voucher_type", Voucher.VoucherType.COMP))
+    discount_value = Decimal(str(vc.get("discount_value", 0)))
+    max_uses = int(vc.get("max_uses", 1))
+
+    sponsor_slug = (bp.sponsor.slug or "").upper() if bp.sponsor else ""
+    prefix = str(vc.get("prefix", f"BULK-{sponsor_slug}-" if sponsor_slug else "BULK-"))
+
+    valid_from = _parse_datetime(vc.get("valid_from"))
+    valid_until = _parse_datetime(vc.get("valid_until"))
+
+    applicable_ticket_types = None
+    if bp.ticket_type_id is not None:
+        applicable_ticket_types = TicketType.objects.filter(pk=bp.ticket_type_id)
+
+    applicable_addons = None
+    if bp.addon_id is not None:
+        applicable_addons = AddOn.objects.filter(pk=bp.addon_id)
+
+    return VoucherBulkConfig(
+        conference=bp.conference,
+        prefix=prefix,
+        count=bp.quantity,
+        voucher_type=voucher_type,
+        discount_value=discount_value,
+        max_uses=max_uses,
+        valid_from=valid_from,
+        valid_until=valid_until,
+        unlocks_hidden_tickets=bool(vc.get("unlocks_hidden_tickets", False)),
+        applicable_ticket_types=applicable_ticket_types,
+        applicable_addons=applicable_addons,
+    )
+
+
 class BulkPurchaseService:
     """Stateless service for sponsor bulk voucher purchase operations.
 
@@ -211,8 +288,11 @@ class BulkPurchaseService:
         return str(session.url)
 
     @staticmethod
-    @transaction.atomic
-    def fulfill_bulk_purchase(bulk_purchase: BulkPurchase) -> list[Voucher]:
+    def fulfill_bulk_purchase(
+        bulk_purchase: BulkPurchase,
+        *,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list[Voucher]:
         """Generate voucher codes for a paid bulk purchase.
 
         Idempotent: returns an empty list if the purchase is already fulfilled
@@ -220,8 +300,15 @@ class BulkPurchaseService:
         the voucher service's ``generate_voucher_codes()`` and creates
         ``BulkPurchaseVoucher`` links.
 
+        Codes are generated in chunks of ``_FULFILL_CHUNK_SIZE``, each in its
+        own short transaction that locks the purchase, so a 10,000-code order
+        neither holds one long transaction nor builds every voucher in memory
+        at once.  An interrupted run resumes where it stopped, because every
+        chunk only tops the purchase up to its quantity.
+
         Args:
             bulk_purchase: The bulk purchase to fulfill.
+            progress: Called with ``(generated, quantity)`` after each chunk.
 
         Returns:
             List of newly created ``Voucher`` instances, or an empty list
@@ -231,75 +318,35 @@ class BulkPurchaseService:
             BulkPurchaseError: If the purchase is in a state that cannot be
                 fulfilled (e.g. PENDING, FAILED, REFUNDED).
         """
-        bp = BulkPurchase.objects.select_for_update().get(pk=bulk_purchase.pk)
-
-        if bp.is_fulfilled and bp.payment_status == BulkPurchase.PaymentStatus.PAID:
-            logger.info("BulkPurchase #%s already fulfilled, skipping", bp.pk)
-            return []
-
-        if bp.payment_status not in (
-            BulkPurchase.PaymentStatus.APPROVED,
-            BulkPurchase.PaymentStatus.PROCESSING,
-            BulkPurchase.PaymentStatus.PAID,
-        ):
-            msg = f"Cannot fulfill BulkPurchase #{bp.pk} in '{bp.get_payment_status_display()}' state."
-            raise BulkPurchaseError(msg)
-
-        if bp.payment_status == BulkPurchase.PaymentStatus.APPROVED and bp.total_amount > Decimal(0):
-            msg = (
-                f"Cannot fulfill BulkPurchase #{bp.pk}: payment must be completed first. "
-                f"Only comp deals (total_amount=0) can be fulfilled from APPROVED state."
-            )
-            raise BulkPurchaseError(msg)
-
-        vc = bp.voucher_config if isinstance(bp.voucher_config, dict) else {}
+        with transaction.atomic():
+            bp = BulkPurchase.objects.select_for_update().get(pk=bulk_purchase.pk)
+            if bp.is_fulfilled and bp.payment_status == BulkPurchase.PaymentStatus.PAID:
+                logger.info("BulkPurchase #%s already fulfilled, skipping", bp.pk)
+                return []
+            config = _fulfillment_config(bp)
 
-        if not vc.get("voucher_type") or vc.get("discount_value") is None:
-            msg = (
-                f"Cannot fulfill BulkPurchase #{bp.pk}: voucher_config is missing "
-                f"required fields (voucher_type, discount_value). "
-                f"Configure these via the manage dashboard before fulfillment."
+        vouchers: list[Voucher] = []
+        while True:
+            with transaction.atomic():
+                bp = BulkPurchase.objects.select_for_update().get(pk=bp.pk)
+                generated = bp.vouchers_generated
+                remaining = bp.quantity - generated
+                if remaining <= 0:
+                    bp.payment_status = BulkPurchase.PaymentStatus.PAID
+                    bp.save(update_fields=["payment_status", "updated_at"])
+                    break
+                chunk = generate_voucher_codes(replace(config, count=min(remaining, _FULFILL_CHUNK_SIZE)))
+                links = [BulkPurchaseVoucher(bulk_purchase=bp, voucher=v) for v in chunk]
+                BulkPurchaseVoucher.objects.bulk_create(links)
+            vouchers.extend(chunk)
+            logger.info(
+                "BulkPurchase #%s: generated %d of %d voucher codes",
+                bp.pk,
+                generated + len(chunk),
+                bp.quantity,
             )
-            raise BulkPurchaseError(msg)
-        voucher_type = str(vc.get("voucher_type", Voucher.VoucherType.COMP))
-        discount_value = Decimal(str(vc.get("discount_value", 0)))
-        max_uses = int(vc.get("max_uses", 1))
-
-        sponsor_slug = (bp.sponsor.slug or "").upper() if bp.sponsor else ""
-        prefix = str(vc.get("prefix", f"BULK-{sponsor_slug}-" if sponsor_slug else "BULK-"))
-
-        valid_from = _parse_datetime(vc.get("valid_from"))
-        valid_until = _parse_datetime(vc.get("valid_until"))
-
-        applicable_ticket_types = None
-        if bp.ticket_type_id is not None:
-            applicable_ticket_types = TicketType.objects.filter(pk=bp.ticket_type_id)
-
-        applicable_addons = None
-        if bp.addon_id is not None:
-            applicable_addons = AddOn.objects.filter(pk=bp.addon_id)
-
-        config = VoucherBulkConfig(
-            conference=bp.conference,
-            prefix=prefix,
-            count=bp.quantity,
-            voucher_type=voucher_type,
-            discount_value=discount_value,
-            max_uses=max_uses,
-            valid_from=valid_from,
-            valid_until=valid_until,
-            unlocks_hidden_tickets=bool(vc.get("unlocks_hidden_tickets", False)),
-            applicable_ticket_types=applicable_ticket_types,
-            applicable_addons=applicable_addons,
-        )
-
-        vouchers = generate_voucher_codes(config)
-
-        links = [BulkPurchaseVoucher(bulk_purchase=bp, voucher=v) for v in vouchers]
-        BulkPurchaseVoucher.objects.bulk_create(links)
-
-        bp.payment_status = BulkPurchase.PaymentStatus.PAID
-        bp.save(update_fields=["payment_status", "updated_at"])
+            if progress is not None:
+                progress(generated + len(chunk), bp.quantity)
 
         sponsor_name = bp.sponsor.name if bp.sponsor else "No sponsor"
         logger.info(
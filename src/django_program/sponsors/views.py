@@ -169,12 +169,14 @@ class SponsorPortalMixin(LoginRequiredMixin):
         if not user_email:
             raise PermissionDenied("Your account has no email address configured.")
 
-        sponsors = Sponsor.objects.filter(conference=self.conference, is_active=True).select_related(
-            "level", "override"
+        sponsor = (
+            Sponsor.objects.filter(conference=self.conference, is_active=True)
+            .with_overrides()
+            .filter(resolved_contact_email__iexact=user_email)
+            .first()
         )
-        for sponsor in sponsors:
-            if sponsor.effective_contact_email.lower() == user_email.lower():
-                return sponsor
+        if sponsor is not None:
+            return sponsor
 
         raise PermissionDenied("You do not have access to any sponsor portal for this conference.")
 
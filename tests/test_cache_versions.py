@@ -0,0 +1,35 @@
+"""Tests for the shared cache version tokens."""
+
+import pytest
+from django.core.cache import cache
+
+from django_program.cache_versions import bump_version, current_version
+
+KEY = "django_program:test:version"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.delete(KEY)
+    yield
+    cache.delete(KEY)
+
+
+def test_current_version_is_created_once():
+    version = current_version(KEY)
+
+    assert version
+    assert current_version(KEY) == version
+
+
+@pytest.mark.django_db
+def test_bump_version_replaces_the_token_now_and_on_commit(django_capture_on_commit_callbacks):
+    version = current_version(KEY)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        bump_version(KEY)
+        bumped = current_version(KEY)
+
+    assert bumped != version
+    assert len(callbacks) == 1
+    assert current_version(KEY) not in {version, bumped}
@@ -1,12 +1,15 @@
 """Tests for the admin reports dashboard and report views."""
 
+import gzip
 from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 from django.contrib.auth.models import Group, Permission, User
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from model_bakery import baker
@@ -291,6 +294,11 @@ def _url(name: str, conference: Conference) -> str:
     return reverse(f"manage:{name}", kwargs={"conference_slug": conference.slug})
 
 
+def _csv_content(resp) -> str:
+    """Consume a streaming CSV export response and return its text."""
+    return b"".join(resp.streaming_content).decode()
+
+
 # ---------------------------------------------------------------------------
 # Permission tests
 # ---------------------------------------------------------------------------
@@ -484,7 +492,7 @@ class TestAttendeeManifestExport:
     def test_csv_has_header_row(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-attendee-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         header = lines[0]
         assert "Username" in header
@@ -496,7 +504,7 @@ class TestAttendeeManifestExport:
     def test_csv_contains_attendee_rows(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-attendee-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 2 attendees
         assert len(lines) == 3
@@ -505,11 +513,66 @@ class TestAttendeeManifestExport:
         conference = report_data["conference"]
         url = _url("report-attendee-export", conference) + "?checked_in=yes"
         resp = client_logged_in_super.get(url)
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 1 checked-in attendee
         assert len(lines) == 2
 
+    def test_csv_is_streamed(self, client_logged_in_super, report_data):
+        conference = report_data["conference"]
+        resp = client_logged_in_super.get(_url("report-attendee-export", conference))
+        assert resp.streaming
+        assert "Content-Encoding" not in resp
+        assert resp["Vary"] == "Accept-Encoding, Cookie"
+
+    def test_csv_ticket_type_lists_only_ticket_line_items(self, client_logged_in_super, report_data):
+        conference = report_data["conference"]
+        resp = client_logged_in_super.get(_url("report-attendee-export", conference) + "?checked_in=yes")
+        row = _csv_content(resp).strip().split("\n")[1]
+        assert "General" in row
+        assert "Tutorial" not in row
+
+    def test_csv_gzip_when_accepted(self, client_logged_in_super, report_data):
+        conference = report_data["conference"]
+        resp = client_logged_in_super.get(_url("report-attendee-export", conference), HTTP_ACCEPT_ENCODING="gzip")
+        assert resp["Content-Encoding"] == "gzip"
+        content = gzip.decompress(b"".join(resp.streaming_content)).decode()
+        assert content.startswith("Username,Email,")
+        assert len(content.strip().split("\n")) == 3
+
+    def test_csv_query_count_does_not_grow_with_attendees(self, client_logged_in_super, report_data, ticket_general):
+        conference = report_data["conference"]
+        url = _url("report-attendee-export", conference)
+
+        def export_queries():
+            resp = client_logged_in_super.get(url)
+            with CaptureQueriesContext(connection) as ctx:
+                _csv_content(resp)
+            return len(ctx.captured_queries)
+
+        baseline = export_queries()
+        for i in range(3):
+            user = User.objects.create_user(username=f"extra{i}", password="password")
+            order = Order.objects.create(
+                conference=conference,
+                user=user,
+                status=Order.Status.PAID,
+                subtotal=Decimal("100.00"),
+                total=Decimal("100.00"),
+                reference=f"ORD-X{i}",
+            )
+            OrderLineItem.objects.create(
+                order=order,
+                description="General",
+                quantity=1,
+                unit_price=Decimal("100.00"),
+                line_total=Decimal("100.00"),
+                ticket_type=ticket_general,
+            )
+            Attendee.objects.create(user=user, conference=conference, order=order)
+
+        assert export_queries() == baseline
+
 
 # ---------------------------------------------------------------------------
 # Inventory Report
@@ -575,7 +638,7 @@ class TestInventoryReportExport:
     def test_csv_has_ticket_and_addon_rows(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-inventory-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 2 tickets + 1 addon = 4
         assert len(lines) == 4
@@ -640,7 +703,7 @@ class TestVoucherUsageExport:
     def test_csv_has_header_and_rows(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-voucher-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 2 vouchers
         assert len(lines) == 3
@@ -648,7 +711,7 @@ class TestVoucherUsageExport:
     def test_csv_header_fields(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-voucher-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         header = content.split("\n")[0]
         assert "Code" in header
         assert "Redemption Rate" in header
@@ -718,7 +781,7 @@ class TestDiscountEffectivenessExport:
     def test_csv_has_header_and_rows(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-discount-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 1 condition
         assert len(lines) == 2
@@ -726,7 +789,7 @@ class TestDiscountEffectivenessExport:
     def test_csv_header_fields(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-discount-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         header = content.split("\n")[0]
         assert "Name" in header
         assert "Type" in header
@@ -789,7 +852,7 @@ class TestCSVInjectionSafety:
             completed_registration=False,
         )
         resp = client_logged_in_super.get(_url("report-attendee-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         # The leading '=' should be escaped with a preceding apostrophe
         assert "'=CMD" in content
 
@@ -861,7 +924,7 @@ class TestSalesByDateExport:
     def test_csv_header_fields(self, client_logged_in_super, sales_data):
         conference = sales_data["conference"]
         resp = client_logged_in_super.get(_url("report-sales-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         header = content.split("\n")[0]
         assert "Date" in header
         assert "Orders" in header
@@ -870,7 +933,7 @@ class TestSalesByDateExport:
     def test_csv_contains_data_rows(self, client_logged_in_super, sales_data):
         conference = sales_data["conference"]
         resp = client_logged_in_super.get(_url("report-sales-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + at least 1 data row from the paid order
         assert len(lines) >= 2
@@ -939,7 +1002,7 @@ class TestCreditNotesExport:
     def test_csv_has_header_and_rows(self, client_logged_in_super, credit_data):
         conference = credit_data["conference"]
         resp = client_logged_in_super.get(_url("report-credit-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 1 credit
         assert len(lines) == 2
@@ -947,7 +1010,7 @@ class TestCreditNotesExport:
     def test_csv_header_fields(self, client_logged_in_super, credit_data):
         conference = credit_data["conference"]
         resp = client_logged_in_super.get(_url("report-credit-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         header = content.split("\n")[0]
         assert "User" in header
         assert "Amount" in header
@@ -1033,7 +1096,7 @@ class TestSpeakerRegistrationExport:
     def test_csv_header_fields(self, client_logged_in_super, speaker_data):
         conference = speaker_data["conference"]
         resp = client_logged_in_super.get(_url("report-speaker-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         header = content.split("\n")[0]
         assert "Name" in header
         assert "Email" in header
@@ -1042,7 +1105,7 @@ class TestSpeakerRegistrationExport:
     def test_csv_has_data_rows(self, client_logged_in_super, speaker_data):
         conference = speaker_data["conference"]
         resp = client_logged_in_super.get(_url("report-speaker-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + 2 speakers
         assert len(lines) == 3
@@ -1117,7 +1180,7 @@ class TestReconciliationExport:
     def test_csv_contains_summary_rows(self, client_logged_in_super, reconciliation_data):
         conference = reconciliation_data["conference"]
         resp = client_logged_in_super.get(_url("report-reconciliation-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         assert "Total Sales" in content
         assert "Total Payments" in content
         assert "Discrepancy" in content
@@ -1180,7 +1243,7 @@ class TestRegistrationFlowExport:
     def test_csv_header_fields(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-registration-flow-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         header = content.split("\n")[0]
         assert "Date" in header
         assert "Registrations" in header
@@ -1190,7 +1253,7 @@ class TestRegistrationFlowExport:
     def test_csv_has_data_rows(self, client_logged_in_super, report_data):
         conference = report_data["conference"]
         resp = client_logged_in_super.get(_url("report-registration-flow-export", conference))
-        content = resp.content.decode()
+        content = _csv_content(resp)
         lines = content.strip().split("\n")
         # header + at least 1 row (attendees created today)
         assert len(lines) >= 2
@@ -0,0 +1,258 @@
+"""Tests for the cached dashboard snapshots and their signal-driven invalidation."""
+
+import threading
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import Permission, User
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.manage import snapshots
+from django_program.manage.snapshots import data_version, get_dashboard_snapshot, permissions_version
+from django_program.manage.views import ConferencePermissionMixin
+from django_program.pretalx.models import PretalxSyncState, Talk
+from django_program.pretalx.signals import pretalx_synced
+from django_program.pretalx.sync import PretalxSyncService
+from django_program.registration.models import Order, Payment
+from django_program.registration.services.hold_expiry import expire_stale_holds
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def conference(db):
+    return Conference.objects.create(
+        name="Snapshot Conf",
+        slug="snapshot-conf",
+        start_date=date(2027, 5, 1),
+        end_date=date(2027, 5, 3),
+        timezone="UTC",
+    )
+
+
+@pytest.fixture
+def client_logged_in_super(client, db):
+    user = User.objects.create_superuser(username="admin", password="password", email="admin@test.com")
+    client.force_login(user)
+    return client
+
+
+class _Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"calls": self.calls}
+
+
+def _order(conference, **kwargs):
+    user = User.objects.create_user(username=f"buyer-{Order.objects.count()}", password="x")
+    return Order.objects.create(conference=conference, user=user, reference=f"SNAP-{user.pk}", **kwargs)
+
+
+@pytest.mark.django_db
+def test_snapshot_is_computed_once_per_data_version(conference):
+    compute = _Counter()
+
+    first = get_dashboard_snapshot(conference, "reports", compute)
+    second = get_dashboard_snapshot(conference, "reports", compute)
+
+    assert first == second == {"calls": 1}
+    assert compute.calls == 1
+
+
+@pytest.mark.django_db
+def test_model_changes_invalidate_the_snapshot(conference):
+    compute = _Counter()
+    get_dashboard_snapshot(conference, "reports", compute)
+
+    order = _order(conference)
+    assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 2}
+
+    Payment.objects.create(order=order, method=Payment.Method.COMP, amount=Decimal("0.00"))
+    assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 3}
+
+    Talk.objects.create(conference=conference, pretalx_code="SNAP1", title="Talk")
+    assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 4}
+
+
+@pytest.mark.django_db
+def test_order_saves_outside_the_dashboard_fields_keep_the_snapshot(conference):
+    order = Order.objects.get(pk=_order(conference).pk)
+    version = data_version(conference.pk)
+
+    order.billing_name = "Ada Lovelace"
+    order.save()
+    order.utm_source = "newsletter"
+    order.save(update_fields=["utm_source", "updated_at"])
+    order.save(update_fields=["status", "updated_at"])
+    assert data_version(conference.pk) == version
+
+    order.status = Order.Status.PAID
+    order.save(update_fields=["status", "updated_at"])
+    assert data_version(conference.pk) != version
+
+
+@pytest.mark.django_db
+def test_changes_to_other_conferences_keep_the_snapshot(conference):
+    other = Conference.objects.create(
+        name="Other", slug="other-conf", start_date=date(2027, 6, 1), end_date=date(2027, 6, 2), timezone="UTC"
+    )
+    compute = _Counter()
+    get_dashboard_snapshot(conference, "reports", compute)
+
+    _order(other)
+
+    assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 1}
+
+
+@pytest.mark.django_db
+def test_pretalx_sync_invalidates_the_snapshot(conference):
+    version = data_version(conference.pk)
+
+    pretalx_synced.send(sender=PretalxSyncService, conference=conference, entity="talks")
+
+    assert data_version(conference.pk) != version
+
+
+@pytest.mark.django_db
+def test_hold_sweep_invalidates_the_snapshot(conference):
+    _order(conference, status=Order.Status.PENDING, hold_expires_at=timezone.now() - timedelta(minutes=1))
+    compute = _Counter()
+    get_dashboard_snapshot(conference, "reports", compute)
+
+    result = expire_stale_holds()
+
+    assert result.conference_ids == {conference.pk}
+    assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 2}
+
+
+@pytest.mark.django_db
+def test_zero_cache_seconds_disables_snapshots(conference):
+    compute = _Counter()
+
+    with override_settings(DJANGO_PROGRAM={"dashboard_cache_seconds": 0}):
+        get_dashboard_snapshot(conference, "reports", compute)
+        get_dashboard_snapshot(conference, "reports", compute)
+
+    assert compute.calls == 2
+
+
+@pytest.mark.django_db
+def test_stale_snapshot_is_served_while_revalidating(conference):
+    compute = _Counter()
+
+    with override_settings(DJANGO_PROGRAM={"dashboard_stale_seconds": 60}):
+        get_dashboard_snapshot(conference, "reports", compute)
+        _order(conference)
+        with patch.object(snapshots, "_refresh_in_background") as refresh:
+            assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 1}
+
+    refresh.assert_called_once()
+    assert compute.calls == 1
+
+
+@pytest.mark.django_db
+def test_background_refresh_stores_the_new_payload(conference):
+    compute = _Counter()
+    get_dashboard_snapshot(conference, "reports", compute)
+    _order(conference)
+
+    thread = threading.Thread(target=snapshots._refresh, args=(conference.pk, "reports", compute, 300))
+    thread.start()
+    thread.join()
+
+    assert get_dashboard_snapshot(conference, "reports", compute) == {"calls": 2}
+
+
+@pytest.mark.django_db
+def test_dashboard_view_reflects_new_rows(client_logged_in_super, conference):
+    url = reverse("manage:dashboard", kwargs={"conference_slug": conference.slug})
+    assert client_logged_in_super.get(url).context["stats"]["talks"] == 0
+
+    Talk.objects.create(conference=conference, pretalx_code="SNAP2", title="Talk")
+
+    assert client_logged_in_super.get(url).context["stats"]["talks"] == 1
+
+
+@pytest.mark.django_db
+def test_reports_dashboard_is_served_from_the_snapshot(client_logged_in_super, conference):
+    url = reverse("manage:reports-dashboard", kwargs={"conference_slug": conference.slug})
+    client_logged_in_super.get(url)
+
+    with patch("django_program.manage.views_reports._reports_dashboard_payload") as payload:
+        resp = client_logged_in_super.get(url)
+
+    payload.assert_not_called()
+    assert resp.context["attendee_summary"]["total"] == 0
+
+
+def _perm(codename):
+    return Permission.objects.get(content_type__app_label="program_conference", codename=codename)
+
+
+@pytest.mark.django_db
+def test_sidebar_is_served_from_the_snapshot(client_logged_in_super, conference):
+    url = reverse("manage:dashboard", kwargs={"conference_slug": conference.slug})
+    client_logged_in_super.get(url)
+
+    with patch.object(ConferencePermissionMixin, "_get_last_synced") as last_synced:
+        resp = client_logged_in_super.get(url)
+
+    last_synced.assert_not_called()
+    assert resp.context["submission_type_nav"] == []
+
+
+@pytest.mark.django_db
+def test_sync_refreshes_the_sidebar(client_logged_in_super, conference):
+    url = reverse("manage:dashboard", kwargs={"conference_slug": conference.slug})
+    assert client_logged_in_super.get(url).context["last_synced"] is None
+
+    PretalxSyncState.objects.create(conference=conference, endpoint="talks", checked_at=timezone.now())
+    Talk.objects.create(conference=conference, pretalx_code="SNAP3", title="Talk", submission_type="Talk")
+
+    resp = client_logged_in_super.get(url)
+    assert resp.context["last_synced"] is not None
+    assert resp.context["submission_type_nav"][0]["count"] == 1
+
+
+@pytest.mark.django_db
+def test_sidebar_permissions_are_memoized_per_session(client, conference):
+    user = User.objects.create_user(username="organizer", password="password")
+    user.user_permissions.add(_perm("view_dashboard"))
+    client.force_login(user)
+    url = reverse("manage:dashboard", kwargs={"conference_slug": conference.slug})
+    assert client.get(url).context["user_perms"]["reports"] is False
+
+    with patch.object(ConferencePermissionMixin, "_compute_sidebar_permissions") as compute:
+        client.get(url)
+    compute.assert_not_called()
+
+    user.user_permissions.add(_perm("view_reports"))
+
+    assert client.get(url).context["user_perms"]["reports"] is True
+
+
+@pytest.mark.django_db
+def test_login_does_not_reset_memoized_permissions(client, conference):
+    user = User.objects.create_user(username="organizer", password="password")
+    version = permissions_version()
+
+    client.login(username="organizer", password="password")
+
+    assert permissions_version() == version
+    user.is_superuser = True
+    user.save()
+    assert permissions_version() != version
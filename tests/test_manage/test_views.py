@@ -18,6 +18,7 @@ from django_program.conference.models import Conference, Section
 from django_program.manage import views as views_module
 from django_program.manage.apps import DjangoProgramManageConfig
 from django_program.manage.forms import AddOnForm, RoomForm, TicketTypeForm
+from django_program.manage.reports import get_conference_counts
 from django_program.manage.views import (
     AddOnCreateView,
     ImportPretalxStreamView,
@@ -30,7 +31,7 @@ from django_program.manage.views import (
     _unique_section_slug,
     _unique_ticket_type_slug,
 )
-from django_program.pretalx.models import Room, ScheduleSlot, Speaker, Talk
+from django_program.pretalx.models import Room, ScheduleSlot, Speaker, Talk, TalkOverride
 from django_program.programs.models import TravelGrant, TravelGrantMessage
 from django_program.registration.models import AddOn, Order, OrderLineItem, Payment, TicketType, Voucher
 
@@ -381,6 +382,24 @@ class TestDashboardView:
         resp = client_logged_in_super.get(url)
         assert resp.context["stats"]["unscheduled_talks"] >= 1
 
+    def test_conference_counts_in_one_query(
+        self, conference, room, speaker, talk, section, schedule_slot, django_assert_num_queries
+    ):
+        Talk.objects.create(conference=conference, pretalx_code="UNSCHED", title="Unscheduled", state="confirmed")
+
+        with django_assert_num_queries(1):
+            counts = get_conference_counts(conference)
+
+        assert len(counts) == 17
+        assert counts["rooms"] == 1
+        assert counts["speakers"] == 1
+        assert counts["talks"] == 2
+        assert counts["unscheduled_talks"] == 1
+        assert counts["sections"] == 1
+        assert counts["schedule_slots"] == 1
+        assert counts["orders"] == 0
+        assert counts["visa_letters_pending"] == 0
+
 
 # ---------------------------------------------------------------------------
 # ConferenceEditView
@@ -694,6 +713,12 @@ class TestTalkViews:
         assert any(t.title == "My Great Talk" for t in talks)
         assert resp.context["search_query"] == "Great"
 
+    def test_talk_list_search_matches_overridden_title(self, client_logged_in_super, conference, talk):
+        TalkOverride.objects.create(talk=talk, conference=conference, override_title="Keynote Reloaded")
+        url = reverse("manage:talk-list", kwargs={"conference_slug": conference.slug})
+        resp = client_logged_in_super.get(url, {"q": "reloaded"})
+        assert [t.pk for t in resp.context["talks"]] == [talk.pk]
+
     def test_talk_list_state_filter(self, client_logged_in_super, conference, talk):
         url = reverse("manage:talk-list", kwargs={"conference_slug": conference.slug})
         resp = client_logged_in_super.get(url, {"state": "confirmed"})
@@ -1179,7 +1204,7 @@ class TestImportPretalxStreamView:
         mock_service.sync_speakers_iter.return_value = iter([{"count": 10}])
         mock_service.sync_talks.return_value = 20
         mock_service.sync_talks_iter.return_value = iter([{"count": 20}])
-        mock_service.sync_schedule.return_value = (25, 0)
+        mock_service.sync_schedule_iter.return_value = iter([{"count": 25, "unscheduled": 0}])
 
         url = reverse("manage:import-pretalx-stream")
         resp = client_logged_in_super.post(url, {"pretalx_event_slug": "stream-conf"})
@@ -1210,13 +1235,10 @@ class TestImportPretalxStreamView:
     @override_settings(DJANGO_PROGRAM={"pretalx": {"base_url": "https://pretalx.com"}})
     @patch("django_program.manage.views.PretalxSyncService")
     @patch("django_program.manage.views.PretalxClient")
-    def test_stream_sync_step_error_rooms_only(self, mock_client_cls, mock_sync_cls, client_logged_in_super):
-        """When rooms fail but speakers/talks use iter_fn, the ``skipped``
-        variable bug in _stream_sync_entities causes UnboundLocalError.
-
-        Test the rooms-failure case alone (no subsequent iter_fn steps) via
-        _stream_sync_entities where all steps after rooms also use no iter_fn.
-        """
+    def test_stream_sync_step_error_continues_with_iter_steps(
+        self, mock_client_cls, mock_sync_cls, client_logged_in_super
+    ):
+        """A failed step is reported and the remaining iterator steps still run."""
         mock_client_cls.return_value.fetch_event.return_value = {
             "name": "Step Err Conf",
             "date_from": "2027-12-01",
@@ -1224,59 +1246,22 @@ class TestImportPretalxStreamView:
             "timezone": "UTC",
         }
         mock_service = mock_sync_cls.return_value
-        # Rooms fail, speakers iter_fn causes UnboundLocalError on ``skipped``
         mock_service.sync_rooms.side_effect = RuntimeError("rooms failed")
         mock_service.sync_speakers_iter.return_value = iter([{"count": 5}])
         mock_service.sync_talks_iter.return_value = iter([{"count": 10}])
-        mock_service.sync_schedule.return_value = (8, 0)
+        mock_service.sync_schedule_iter.return_value = iter([{"count": 8, "unscheduled": 0}])
 
         url = reverse("manage:import-pretalx-stream")
         resp = client_logged_in_super.post(url, {"pretalx_event_slug": "step-err"})
-        with pytest.raises(UnboundLocalError, match="skipped"):
-            _consume_streaming(resp)
-
-    @override_settings(DJANGO_PROGRAM={"pretalx": {"base_url": "https://pretalx.com"}})
-    @patch("django_program.manage.views.PretalxSyncService")
-    @patch("django_program.manage.views.PretalxClient")
-    def test_stream_sync_step_error_when_all_steps_no_iter_fn(
-        self, mock_client_cls, mock_sync_cls, client_logged_in_super
-    ):
-        """When a sync step fails but all steps use plain sync_fn (no iter_fn),
-        the ``skipped`` variable is always set in the else branch and the
-        stream completes with warning=True."""
-        mock_client_cls.return_value.fetch_event.return_value = {
-            "name": "Step Err Conf2",
-            "date_from": "2027-12-01",
-            "date_to": "2027-12-03",
-            "timezone": "UTC",
-        }
-        mock_service = mock_sync_cls.return_value
-        # All sync_fn succeed except rooms
-        mock_service.sync_rooms.side_effect = RuntimeError("rooms failed")
-        # Patch out iter_fn references: _stream_sync_entities hardcodes iter_fn
-        # for speakers/talks, so we can't easily bypass the bug through the
-        # import stream. Instead, verify the step_error event is emitted by
-        # the rooms-specific path (rooms use iter_fn=None).
-        # The step_error SSE event is emitted by _stream_sync_entities line 557-565
-        # when the except clause is triggered for the rooms step.
-        # Verify that at least one step_error event exists before the skipped bug hits.
-        url = reverse("manage:import-pretalx-stream")
-        resp = client_logged_in_super.post(url, {"pretalx_event_slug": "step-err2"})
-        # Collect events until the stream raises
-        collected = []
-        try:
-            for chunk in resp.streaming_content:
-                raw = chunk if isinstance(chunk, str) else chunk.decode()
-                for line in raw.split("\n"):
-                    line = line.strip()
-                    if line.startswith("data: "):
-                        collected.append(json.loads(line[6:]))
-        except UnboundLocalError:
-            pass
+        events = _consume_streaming(resp)
 
-        step_errors = [e for e in collected if e.get("status") == "step_error"]
-        assert len(step_errors) >= 1
-        assert "rooms" in step_errors[0].get("label", "").lower()
+        step_errors = [e for e in events if e.get("status") == "step_error"]
+        assert len(step_errors) == 1
+        assert "rooms" in step_errors[0]["label"].lower()
+        done_labels = [e["label"] for e in events if e.get("status") == "done" and e["step"] >= 3]
+        assert done_labels == ["Synced 5 speakers", "Synced 10 talks", "Synced 8 schedule slots"]
+        complete = [e for e in events if e.get("status") == "complete"]
+        assert complete[0]["warning"] is True
 
     @override_settings(DJANGO_PROGRAM={"pretalx": {"base_url": "https://pretalx.com"}})
     @patch("django_program.manage.views.PretalxSyncService")
@@ -1299,7 +1284,7 @@ class TestImportPretalxStreamView:
             ]
         )
         mock_service.sync_talks_iter.return_value = iter([{"count": 3}])
-        mock_service.sync_schedule.return_value = (4, 2)
+        mock_service.sync_schedule_iter.return_value = iter([{"count": 4, "unscheduled": 2}])
 
         url = reverse("manage:import-pretalx-stream")
         resp = client_logged_in_super.post(url, {"pretalx_event_slug": "iter-conf"})
@@ -1451,7 +1436,7 @@ class TestSyncPretalxStreamView:
             mock_service.sync_speakers_iter.return_value = iter([{"count": 2}])
             mock_service.sync_talks.return_value = 3
             mock_service.sync_talks_iter.return_value = iter([{"count": 3}])
-            mock_service.sync_schedule.return_value = (4, 0)
+            mock_service.sync_schedule_iter.return_value = iter([{"count": 4, "unscheduled": 0}])
 
             resp = client_logged_in_super.post(url)
             assert resp["Content-Type"] == "text/event-stream"
@@ -1497,7 +1482,7 @@ class TestSyncPretalxStreamView:
         mock_service.sync_speakers_iter.return_value = iter([{"count": 10}])
         mock_service.sync_talks.return_value = 20
         mock_service.sync_talks_iter.return_value = iter([{"count": 20}])
-        mock_service.sync_schedule.return_value = (25, 0)
+        mock_service.sync_schedule_iter.return_value = iter([{"count": 25, "unscheduled": 0}])
 
         url = reverse("manage:sync-pretalx-stream", kwargs={"conference_slug": conference.slug})
         resp = client_logged_in_super.post(url)
@@ -1525,9 +1510,16 @@ class TestSyncPretalxStreamView:
     @override_settings(DJANGO_PROGRAM={"pretalx": {"base_url": "https://pretalx.com"}})
     @patch("django_program.manage.views.PretalxSyncService")
     def test_stream_schedule_only_with_skipped(self, mock_sync_cls, client_logged_in_super, conference):
-        """Schedule sync (no iter_fn) with skipped count works correctly."""
+        """Schedule sync reports the unscheduled count from its iterator."""
         mock_service = mock_sync_cls.return_value
-        mock_service.sync_schedule.return_value = (25, 5)
+        mock_service.sync_schedule_iter.return_value = iter(
+            [
+                {"phase": "fetching"},
+                {"current": 0, "total": 25},
+                {"current": 25, "total": 25},
+                {"count": 25, "unscheduled": 5},
+            ]
+        )
 
         url = reverse("manage:sync-pretalx-stream", kwargs={"conference_slug": conference.slug})
         resp = client_logged_in_super.post(url, {"sync_schedule": "on"})
@@ -1616,6 +1608,9 @@ class TestSyncPretalxStreamView:
         sync_fn = steps[0][1]
         sync_fn()
         mock_service.sync_schedule.assert_called_once_with(allow_large_deletions=True)
+        iter_fn = steps[0][2]
+        iter_fn()
+        mock_service.sync_schedule_iter.assert_called_once_with(allow_large_deletions=True)
 
     @override_settings(DJANGO_PROGRAM={"pretalx": {"base_url": "https://pretalx.com"}})
     @patch("django_program.manage.views.PretalxSyncService")
@@ -1687,7 +1682,7 @@ class TestSyncPretalxStreamView:
             ]
         )
         mock_service.sync_talks_iter.return_value = iter([{"count": 3}])
-        mock_service.sync_schedule.return_value = (4, 1)
+        mock_service.sync_schedule_iter.return_value = iter([{"count": 4, "unscheduled": 1}])
 
         url = reverse("manage:sync-pretalx-stream", kwargs={"conference_slug": conference.slug})
         resp = client_logged_in_super.post(url)
@@ -0,0 +1,205 @@
+"""Tests for incremental Pretalx syncs: conditional requests and content hashing."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from django_program.conference.models import Conference
+from django_program.pretalx.models import PretalxSyncState, Speaker, Talk
+from django_program.pretalx.sync import PretalxSyncService
+from pretalx_client.models import PretalxSpeaker, PretalxTalk
+
+_PRETALX_SETTINGS = {
+    "pretalx": {"base_url": "https://pretalx.example.com", "token": "tok"},
+}
+_VALIDATORS = {"https://pretalx.example.com/api/events/evt/speakers/": {"etag": '"v1"'}}
+
+
+@pytest.fixture
+def service(db, settings):
+    settings.DJANGO_PROGRAM = _PRETALX_SETTINGS
+    conference = Conference.objects.create(
+        name="Incremental Conf",
+        slug="incremental",
+        start_date=date(2027, 5, 1),
+        end_date=date(2027, 5, 3),
+        timezone="UTC",
+        pretalx_event_slug="evt",
+    )
+    service = PretalxSyncService(conference)
+    service._rooms = {}
+    service._room_names = {}
+    service._submission_types = {}
+    service._tracks = {}
+    service._tags = {}
+    return service
+
+
+def _speakers():
+    return [
+        PretalxSpeaker(code="SPK1", name="Alice", biography="Bio A", email="alice@example.com"),
+        PretalxSpeaker(code="SPK2", name="Bob", biography="Bio B"),
+    ]
+
+
+def _talks():
+    return [
+        PretalxTalk(code="T1", title="Talk One", speaker_codes=["SPK1"], state="confirmed"),
+        PretalxTalk(code="T2", title="Talk Two", speaker_codes=["SPK2"], state="confirmed"),
+    ]
+
+
+def _final(progress):
+    return list(progress)[-1]
+
+
+def _writes(queries, table):
+    writes = ("UPDATE", "INSERT", "DELETE")
+    return [q["sql"] for q in queries if table in q["sql"] and q["sql"].lstrip().startswith(writes)]
+
+
+def _content_writes(queries, table):
+    """Writes to ``table`` other than the bulk ``synced_at`` refresh of unchanged rows."""
+    return [sql for sql in _writes(queries, table) if not sql.startswith(f'UPDATE "{table}" SET "synced_at"')]
+
+
+class TestSpeakerHashing:
+    def test_rerun_with_same_data_only_refreshes_synced_at(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        assert _final(service.sync_speakers_iter()) == {"count": 2, "created": 2, "updated": 0, "unchanged": 0}
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = _final(service.sync_speakers_iter())
+
+        assert result == {"count": 2, "created": 0, "updated": 0, "unchanged": 2}
+        assert len(_writes(ctx.captured_queries, "program_pretalx_speaker")) == 1
+        assert _content_writes(ctx.captured_queries, "program_pretalx_speaker") == []
+        assert service.stats["speakers"] == {"created": 0, "updated": 0, "unchanged": 2}
+
+    def test_only_changed_rows_are_updated(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        service.sync_speakers()
+        bob = Speaker.objects.get(pretalx_code="SPK2")
+
+        changed = _speakers()
+        changed[0] = PretalxSpeaker(code="SPK1", name="Alice Smith", biography="Bio A", email="alice@example.com")
+        service.client.fetch_speakers = MagicMock(return_value=changed)
+
+        assert _final(service.sync_speakers_iter()) == {"count": 2, "created": 0, "updated": 1, "unchanged": 1}
+        assert Speaker.objects.get(pretalx_code="SPK1").name == "Alice Smith"
+        bob_after = Speaker.objects.get(pretalx_code="SPK2")
+        assert bob_after.updated_at == bob.updated_at
+        assert bob_after.synced_at > bob.synced_at
+
+    def test_unchanged_speaker_still_links_new_user(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        service.sync_speakers()
+        user = get_user_model().objects.create_user(username="alice", email="Alice@example.com", password="x")
+
+        result = _final(service.sync_speakers_iter())
+
+        assert result["updated"] == 1
+        assert Speaker.objects.get(pretalx_code="SPK1").user == user
+
+    def test_full_refresh_rewrites_every_row(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        service.sync_speakers()
+
+        result = _final(service.sync_speakers_iter(full_refresh=True))
+
+        assert result == {"count": 2, "created": 0, "updated": 2, "unchanged": 0}
+
+
+class TestConditionalRequests:
+    def test_validators_are_stored_and_sent_back(self, service):
+        service.client.fetch_speakers_if_modified = MagicMock(return_value=(_speakers(), _VALIDATORS))
+        service.sync_speakers()
+
+        state = PretalxSyncState.objects.get(conference=service.conference, endpoint="speakers")
+        assert state.validators == _VALIDATORS
+        assert state.checked_at is not None
+
+        service.client.fetch_speakers_if_modified = MagicMock(return_value=(None, _VALIDATORS))
+        with CaptureQueriesContext(connection) as ctx:
+            result = _final(service.sync_speakers_iter())
+
+        service.client.fetch_speakers_if_modified.assert_called_once_with(_VALIDATORS)
+        assert result == {"count": 2, "created": 0, "updated": 0, "unchanged": 2}
+        assert _content_writes(ctx.captured_queries, "program_pretalx_speaker") == []
+
+    def test_not_modified_refreshes_synced_at(self, service):
+        service.client.fetch_speakers_if_modified = MagicMock(return_value=(_speakers(), _VALIDATORS))
+        service.sync_speakers()
+        first_synced = set(Speaker.objects.values_list("synced_at", flat=True))
+
+        service.client.fetch_speakers_if_modified = MagicMock(return_value=(None, _VALIDATORS))
+        service.sync_speakers()
+
+        state = PretalxSyncState.objects.get(conference=service.conference, endpoint="speakers")
+        assert set(Speaker.objects.values_list("synced_at", flat=True)) == {state.checked_at}
+        assert state.checked_at > max(first_synced)
+
+    def test_full_refresh_ignores_stored_validators(self, service):
+        service.client.fetch_speakers_if_modified = MagicMock(return_value=(_speakers(), _VALIDATORS))
+        service.sync_speakers()
+
+        service.sync_speakers(full_refresh=True)
+
+        assert service.client.fetch_speakers_if_modified.call_args.args == (None,)
+
+    def test_talks_not_modified_skips_writes_and_activities(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        service.sync_speakers()
+        service.client.fetch_talks_if_modified = MagicMock(return_value=(_talks(), _VALIDATORS))
+        service.sync_talks()
+
+        service.client.fetch_talks_if_modified = MagicMock(return_value=(None, _VALIDATORS))
+        with CaptureQueriesContext(connection) as ctx:
+            result = _final(service.sync_talks_iter())
+
+        assert service.client.fetch_talks_if_modified.call_args.args == (_VALIDATORS,)
+        assert result == {"count": 2, "created": 0, "updated": 0, "unchanged": 2}
+        assert _content_writes(ctx.captured_queries, "program_pretalx_talk") == []
+        assert _writes(ctx.captured_queries, "program_programs_activity") == []
+
+    def test_changed_lookups_invalidate_talk_validators(self, service):
+        service.client.fetch_talks_if_modified = MagicMock(return_value=(_talks(), _VALIDATORS))
+        service.sync_talks()
+
+        service._tracks = {7: "Web"}
+        service.sync_talks()
+
+        assert service.client.fetch_talks_if_modified.call_args.args == (None,)
+
+
+class TestTalkHashing:
+    def test_unchanged_talks_keep_speakers_untouched(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        service.sync_speakers()
+        service.client.fetch_talks = MagicMock(return_value=_talks())
+        service.sync_talks()
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = _final(service.sync_talks_iter())
+
+        assert result == {"count": 2, "created": 0, "updated": 0, "unchanged": 2}
+        assert _content_writes(ctx.captured_queries, "program_pretalx_talk") == []
+        assert list(Talk.objects.get(pretalx_code="T1").speakers.values_list("pretalx_code", flat=True)) == ["SPK1"]
+
+    def test_speaker_change_updates_talk(self, service):
+        service.client.fetch_speakers = MagicMock(return_value=_speakers())
+        service.sync_speakers()
+        service.client.fetch_talks = MagicMock(return_value=_talks())
+        service.sync_talks()
+
+        talks = _talks()
+        talks[0] = PretalxTalk(code="T1", title="Talk One", speaker_codes=["SPK1", "SPK2"], state="confirmed")
+        service.client.fetch_talks = MagicMock(return_value=talks)
+
+        assert _final(service.sync_talks_iter()) == {"count": 2, "created": 0, "updated": 1, "unchanged": 1}
+        assert Talk.objects.get(pretalx_code="T1").speakers.count() == 2
+        assert Talk.objects.get(pretalx_code="T2").speakers.count() == 1
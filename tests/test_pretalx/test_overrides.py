@@ -422,6 +422,60 @@ class TestRoomEffectiveProperties:
         assert room.effective_description == "old"
 
 
+# ===========================================================================
+# with_overrides() querysets
+# ===========================================================================
+
+
+@pytest.mark.django_db
+class TestWithOverrides:
+    def test_talks_resolve_overrides_in_one_query(self, django_assert_num_queries):
+        conf = _make_conference(slug="with-ov-talks")
+        hall = Room.objects.create(conference=conf, pretalx_id=1, name="Hall")
+        annex = Room.objects.create(conference=conf, pretalx_id=2, name="Annex")
+        RoomOverride.objects.create(room=annex, conference=conf, override_name="Main Stage")
+        moved = Talk.objects.create(conference=conf, pretalx_code="T1", title="Old", state="confirmed", room=hall)
+        TalkOverride.objects.create(talk=moved, conference=conf, override_title="New", override_room=annex)
+        cancelled = Talk.objects.create(conference=conf, pretalx_code="T2", title="Gone", state="confirmed")
+        TalkOverride.objects.create(talk=cancelled, conference=conf, is_cancelled=True)
+        Talk.objects.create(conference=conf, pretalx_code="T3", title="Plain", state="confirmed", room=hall)
+
+        with django_assert_num_queries(1):
+            talks = {t.pretalx_code: t for t in Talk.objects.filter(conference=conf).with_overrides()}
+            rendered = {code: (t.effective_title, t.effective_state, t.effective_room) for code, t in talks.items()}
+            room_names = [t.effective_room.effective_name for t in talks.values() if t.effective_room]
+
+        assert rendered["T1"] == ("New", "confirmed", annex)
+        assert rendered["T2"] == ("Gone", "cancelled", None)
+        assert rendered["T3"] == ("Plain", "confirmed", hall)
+        assert sorted(room_names) == ["Hall", "Main Stage"]
+        assert (talks["T1"].resolved_title, talks["T1"].resolved_room_id) == ("New", annex.pk)
+        assert talks["T2"].resolved_state == "cancelled"
+        assert talks["T3"].resolved_title == "Plain"
+
+    def test_speakers_filter_and_order_by_effective_name(self, django_assert_num_queries):
+        conf = _make_conference(slug="with-ov-speakers")
+        zed = Speaker.objects.create(conference=conf, pretalx_code="S1", name="Zed")
+        Speaker.objects.create(conference=conf, pretalx_code="S2", name="Mia")
+        SpeakerOverride.objects.create(speaker=zed, conference=conf, override_name="Ada")
+
+        with django_assert_num_queries(1):
+            names = [s.effective_name for s in Speaker.objects.with_overrides().order_by("resolved_name")]
+
+        assert names == ["Ada", "Mia"]
+        assert list(Speaker.objects.with_overrides().filter(resolved_name="Ada")) == [zed]
+
+    def test_rooms_resolve_capacity(self):
+        conf = _make_conference(slug="with-ov-rooms")
+        room = Room.objects.create(conference=conf, pretalx_id=1, name="Hall", capacity=100)
+        RoomOverride.objects.create(room=room, conference=conf, override_capacity=150)
+        Room.objects.create(conference=conf, pretalx_id=2, name="Annex", capacity=40)
+
+        capacities = dict(Room.objects.with_overrides().values_list("name", "resolved_capacity"))
+
+        assert capacities == {"Hall": 150, "Annex": 40}
+
+
 # ===========================================================================
 # SubmissionTypeDefault.__str__
 # ===========================================================================
@@ -1,8 +1,12 @@
-from datetime import UTC, date, datetime
-from unittest.mock import MagicMock, patch
+import asyncio
+import warnings
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from django_program.conference.models import Conference
 from django_program.pretalx.models import Room, ScheduleSlot, Speaker, Talk
@@ -95,18 +99,18 @@ def test_ensure_mappings_fetches_submission_types_tracks_and_tags(settings):
     conference = _make_conference(slug="map-test")
     service = PretalxSyncService(conference)
 
-    service.client.fetch_submission_types = MagicMock(return_value={1: "Talk"})
-    service.client.fetch_tracks = MagicMock(return_value={2: "Python"})
-    service.client.fetch_tags = MagicMock(return_value={3: "AI"})
+    service.async_client.fetch_submission_types = AsyncMock(return_value={1: "Talk"})
+    service.async_client.fetch_tracks = AsyncMock(return_value={2: "Python"})
+    service.async_client.fetch_tags = AsyncMock(return_value={3: "AI"})
 
     service._ensure_mappings()
 
     assert service._submission_types == {1: "Talk"}
     assert service._tracks == {2: "Python"}
     assert service._tags == {3: "AI"}
-    service.client.fetch_submission_types.assert_called_once()
-    service.client.fetch_tracks.assert_called_once()
-    service.client.fetch_tags.assert_called_once()
+    service.async_client.fetch_submission_types.assert_awaited_once()
+    service.async_client.fetch_tracks.assert_awaited_once()
+    service.async_client.fetch_tags.assert_awaited_once()
 
 
 @pytest.mark.django_db
@@ -115,15 +119,57 @@ def test_ensure_mappings_handles_tags_runtime_error(settings):
     conference = _make_conference(slug="map-err")
     service = PretalxSyncService(conference)
 
-    service.client.fetch_submission_types = MagicMock(return_value={})
-    service.client.fetch_tracks = MagicMock(return_value={})
-    service.client.fetch_tags = MagicMock(side_effect=RuntimeError("404"))
+    service.async_client.fetch_submission_types = AsyncMock(return_value={})
+    service.async_client.fetch_tracks = AsyncMock(return_value={})
+    service.async_client.fetch_tags = AsyncMock(side_effect=RuntimeError("404"))
 
     service._ensure_mappings()
 
     assert service._tags == {}
 
 
+@pytest.mark.django_db
+def test_ensure_mappings_propagates_non_tag_errors(settings):
+    settings.DJANGO_PROGRAM = _PRETALX_SETTINGS
+    conference = _make_conference(slug="map-fail")
+    service = PretalxSyncService(conference)
+
+    service.async_client.fetch_submission_types = AsyncMock(return_value={1: "Talk"})
+    service.async_client.fetch_tracks = AsyncMock(side_effect=RuntimeError("500"))
+    service.async_client.fetch_tags = AsyncMock(return_value={})
+
+    with pytest.raises(RuntimeError, match="500"):
+        service._ensure_mappings()
+
+
+@pytest.mark.django_db
+def test_ensure_mappings_fetches_concurrently(settings):
+    settings.DJANGO_PROGRAM = _PRETALX_SETTINGS
+    conference = _make_conference(slug="map-gather")
+    service = PretalxSyncService(conference)
+    in_flight = []
+    peak = []
+
+    def _mapping(value):
+        async def fetch():
+            in_flight.append(value)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(value)
+            return value
+
+        return fetch
+
+    service.async_client.fetch_submission_types = _mapping({1: "Talk"})
+    service.async_client.fetch_tracks = _mapping({2: "Python"})
+    service.async_client.fetch_tags = _mapping({3: "AI"})
+
+    service._ensure_mappings()
+
+    assert max(peak) == 3
+    assert (service._submission_types, service._tracks, service._tags) == ({1: "Talk"}, {2: "Python"}, {3: "AI"})
+
+
 @pytest.mark.django_db
 def test_ensure_mappings_caches_room_names(settings):
     settings.DJANGO_PROGRAM = _PRETALX_SETTINGS
@@ -131,9 +177,9 @@ def test_ensure_mappings_caches_room_names(settings):
     room = Room.objects.create(conference=conference, pretalx_id=10, name="Hall A")
 
     service = PretalxSyncService(conference)
-    service.client.fetch_submission_types = MagicMock(return_value={})
-    service.client.fetch_tracks = MagicMock(return_value={})
-    service.client.fetch_tags = MagicMock(return_value={})
+    service.async_client.fetch_submission_types = AsyncMock(return_value={})
+    service.async_client.fetch_tracks = AsyncMock(return_value={})
+    service.async_client.fetch_tags = AsyncMock(return_value={})
 
     service._ensure_mappings()
 
@@ -147,16 +193,16 @@ def test_ensure_mappings_only_fetches_once(settings):
     conference = _make_conference(slug="map-once")
     service = PretalxSyncService(conference)
 
-    service.client.fetch_submission_types = MagicMock(return_value={})
-    service.client.fetch_tracks = MagicMock(return_value={})
-    service.client.fetch_tags = MagicMock(return_value={})
+    service.async_client.fetch_submission_types = AsyncMock(return_value={})
+    service.async_client.fetch_tracks = AsyncMock(return_value={})
+    service.async_client.fetch_tags = AsyncMock(return_value={})
 
     service._ensure_mappings()
     service._ensure_mappings()
 
-    assert service.client.fetch_submission_types.call_count == 1
-    assert service.client.fetch_tracks.call_count == 1
-    assert service.client.fetch_tags.call_count == 1
+    assert service.async_client.fetch_submission_types.await_count == 1
+    assert service.async_client.fetch_tracks.await_count == 1
+    assert service.async_client.fetch_tags.await_count == 1
 
 
 # ===========================================================================
@@ -312,7 +358,7 @@ def test_sync_speakers_iter_yields_progress(settings):
 
     assert progress_updates[0] == {"phase": "fetching"}
     assert {"current": 0, "total": 3} in progress_updates
-    assert progress_updates[-1] == {"count": 3}
+    assert progress_updates[-1] == {"count": 3, "created": 3, "updated": 0, "unchanged": 0}
 
 
 @pytest.mark.django_db
@@ -323,7 +369,7 @@ def test_sync_speakers_iter_empty_yields_count_zero(settings):
 
     progress_updates = list(service.sync_speakers_iter())
 
-    assert progress_updates == [{"phase": "fetching"}, {"count": 0}]
+    assert progress_updates == [{"phase": "fetching"}, {"count": 0, "created": 0, "updated": 0, "unchanged": 0}]
 
 
 @pytest.mark.django_db
@@ -407,7 +453,7 @@ def test_sync_talks_iter_returns_zero_on_empty(settings):
 
     progress = list(service.sync_talks_iter())
 
-    assert progress[-1] == {"count": 0}
+    assert progress[-1] == {"count": 0, "created": 0, "updated": 0, "unchanged": 0}
 
 
 @pytest.mark.django_db
@@ -779,6 +825,33 @@ def test_sync_schedule_falls_back_to_iso_parsing(settings):
     assert slot.start is not None
 
 
+@pytest.mark.django_db
+def test_sync_schedule_makes_naive_times_aware(settings):
+    conference = _make_conference(slug="sched-naive")
+    service = _make_service(conference, settings)
+    service.client.fetch_schedule = MagicMock(
+        return_value=[
+            PretalxSlot(
+                room="",
+                start="",
+                end="",
+                code="",
+                title="Naive Slot",
+                start_dt=datetime(2027, 5, 1, 16, 0),
+                end_dt=datetime(2027, 5, 1, 16, 30),
+            ),
+        ]
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        service.sync_schedule()
+        service.sync_schedule()
+
+    slot = ScheduleSlot.objects.get(conference=conference)
+    assert slot.end - slot.start == timedelta(minutes=30)
+
+
 @pytest.mark.django_db
 def test_sync_schedule_unscheduled_count(settings):
     conference = _make_conference(slug="sched-unsched")
@@ -869,6 +942,92 @@ def test_sync_schedule_social_slot(settings):
     assert slot.slot_type == ScheduleSlot.SlotType.SOCIAL
 
 
+def _schedule_slot(code, title, hour, room="Hall A"):
+    return PretalxSlot(
+        room=room,
+        start="",
+        end="",
+        code=code,
+        title=title,
+        start_dt=datetime(2027, 5, 1, hour, 0, tzinfo=UTC),
+        end_dt=datetime(2027, 5, 1, hour, 45, tzinfo=UTC),
+    )
+
+
+@pytest.mark.django_db
+def test_sync_schedule_iter_yields_progress(settings):
+    conference = _make_conference(slug="sched-iter")
+    Talk.objects.create(conference=conference, pretalx_code="T1", title="Unscheduled")
+    service = _make_service(conference, settings)
+    service.client.fetch_schedule = MagicMock(
+        return_value=[_schedule_slot("", "Lunch", 12, room=""), _schedule_slot("", "Party", 19, room="")],
+    )
+
+    progress = list(service.sync_schedule_iter())
+
+    assert progress[0] == {"phase": "fetching"}
+    assert {"current": 0, "total": 2} in progress
+    assert {"current": 2, "total": 2} in progress
+    assert progress[-1] == {"count": 2, "unscheduled": 1}
+
+
+@pytest.mark.django_db
+def test_sync_schedule_updates_existing_slot_in_place(settings):
+    conference = _make_conference(slug="sched-update")
+    room = Room.objects.create(conference=conference, pretalx_id=1, name="Hall A")
+    talk = Talk.objects.create(conference=conference, pretalx_code="T1", title="My Talk")
+    existing = ScheduleSlot.objects.create(
+        conference=conference,
+        room=room,
+        title="Placeholder",
+        start=datetime(2027, 5, 1, 10, 0, tzinfo=UTC),
+        end=datetime(2027, 5, 1, 10, 30, tzinfo=UTC),
+        slot_type=ScheduleSlot.SlotType.OTHER,
+    )
+    service = _make_service(conference, settings)
+    service._rooms = {1: room}
+    service._room_names = {1: "Hall A"}
+    service.client.fetch_schedule = MagicMock(return_value=[_schedule_slot("T1", "My Talk", 10)])
+
+    count, _ = service.sync_schedule()
+
+    assert count == 1
+    slot = ScheduleSlot.objects.get(conference=conference)
+    assert slot.pk == existing.pk
+    assert slot.talk == talk
+    assert slot.title == "My Talk"
+    assert slot.end == datetime(2027, 5, 1, 10, 45, tzinfo=UTC)
+    assert slot.slot_type == ScheduleSlot.SlotType.TALK
+
+
+@pytest.mark.django_db
+def test_sync_schedule_query_count_does_not_grow_with_slots(settings):
+    conference = _make_conference(slug="sched-bulk")
+    room = Room.objects.create(conference=conference, pretalx_id=1, name="Hall A")
+    for hour in range(8, 20):
+        Talk.objects.create(conference=conference, pretalx_code=f"T{hour}", title=f"Talk {hour}")
+    ScheduleSlot.objects.create(
+        conference=conference,
+        room=room,
+        start=datetime(2027, 5, 1, 8, 0, tzinfo=UTC),
+        end=datetime(2027, 5, 1, 8, 30, tzinfo=UTC),
+    )
+    service = _make_service(conference, settings)
+    service._rooms = {1: room}
+    service._room_names = {1: "Hall A"}
+    service.client.fetch_schedule = MagicMock(
+        return_value=[_schedule_slot(f"T{hour}", f"Talk {hour}", hour) for hour in range(8, 20)],
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        count, unscheduled = service.sync_schedule()
+
+    assert len(ctx.captured_queries) <= 12
+    assert count == 12
+    assert unscheduled == 0
+    assert ScheduleSlot.objects.filter(conference=conference, talk__isnull=False).count() == 12
+
+
 # ===========================================================================
 # _backfill_talks_from_schedule
 # ===========================================================================
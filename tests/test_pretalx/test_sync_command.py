@@ -72,7 +72,7 @@ def test_command_default_runs_sync_all(mock_service_cls, settings):
     out = StringIO()
     call_command("sync_pretalx", conference="cmd-all", stdout=out)
 
-    mock_service.sync_all.assert_called_once_with(allow_large_deletions=False)
+    mock_service.sync_all.assert_called_once_with(allow_large_deletions=False, full_refresh=False)
     output = out.getvalue()
     assert "3 rooms" in output
     assert "10 speakers" in output
@@ -103,7 +103,7 @@ def test_command_all_flag_runs_sync_all(mock_service_cls, settings):
     out = StringIO()
     call_command("sync_pretalx", conference="cmd-allflag", sync_all=True, stdout=out)
 
-    mock_service.sync_all.assert_called_once_with(allow_large_deletions=False)
+    mock_service.sync_all.assert_called_once_with(allow_large_deletions=False, full_refresh=False)
 
 
 # ---------------------------------------------------------------------------
@@ -10,12 +10,22 @@ from datetime import date, datetime, timedelta
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 from django_program.conference.models import Conference
-from django_program.pretalx.models import Room, ScheduleSlot, Speaker, Talk
+from django_program.pretalx.models import Room, RoomOverride, ScheduleSlot, Speaker, SpeakerOverride, Talk, TalkOverride
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
 
 
 @pytest.fixture
@@ -345,6 +355,54 @@ class TestScheduleJSONView:
         assert data[1]["title"] == "Lunch Break"
         assert data[2]["title"] == "Solo Talk"
 
+    def test_sends_etag_and_last_modified(self, client, conference, slot_with_talk):
+        url = reverse("pretalx:schedule-json", kwargs={"conference_slug": conference.slug})
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response["ETag"].startswith('"')
+        assert "Last-Modified" in response
+
+    def test_if_none_match_returns_not_modified(self, client, conference, slot_with_talk):
+        url = reverse("pretalx:schedule-json", kwargs={"conference_slug": conference.slug})
+        first = client.get(url)
+        etag = first["ETag"]
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response["ETag"] == etag
+        assert response["Last-Modified"] == first["Last-Modified"]
+
+        slot_with_talk.title = "Renamed"
+        slot_with_talk.end += timedelta(minutes=15)
+        slot_with_talk.save()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_served_from_cache(self, client, conference, slot_with_talk):
+        url = reverse("pretalx:schedule-json", kwargs={"conference_slug": conference.slug})
+        client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+
+        assert response.status_code == 200
+        assert not any(ScheduleSlot._meta.db_table in q["sql"] for q in queries.captured_queries)
+
+    def test_applies_talk_and_room_overrides(self, client, conference, room, room_b, talk, slot_with_talk):
+        url = reverse("pretalx:schedule-json", kwargs={"conference_slug": conference.slug})
+        client.get(url)
+
+        TalkOverride.objects.create(
+            talk=talk, conference=conference, override_title="Better APIs", override_room=room_b
+        )
+        RoomOverride.objects.create(room=room_b, conference=conference, override_name="Main Stage")
+        entry = json.loads(client.get(url).content)[0]
+
+        assert entry["title"] == "Better APIs"
+        assert entry["room"] == "Main Stage"
+
     def test_nonexistent_conference_returns_404(self, client):
         url = reverse("pretalx:schedule-json", kwargs={"conference_slug": "nope"})
         response = client.get(url)
@@ -456,6 +514,15 @@ class TestSpeakerListView:
         assert speakers[0].name == "Alice Johnson"
         assert speakers[1].name == "Bob Smith"
 
+    def test_speaker_list_uses_overridden_names(self, client, conference, speaker, speaker_bob):
+        SpeakerOverride.objects.create(speaker=speaker_bob, conference=conference, override_name="Aaron Smith")
+        url = reverse("pretalx:speaker-list", kwargs={"conference_slug": conference.slug})
+
+        response = client.get(url)
+
+        assert [s.effective_name for s in response.context["speakers"]] == ["Aaron Smith", "Alice Johnson"]
+        assert b"Aaron Smith" in response.content
+
     def test_speaker_list_scoped_to_conference(self, client, conference, speaker):
         other = Conference.objects.create(
             name="Other Conf",
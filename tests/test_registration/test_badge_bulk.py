@@ -0,0 +1,178 @@
+"""Tests for the batched bulk badge renderer and the generate_badges command."""
+
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from django_program.conference.models import Conference
+from django_program.registration.attendee import Attendee
+from django_program.registration.badge import Badge, BadgeTemplate
+from django_program.registration.services import badge_bulk
+from django_program.registration.services.badge_bulk import BulkBadgeRenderer
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def conference():
+    return Conference.objects.create(
+        name="BulkCon",
+        slug=f"bulkcon-{uuid4().hex[:6]}",
+        start_date=date(2027, 7, 1),
+        end_date=date(2027, 7, 3),
+    )
+
+
+@pytest.fixture
+def template(conference):
+    return BadgeTemplate.objects.create(conference=conference, name="Default", slug="default", is_default=True)
+
+
+def _attendees(conference, count):
+    return [
+        Attendee.objects.create(
+            user=User.objects.create_user(username=f"bulk-{uuid4().hex[:8]}", first_name="Ada", last_name="Lovelace"),
+            conference=conference,
+        )
+        for _ in range(count)
+    ]
+
+
+def test_renders_and_stores_every_attendee_in_batches(conference, template):
+    attendees = _attendees(conference, 5)
+    progress = []
+
+    with CaptureQueriesContext(connection) as ctx:
+        badges = list(BulkBadgeRenderer(conference, template, batch_size=2, progress=progress.append))
+
+    badge_queries = [q["sql"] for q in ctx.captured_queries if '"program_registration_badge"' in q["sql"]]
+    # One existence lookup and one bulk insert per batch.
+    assert len(badge_queries) == 6
+    assert [badge.attendee_id for badge in badges] == [attendee.pk for attendee in attendees]
+    assert Badge.objects.filter(template=template, file__gt="").count() == 5
+    assert [(p.completed, p.total, p.rendered) for p in progress] == [(2, 5, 2), (4, 5, 4), (5, 5, 5)]
+
+
+def test_existing_badges_are_reused(conference, template):
+    _attendees(conference, 3)
+    list(BulkBadgeRenderer(conference, template))
+    progress = []
+
+    with patch.object(badge_bulk, "_render_badges", wraps=badge_bulk._render_badges) as render:
+        badges = list(BulkBadgeRenderer(conference, template, progress=progress.append))
+
+    assert len(badges) == 3
+    assert render.call_args.args[2] == []
+    assert progress[-1].skipped == 3
+    assert Badge.objects.filter(template=template).count() == 3
+
+
+def test_missing_files_are_rendered_again(conference, template):
+    _attendees(conference, 2)
+    first, _second = BulkBadgeRenderer(conference, template)
+    Badge.objects.filter(pk=first.pk).update(file="")
+
+    progress = []
+    list(BulkBadgeRenderer(conference, template, progress=progress.append))
+
+    assert progress[-1].rendered == 1
+    assert Badge.objects.filter(template=template).count() == 2
+
+
+def test_worker_pool_renders_in_attendee_order(conference, template):
+    attendees = _attendees(conference, 4)
+
+    with patch.object(badge_bulk, "ProcessPoolExecutor", ThreadPoolExecutor):
+        badges = list(BulkBadgeRenderer(conference, template, badge_format="png", workers=2, batch_size=1))
+
+    assert [badge.attendee_id for badge in badges] == [attendee.pk for attendee in attendees]
+    assert all(badge.format == Badge.Format.PNG and badge.file for badge in badges)
+
+
+def test_failed_batch_deletes_its_stored_files(conference, template, tmp_path, settings):
+    settings.MEDIA_ROOT = str(tmp_path)
+    _attendees(conference, 2)
+
+    with (
+        patch.object(Badge.objects, "bulk_create", side_effect=IntegrityError("boom")),
+        pytest.raises(IntegrityError),
+    ):
+        list(BulkBadgeRenderer(conference, template))
+
+    assert not Badge.objects.exists()
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+def test_write_zip_bundles_every_badge(conference, template):
+    attendees = _attendees(conference, 3)
+    first, *_rest = BulkBadgeRenderer(conference, template, batch_size=1)
+    first.delete()
+    buffer = io.BytesIO()
+
+    result = BulkBadgeRenderer(conference, template).write_zip(buffer)
+
+    assert (result.total, result.rendered, result.skipped) == (3, 1, 2)
+    names = zipfile.ZipFile(buffer).namelist()
+    assert sorted(names) == sorted(f"badge-{attendee.access_code}.pdf" for attendee in attendees)
+
+
+def test_write_sheets_imposes_badges_n_up(conference, template):
+    # A 90x130mm badge fits 2x2 on A4.
+    template.width_mm, template.height_mm = 90, 130
+    template.save()
+    _attendees(conference, 5)
+    buffer = io.BytesIO()
+
+    result = BulkBadgeRenderer(conference, template).write_sheets(buffer, paper="a4")
+
+    assert result.total == 5
+    assert b"/Count 2" in buffer.getvalue()
+    assert not Badge.objects.exists()
+
+
+def test_write_sheets_rejects_badges_larger_than_the_sheet(conference, template):
+    template.width_mm = 400
+    with pytest.raises(ValueError, match="does not fit"):
+        BulkBadgeRenderer(conference, template).write_sheets(io.BytesIO(), paper="letter")
+
+
+def test_requires_a_template(conference):
+    with pytest.raises(ValueError, match="No default badge template"):
+        BulkBadgeRenderer(conference)
+
+
+def test_generate_badges_command(conference, template, tmp_path):
+    _attendees(conference, 2)
+    out = io.StringIO()
+
+    call_command(
+        "generate_badges",
+        "--conference",
+        conference.slug,
+        "--zip",
+        str(tmp_path / "badges.zip"),
+        "--sheets",
+        str(tmp_path / "sheets.pdf"),
+        stdout=out,
+    )
+
+    assert "Wrote 2 badges" in out.getvalue()
+    assert "Imposed 2 badges" in out.getvalue()
+    assert len(zipfile.ZipFile(tmp_path / "badges.zip").namelist()) == 2
+
+
+def test_generate_badges_command_unknown_template(conference):
+    with pytest.raises(CommandError, match="not found"):
+        call_command("generate_badges", "--conference", conference.slug, "--template", "missing")
@@ -830,3 +830,129 @@ class TestPDFBadgeBannerPositions:
         service = BadgeGenerationService()
         result = service.generate_badge_pdf(attendee, tpl)
         assert result[:5] == b"%PDF-"
+
+
+class TestRenderCaches:
+    """Tests for the font, template image, QR and static layer memoization."""
+
+    def test_qr_code_is_built_once(self) -> None:
+        from django_program.registration.services.badge import _qr_image
+
+        _qr_image.cache_clear()
+        service = BadgeGenerationService()
+
+        assert service.generate_qr_code("cache-me") == service.generate_qr_code("cache-me")
+        assert _qr_image.cache_info().misses == 1
+
+    def test_template_image_is_decoded_once_per_version(self) -> None:
+        from django_program.registration.services.badge import _template_image
+
+        tpl = _make_template(_make_conference())
+        tpl.logo.name = "badge_logos/missing.png"
+        calls = []
+
+        def loader(path: str) -> object:
+            calls.append(path)
+            raise FileNotFoundError(path)
+
+        assert _template_image(tpl, "logo", loader) is None
+        assert _template_image(tpl, "logo", loader) is None
+        assert len(calls) == 1
+
+        tpl.save()
+        _template_image(tpl, "logo", loader)
+        assert len(calls) == 2
+
+    def test_pdf_font_is_registered_once(self) -> None:
+        from unittest.mock import patch
+
+        from django_program.registration.services.badge import _PDF_FONT_CACHE
+
+        service = BadgeGenerationService()
+        with (
+            patch(
+                "django_program.registration.services.badge._resolve_font_path",
+                return_value="/fonts/cached-badge-font.ttf",
+            ),
+            patch.object(BadgeGenerationService, "_register_pdf_font", side_effect=lambda _spec, name: name) as reg,
+        ):
+            try:
+                first = service._pdf_font("cached-badge-font.ttf")
+                second = service._pdf_font("cached-badge-font.ttf")
+            finally:
+                _PDF_FONT_CACHE.pop("/fonts/cached-badge-font.ttf", None)
+
+        assert first == second
+        assert first.startswith("BadgeFont-")
+        reg.assert_called_once()
+
+    def test_pdf_static_layer_is_defined_once_per_document(self) -> None:
+        import io
+        from unittest.mock import patch
+
+        from reportlab.pdfgen import canvas
+
+        conf = _make_conference()
+        tpl = _make_template(conf)
+        c = canvas.Canvas(io.BytesIO())
+        service = BadgeGenerationService()
+
+        with (
+            patch.object(c, "beginForm", wraps=c.beginForm) as begin,
+            patch.object(c, "doForm", wraps=c.doForm) as do,
+        ):
+            service.draw_badge_pdf(c, _make_attendee(conf), tpl)
+            service.draw_badge_pdf(c, _make_attendee(conf), tpl)
+
+        assert begin.call_count == 1
+        assert do.call_count == 2
+
+    def test_png_static_layer_is_reused_without_leaking_attendees(self) -> None:
+        from unittest.mock import patch
+
+        from PIL import Image
+
+        conf = _make_conference()
+        tpl = _make_template(conf, show_name=True)
+        first, second = _make_attendee(conf), _make_attendee(conf, user=_make_user(first_name="Grace"))
+        service = BadgeGenerationService()
+
+        rendered = service.generate_badge_png(first, tpl)
+        with patch("PIL.Image.new", wraps=Image.new) as new:
+            service.generate_badge_png(second, tpl)
+            again = service.generate_badge_png(first, tpl)
+
+        # Only the new attendee's QR code is drawn from scratch.
+        assert [call.args[0] for call in new.call_args_list] == ["1"]
+        assert again == rendered
+
+    def test_lru_cache_get_marks_entries_recently_used(self) -> None:
+        from django_program.registration.services.badge import _LRUCache
+
+        cache = _LRUCache(maxsize=2)
+        cache["a"], cache["b"] = 1, 2
+
+        assert cache.get("a") == 1
+        cache["c"] = 3
+
+        assert list(cache) == ["a", "c"]
+        assert cache.get("b") is None
+        assert cache.get("b", "default") == "default"
+
+    def test_lru_cache_get_is_safe_while_other_threads_evict(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from django_program.registration.services.badge import _LRUCache
+
+        cache = _LRUCache(maxsize=4)
+
+        def churn(offset: int) -> None:
+            for i in range(2000):
+                key = (offset + i) % 16
+                if cache.get(key) is None:
+                    cache[key] = key
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(churn, range(4)))
+
+        assert len(cache) <= 4
@@ -7,7 +7,9 @@ from uuid import uuid4
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.test import Client
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from django_program.conference.models import Conference
@@ -348,6 +350,79 @@ class TestCheckInServiceCheckIn:
 
         assert checkin.checked_in_by == staff
 
+    def test_check_in_counts_reentries(self) -> None:
+        conf = _make_conference()
+        attendee = _make_attendee(conference=conf, user=_make_user())
+
+        first = CheckInService.check_in(attendee=attendee)
+        CheckInService.check_in(attendee=attendee)
+
+        assert attendee.checkin_count == 2
+        assert attendee.checked_in_at == first.checked_in_at
+        attendee.refresh_from_db()
+        assert attendee.checkin_count == 2
+        assert attendee.checked_in_at == first.checked_in_at
+
+
+@pytest.mark.unit
+class TestCheckInServiceScanPath:
+    """Tests for the scan lookup and the cached attendee card."""
+
+    def _attendee(self) -> Attendee:
+        conf = _make_conference()
+        user = _make_user(first_name="Jane", last_name="Doe")
+        order = _make_order(conference=conf, user=user)
+        _make_line_item(order=order, ticket_type=_make_ticket_type(conference=conf, name="Professional"))
+        _make_line_item(order=order, addon=_make_addon(conference=conf))
+        return _make_attendee(conference=conf, user=user, order=order)
+
+    def _scan(self, attendee: Attendee) -> tuple[Attendee, object]:
+        scanned = CheckInService.lookup_for_scan(conference=attendee.conference, access_code=attendee.access_code)
+        card = CheckInService.get_attendee_card(scanned)
+        CheckInService.check_in(attendee=scanned, station="Door A")
+        return scanned, card
+
+    def test_card_holds_display_data(self) -> None:
+        attendee = self._attendee()
+
+        _scanned, card = self._scan(attendee)
+
+        assert (card.name, card.ticket_type) == ("Jane Doe", "Professional")
+        assert len(card.products) == 2
+
+    def test_warm_scan_costs_one_read(self) -> None:
+        attendee = self._attendee()
+        self._scan(attendee)
+
+        with CaptureQueriesContext(connection) as ctx:
+            scanned, card = self._scan(attendee)
+
+        reads = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        assert len(reads) == 1
+        assert card.name == "Jane Doe"
+        assert scanned.checkin_count == 2
+
+    def test_saving_the_attendee_discards_the_card(self) -> None:
+        attendee = self._attendee()
+        self._scan(attendee)
+
+        attendee.user.first_name = "Janet"
+        attendee.user.save()
+        attendee.save()
+
+        _scanned, card = self._scan(attendee)
+        assert card.name == "Janet Doe"
+
+    def test_card_cache_can_be_disabled(self) -> None:
+        attendee = self._attendee()
+
+        with override_settings(DJANGO_PROGRAM={"checkin_card_cache_seconds": 0}):
+            self._scan(attendee)
+            with CaptureQueriesContext(connection) as ctx:
+                self._scan(attendee)
+
+        assert len([q for q in ctx.captured_queries if q["sql"].startswith("SELECT")]) > 1
+
 
 @pytest.mark.unit
 class TestCheckInServiceBadgeData:
@@ -601,6 +676,7 @@ class TestScanView:
         data = response.json()
         assert data["status"] == "checked_in"
         assert data["attendee"]["access_code"] == attendee.access_code
+        assert data["attendee"]["check_in_count"] == 1
         assert data["checkin_id"] is not None
 
     def test_returns_404_for_unknown_access_code(self) -> None:
@@ -767,6 +843,350 @@ class TestOfflinePreloadView:
         assert data["count"] == 1
         assert data["attendees"][0]["ticket_type"] == "VIP"
 
+    def _paid_attendee(self, conf: Conference) -> Attendee:
+        user = _make_user()
+        return _make_attendee(conference=conf, user=user, order=_make_order(conference=conf, user=user))
+
+    def _client(self) -> Client:
+        client = Client()
+        client.force_login(_make_staff_user())
+        return client
+
+    def test_full_preload_reports_sequence(self) -> None:
+        conf = _make_conference()
+        self._paid_attendee(conf)
+
+        data = self._client().get(self._url(conf)).json()
+
+        assert data["full"] is True
+        assert data["seq"] > 0
+        assert data["removed"] == []
+
+    # Without the overlap window a delta carries exactly the changes after ``since``.
+    @override_settings(DJANGO_PROGRAM={"checkin_change_overlap_seconds": 0})
+    def test_delta_returns_only_changed_attendees(self) -> None:
+        conf = _make_conference()
+        self._paid_attendee(conf)
+        scanned = self._paid_attendee(conf)
+        client = self._client()
+        seq = client.get(self._url(conf)).json()["seq"]
+
+        CheckInService.check_in(attendee=scanned, station="Door A")
+        data = client.get(self._url(conf), {"since": seq}).json()
+
+        assert data["full"] is False
+        assert data["seq"] > seq
+        assert [(r["access_code"], r["checked_in"]) for r in data["attendees"]] == [(scanned.access_code, True)]
+        assert client.get(self._url(conf), {"since": data["seq"]}).json()["attendees"] == []
+
+    def test_delta_resends_changes_that_commit_behind_the_sequence(self) -> None:
+        from django_program.registration.checkin import CheckInChange
+
+        conf = _make_conference()
+        early = self._paid_attendee(conf)
+        late = self._paid_attendee(conf)
+        client = self._client()
+        seq = client.get(self._url(conf)).json()["seq"]
+
+        # Transaction 1 takes the next change key but has not committed yet.
+        reserved = CheckInChange.objects.create(conference=conf, attendee_id=early.pk, access_code=early.access_code).pk
+        CheckInChange.objects.filter(pk=reserved).delete()
+        # Transaction 2 takes a higher key, commits, and a poll returns it.
+        CheckInService.check_in(attendee=late, station="Door A")
+        data = client.get(self._url(conf), {"since": seq}).json()
+        assert late.access_code in [r["access_code"] for r in data["attendees"]]
+        # Transaction 1 commits now, with a key below the scanner's sequence.
+        CheckInService.check_in(attendee=early, station="Door B")
+        CheckInChange.objects.filter(pk=CheckInChange.objects.latest("pk").pk).update(id=reserved)
+
+        data = client.get(self._url(conf), {"since": data["seq"]}).json()
+
+        assert (early.access_code, True) in [(r["access_code"], r["checked_in"]) for r in data["attendees"]]
+
+    def test_delta_reports_redemptions(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        item = _make_line_item(order=attendee.order, addon=_make_addon(conference=conf), quantity=2)
+        client = self._client()
+        seq = client.get(self._url(conf)).json()["seq"]
+
+        RedemptionService.redeem_product(attendee=attendee, order_line_item=item)
+        data = client.get(self._url(conf), {"since": seq}).json()
+
+        assert data["attendees"][0]["products"][0]["remaining"] == 1
+
+    def test_delta_lists_attendees_no_longer_admitted_as_removed(self) -> None:
+        conf = _make_conference()
+        refunded = self._paid_attendee(conf)
+        deleted = self._paid_attendee(conf)
+        client = self._client()
+        seq = client.get(self._url(conf)).json()["seq"]
+
+        refunded.order.status = Order.Status.REFUNDED
+        refunded.order.save(update_fields=["status", "updated_at"])
+        deleted.delete()
+        data = client.get(self._url(conf), {"since": seq}).json()
+
+        assert data["attendees"] == []
+        assert data["removed"] == sorted([refunded.access_code, deleted.access_code])
+
+    def test_since_ahead_of_the_server_returns_full_preload(self) -> None:
+        conf = _make_conference()
+        self._paid_attendee(conf)
+
+        data = self._client().get(self._url(conf), {"since": 10**9}).json()
+
+        assert data["full"] is True
+        assert data["count"] == 1
+
+    def test_invalid_since_is_rejected(self) -> None:
+        conf = _make_conference()
+        response = self._client().get(self._url(conf), {"since": "yesterday"})
+        assert response.status_code == 400
+
+    def test_gzip_encoding_when_accepted(self) -> None:
+        import gzip
+
+        conf = _make_conference()
+        for _ in range(3):
+            self._paid_attendee(conf)
+
+        response = self._client().get(self._url(conf), HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert json.loads(gzip.decompress(response.content))["count"] == 3
+
+    def test_preload_warms_the_scanner_cards(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        self._client().get(self._url(conf))
+
+        scanned = CheckInService.lookup_for_scan(conference=conf, access_code=attendee.access_code)
+        with CaptureQueriesContext(connection) as ctx:
+            card = CheckInService.get_attendee_card(scanned)
+
+        assert ctx.captured_queries == []
+        assert card.email == attendee.user.email
+
+    def test_deleting_the_conference_drops_its_change_log(self) -> None:
+        from django_program.registration.checkin import CheckInChange
+
+        conf = _make_conference()
+        CheckInService.check_in(attendee=self._paid_attendee(conf))
+
+        conf.delete()
+
+        assert not CheckInChange.objects.exists()
+
+
+@pytest.mark.integration
+class TestOfflineSyncView:
+    """Tests for the OfflineSyncView endpoint."""
+
+    def _url(self, conference: Conference) -> str:
+        return reverse("registration:checkin-sync", args=[conference.slug])
+
+    def _paid_attendee(self, conf: Conference) -> Attendee:
+        user = _make_user()
+        return _make_attendee(conference=conf, user=user, order=_make_order(conference=conf, user=user))
+
+    @staticmethod
+    def _action(kind: str, key: str, access_code: str, occurred_at: str, **extra: object) -> dict[str, object]:
+        return {"type": kind, "key": key, "access_code": access_code, "occurred_at": occurred_at, **extra}
+
+    def _sync(self, conf: Conference, actions: list[object], client: Client | None = None) -> object:
+        if client is None:
+            client = Client()
+            client.force_login(_make_staff_user())
+        return client.post(self._url(conf), data=json.dumps({"actions": actions}), content_type="application/json")
+
+    def test_applies_scans_and_redemptions_with_scanner_timestamps(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        item = _make_line_item(order=attendee.order, addon=_make_addon(conference=conf))
+        code = attendee.access_code
+
+        response = self._sync(
+            conf,
+            [
+                self._action("scan", "k1", code, "2026-07-01T09:05:00+00:00", station="Door A"),
+                self._action("scan", "k2", code, "2026-07-01T09:00:00+00:00"),
+                self._action("redeem", "k3", code, "2026-07-01T09:10:00+00:00", line_item_id=item.pk),
+            ],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["status"] for r in data["results"]] == ["checked_in", "checked_in", "redeemed"]
+        assert data["summary"] == {"checked_in": 2, "redeemed": 1, "duplicate": 0, "rejected": 0}
+        assert CheckIn.objects.get(pk=data["results"][0]["id"]).station == "Door A"
+        redemption = ProductRedemption.objects.get(pk=data["results"][2]["id"])
+        assert redemption.redeemed_at.isoformat() == "2026-07-01T09:10:00+00:00"
+        attendee.refresh_from_db()
+        assert attendee.checked_in_at.isoformat() == "2026-07-01T09:00:00+00:00"
+        assert attendee.checkin_count == 2
+
+    def test_replayed_keys_are_duplicates(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        scan = self._action("scan", "k1", attendee.access_code, "2026-07-01T09:00:00Z")
+        first = self._sync(conf, [scan]).json()["results"][0]
+
+        data = self._sync(conf, [scan, {**scan, "key": "k2"}, {**scan, "key": "k2"}]).json()
+
+        assert [(r["status"], r["id"]) for r in data["results"]] == [
+            ("duplicate", first["id"]),
+            ("checked_in", data["results"][1]["id"]),
+            ("duplicate", data["results"][1]["id"]),
+        ]
+        assert CheckIn.objects.filter(attendee=attendee).count() == 2
+
+    def test_key_committed_by_an_overlapping_batch_is_a_duplicate(self) -> None:
+        from unittest.mock import patch
+
+        from django_program.registration.services import checkin_sync
+
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        scan = self._action("scan", "k1", attendee.access_code, "2026-07-01T09:00:00Z")
+        original = CheckIn.objects.create(attendee=attendee, conference=conf, client_key="k1")
+        read_keys = checkin_sync._applied_keys
+        reads = []
+
+        def keys_read_before_the_original_committed(*args: object) -> dict[tuple[str, str], int]:
+            # The first read happens while the original batch still has k1 uncommitted.
+            keys = read_keys(*args)
+            if not reads:
+                keys.pop(("scan", "k1"))
+            reads.append(keys)
+            return keys
+
+        with patch.object(checkin_sync, "_applied_keys", side_effect=keys_read_before_the_original_committed):
+            response = self._sync(conf, [scan, {**scan, "key": "k2"}])
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [(r["status"], r["id"]) for r in results] == [
+            ("duplicate", original.pk),
+            ("checked_in", results[1]["id"]),
+        ]
+        assert len(reads) == 2
+        attendee.refresh_from_db()
+        assert attendee.checkin_count == 1
+        assert CheckIn.objects.filter(attendee=attendee).count() == 2
+
+    def test_keeps_an_existing_check_in_time(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        CheckInService.check_in(attendee=attendee)
+        attendee.refresh_from_db()
+        checked_in_at = attendee.checked_in_at
+
+        self._sync(conf, [self._action("scan", "k1", attendee.access_code, "2026-07-01T09:00:00Z")])
+
+        attendee.refresh_from_db()
+        assert attendee.checked_in_at == checked_in_at
+
+    def test_rejects_invalid_actions_individually(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        item = _make_line_item(order=attendee.order, addon=_make_addon(conference=conf))
+        user = _make_user()
+        pending = _make_attendee(
+            conference=conf, user=user, order=_make_order(conference=conf, user=user, status=Order.Status.PENDING)
+        )
+        at = "2026-07-01T09:00:00Z"
+
+        data = self._sync(
+            conf,
+            [
+                "not an object",
+                self._action("scan", "k1", "NOPE", at),
+                self._action("scan", "k2", pending.access_code, at),
+                self._action("scan", "k3", attendee.access_code, "soon"),
+                self._action("redeem", "k4", attendee.access_code, at, line_item_id=item.pk),
+                self._action("redeem", "k5", attendee.access_code, at, line_item_id=item.pk),
+                self._action("redeem", "k6", attendee.access_code, at, line_item_id=0),
+            ],
+        ).json()
+
+        assert [(r["status"], r.get("error", "")) for r in data["results"]] == [
+            ("rejected", "Action must be an object"),
+            ("rejected", "Attendee not found"),
+            ("rejected", CheckInService.validate_order_status(pending)),
+            ("rejected", "occurred_at must be an ISO 8601 datetime"),
+            ("redeemed", ""),
+            ("rejected", "Product already fully redeemed"),
+            ("rejected", "Line item not found in attendee's order"),
+        ]
+        assert ProductRedemption.objects.count() == 1
+        assert not CheckIn.objects.exists()
+
+    def test_impossible_dates_and_huge_ids_are_rejected_individually(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        code = attendee.access_code
+        actions = [
+            self._action("scan", "k1", code, "2026-02-30T09:00:00Z"),
+            self._action("redeem", "k2", code, "2026-07-01T09:00:00Z", line_item_id="HUGE"),
+            self._action("scan", "k3", code, "2026-07-01T09:00:00Z"),
+        ]
+        client = Client()
+        client.force_login(_make_staff_user())
+        body = json.dumps({"actions": actions}).replace('"HUGE"', "1e400")
+
+        response = client.post(self._url(conf), data=body, content_type="application/json")
+
+        assert response.status_code == 200
+        assert [(r["status"], r.get("error", "")) for r in response.json()["results"]] == [
+            ("rejected", "occurred_at must be an ISO 8601 datetime"),
+            ("rejected", "line_item_id must be an integer"),
+            ("checked_in", ""),
+        ]
+        assert CheckIn.objects.filter(attendee=attendee).count() == 1
+
+    def test_future_timestamps_are_clamped(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+
+        data = self._sync(conf, [self._action("scan", "k1", attendee.access_code, "2999-01-01T00:00:00Z")]).json()
+
+        assert CheckIn.objects.get(pk=data["results"][0]["id"]).checked_in_at.year < 2999
+
+    @override_settings(DJANGO_PROGRAM={"checkin_change_overlap_seconds": 0})
+    def test_synced_attendees_appear_in_the_preload_delta(self) -> None:
+        conf = _make_conference()
+        attendee = self._paid_attendee(conf)
+        self._paid_attendee(conf)
+        client = Client()
+        client.force_login(_make_staff_user())
+        preload = reverse("registration:checkin-preload", args=[conf.slug])
+        seq = client.get(preload).json()["seq"]
+
+        self._sync(conf, [self._action("scan", "k1", attendee.access_code, "2026-07-01T09:00:00Z")], client)
+        data = client.get(preload, {"since": seq}).json()
+
+        assert [(r["access_code"], r["checked_in"]) for r in data["attendees"]] == [(attendee.access_code, True)]
+
+    def test_rejects_oversized_and_malformed_batches(self) -> None:
+        from django_program.registration.services.checkin_sync import MAX_OFFLINE_ACTIONS
+
+        conf = _make_conference()
+
+        assert self._sync(conf, [{}] * (MAX_OFFLINE_ACTIONS + 1)).status_code == 400
+        client = Client()
+        client.force_login(_make_staff_user())
+        response = client.post(self._url(conf), data=json.dumps({"actions": {}}), content_type="application/json")
+        assert response.status_code == 400
+
+    def test_requires_staff(self) -> None:
+        conf = _make_conference()
+        client = Client()
+        client.force_login(_make_user())
+        response = client.post(self._url(conf), data=json.dumps({"actions": []}), content_type="application/json")
+        assert response.status_code == 403
+
 
 # -- Manage Dashboard/Scanner View Tests -------------------------------------
 
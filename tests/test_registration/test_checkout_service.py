@@ -1,6 +1,7 @@
 """Tests for the CheckoutService in django_program.registration.services.checkout."""
 
 import json
+import re
 from datetime import date, timedelta
 from decimal import Decimal
 from unittest.mock import patch
@@ -9,7 +10,8 @@ from uuid import uuid4
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from django_program.conference.models import Conference
@@ -17,6 +19,7 @@ from django_program.registration.models import (
     AddOn,
     Cart,
     Credit,
+    InventoryCounter,
     Order,
     OrderLineItem,
     Payment,
@@ -32,11 +35,12 @@ from django_program.registration.services.cart import (
 )
 from django_program.registration.services.checkout import (
     CheckoutService,
-    _expire_stale_pending_orders,
     _increment_voucher_usage,
     _revalidate_global_capacity,
 )
-from django_program.registration.signals import order_paid
+from django_program.registration.services.metrics import checkout_latency
+from django_program.registration.services.references import generate_order_reference
+from django_program.registration.signals import checkout_timed, order_paid
 
 User = get_user_model()
 
@@ -129,6 +133,24 @@ def cart_with_ticket(cart, ticket_type):
     return cart
 
 
+# =============================================================================
+# TestGenerateOrderReference
+# =============================================================================
+
+
+class TestGenerateOrderReference:
+    def test_references_are_unique_and_time_ordered(self):
+        references = [generate_order_reference("ORD") for _ in range(2000)]
+
+        assert len(set(references)) == len(references)
+        assert references == sorted(references)
+
+    def test_uses_configured_prefix(self, settings):
+        settings.DJANGO_PROGRAM = {"order_reference_prefix": "PYCON"}
+
+        assert re.fullmatch(r"PYCON-[0-9A-Z]{13}", generate_order_reference())
+
+
 # =============================================================================
 # TestCheckout
 # =============================================================================
@@ -151,8 +173,7 @@ class TestCheckout:
         assert order.discount_amount == Decimal("0.00")
         assert order.billing_name == "Alice Smith"
         assert order.billing_email == "alice@example.com"
-        assert order.reference.startswith("ORD-")
-        assert len(order.reference) == 12  # ORD- + 8 chars
+        assert re.fullmatch(r"ORD-[0-9A-Z]{13}", order.reference)
         assert order.hold_expires_at is not None
 
     def test_uses_custom_reference_prefix(self, cart_with_ticket, settings):
@@ -160,8 +181,7 @@ class TestCheckout:
 
         order = CheckoutService.checkout(cart_with_ticket)
 
-        assert order.reference.startswith("PYCON-")
-        assert len(order.reference) == 14  # PYCON- + 8 chars
+        assert re.fullmatch(r"PYCON-[0-9A-Z]{13}", order.reference)
 
     def test_creates_order_line_items(self, cart, ticket_type, conference):
         add_ticket(cart, ticket_type, qty=2)
@@ -343,29 +363,49 @@ class TestCheckout:
         with pytest.raises(ValidationError, match="no longer valid"):
             CheckoutService.checkout(cart)
 
-    def test_retries_on_reference_collision(self, cart_with_ticket):
-        """IntegrityError on duplicate reference triggers retry with new reference."""
-        real_create = Order.objects.create
-        call_count = 0
+    def test_reference_collision_is_not_retried(self, cart_with_ticket):
+        """References are collision-free, so a duplicate key is a real error and propagates."""
+        with patch.object(Order.objects, "create", side_effect=IntegrityError("duplicate key")) as create:
+            with pytest.raises(IntegrityError):
+                CheckoutService.checkout(cart_with_ticket)
 
-        def create_with_collision(**kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise IntegrityError("duplicate key")
-            return real_create(**kwargs)
+        assert create.call_count == 1
 
-        with patch.object(Order.objects, "create", side_effect=create_with_collision):
-            order = CheckoutService.checkout(cart_with_ticket)
+    def test_line_items_bulk_created_and_counted(self, cart, ticket_type, conference):
+        add_ticket(cart, ticket_type, qty=2)
+        addon = AddOn.objects.create(conference=conference, name="Lunch", slug="lunch", price=Decimal("15.00"))
+        add_addon(cart, addon, qty=1)
 
-        assert order.status == Order.Status.PENDING
-        assert call_count == 2
+        with CaptureQueriesContext(connection) as ctx:
+            order = CheckoutService.checkout(cart)
 
-    def test_raises_after_max_reference_retries(self, cart_with_ticket):
-        """IntegrityError is re-raised after exhausting retry attempts."""
-        with patch.object(Order.objects, "create", side_effect=IntegrityError("duplicate key")):
-            with pytest.raises(IntegrityError):
-                CheckoutService.checkout(cart_with_ticket)
+        line_item_inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "program_registration_orderlineitem"')
+        ]
+        assert len(line_item_inserts) == 1
+        assert order.line_items.count() == 2
+        assert InventoryCounter.objects.get(ticket_type=ticket_type).held == 2
+        assert InventoryCounter.objects.get(addon=addon).held == 1
+
+    def test_records_phase_latencies(self, cart_with_ticket):
+        checkout_latency.reset()
+        received = []
+
+        def handler(sender, **kwargs):
+            received.append(kwargs)
+
+        checkout_timed.connect(handler)
+        try:
+            order = CheckoutService.checkout(cart_with_ticket)
+        finally:
+            checkout_timed.disconnect(handler)
+
+        phases = {"lock", "revalidate", "price", "persist", "total"}
+        assert received[0]["order"] == order
+        assert set(received[0]["timings"]) == phases
+        snapshot = checkout_latency.snapshot()
+        assert set(snapshot) == phases
+        assert all(stats.count == 1 for stats in snapshot.values())
 
     def test_voucher_race_condition_at_update(self, conference, user):
         """Voucher passes is_valid in-memory but DB update returns 0."""
@@ -1013,52 +1053,6 @@ class TestCancelOrder:
         assert credit.remaining_amount == Decimal("50.00")
 
 
-# =============================================================================
-# TestExpireStaleOrders
-# =============================================================================
-
-
-@pytest.mark.django_db
-class TestExpireStaleOrders:
-    def test_expire_skipped_without_hold_field(self, conference):
-        """When _order_has_hold_expires_at returns False, no orders are expired."""
-
-        with patch(
-            "django_program.registration.services.checkout._order_has_hold_expires_at",
-            return_value=False,
-        ):
-            _expire_stale_pending_orders(conference_id=conference.pk, now=timezone.now())
-
-    def test_expire_decrements_voucher_usage(self, conference, user):
-        """Expiring stale orders releases their voucher usage."""
-        voucher = Voucher.objects.create(
-            conference=conference,
-            code="STALE",
-            voucher_type=Voucher.VoucherType.COMP,
-            max_uses=10,
-            times_used=3,
-            is_active=True,
-        )
-        order = Order.objects.create(
-            conference=conference,
-            user=user,
-            status=Order.Status.PENDING,
-            subtotal=Decimal("0.00"),
-            total=Decimal("0.00"),
-            reference=f"ORD-{uuid4().hex[:8].upper()}",
-            voucher_code="STALE",
-            hold_expires_at=timezone.now() - timedelta(minutes=1),
-        )
-
-        _expire_stale_pending_orders(conference_id=conference.pk, now=timezone.now())
-
-        order.refresh_from_db()
-        assert order.status == Order.Status.CANCELLED
-
-        voucher.refresh_from_db()
-        assert voucher.times_used == 2
-
-
 # =============================================================================
 # TestGlobalCapacityCheckoutIntegration
 # =============================================================================
@@ -0,0 +1,192 @@
+"""Tests for the compiled, cached condition plan."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.registration.conditions import (
+    DiscountEffect,
+    DiscountForCategory,
+    GroupMemberCondition,
+    TimeOrStockLimitCondition,
+)
+from django_program.registration.models import Cart, CartItem, TicketType
+from django_program.registration.services.condition_plan import (
+    compile_condition_plan,
+    get_condition_plan,
+    invalidate_condition_plan,
+)
+from django_program.registration.services.conditions import (
+    commit_condition_usage,
+    evaluate_for_items,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def conference():
+    return Conference.objects.create(
+        name="PlanCon",
+        slug=f"plancon-{uuid4().hex[:6]}",
+        start_date=date(2027, 6, 1),
+        end_date=date(2027, 6, 3),
+        timezone="UTC",
+    )
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username=f"plan-{uuid4().hex[:6]}", password="testpass123")
+
+
+@pytest.fixture
+def ticket_type(conference):
+    return TicketType.objects.create(
+        conference=conference,
+        name="General",
+        slug="general",
+        price=Decimal("100.00"),
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def items(user, conference, ticket_type):
+    cart = Cart.objects.create(
+        user=user,
+        conference=conference,
+        status=Cart.Status.OPEN,
+        expires_at=timezone.now() + timedelta(minutes=30),
+    )
+    CartItem.objects.create(cart=cart, ticket_type=ticket_type, quantity=1)
+    return list(cart.items.select_related("ticket_type", "addon"))
+
+
+def _percent_off(conference, name, value, **kwargs):
+    return TimeOrStockLimitCondition.objects.create(
+        conference=conference,
+        name=name,
+        discount_type=DiscountEffect.DiscountType.PERCENTAGE,
+        discount_value=Decimal(value),
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+def test_compile_sorts_across_types_and_snapshots_scope(conference, ticket_type):
+    cond = _percent_off(conference, "Scoped", "10.00", priority=5)
+    cond.applicable_ticket_types.add(ticket_type)
+    DiscountForCategory.objects.create(conference=conference, name="Category", percentage=Decimal("5.00"), priority=1)
+    _percent_off(conference, "Inactive", "50.00", is_active=False)
+
+    plan = compile_condition_plan(conference.pk)
+
+    assert [c.name for c in plan.conditions] == ["Category", "Scoped"]
+    assert plan.conditions[0].is_category is True
+    assert plan.conditions[1].ticket_type_ids == frozenset({ticket_type.pk})
+
+
+@pytest.mark.django_db
+def test_cached_plan_needs_no_metadata_queries(conference, user, items):
+    _percent_off(conference, "Early Bird", "20.00")
+    evaluate_for_items(items, user, conference)
+
+    with CaptureQueriesContext(connection) as ctx:
+        results = evaluate_for_items(items, user, conference)
+
+    assert len(ctx.captured_queries) == 0
+    assert results[0].discount_amount == Decimal("20.00")
+    assert results[0].conference_id == conference.pk
+
+
+@pytest.mark.django_db
+def test_save_invalidates_plan(conference, user, items):
+    cond = _percent_off(conference, "Early Bird", "20.00")
+    assert evaluate_for_items(items, user, conference)[0].discount_amount == Decimal("20.00")
+
+    cond.discount_value = Decimal("30.00")
+    cond.save()
+
+    assert evaluate_for_items(items, user, conference)[0].discount_amount == Decimal("30.00")
+
+
+@pytest.mark.django_db
+def test_delete_invalidates_plan(conference, user, items):
+    cond = _percent_off(conference, "Early Bird", "20.00")
+    assert len(evaluate_for_items(items, user, conference)) == 1
+
+    cond.delete()
+
+    assert evaluate_for_items(items, user, conference) == []
+
+
+@pytest.mark.django_db
+def test_m2m_changes_invalidate_plan(conference, user, items, ticket_type):
+    other = TicketType.objects.create(conference=conference, name="VIP", slug="vip", price=Decimal("200.00"))
+    cond = _percent_off(conference, "VIP only", "25.00")
+    cond.applicable_ticket_types.add(other)
+    assert evaluate_for_items(items, user, conference) == []
+
+    ticket_type.timeorstocklimitcondition_discounts.add(cond)
+    assert len(evaluate_for_items(items, user, conference)) == 1
+
+    ticket_type.timeorstocklimitcondition_discounts.clear()
+    assert evaluate_for_items(items, user, conference) == []
+
+
+@pytest.mark.django_db
+def test_group_membership_is_read_per_user_not_cached(conference, user, items):
+    group = Group.objects.create(name=f"staff-plan-{uuid4().hex[:6]}")
+    cond = GroupMemberCondition.objects.create(
+        conference=conference,
+        name="Staff",
+        discount_type=DiscountEffect.DiscountType.PERCENTAGE,
+        discount_value=Decimal("50.00"),
+    )
+    cond.groups.add(group)
+    assert evaluate_for_items(items, user, conference) == []
+
+    user.groups.add(group)
+
+    assert len(evaluate_for_items(items, user, conference)) == 1
+
+
+@pytest.mark.django_db
+def test_commit_usage_invalidates_stock_capped_plan(conference, user, items):
+    _percent_off(conference, "One left", "20.00", limit=1)
+    discounts = evaluate_for_items(items, user, conference)
+    assert len(discounts) == 1
+
+    commit_condition_usage(discounts)
+
+    assert evaluate_for_items(items, user, conference) == []
+
+
+@pytest.mark.django_db
+def test_commit_usage_keeps_uncapped_plan(conference, user, items):
+    _percent_off(conference, "Unlimited", "20.00")
+    discounts = evaluate_for_items(items, user, conference)
+    plan = get_condition_plan(conference)
+
+    commit_condition_usage(discounts)
+
+    assert get_condition_plan(conference) is plan
+
+
+@pytest.mark.django_db
+def test_invalidate_forces_recompile(conference):
+    plan = get_condition_plan(conference)
+    assert get_condition_plan(conference) is plan
+
+    invalidate_condition_plan(conference.pk)
+
+    assert get_condition_plan(conference).version != plan.version
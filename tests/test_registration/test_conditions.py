@@ -1212,31 +1212,38 @@ class TestCommitConditionUsage:
         results = evaluate_for_cart(cart)
         assert results == []
 
-    @pytest.mark.django_db
     def test_item_with_no_product_type_skipped(self):
-        """_item_matches_discount_scope returns False for item without product type."""
+        """CompiledCondition.matches_item returns False for item without product type."""
         from unittest.mock import MagicMock
 
-        from django_program.registration.services.conditions import _item_matches_discount_scope
+        from django_program.registration.services.condition_plan import CompiledCondition
 
         item = MagicMock()
         item.ticket_type_id = None
         item.addon_id = None
-        assert _item_matches_discount_scope(item, set(), set()) is False
+        condition = CompiledCondition(model="TimeOrStockLimitCondition", pk=1, conference_id=1, name="x", priority=0)
+        assert condition.matches_item(item) is False
 
-    @pytest.mark.django_db
     def test_item_with_no_product_type_skipped_by_category(self):
-        """_item_matches_category_scope returns False for item without product type."""
+        """A compiled category discount does not match an item without product type."""
         from unittest.mock import MagicMock
 
-        from django_program.registration.conditions import DiscountForCategory
-        from django_program.registration.services.conditions import _item_matches_category_scope
+        from django_program.registration.services.condition_plan import CompiledCondition
 
         item = MagicMock()
         item.ticket_type_id = None
         item.addon_id = None
-        condition = MagicMock(spec=DiscountForCategory)
-        assert _item_matches_category_scope(item, condition) is False
+        condition = CompiledCondition(
+            model="DiscountForCategory",
+            pk=1,
+            conference_id=1,
+            name="x",
+            priority=0,
+            is_category=True,
+            apply_to_tickets=True,
+            apply_to_addons=True,
+        )
+        assert condition.matches_item(item) is False
 
     @pytest.mark.django_db
     def test_category_discount_addons_only(self, cart, conference):
@@ -1291,3 +1298,103 @@ class TestFinalizeDiscountUsage:
         with patch("django_program.registration.services.checkout.commit_condition_usage") as mock_commit:
             _finalize_discount_usage(voucher=None, summary=summary, now=timezone.now())
             mock_commit.assert_called_once_with(summary.condition_discounts)
+
+
+# =============================================================================
+# UserEligibilityContext tests
+# =============================================================================
+
+
+class TestUserEligibilityContext:
+    """Tests for the batched per-user eligibility resolver."""
+
+    @pytest.mark.django_db
+    def test_speaker_and_copresenter_flags(self, conference, user, other_user):
+        from django_program.registration.services.eligibility import UserEligibilityContext
+
+        speaker = Speaker.objects.create(conference=conference, pretalx_code="SPK-CTX1", name="Me", user=user)
+        solo = Talk.objects.create(conference=conference, pretalx_code="TALK-CTX1", title="Solo")
+        solo.speakers.add(speaker)
+
+        context = UserEligibilityContext(user, conference.pk)
+        assert context.is_speaker is True
+        assert context.is_copresenter is False
+
+        other = Speaker.objects.create(conference=conference, pretalx_code="SPK-CTX2", name="Other", user=other_user)
+        duo = Talk.objects.create(conference=conference, pretalx_code="TALK-CTX2", title="Duo")
+        duo.speakers.add(speaker, other)
+
+        context = UserEligibilityContext(user, conference.pk)
+        assert context.is_copresenter is True
+        assert context.matches_speaker_roles(is_presenter=False, is_copresenter=True) is True
+
+    @pytest.mark.django_db
+    def test_anonymous_user_runs_no_queries(self, conference, django_assert_num_queries):
+        from django.contrib.auth.models import AnonymousUser
+
+        from django_program.registration.services.eligibility import UserEligibilityContext
+
+        context = UserEligibilityContext(AnonymousUser(), conference.pk)
+        with django_assert_num_queries(0):
+            assert context.is_speaker is False
+            assert context.in_any_group({1}) is False
+            assert context.has_purchased_any({1}) is False
+
+    @pytest.mark.django_db
+    def test_purchased_ids_only_count_paid_orders(self, conference, user, ticket_type, addon):
+        from django_program.registration.services.eligibility import UserEligibilityContext
+
+        paid = _make_order(conference=conference, user=user, status=Order.Status.PAID)
+        OrderLineItem.objects.create(
+            order=paid,
+            description="T",
+            quantity=1,
+            unit_price=Decimal(1),
+            line_total=Decimal(1),
+            ticket_type=ticket_type,
+        )
+        OrderLineItem.objects.create(
+            order=paid, description="A", quantity=1, unit_price=Decimal(1), line_total=Decimal(1), addon=addon
+        )
+        pending = _make_order(conference=conference, user=user, status=Order.Status.PENDING)
+        other_ticket = TicketType.objects.create(
+            conference=conference, name="Other", slug="other-ctx", price=Decimal("10.00")
+        )
+        OrderLineItem.objects.create(
+            order=pending,
+            description="P",
+            quantity=1,
+            unit_price=Decimal(1),
+            line_total=Decimal(1),
+            ticket_type=other_ticket,
+        )
+
+        context = UserEligibilityContext(user, conference.pk)
+        assert context.purchased_ticket_type_ids == frozenset({ticket_type.pk})
+        assert context.purchased_addon_ids == frozenset({addon.pk})
+
+    @pytest.mark.django_db
+    def test_many_conditions_cost_at_most_three_queries(
+        self, cart, conference, user, ticket_type, django_assert_max_num_queries
+    ):
+        from django_program.registration.services.conditions import evaluate_for_items, get_eligible_discounts
+        from django_program.registration.services.eligibility import UserEligibilityContext
+
+        CartItem.objects.create(cart=cart, ticket_type=ticket_type, quantity=1)
+        items = list(cart.items.select_related("ticket_type", "addon"))
+        Speaker.objects.create(conference=conference, pretalx_code="SPK-CTX3", name="Me", user=user)
+        for i in range(10):
+            SpeakerCondition.objects.create(
+                conference=conference, name=f"Copresenter {i}", is_presenter=False, is_copresenter=True
+            )
+            group = Group.objects.create(name=f"ctx-group-{i}-{uuid4().hex[:6]}")
+            GroupMemberCondition.objects.create(conference=conference, name=f"Group {i}").groups.add(group)
+            IncludedProductCondition.objects.create(
+                conference=conference, name=f"Included {i}"
+            ).enabling_ticket_types.add(ticket_type)
+        get_eligible_discounts(user, conference)  # warm the compiled plan
+
+        eligibility = UserEligibilityContext(user, conference.pk)
+        with django_assert_max_num_queries(3):
+            assert evaluate_for_items(items, user, conference, eligibility=eligibility) == []
+            assert get_eligible_discounts(user, conference, eligibility=eligibility) == []
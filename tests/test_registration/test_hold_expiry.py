@@ -0,0 +1,196 @@
+"""Tests for the hold-expiry sweeper and the expire_holds command."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.registration.models import (
+    Cart,
+    CartItem,
+    InventoryCounter,
+    Order,
+    OrderLineItem,
+    TicketType,
+    Voucher,
+)
+from django_program.registration.services.checkout import CheckoutService
+from django_program.registration.services.hold_expiry import (
+    expire_stale_holds,
+    start_hold_sweeper,
+    stop_hold_sweeper,
+)
+from django_program.registration.signals import holds_expired
+
+User = get_user_model()
+
+
+@pytest.fixture
+def conference():
+    return Conference.objects.create(
+        name="SweepCon",
+        slug=f"sweepcon-{uuid4().hex[:6]}",
+        start_date=date(2027, 6, 1),
+        end_date=date(2027, 6, 3),
+        timezone="UTC",
+    )
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username=f"sweep-{uuid4().hex[:6]}", password="testpass123")
+
+
+@pytest.fixture
+def ticket_type(conference):
+    return TicketType.objects.create(
+        conference=conference,
+        name="General",
+        slug="general",
+        price=Decimal("100.00"),
+        total_quantity=3,
+    )
+
+
+def _pending(conference, user, *, minutes, voucher_code="", ticket_type=None, quantity=1):
+    order = Order.objects.create(
+        conference=conference,
+        user=user,
+        status=Order.Status.PENDING,
+        reference=f"SWP-{uuid4().hex[:8].upper()}",
+        voucher_code=voucher_code,
+        hold_expires_at=timezone.now() + timedelta(minutes=15),
+    )
+    if ticket_type is not None:
+        OrderLineItem.objects.create(
+            order=order,
+            description=ticket_type.name,
+            quantity=quantity,
+            unit_price=ticket_type.price,
+            line_total=ticket_type.price * quantity,
+            ticket_type=ticket_type,
+        )
+    Order.objects.filter(pk=order.pk).update(hold_expires_at=timezone.now() + timedelta(minutes=minutes))
+    return order
+
+
+@pytest.mark.django_db
+class TestExpireStaleHolds:
+    def test_cancels_lapsed_orders_and_releases_inventory(self, conference, user, ticket_type):
+        stale = _pending(conference, user, minutes=-1, ticket_type=ticket_type, quantity=2)
+        fresh = _pending(conference, user, minutes=10, ticket_type=ticket_type)
+
+        result = expire_stale_holds(conference_id=conference.pk)
+
+        assert (result.orders_expired, result.holds_released, result.batches) == (1, 1, 1)
+        stale.refresh_from_db()
+        fresh.refresh_from_db()
+        assert stale.status == Order.Status.CANCELLED
+        assert stale.hold_expires_at is None
+        assert fresh.status == Order.Status.PENDING
+        counter = InventoryCounter.objects.get(ticket_type=ticket_type)
+        assert (counter.sold, counter.held, counter.released) == (0, 1, 2)
+
+    def test_voucher_usage_released_in_one_grouped_update(self, conference, user):
+        spring = Voucher.objects.create(conference=conference, code="SPRING", max_uses=10, times_used=5)
+        once = Voucher.objects.create(conference=conference, code="ONCE", max_uses=10, times_used=1)
+        for code in ("SPRING", "SPRING", "ONCE", "ONCE", ""):
+            _pending(conference, user, minutes=-1, voucher_code=code)
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = expire_stale_holds(conference_id=conference.pk)
+
+        voucher_updates = [
+            q for q in ctx.captured_queries if q["sql"].startswith('UPDATE "program_registration_voucher"')
+        ]
+        assert len(voucher_updates) == 1
+
+        assert result.vouchers_released == 4
+        spring.refresh_from_db()
+        once.refresh_from_db()
+        assert spring.times_used == 3
+        assert once.times_used == 0
+
+    def test_works_off_backlog_in_batches(self, conference, user):
+        for _ in range(5):
+            _pending(conference, user, minutes=-1)
+
+        limited = expire_stale_holds(conference_id=conference.pk, batch_size=2, max_batches=1)
+        assert (limited.orders_expired, limited.batches) == (2, 1)
+
+        rest = expire_stale_holds(conference_id=conference.pk, batch_size=2)
+        assert (rest.orders_expired, rest.batches) == (3, 2)
+
+    def test_sends_holds_expired_signal(self, conference, user):
+        _pending(conference, user, minutes=-1)
+        received = []
+
+        def handler(sender, **kwargs):
+            received.append(kwargs)
+
+        holds_expired.connect(handler)
+        try:
+            expire_stale_holds(conference_id=conference.pk)
+        finally:
+            holds_expired.disconnect(handler)
+
+        assert received[0]["conference_id"] == conference.pk
+        assert received[0]["result"].orders_expired == 1
+
+    def test_checkout_leaves_other_stale_orders_to_the_sweeper(self, conference, user, ticket_type):
+        other = User.objects.create_user(username=f"sweep-other-{uuid4().hex[:6]}", password="testpass123")
+        stale = _pending(conference, other, minutes=-1, ticket_type=ticket_type, quantity=3)
+        cart = Cart.objects.create(
+            user=user,
+            conference=conference,
+            status=Cart.Status.OPEN,
+            expires_at=timezone.now() + timedelta(minutes=30),
+        )
+        CartItem.objects.create(cart=cart, ticket_type=ticket_type, quantity=1)
+
+        CheckoutService.checkout(cart)
+
+        stale.refresh_from_db()
+        assert stale.status == Order.Status.PENDING
+        assert stale.inventory_bucket == Order.InventoryBucket.NONE
+
+
+@pytest.mark.django_db
+class TestExpireHoldsCommand:
+    def test_reports_sweep(self, conference, user):
+        _pending(conference, user, minutes=-1)
+        out = StringIO()
+
+        call_command("expire_holds", "--conference", conference.slug, stdout=out)
+
+        assert "Expired 1 orders in 1 batches" in out.getvalue()
+
+    def test_unknown_conference(self):
+        with pytest.raises(CommandError, match="not found"):
+            call_command("expire_holds", "--conference", "missing")
+
+
+class TestInProcessSweeper:
+    def test_disabled_by_default(self):
+        assert start_hold_sweeper() is None
+
+    def test_starts_once_and_stops(self):
+        with override_settings(DJANGO_PROGRAM={"hold_sweep_interval_seconds": 3600}):
+            thread = start_hold_sweeper()
+            try:
+                assert thread is not None
+                assert thread.is_alive()
+                assert start_hold_sweeper() is thread
+            finally:
+                stop_hold_sweeper(timeout=5)
+        assert not thread.is_alive()
@@ -0,0 +1,224 @@
+"""Tests for the denormalized inventory counters and the reconcile command."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.registration.models import (
+    AddOn,
+    Cart,
+    CartItem,
+    InventoryCounter,
+    Order,
+    OrderLineItem,
+    TicketType,
+)
+from django_program.registration.services.checkout import CheckoutService
+from django_program.registration.services.inventory import (
+    reconcile_inventory,
+    release_expired_holds,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def conference():
+    return Conference.objects.create(
+        name="StockCon",
+        slug=f"stockcon-{uuid4().hex[:6]}",
+        start_date=date(2027, 6, 1),
+        end_date=date(2027, 6, 3),
+        timezone="UTC",
+    )
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username=f"stock-{uuid4().hex[:6]}", password="testpass123")
+
+
+@pytest.fixture
+def ticket_type(conference):
+    return TicketType.objects.create(
+        conference=conference,
+        name="General",
+        slug="general",
+        price=Decimal("100.00"),
+        total_quantity=10,
+    )
+
+
+@pytest.fixture
+def addon(conference):
+    return AddOn.objects.create(
+        conference=conference,
+        name="Workshop",
+        slug="workshop",
+        price=Decimal("50.00"),
+        total_quantity=5,
+    )
+
+
+def _order(conference, user, *lines, status=Order.Status.PENDING, hold_minutes=None):
+    hold = timezone.now() + timedelta(minutes=hold_minutes) if hold_minutes is not None else None
+    order = Order.objects.create(
+        conference=conference,
+        user=user,
+        status=status,
+        reference=f"INV-{uuid4().hex[:8].upper()}",
+        hold_expires_at=hold,
+    )
+    for product, quantity in lines:
+        field = "ticket_type" if isinstance(product, TicketType) else "addon"
+        OrderLineItem.objects.create(
+            order=order,
+            description=product.name,
+            quantity=quantity,
+            unit_price=Decimal("1.00"),
+            line_total=Decimal(quantity),
+            **{field: product},
+        )
+    return order
+
+
+def _counts(**lookup):
+    counter = InventoryCounter.objects.filter(**lookup).first()
+    return (counter.sold, counter.held, counter.released) if counter else (0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_line_items_count_under_their_orders_bucket(conference, user, ticket_type, addon):
+    _order(conference, user, (ticket_type, 2), (addon, 1), status=Order.Status.PAID)
+    _order(conference, user, (ticket_type, 3), hold_minutes=15)
+    _order(conference, user, (ticket_type, 4), status=Order.Status.CANCELLED)
+
+    assert _counts(ticket_type=ticket_type) == (2, 3, 4)
+    assert _counts(addon=addon) == (1, 0, 0)
+    assert ticket_type.remaining_quantity == 5
+
+
+@pytest.mark.django_db
+def test_status_transitions_move_quantities(conference, user, ticket_type):
+    order = _order(conference, user, (ticket_type, 2), hold_minutes=15)
+
+    order.status = Order.Status.PAID
+    order.hold_expires_at = None
+    order.save(update_fields=["status", "hold_expires_at", "updated_at"])
+    assert _counts(ticket_type=ticket_type) == (2, 0, 0)
+
+    order.status = Order.Status.REFUNDED
+    order.save()
+    assert _counts(ticket_type=ticket_type) == (0, 0, 2)
+
+
+@pytest.mark.django_db
+def test_stale_instance_save_does_not_double_count(conference, user, ticket_type):
+    order = _order(conference, user, (ticket_type, 2), hold_minutes=15)
+    stale = Order.objects.get(pk=order.pk)
+
+    order.status = Order.Status.PAID
+    order.save(update_fields=["status", "updated_at"])
+    stale.billing_name = "Ada"
+    stale.status = Order.Status.PAID
+    stale.save()
+
+    assert _counts(ticket_type=ticket_type) == (2, 0, 0)
+    assert Order.objects.get(pk=order.pk).inventory_bucket == Order.InventoryBucket.SOLD
+
+
+@pytest.mark.django_db
+def test_unrelated_save_skips_inventory_sync(conference, user, ticket_type, django_assert_num_queries):
+    order = _order(conference, user, (ticket_type, 1), status=Order.Status.PAID)
+
+    order.billing_name = "Ada"
+    with django_assert_num_queries(1):
+        order.save(update_fields=["billing_name", "updated_at"])
+
+
+@pytest.mark.django_db
+def test_remaining_quantity_is_a_single_row_read(conference, user, ticket_type, django_assert_num_queries):
+    _order(conference, user, (ticket_type, 3), status=Order.Status.PAID)
+
+    with django_assert_num_queries(1):
+        assert ticket_type.remaining_quantity == 7
+
+
+@pytest.mark.django_db
+def test_release_expired_holds_keeps_orders_pending(conference, user, ticket_type):
+    order = _order(conference, user, (ticket_type, 4), hold_minutes=15)
+    Order.objects.filter(pk=order.pk).update(hold_expires_at=timezone.now() - timedelta(minutes=1))
+
+    assert ticket_type.remaining_quantity == 6
+    assert release_expired_holds(conference_id=conference.pk) == 1
+    assert ticket_type.remaining_quantity == 10
+    assert release_expired_holds(conference_id=conference.pk) == 0
+
+    order.refresh_from_db()
+    assert order.status == Order.Status.PENDING
+    order.status = Order.Status.PAID
+    order.save(update_fields=["status", "updated_at"])
+    assert _counts(ticket_type=ticket_type) == (4, 0, 0)
+
+
+@pytest.mark.django_db
+def test_checkout_holds_stock_and_deleting_order_releases_counters(conference, user, ticket_type):
+    cart = Cart.objects.create(
+        user=user,
+        conference=conference,
+        status=Cart.Status.OPEN,
+        expires_at=timezone.now() + timedelta(minutes=30),
+    )
+    CartItem.objects.create(cart=cart, ticket_type=ticket_type, quantity=2)
+
+    order = CheckoutService.checkout(cart)
+    assert _counts(ticket_type=ticket_type) == (0, 2, 0)
+
+    order.delete()
+    assert _counts(ticket_type=ticket_type) == (0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_reconcile_repairs_drift(conference, user, ticket_type, addon):
+    _order(conference, user, (ticket_type, 2), status=Order.Status.PAID)
+    lapsed = _order(conference, user, (addon, 1), hold_minutes=15)
+    Order.objects.filter(pk=lapsed.pk).update(hold_expires_at=timezone.now() - timedelta(minutes=1))
+    InventoryCounter.objects.filter(ticket_type=ticket_type).update(sold=9)
+
+    dry = reconcile_inventory(conference_id=conference.pk, dry_run=True)
+    assert len(dry.drift) == 2
+    assert _counts(ticket_type=ticket_type) == (9, 0, 0)
+
+    result = reconcile_inventory(conference_id=conference.pk)
+
+    assert result.orders_rebucketed == 1
+    assert _counts(ticket_type=ticket_type) == (2, 0, 0)
+    assert _counts(addon=addon) == (0, 0, 1)
+    assert reconcile_inventory(conference_id=conference.pk).drift == ()
+
+
+@pytest.mark.django_db
+def test_reconcile_inventory_command(conference, user, ticket_type):
+    _order(conference, user, (ticket_type, 2), status=Order.Status.PAID)
+    InventoryCounter.objects.filter(ticket_type=ticket_type).delete()
+    out = StringIO()
+
+    call_command("reconcile_inventory", "--conference", conference.slug, stdout=out)
+
+    assert f"ticket type {ticket_type.pk}: sold/held/released 0/0/0 -> 2/0/0" in out.getvalue()
+    assert "Corrected 1 counters" in out.getvalue()
+    assert _counts(ticket_type=ticket_type) == (2, 0, 0)
+
+
+@pytest.mark.django_db
+def test_reconcile_inventory_command_unknown_conference():
+    with pytest.raises(CommandError, match="not found"):
+        call_command("reconcile_inventory", "--conference", "missing")
@@ -0,0 +1,274 @@
+"""Tests for the daily sales rollups and the rebuild_rollups command."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.manage.reports import (
+    get_aov_by_date,
+    get_cumulative_revenue,
+    get_registration_flow,
+    get_revenue_by_ticket_type,
+    get_sales_by_date,
+)
+from django_program.registration.models import (
+    Attendee,
+    DailySalesRollup,
+    Order,
+    OrderLineItem,
+    SalesRollupState,
+    TicketType,
+)
+from django_program.registration.services.hold_expiry import expire_stale_holds
+from django_program.registration.services.rollups import rebuild_rollups, recount_cancellations, rollups_ready
+
+User = get_user_model()
+
+_REPORTS = (
+    get_sales_by_date,
+    get_aov_by_date,
+    get_registration_flow,
+    get_revenue_by_ticket_type,
+    get_cumulative_revenue,
+)
+
+
+@pytest.fixture
+def conference():
+    return Conference.objects.create(
+        name="RollupCon",
+        slug=f"rollupcon-{uuid4().hex[:6]}",
+        start_date=date(2027, 6, 1),
+        end_date=date(2027, 6, 3),
+        timezone="UTC",
+    )
+
+
+@pytest.fixture
+def ticket_types(conference):
+    return [
+        TicketType.objects.create(conference=conference, name=name, slug=name.lower(), price=price)
+        for name, price in (("General", Decimal("100.00")), ("Student", Decimal("40.00")))
+    ]
+
+
+def _user():
+    return User.objects.create_user(username=f"rollup-{uuid4().hex[:6]}", password="testpass123")
+
+
+def _order(conference, *lines, status=Order.Status.PENDING, days_ago=0, hold_minutes=None):
+    hold = timezone.now() + timedelta(minutes=hold_minutes) if hold_minutes is not None else None
+    order = Order.objects.create(
+        conference=conference,
+        user=_user(),
+        status=status,
+        reference=f"ROL-{uuid4().hex[:8].upper()}",
+        hold_expires_at=hold,
+        total=sum((ticket_type.price * quantity for ticket_type, quantity in lines), Decimal("0.00")),
+    )
+    for ticket_type, quantity in lines:
+        OrderLineItem.objects.create(
+            order=order,
+            description=ticket_type.name,
+            quantity=quantity,
+            unit_price=ticket_type.price,
+            line_total=ticket_type.price * quantity,
+            ticket_type=ticket_type,
+        )
+    if days_ago:
+        Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        order.refresh_from_db()
+    return order
+
+
+def _day_row(conference, day=None):
+    return DailySalesRollup.objects.get(
+        conference=conference, date=day or timezone.localdate(), ticket_type__isnull=True
+    )
+
+
+def _live(conference):
+    """Run every report against the live order tables."""
+    SalesRollupState.objects.filter(conference=conference).delete()
+    return [report(conference) for report in _REPORTS]
+
+
+@pytest.mark.django_db
+def test_payment_and_refund_move_order_through_rollups(conference, ticket_types):
+    general, student = ticket_types
+    order = _order(conference, (general, 2), (student, 1), hold_minutes=15)
+
+    order.status = Order.Status.PAID
+    order.hold_expires_at = None
+    order.save(update_fields=["status", "hold_expires_at", "updated_at"])
+
+    day = _day_row(conference)
+    assert (day.orders, day.revenue) == (1, Decimal("240.00"))
+    general_row = DailySalesRollup.objects.get(conference=conference, ticket_type=general)
+    assert (general_row.quantity, general_row.revenue) == (2, Decimal("200.00"))
+
+    order.status = Order.Status.REFUNDED
+    order.save()
+
+    day.refresh_from_db()
+    general_row.refresh_from_db()
+    assert (day.orders, day.revenue) == (0, Decimal("0.00"))
+    assert general_row.quantity == 0
+
+
+@pytest.mark.django_db
+def test_orders_created_paid_are_counted_once(conference, ticket_types):
+    _order(conference, (ticket_types[0], 3), status=Order.Status.PAID)
+
+    day = _day_row(conference)
+    assert (day.orders, day.revenue) == (1, Decimal("300.00"))
+    assert DailySalesRollup.objects.get(conference=conference, ticket_type=ticket_types[0]).quantity == 3
+
+
+@pytest.mark.django_db
+def test_registrations_and_cancellations_are_counted(conference, ticket_types):
+    Attendee.objects.create(user=_user(), conference=conference)
+    attendee = Attendee.objects.create(user=_user(), conference=conference)
+    order = _order(conference, (ticket_types[0], 1))
+
+    order.status = Order.Status.CANCELLED
+    order.save()
+    attendee.delete()
+
+    day = _day_row(conference)
+    assert (day.registrations, day.cancellations) == (1, 1)
+
+
+@pytest.mark.django_db
+def test_cancelled_order_saved_on_a_later_day_moves_its_cancellation(conference, ticket_types):
+    order = _order(conference, (ticket_types[0], 1), status=Order.Status.CANCELLED)
+    today = timezone.localdate(order.updated_at)
+    yesterday = today - timedelta(days=1)
+    Order.objects.filter(pk=order.pk).update(updated_at=order.updated_at - timedelta(days=1))
+    recount_cancellations([(conference.pk, today), (conference.pk, yesterday)])
+
+    order = Order.objects.get(pk=order.pk)
+    order.save()
+
+    assert _day_row(conference, yesterday).cancellations == 0
+    assert _day_row(conference, today).cancellations == 1
+
+
+@pytest.mark.django_db
+def test_uncancelling_an_order_recounts_its_day(conference, ticket_types):
+    order = _order(conference, (ticket_types[0], 1), status=Order.Status.CANCELLED)
+    day = timezone.localdate(order.updated_at)
+
+    order.status = Order.Status.PENDING
+    order.save(update_fields=["status", "updated_at"])
+
+    assert _day_row(conference, day).cancellations == 0
+
+
+@pytest.mark.django_db
+def test_deleting_the_conference_removes_its_rollups(conference, ticket_types):
+    _order(conference, (ticket_types[0], 2), status=Order.Status.PAID)
+    _order(conference, (ticket_types[1], 1), status=Order.Status.CANCELLED)
+    Attendee.objects.create(user=_user(), conference=conference)
+
+    conference.delete()
+
+    assert not DailySalesRollup.objects.exists()
+
+
+@pytest.mark.django_db
+def test_hold_sweeper_recounts_cancellations(conference, ticket_types):
+    order = _order(conference, (ticket_types[0], 1), hold_minutes=-1)
+
+    expire_stale_holds(conference_id=conference.pk)
+
+    order.refresh_from_db()
+    assert _day_row(conference, timezone.localdate(order.updated_at)).cancellations == 1
+
+
+@pytest.mark.django_db
+def test_reports_read_live_tables_until_rollups_are_built(conference, ticket_types):
+    _order(conference, (ticket_types[0], 1), status=Order.Status.PAID)
+    DailySalesRollup.objects.filter(conference=conference).delete()
+
+    assert not rollups_ready(conference.pk)
+    assert get_sales_by_date(conference)[0]["count"] == 1
+
+
+@pytest.mark.django_db
+def test_rebuilt_rollups_match_live_reports(conference, ticket_types):
+    general, student = ticket_types
+    _order(conference, (general, 1), (student, 2), status=Order.Status.PAID, days_ago=3)
+    _order(conference, (general, 2), status=Order.Status.PARTIALLY_REFUNDED, days_ago=3)
+    _order(conference, (student, 1), status=Order.Status.PAID, days_ago=1)
+    _order(conference, (general, 5), status=Order.Status.PENDING, hold_minutes=15)
+    _order(conference, (general, 1), status=Order.Status.CANCELLED)
+    Attendee.objects.create(user=_user(), conference=conference)
+    # Drift the rollups so the rebuild has something to correct.
+    DailySalesRollup.objects.filter(conference=conference).update(orders=99)
+
+    expected = _live(conference)
+    result = rebuild_rollups(conference_id=conference.pk)
+
+    assert result.conferences == 1
+    assert rollups_ready(conference.pk)
+    assert [report(conference) for report in _REPORTS] == expected
+
+
+@pytest.mark.django_db
+def test_incremental_updates_keep_rollups_in_step_with_live_reports(conference, ticket_types):
+    general, student = ticket_types
+    _order(conference, (general, 1), status=Order.Status.PAID, days_ago=2)
+    rebuild_rollups(conference_id=conference.pk)
+
+    pending = _order(conference, (general, 1), (student, 3), hold_minutes=15)
+    pending.status = Order.Status.PAID
+    pending.save()
+    refunded = _order(conference, (student, 1), status=Order.Status.PAID)
+    refunded.status = Order.Status.REFUNDED
+    refunded.save()
+    Attendee.objects.create(user=_user(), conference=conference)
+
+    from_rollups = [report(conference) for report in _REPORTS]
+    assert from_rollups == _live(conference)
+
+
+@pytest.mark.django_db
+def test_rollup_reports_do_not_scan_orders(conference, ticket_types):
+    for days_ago in range(1, 6):
+        _order(conference, (ticket_types[0], 1), status=Order.Status.PAID, days_ago=days_ago)
+    rebuild_rollups(conference_id=conference.pk)
+
+    with CaptureQueriesContext(connection) as ctx:
+        get_sales_by_date(conference)
+        get_revenue_by_ticket_type(conference)
+
+    assert not [q for q in ctx.captured_queries if '"program_registration_order"' in q["sql"]]
+    assert len(ctx.captured_queries) == 4
+
+
+@pytest.mark.django_db
+def test_rebuild_rollups_command(conference, ticket_types):
+    _order(conference, (ticket_types[0], 1), status=Order.Status.PAID)
+    out = StringIO()
+
+    call_command("rebuild_rollups", "--conference", conference.slug, stdout=out)
+
+    assert "Rebuilt 2 rollup rows for 1 conferences" in out.getvalue()
+    assert rollups_ready(conference.pk)
+
+
+@pytest.mark.django_db
+def test_rebuild_rollups_command_unknown_conference():
+    with pytest.raises(CommandError, match="not found"):
+        call_command("rebuild_rollups", "--conference", "missing")
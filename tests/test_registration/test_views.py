@@ -1,17 +1,19 @@
 """Tests for registration views.
 
 Covers TicketSelectView, CartView, CheckoutView, OrderConfirmationView,
-OrderDetailView, and the helper functions _generate_order_reference,
-_calculate_discount, and _cart_totals.
+OrderDetailView, and the helper functions _calculate_discount and
+_cart_totals.
 """
 
+import re
 from datetime import date, timedelta
 from decimal import Decimal
-from unittest.mock import patch
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -20,6 +22,7 @@ from django_program.registration.models import (
     AddOn,
     Cart,
     CartItem,
+    InventoryCounter,
     Order,
     OrderLineItem,
     Payment,
@@ -28,7 +31,6 @@ from django_program.registration.models import (
 from django_program.registration.views import (
     _calculate_discount,
     _cart_totals,
-    _generate_order_reference,
 )
 
 # ---------------------------------------------------------------------------
@@ -229,23 +231,6 @@ def anon_client():
 # ---------------------------------------------------------------------------
 
 
-class TestGenerateOrderReference:
-    def test_format(self):
-        ref = _generate_order_reference()
-        assert ref.startswith("ORD-")
-        assert len(ref) == 10  # "ORD-" + 6 chars
-
-    def test_alphanumeric_chars(self):
-        ref = _generate_order_reference()
-        suffix = ref[4:]
-        assert suffix.isalnum()
-        assert suffix == suffix.upper()
-
-    def test_uniqueness(self):
-        refs = {_generate_order_reference() for _ in range(50)}
-        assert len(refs) >= 45  # statistically near impossible to collide
-
-
 class TestCalculateDiscount:
     def test_none_voucher_returns_zero(self):
         assert _calculate_discount(Decimal("100.00"), None) == Decimal("0.00")
@@ -1036,32 +1021,31 @@ class TestCheckoutViewPost:
         )
         assert resp.url == expected_url
 
-    def test_checkout_retries_on_reference_collision(self, client_logged_in, conference, cart_with_ticket, user):
-        # Pre-create an order with a known reference
-        Order.objects.create(
-            conference=conference,
-            user=user,
-            reference="ORD-DUPE01",
-            status=Order.Status.PAID,
-            subtotal=Decimal(0),
-            total=Decimal(0),
-        )
-        # First call returns the colliding reference, second returns a unique one
-        with patch(
-            "django_program.registration.views._generate_order_reference",
-            side_effect=["ORD-DUPE01", "ORD-UNIQ99"],
-        ):
-            url = reverse("registration:checkout", kwargs={"conference_slug": conference.slug})
-            resp = client_logged_in.post(
-                url,
-                {
-                    "billing_name": "Jane Doe",
-                    "billing_email": "jane@example.com",
-                },
-            )
+    def test_checkout_uses_collision_free_reference(self, client_logged_in, conference, cart_with_ticket, user):
+        url = reverse("registration:checkout", kwargs={"conference_slug": conference.slug})
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client_logged_in.post(url, {"billing_name": "Jane Doe", "billing_email": "jane@example.com"})
+
+        assert resp.status_code == 302
+        order = Order.objects.get(conference=conference, user=user)
+        assert re.fullmatch(r"ORD-[0-9A-Z]{13}", order.reference)
+        # No exists() probe for the reference before the insert.
+        assert not any('"reference" =' in q["sql"] and q["sql"].startswith("SELECT") for q in ctx.captured_queries)
+
+    def test_checkout_bulk_creates_and_counts_line_items(
+        self, client_logged_in, conference, cart_with_ticket, cart_with_addon, ticket_type, addon
+    ):
+        url = reverse("registration:checkout", kwargs={"conference_slug": conference.slug})
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client_logged_in.post(url, {"billing_name": "Jane Doe", "billing_email": "jane@example.com"})
+
         assert resp.status_code == 302
-        new_order = Order.objects.get(reference="ORD-UNIQ99")
-        assert new_order.user == user
+        line_item_inserts = [
+            q for q in ctx.captured_queries if q["sql"].startswith('INSERT INTO "program_registration_orderlineitem"')
+        ]
+        assert len(line_item_inserts) == 1
+        assert InventoryCounter.objects.get(ticket_type=ticket_type).held == 1
+        assert InventoryCounter.objects.get(addon=addon).held == 2
 
     def test_checkout_with_expired_voucher(self, client_logged_in, conference, cart_with_ticket, user):
         expired_voucher = Voucher.objects.create(
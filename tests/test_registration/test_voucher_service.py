@@ -13,7 +13,7 @@ from django_program.registration.models import AddOn, TicketType, Voucher
 from django_program.registration.services.voucher_service import (
     _CODE_LENGTH,
     VoucherBulkConfig,
-    _generate_unique_code,
+    _random_codes,
     generate_voucher_codes,
 )
 
@@ -66,56 +66,40 @@ def base_config(conference):
 
 
 # ---------------------------------------------------------------------------
-# _generate_unique_code tests
+# _random_codes tests
 # ---------------------------------------------------------------------------
 
 
-class TestGenerateUniqueCode:
-    """Tests for the internal ``_generate_unique_code`` helper."""
+class TestRandomCodes:
+    """Tests for the internal ``_random_codes`` helper."""
 
-    def test_produces_code_with_prefix(self):
-        code = _generate_unique_code("SPEAKER-", set())
-        assert code.startswith("SPEAKER-")
+    def test_produces_codes_with_prefix(self):
+        codes = _random_codes("SPEAKER-", 5)
+        assert all(code.startswith("SPEAKER-") for code in codes)
 
     def test_code_has_correct_length(self):
         prefix = "PFX-"
-        code = _generate_unique_code(prefix, set())
-        random_part = code[len(prefix) :]
-        assert len(random_part) == _CODE_LENGTH
+        for code in _random_codes(prefix, 5):
+            assert len(code[len(prefix) :]) == _CODE_LENGTH
 
     def test_code_is_uppercase_alphanumeric(self):
-        code = _generate_unique_code("", set())
         allowed = set(string.ascii_uppercase + string.digits)
-        assert all(c in allowed for c in code)
+        for code in _random_codes("", 20):
+            assert all(c in allowed for c in code)
 
-    def test_code_with_prefix_is_uppercase_alphanumeric_in_random_part(self):
-        prefix = "TEST-"
-        code = _generate_unique_code(prefix, set())
-        random_part = code[len(prefix) :]
-        allowed = set(string.ascii_uppercase + string.digits)
-        assert all(c in allowed for c in random_part)
-
-    def test_avoids_existing_codes(self):
-        existing = set()
-        codes = []
-        for _ in range(50):
-            code = _generate_unique_code("", existing)
-            assert code not in existing
-            existing.add(code)
-            codes.append(code)
-        assert len(set(codes)) == 50
+    def test_draws_distinct_codes(self):
+        assert len(_random_codes("", 1000)) == 1000
 
-    def test_raises_runtime_error_on_exhaustion(self):
+    def test_drops_biased_bytes(self):
+        # 252-255 would favour the first characters of the alphabet.
         with patch(
-            "django_program.registration.services.voucher_service.secrets.choice",
-            return_value="A",
+            "django_program.registration.services.voucher_service.secrets.token_bytes",
+            side_effect=[bytes([255] * 16), bytes(range(16))],
         ):
-            existing = {"A" * _CODE_LENGTH}
-            with pytest.raises(RuntimeError, match="Failed to generate a unique voucher code"):
-                _generate_unique_code("", existing)
+            assert _random_codes("", 1) == {"ABCDEFGH"}
 
     def test_empty_prefix_works(self):
-        code = _generate_unique_code("", set())
+        (code,) = _random_codes("", 1)
         assert len(code) == _CODE_LENGTH
 
 
@@ -222,6 +206,40 @@ class TestGenerateVoucherCodes:
         all_codes = list(Voucher.objects.filter(conference=conference).values_list("code", flat=True))
         assert len(set(all_codes)) == 4  # 1 existing + 3 new
 
+    def test_redraws_codes_that_already_exist(self, conference):
+        Voucher.objects.create(conference=conference, code="EXIST-AAAAAAAA", discount_value=Decimal("0.00"))
+        config = VoucherBulkConfig(
+            conference=conference,
+            prefix="EXIST-",
+            count=2,
+            voucher_type=Voucher.VoucherType.COMP,
+            discount_value=Decimal("0.00"),
+        )
+        # Round one draws AAAAAAAA (taken) and BBBBBBBB; round two draws CCCCCCCC.
+        draws = [b"\x00" * 8 + b"\x01" * 8, b"\x02" * 16]
+        with patch("django_program.registration.services.voucher_service.secrets.token_bytes", side_effect=draws):
+            created = generate_voucher_codes(config)
+
+        assert sorted(v.code for v in created) == ["EXIST-BBBBBBBB", "EXIST-CCCCCCCC"]
+
+    def test_raises_runtime_error_when_codes_run_out(self, conference):
+        Voucher.objects.create(conference=conference, code="AAAAAAAA", discount_value=Decimal("0.00"))
+        config = VoucherBulkConfig(
+            conference=conference,
+            prefix="",
+            count=1,
+            voucher_type=Voucher.VoucherType.COMP,
+            discount_value=Decimal("0.00"),
+        )
+        with (
+            patch(
+                "django_program.registration.services.voucher_service.secrets.token_bytes",
+                side_effect=lambda n: b"\x00" * n,
+            ),
+            pytest.raises(RuntimeError, match="Failed to generate 1 unique voucher codes"),
+        ):
+            generate_voucher_codes(config)
+
     def test_generated_codes_use_specified_prefix(self, conference):
         """Verify generated codes start with the configured prefix."""
         Voucher.objects.create(
@@ -0,0 +1,185 @@
+"""Tests for the checkout waiting room and its cart/checkout view gating."""
+
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import cache
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from django_program.conference.models import Conference
+from django_program.registration.models import Cart, CartItem, Order, TicketType
+from django_program.registration.services.waiting_room import (
+    _key,
+    admit,
+    is_gated,
+    read_queue_token,
+    release,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def waiting_room(settings):
+    settings.DJANGO_PROGRAM = {"waiting_room": {"enabled": True, "concurrency": 2}}
+
+
+@pytest.fixture
+def conference(db):
+    return Conference.objects.create(
+        name="LaunchCon",
+        slug=f"launchcon-{uuid4().hex[:6]}",
+        start_date=date(2027, 5, 1),
+        end_date=date(2027, 5, 3),
+        timezone="UTC",
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def tutorial(conference):
+    return TicketType.objects.create(
+        conference=conference,
+        name="Tutorial",
+        slug="tutorial",
+        price=Decimal("150.00"),
+        total_quantity=40,
+        is_active=True,
+    )
+
+
+def _client_for(username):
+    user = User.objects.create_user(username=f"{username}-{uuid4().hex[:6]}", password="password")
+    client = Client()
+    client.force_login(user)
+    return user, client
+
+
+@pytest.mark.usefixtures("waiting_room")
+class TestAdmission:
+    def test_admits_up_to_concurrency_then_queues(self):
+        first, second, third, fourth = (admit(7, f"user:{n}") for n in range(4))
+
+        assert first.admitted
+        assert second.admitted
+        assert not third.admitted
+        assert not fourth.admitted
+        assert (third.position, fourth.position) == (1, 2)
+        assert third.eta_seconds > 0
+
+    def test_polling_keeps_queue_position(self):
+        admit(7, "user:1")
+        admit(7, "user:2")
+        waiting = admit(7, "user:3")
+
+        assert admit(7, "user:3").position == waiting.position
+        assert admit(7, "user:1").admitted
+
+    def test_release_admits_next_in_line(self):
+        admit(7, "user:1")
+        admit(7, "user:2")
+        assert not admit(7, "user:3").admitted
+
+        release(7, "user:1")
+
+        assert admit(7, "user:3").admitted
+        assert not admit(7, "user:1").admitted
+
+    def test_abandoned_waiters_are_skipped(self):
+        admit(7, "user:1")
+        admit(7, "user:2")
+        admit(7, "user:3")
+        assert admit(7, "user:4").position == 2
+
+        cache.delete(_key(7, "alive", 3))
+
+        assert admit(7, "user:4").position == 1
+
+    def test_queues_are_per_ticket_type(self):
+        admit(7, "user:1")
+        admit(7, "user:2")
+
+        assert admit(8, "user:3").admitted
+
+    def test_token_round_trips_position_and_eta(self):
+        admit(7, "user:1")
+        admit(7, "user:2")
+        waiting = admit(7, "user:3")
+
+        decoded = read_queue_token(waiting.token)
+
+        assert (decoded.ticket_type_id, decoded.position, decoded.eta_seconds) == (7, 1, waiting.eta_seconds)
+        with pytest.raises(signing.BadSignature):
+            read_queue_token(waiting.token + "x")
+
+    @pytest.mark.django_db
+    def test_only_limited_ticket_types_are_gated(self, tutorial, conference):
+        unlimited = TicketType.objects.create(conference=conference, name="GA", slug="ga", price=Decimal("10.00"))
+
+        assert is_gated(tutorial)
+        assert not is_gated(unlimited)
+        with override_settings(DJANGO_PROGRAM={}):
+            assert not is_gated(tutorial)
+
+
+@pytest.mark.django_db
+class TestViewGating:
+    def _checkout_url(self, conference):
+        return reverse("registration:checkout", args=[conference.slug])
+
+    def _cart_with(self, user, conference, ticket_type):
+        cart = Cart.objects.create(user=user, conference=conference, status=Cart.Status.OPEN)
+        CartItem.objects.create(cart=cart, ticket_type=ticket_type, quantity=1)
+        return cart
+
+    def test_disabled_waiting_room_does_not_gate(self, conference, tutorial):
+        for name in ("a", "b", "c"):
+            user, client = _client_for(name)
+            self._cart_with(user, conference, tutorial)
+            assert client.get(self._checkout_url(conference)).status_code == 200
+
+    def test_checkout_queues_until_slot_released(self, conference, tutorial, settings):
+        settings.DJANGO_PROGRAM = {"waiting_room": {"enabled": True, "concurrency": 1}}
+        first, first_client = _client_for("first")
+        second, second_client = _client_for("second")
+        self._cart_with(first, conference, tutorial)
+        self._cart_with(second, conference, tutorial)
+
+        assert first_client.get(self._checkout_url(conference)).status_code == 200
+        waiting = second_client.get(self._checkout_url(conference))
+        assert waiting.status_code == 429
+        assert waiting["Retry-After"] == "5"
+        assert waiting.context["queue"].position == 1
+
+        response = first_client.post(
+            self._checkout_url(conference),
+            {"billing_name": "First", "billing_email": "first@example.com"},
+        )
+        assert response.status_code == 302
+        assert Order.objects.filter(user=first).exists()
+
+        assert second_client.get(self._checkout_url(conference)).status_code == 200
+
+    def test_cart_add_queues_and_preserves_post(self, conference, tutorial, settings):
+        settings.DJANGO_PROGRAM = {"waiting_room": {"enabled": True, "concurrency": 1}}
+        admit(tutorial.pk, "user:someone-else")
+        user, client = _client_for("buyer")
+
+        response = client.post(
+            reverse("registration:cart", args=[conference.slug]),
+            {"action": "add_ticket", "ticket_type": tutorial.slug, "quantity": "2"},
+        )
+
+        assert response.status_code == 429
+        assert ("quantity", "2") in response.context["resubmit"]
+        assert not CartItem.objects.filter(cart__user=user).exists()
@@ -0,0 +1,202 @@
+"""Tests for queued Stripe webhook ingestion and the process_stripe_events worker."""
+
+import io
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+
+from django_program.conference.models import Conference
+from django_program.registration.models import EventProcessingException, Order, StripeEvent, Voucher
+from django_program.registration.services.webhook_queue import process_stripe_events, retry_at
+from django_program.registration.webhooks import stripe_webhook
+from django_program.sponsors import services as sponsor_services
+from django_program.sponsors.models import BulkPurchase, Sponsor, SponsorLevel
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+QUEUE = {"stripe": {"webhook_queue": True}}
+
+
+@pytest.fixture
+def conference():
+    return Conference.objects.create(
+        name="QueueCon",
+        slug="queuecon",
+        start_date="2027-06-01",
+        end_date="2027-06-03",
+        is_active=True,
+        stripe_webhook_secret="whsec_test_secret",
+    )
+
+
+@pytest.fixture
+def order(conference):
+    return Order.objects.create(
+        conference=conference,
+        user=User.objects.create_user(username="queue-buyer", email="queue@example.com"),
+        status=Order.Status.PENDING,
+        subtotal=Decimal("100.00"),
+        total=Decimal("100.00"),
+        reference="ORD-QUEUE1",
+    )
+
+
+def _event(event_id, *, kind="payment_intent.succeeded", order_id="0"):
+    return {
+        "id": event_id,
+        "type": kind,
+        "livemode": False,
+        "data": {"object": {"id": "pi_queue_001", "amount": 10000, "metadata": {"order_id": order_id}}},
+        "api_version": "2024-12-18.acacia",
+    }
+
+
+def _deliver(event):
+    request = RequestFactory().post("/webhook/", data=b"{}", content_type="application/json")
+    request.META["HTTP_STRIPE_SIGNATURE"] = "t=123,v1=abc"
+    with patch("django_program.registration.webhooks.stripe.Webhook.construct_event", return_value=event):
+        return stripe_webhook(request, conference_slug="queuecon")
+
+
+@override_settings(DJANGO_PROGRAM=QUEUE)
+def test_queue_mode_records_without_processing(conference, order):
+    event = _event("evt_queue_001", order_id=str(order.pk))
+
+    assert _deliver(event).status_code == 200
+    assert _deliver(event).status_code == 200
+
+    stripe_event = StripeEvent.objects.get(stripe_id="evt_queue_001")
+    assert stripe_event.processed is False
+    order.refresh_from_db()
+    assert order.status == Order.Status.PENDING
+
+
+@override_settings(DJANGO_PROGRAM=QUEUE)
+def test_worker_processes_queued_events(conference, order):
+    _deliver(_event("evt_queue_002", order_id=str(order.pk)))
+
+    result = process_stripe_events()
+
+    assert (result.processed, result.failed, result.batches) == (1, 0, 1)
+    assert StripeEvent.objects.get(stripe_id="evt_queue_002").processed is True
+    order.refresh_from_db()
+    assert order.status == Order.Status.PAID
+    assert process_stripe_events().batches == 0
+
+
+@override_settings(DJANGO_PROGRAM={"stripe": {"webhook_queue": True, "webhook_max_attempts": 2}})
+def test_failures_are_retried_with_backoff(conference):
+    _deliver(_event("evt_queue_003", order_id="99999999"))
+    now = timezone.now()
+
+    first = process_stripe_events(now=now)
+    stripe_event = StripeEvent.objects.get(stripe_id="evt_queue_003")
+
+    assert (first.processed, first.failed) == (0, 1)
+    assert stripe_event.attempts == 1
+    assert stripe_event.next_attempt_at == now + timedelta(seconds=30)
+    assert EventProcessingException.objects.filter(event=stripe_event).count() == 1
+    assert process_stripe_events(now=now).batches == 0
+
+    process_stripe_events(now=now + timedelta(seconds=31))
+    stripe_event.refresh_from_db()
+    assert stripe_event.attempts == 2
+    assert process_stripe_events(now=now + timedelta(days=1)).batches == 0
+
+
+def test_inline_failures_are_left_for_the_worker(conference):
+    _deliver(_event("evt_queue_004", order_id="99999999"))
+
+    stripe_event = StripeEvent.objects.get(stripe_id="evt_queue_004")
+    assert stripe_event.attempts == 1
+    assert process_stripe_events().batches == 0
+    assert process_stripe_events(now=stripe_event.next_attempt_at).failed == 1
+
+
+@override_settings(
+    DJANGO_PROGRAM={"stripe": {"webhook_queue": True, "webhook_kind_limits": {"charge.dispute.created": 1}}}
+)
+def test_kind_limits_cap_events_per_batch(conference):
+    for n in range(3):
+        _deliver(_event(f"evt_dispute_{n}", kind="charge.dispute.created"))
+
+    result = process_stripe_events(batch_size=10)
+
+    assert (result.processed, result.batches) == (3, 3)
+
+
+@override_settings(
+    DJANGO_PROGRAM={"stripe": {"webhook_queue": True, "webhook_kind_limits": {"charge.dispute.created": 5}}}
+)
+def test_kind_limits_do_not_grow_the_batch(conference):
+    for n in range(2):
+        _deliver(_event(f"evt_refund_{n}", kind="charge.refunded"))
+        _deliver(_event(f"evt_dispute_limit_{n}", kind="charge.dispute.created"))
+
+    result = process_stripe_events(batch_size=2, max_batches=1)
+
+    assert result.processed + result.failed == 2
+    assert StripeEvent.objects.filter(attempts=0, processed=False).count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DJANGO_PROGRAM=QUEUE)
+def test_bulk_purchase_chunks_commit_after_the_batch(conference):
+    level = SponsorLevel.objects.create(conference=conference, name="Gold", cost=Decimal("5000.00"))
+    bp = BulkPurchase.objects.create(
+        conference=conference,
+        sponsor=Sponsor.objects.create(conference=conference, level=level, name="Acme Corp"),
+        quantity=5,
+        unit_price=Decimal(0),
+        total_amount=Decimal(0),
+        payment_status=BulkPurchase.PaymentStatus.PROCESSING,
+        stripe_checkout_session_id="cs_bulk_001",
+        voucher_config={"voucher_type": Voucher.VoucherType.COMP, "discount_value": "0"},
+    )
+    session = {"id": "cs_bulk_001", "payment_status": "paid", "metadata": {"bulk_purchase_id": str(bp.pk)}}
+    _deliver({"id": "evt_bulk_001", "type": "checkout.session.completed", "data": {"object": session}})
+    generate = sponsor_services.generate_voucher_codes
+    calls = []
+
+    def fail_second_chunk(config):
+        calls.append(config.count)
+        if len(calls) == 2:
+            raise RuntimeError("chunk failed")
+        return generate(config)
+
+    with (
+        patch.object(sponsor_services, "_FULFILL_CHUNK_SIZE", 2),
+        patch.object(sponsor_services, "generate_voucher_codes", side_effect=fail_second_chunk),
+    ):
+        result = process_stripe_events()
+
+    # The event and the first chunk were committed before the second chunk failed.
+    assert (result.processed, result.failed) == (1, 0)
+    assert StripeEvent.objects.get(stripe_id="evt_bulk_001").processed is True
+    assert bp.vouchers_generated == 2
+
+
+def test_retry_delay_doubles_up_to_an_hour():
+    now = timezone.now()
+
+    assert retry_at(1, now) - now == timedelta(seconds=30)
+    assert retry_at(3, now) - now == timedelta(seconds=120)
+    assert retry_at(20, now) - now == timedelta(hours=1)
+
+
+@override_settings(DJANGO_PROGRAM=QUEUE)
+def test_process_stripe_events_command(conference):
+    _deliver(_event("evt_dispute_cmd", kind="charge.dispute.created"))
+    out = io.StringIO()
+
+    call_command("process_stripe_events", stdout=out)
+
+    assert "Processed 1 Stripe events (0 failed)" in out.getvalue()
@@ -6,7 +6,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 import stripe as _stripe
 from django.contrib.auth import get_user_model
-from django.test import RequestFactory
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
 from django.utils import timezone
 
 from django_program.conference.models import Conference
@@ -37,6 +38,13 @@ User = get_user_model()
 # -- Fixtures -----------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def conference(db):
     return Conference.objects.create(
@@ -895,6 +903,8 @@ class TestStripeWebhookView:
         mock_config = MagicMock()
         mock_config.currency = "USD"
         mock_config.stripe.webhook_tolerance = 300
+        mock_config.stripe.webhook_queue = False
+        mock_config.stripe.webhook_seen_seconds = 0
         mock_get_config.return_value = mock_config
 
         mock_construct.return_value = self._mock_event(
@@ -997,6 +1007,44 @@ class TestStripeWebhookView:
         assert response.status_code == 200
         assert StripeEvent.objects.count() == 0
 
+    @patch("django_program.registration.webhooks.stripe.Webhook.construct_event")
+    def test_recent_redelivery_is_acknowledged_from_the_seen_set(
+        self, mock_construct, request_factory, conference, django_assert_num_queries
+    ):
+        mock_construct.return_value = self._mock_event(event_id="evt_seen_001", kind="charge.dispute.created")
+        body = b'{"id": "evt_seen_001", "type": "charge.dispute.created"}'
+        stripe_webhook(self._make_request(request_factory, body=body), conference_slug="testcon-wh")
+
+        with django_assert_num_queries(0):
+            response = stripe_webhook(self._make_request(request_factory, body=body), conference_slug="testcon-wh")
+
+        assert response.status_code == 200
+        mock_construct.assert_called_once()
+
+    @override_settings(DJANGO_PROGRAM={"stripe": {"webhook_seen_seconds": 0}})
+    @patch("django_program.registration.webhooks.stripe.Webhook.construct_event")
+    def test_seen_set_can_be_disabled(self, mock_construct, request_factory, conference):
+        mock_construct.return_value = self._mock_event(event_id="evt_seen_002", kind="charge.dispute.created")
+        body = b'{"id": "evt_seen_002"}'
+
+        for _ in range(2):
+            stripe_webhook(self._make_request(request_factory, body=body), conference_slug="testcon-wh")
+
+        assert mock_construct.call_count == 2
+        assert StripeEvent.objects.filter(stripe_id="evt_seen_002").count() == 1
+
+    @patch("django_program.registration.webhooks.stripe.Webhook.construct_event")
+    def test_duplicate_insert_skips_the_handler(self, mock_construct, request_factory, conference, order):
+        StripeEvent.objects.create(stripe_id="evt_race_001", kind="payment_intent.succeeded")
+        mock_construct.return_value = self._mock_event(event_id="evt_race_001", order_id=str(order.pk))
+
+        response = stripe_webhook(self._make_request(request_factory), conference_slug="testcon-wh")
+
+        assert response.status_code == 200
+        order.refresh_from_db()
+        assert order.status == Order.Status.PENDING
+        assert cache.get("django_program:stripe_event_seen:evt_race_001") == 1
+
 
 # ---------------------------------------------------------------------------
 # URL conf coverage
@@ -29,6 +29,38 @@ def test_get_config_validates_primitive_values() -> None:
         with pytest.raises(ValueError, match="positive integer"):
             get_config()
 
+    with override_settings(DJANGO_PROGRAM={"hold_sweep_batch_size": 0}):
+        with pytest.raises(ValueError, match="hold_sweep_batch_size"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"hold_sweep_interval_seconds": -1}):
+        with pytest.raises(ValueError, match="hold_sweep_interval_seconds"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"dashboard_cache_seconds": -1}):
+        with pytest.raises(ValueError, match="dashboard_cache_seconds"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"dashboard_stale_seconds": "5"}):
+        with pytest.raises(ValueError, match="dashboard_stale_seconds"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"checkin_card_cache_seconds": -1}):
+        with pytest.raises(ValueError, match="checkin_card_cache_seconds"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"schedule_cache_seconds": -1}):
+        with pytest.raises(ValueError, match="schedule_cache_seconds"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"badge_render_workers": -1}):
+        with pytest.raises(ValueError, match="badge_render_workers"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"badge_batch_size": 0}):
+        with pytest.raises(ValueError, match="badge_batch_size"):
+            get_config()
+
     with override_settings(DJANGO_PROGRAM={"currency": ""}):
         with pytest.raises(ValueError, match="currency"):
             get_config()
@@ -45,6 +77,30 @@ def test_get_config_validates_primitive_values() -> None:
         with pytest.raises(ValueError, match="schedule_delete_guard_max_fraction_removed"):
             get_config()
 
+    with override_settings(DJANGO_PROGRAM={"waiting_room": {"concurrency": 0}}):
+        with pytest.raises(ValueError, match="concurrency"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"waiting_room": {"enabled": "yes"}}):
+        with pytest.raises(TypeError, match="enabled"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"stripe": {"webhook_queue": "yes"}}):
+        with pytest.raises(TypeError, match="webhook_queue"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"stripe": {"webhook_max_attempts": 0}}):
+        with pytest.raises(ValueError, match="webhook_max_attempts"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"stripe": {"webhook_seen_seconds": -1}}):
+        with pytest.raises(ValueError, match="webhook_seen_seconds"):
+            get_config()
+
+    with override_settings(DJANGO_PROGRAM={"stripe": {"webhook_kind_limits": {"charge.dispute.created": 0}}}):
+        with pytest.raises(ValueError, match="webhook_kind_limits"):
+            get_config()
+
 
 def test_get_config_cache_clears_on_setting_changed() -> None:
     with override_settings(DJANGO_PROGRAM={"currency": "USD"}):
@@ -0,0 +1,79 @@
+"""Tests for sponsor bulk purchase fulfillment."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from django_program.conference.models import Conference
+from django_program.registration.models import Voucher
+from django_program.sponsors.models import BulkPurchase, BulkPurchaseVoucher, Sponsor, SponsorLevel
+from django_program.sponsors.services import BulkPurchaseError, BulkPurchaseService
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def conference() -> Conference:
+    return Conference.objects.create(
+        name="BulkCon",
+        slug="bulkcon",
+        start_date=date(2027, 6, 1),
+        end_date=date(2027, 6, 3),
+        timezone="UTC",
+    )
+
+
+@pytest.fixture
+def sponsor(conference: Conference) -> Sponsor:
+    level = SponsorLevel.objects.create(conference=conference, name="Gold", cost=Decimal("5000.00"))
+    return Sponsor.objects.create(conference=conference, level=level, name="Acme Corp")
+
+
+def _purchase(conference: Conference, sponsor: Sponsor, quantity: int, **kwargs: object) -> BulkPurchase:
+    return BulkPurchase.objects.create(
+        conference=conference,
+        sponsor=sponsor,
+        quantity=quantity,
+        unit_price=Decimal(0),
+        total_amount=Decimal(0),
+        payment_status=kwargs.pop("payment_status", BulkPurchase.PaymentStatus.APPROVED),
+        voucher_config={"voucher_type": Voucher.VoucherType.COMP, "discount_value": "0"},
+        **kwargs,
+    )
+
+
+def test_fulfills_large_purchases_in_chunks(conference: Conference, sponsor: Sponsor):
+    bp = _purchase(conference, sponsor, 1200)
+    reports: list[tuple[int, int]] = []
+
+    vouchers = BulkPurchaseService.fulfill_bulk_purchase(bp, progress=lambda done, total: reports.append((done, total)))
+
+    assert reports == [(500, 1200), (1000, 1200), (1200, 1200)]
+    assert len({v.code for v in vouchers}) == 1200
+    assert all(v.code.startswith("BULK-") for v in vouchers)
+    bp.refresh_from_db()
+    assert bp.payment_status == BulkPurchase.PaymentStatus.PAID
+    assert bp.vouchers_generated == 1200
+
+
+def test_resumes_a_partial_fulfillment(conference: Conference, sponsor: Sponsor):
+    bp = _purchase(conference, sponsor, 3)
+    for code in ("BULK-EARLY1", "BULK-EARLY2"):
+        voucher = Voucher.objects.create(conference=conference, code=code, discount_value=Decimal(0))
+        BulkPurchaseVoucher.objects.create(bulk_purchase=bp, voucher=voucher)
+
+    vouchers = BulkPurchaseService.fulfill_bulk_purchase(bp)
+
+    assert len(vouchers) == 1
+    assert bp.vouchers_generated == 3
+    assert BulkPurchaseService.fulfill_bulk_purchase(bp) == []
+
+
+def test_rejects_unpaid_purchases_before_generating(conference: Conference, sponsor: Sponsor):
+    bp = _purchase(conference, sponsor, 3, payment_status=BulkPurchase.PaymentStatus.PENDING)
+
+    with pytest.raises(BulkPurchaseError, match="Pending"):
+        BulkPurchaseService.fulfill_bulk_purchase(bp)
+
+    assert not Voucher.objects.filter(conference=conference).exists()
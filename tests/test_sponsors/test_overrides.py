@@ -321,3 +321,30 @@ class TestSponsorEffectiveProperties:
         sponsor = _make_sponsor(conf, level_a, "Acme Corp")
         SponsorOverride.objects.create(sponsor=sponsor, conference=conf, override_level=level_b)
         assert sponsor.effective_level == level_b
+
+
+# ===========================================================================
+# Sponsor.objects.with_overrides()
+# ===========================================================================
+
+
+@pytest.mark.django_db
+class TestSponsorWithOverrides:
+    def test_resolves_overrides_in_one_query(self, django_assert_num_queries):
+        conf = _make_conference(slug="sponsor-with-ov")
+        gold = _make_level(conf, name="Gold")
+        silver = _make_level(conf, name="Silver")
+        acme = _make_sponsor(conf, gold, "Acme Corp", contact_email="old@acme.example")
+        SponsorOverride.objects.create(
+            sponsor=acme, conference=conf, override_contact_email="new@acme.example", override_level=silver
+        )
+        _make_sponsor(conf, gold, "Globex", contact_email="hi@globex.example")
+
+        with django_assert_num_queries(1):
+            sponsors = list(Sponsor.objects.with_overrides().order_by("name"))
+            levels = [s.effective_level.name for s in sponsors]
+
+        assert levels == ["Silver", "Gold"]
+        assert [s.resolved_contact_email for s in sponsors] == ["new@acme.example", "hi@globex.example"]
+        assert sponsors[0].resolved_level_id == silver.pk
+        assert Sponsor.objects.with_overrides().get(resolved_contact_email="new@acme.example") == acme